@@ -0,0 +1,495 @@
+"""
+Async client for the Bluesky public AppView API.
+
+Scraping Bluesky one account at a time, with config.REQUEST_DELAY between
+every call and a getProfile per account, made a sweep of every grantee take
+minutes for what is a few dozen cheap API calls. Requests made through
+BlueskyClient share three things across the process:
+
+- a rate budget (RateBudget): requests are spaced to
+  config.BLUESKY_REQUESTS_PER_SECOND over all jobs, threads and event
+  loops, and a 429 holds everyone back until the limit resets
+- a profile batcher: profile lookups made close together on one event loop
+  (e.g. by Bluesky jobs running side by side in the orchestrator) are
+  combined into app.bsky.actor.getProfiles calls of up to
+  config.BLUESKY_PROFILE_BATCH_SIZE actors. Batches go out on the
+  batcher's own session, so no job's session or deadline decides them.
+- a handle -> DID cache on disk (DidCache): author feeds are read by DID,
+  and a handle is not resolved again for config.BLUESKY_DID_CACHE_TTL_HOURS.
+  Profiles carry their DID, so most entries come for free.
+
+The caller owns the aiohttp session; one client per session is cheap.
+"""
+
+import asyncio
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set
+
+import aiohttp
+
+import config
+from deadline import Deadline, DeadlineExceeded
+from http_client import RateBudget, async_session
+from time_accounting import measure
+
+
+logger = logging.getLogger(__name__)
+
+# Public AppView endpoints (no authentication)
+API_BASE = "https://public.api.bsky.app/xrpc"
+PROFILES_ENDPOINT = f"{API_BASE}/app.bsky.actor.getProfiles"
+FEED_ENDPOINT = f"{API_BASE}/app.bsky.feed.getAuthorFeed"
+RESOLVE_HANDLE_ENDPOINT = f"{API_BASE}/com.atproto.identity.resolveHandle"
+
+# Headers for sessions the client opens itself (profile batches)
+HEADERS = {'User-Agent': config.USER_AGENT, 'Accept': 'application/json'}
+
+# Most posts getAuthorFeed returns per page
+FEED_PAGE_SIZE = 100
+
+# Wait after a 429 that carries no usable reset header, and the longest we
+# wait for any reset
+DEFAULT_RETRY_AFTER = 5
+MAX_RETRY_AFTER = 60
+
+
+class DidCache:
+    """Handle -> DID resolutions kept on disk for a limited time."""
+
+    def __init__(self, path: Optional[Path] = None, ttl_hours: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            path: Cache JSON file (default: config.BLUESKY_DID_CACHE_PATH)
+            ttl_hours: How long a resolution is trusted (default:
+                config.BLUESKY_DID_CACHE_TTL_HOURS)
+        """
+        self.path = Path(path) if path else config.BLUESKY_DID_CACHE_PATH
+        self.ttl_seconds = (config.BLUESKY_DID_CACHE_TTL_HOURS if ttl_hours is None else ttl_hours) * 3600
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        """Read the cache from disk, starting empty if missing or unreadable."""
+        if not self.path.exists():
+            return
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f).get('handles', {})
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable DID cache {self.path}: {e}")
+            self.entries = {}
+
+    def get(self, handle: str) -> Optional[str]:
+        """
+        Return the cached DID for a handle.
+
+        Args:
+            handle: Bluesky handle
+
+        Returns:
+            DID, or None if not cached or older than the TTL
+        """
+        with self._lock:
+            entry = self.entries.get(handle.lower())
+
+        if not entry:
+            return None
+        try:
+            age = (datetime.now() - datetime.fromisoformat(entry['resolved_at'])).total_seconds()
+        except (KeyError, TypeError, ValueError):
+            return None
+        return entry.get('did') if age < self.ttl_seconds else None
+
+    def put(self, handle: str, did: str) -> None:
+        """Record a resolution."""
+        with self._lock:
+            self.entries[handle.lower()] = {'did': did, 'resolved_at': datetime.now().isoformat()}
+            self._dirty = True
+
+    def save(self) -> None:
+        """Atomically write the cache to disk if anything changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = dict(self.entries)
+            self._dirty = False
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'updated_at': datetime.now().isoformat(),
+                'handles': entries
+            }, f, indent=2, ensure_ascii=False)
+
+        os.replace(tmp_path, self.path)
+
+
+class ProfileBatcher:
+    """
+    Combines profile lookups on one event loop into getProfiles calls.
+
+    A lookup waits up to config.BLUESKY_PROFILE_BATCH_WINDOW_MS for others
+    to join it; a full batch is sent at once. Batches are sent on a session
+    the batcher opens, with no deadline, so the lookups in a batch do not
+    depend on whichever job opened it. Each lookup bounds its own wait by
+    its job's deadline, and a failed batch fails each lookup with a
+    ClientError.
+    """
+
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        window_ms: Optional[float] = None,
+        open_session: Callable[..., Any] = async_session
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            batch_size: Actors per call (default: config.BLUESKY_PROFILE_BATCH_SIZE)
+            window_ms: Wait for more lookups (default: config.BLUESKY_PROFILE_BATCH_WINDOW_MS)
+            open_session: Async context manager factory taking headers= and
+                yielding the session a batch is sent on
+        """
+        self.batch_size = batch_size or config.BLUESKY_PROFILE_BATCH_SIZE
+        self.window = (config.BLUESKY_PROFILE_BATCH_WINDOW_MS if window_ms is None else window_ms) / 1000
+        self.open_session = open_session
+        self._pending: Dict[str, List[asyncio.Future]] = {}
+        self._client: Optional['BlueskyClient'] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # Batches in flight; the loop only holds weak references to tasks
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def get(self, client: 'BlueskyClient', actor: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up one profile as part of the next batch.
+
+        Args:
+            client: Client making the lookup; its deadline bounds the wait
+                and its rate budget and DID cache are used if it opens the
+                batch
+            actor: Handle or DID
+
+        Returns:
+            Profile, or None if the API returned none for the actor
+
+        Raises:
+            aiohttp.ClientError: If the batch failed
+            asyncio.TimeoutError: If the batch took longer than a request may
+            DeadlineExceeded: If the client's deadline passed while waiting
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        if not self._pending:
+            self._client = client
+        self._pending.setdefault(actor.lower(), []).append(future)
+
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+
+        wait = client.deadline.timeout(config.TIMEOUT * config.MAX_RETRIES)
+        try:
+            return await asyncio.wait_for(future, wait)
+        except asyncio.TimeoutError:
+            client.deadline.check("waiting for a profile batch")
+            raise
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, client = self._pending, self._client
+        self._pending, self._client = {}, None
+        if batch:
+            task = asyncio.ensure_future(self._send(client, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, opener: 'BlueskyClient', batch: Dict[str, List[asyncio.Future]]) -> None:
+        try:
+            async with self.open_session(headers=HEADERS) as session:
+                client = BlueskyClient(session, Deadline.unlimited(), opener.budget, opener.did_cache)
+                profiles = await client.get_profiles(list(batch))
+        except Exception as e:
+            if not isinstance(e, (aiohttp.ClientError, asyncio.TimeoutError)):
+                e = aiohttp.ClientError(f"Profile batch failed: {e}")
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for actor, futures in batch.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(profiles.get(actor))
+
+
+_rate_budget: Optional[RateBudget] = None
+_did_cache: Optional[DidCache] = None
+_batchers: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, ProfileBatcher]' = weakref.WeakKeyDictionary()
+_client_lock = threading.Lock()
+
+
+def get_rate_budget() -> RateBudget:
+    """Return the process-wide Bluesky rate budget."""
+    global _rate_budget
+
+    with _client_lock:
+        if _rate_budget is None:
+            _rate_budget = RateBudget(config.BLUESKY_REQUESTS_PER_SECOND)
+        return _rate_budget
+
+
+def get_did_cache() -> DidCache:
+    """Return the process-wide DID cache, saved at interpreter exit."""
+    global _did_cache
+
+    with _client_lock:
+        if _did_cache is None:
+            _did_cache = DidCache()
+            atexit.register(_did_cache.save)
+        return _did_cache
+
+
+def _profile_batcher() -> ProfileBatcher:
+    """Return the profile batcher for the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _client_lock:
+        batcher = _batchers.get(loop)
+        if batcher is None:
+            batcher = _batchers[loop] = ProfileBatcher()
+        return batcher
+
+
+class BlueskyClient:
+    """Public AppView API calls over one aiohttp session."""
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        deadline: Optional[Deadline] = None,
+        budget: Optional[RateBudget] = None,
+        did_cache: Optional[DidCache] = None
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            session: HTTP session (owned by the caller)
+            deadline: Bounds request timeouts and waits (None for no limit)
+            budget: Rate budget (default: the process-wide one)
+            did_cache: DID cache (default: the process-wide one)
+        """
+        self.session = session
+        self.deadline = deadline or Deadline.unlimited()
+        self.budget = budget or get_rate_budget()
+        self.did_cache = did_cache if did_cache is not None else get_did_cache()
+
+    @staticmethod
+    def _retry_after(response: aiohttp.ClientResponse) -> float:
+        """Seconds until a rate-limited request may be retried."""
+        try:
+            if 'ratelimit-reset' in response.headers:
+                seconds = float(response.headers['ratelimit-reset']) - time.time()
+            else:
+                seconds = float(response.headers.get('Retry-After', DEFAULT_RETRY_AFTER))
+        except ValueError:
+            seconds = DEFAULT_RETRY_AFTER
+        return min(max(seconds, 1), MAX_RETRY_AFTER)
+
+    async def get_json(self, url: str, params: Any) -> Dict[str, Any]:
+        """
+        GET a JSON endpoint within the rate budget.
+
+        A 429 holds the whole budget back until the limit resets and the
+        request is retried, up to config.MAX_RETRIES attempts.
+
+        Args:
+            url: Endpoint URL
+            params: Query parameters (a dict, or (name, value) pairs for
+                repeated parameters)
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            aiohttp.ClientError: On connection errors and HTTP error statuses
+            asyncio.TimeoutError: If the request outlives its timeout
+            DeadlineExceeded: If waiting for the budget would outlast the deadline
+        """
+        for attempt in range(config.MAX_RETRIES):
+            wait = self.budget.reserve()
+            if wait > 0:
+                with measure('sleep', 'rate_limit'):
+                    await self.deadline.async_sleep(wait)
+
+            timeout = aiohttp.ClientTimeout(total=self.deadline.timeout(config.TIMEOUT))
+            with measure('network', 'api'):
+                async with self.session.get(url, params=params, timeout=timeout) as response:
+                    if response.status != 429 or attempt == config.MAX_RETRIES - 1:
+                        response.raise_for_status()
+                        return await response.json()
+                    retry_after = self._retry_after(response)
+
+            logger.warning(f"Bluesky rate limit hit; holding requests for {retry_after:.0f}s")
+            self.budget.hold(retry_after)
+
+    async def get_profiles(self, actors: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch profiles through getProfiles, config.BLUESKY_PROFILE_BATCH_SIZE per call.
+
+        The DIDs of the returned profiles are added to the DID cache.
+
+        Args:
+            actors: Handles or DIDs
+
+        Returns:
+            Dictionary mapping each profile's lowercased handle and its DID
+            to the profile; actors the API does not know are absent
+        """
+        size = config.BLUESKY_PROFILE_BATCH_SIZE
+        chunks = [list(actors[i:i + size]) for i in range(0, len(actors), size)]
+
+        responses = await asyncio.gather(*(
+            self.get_json(PROFILES_ENDPOINT, [('actors', actor) for actor in chunk])
+            for chunk in chunks
+        ))
+
+        profiles: Dict[str, Dict[str, Any]] = {}
+        for response in responses:
+            for profile in response.get('profiles', []):
+                handle, did = profile.get('handle', '').lower(), profile.get('did')
+                if handle:
+                    profiles[handle] = profile
+                if did:
+                    profiles[did] = profile
+                    if handle:
+                        self.did_cache.put(handle, did)
+        return profiles
+
+    async def get_profile(self, actor: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch one profile, batched with other lookups on this event loop.
+
+        Args:
+            actor: Handle or DID
+
+        Returns:
+            Profile, or None if the API has none for the actor
+        """
+        return await _profile_batcher().get(self, actor)
+
+    async def resolve_did(self, handle: str) -> Optional[str]:
+        """
+        Resolve a handle to its DID, using the DID cache.
+
+        Args:
+            handle: Bluesky handle (a DID is returned as is)
+
+        Returns:
+            DID, or None if the handle cannot be resolved
+        """
+        if handle.startswith('did:'):
+            return handle
+
+        did = self.did_cache.get(handle)
+        if did:
+            return did
+
+        try:
+            did = (await self.get_json(RESOLVE_HANDLE_ENDPOINT, {'handle': handle})).get('did')
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"Could not resolve Bluesky handle {handle}: {e}")
+            return None
+
+        if did:
+            self.did_cache.put(handle, did)
+        return did
+
+    async def get_author_feed(self, actor: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Page through an author's feed.
+
+        Paging stops at the job deadline or on an API error; the posts
+        fetched so far are returned.
+
+        Args:
+            actor: DID (preferred) or handle
+            limit: Maximum number of feed items
+
+        Returns:
+            Raw feed items, newest first
+        """
+        posts: List[Dict[str, Any]] = []
+        cursor = None
+
+        try:
+            while len(posts) < limit:
+                params = {'actor': actor, 'limit': min(FEED_PAGE_SIZE, limit - len(posts))}
+                if cursor:
+                    params['cursor'] = cursor
+
+                data = await self.get_json(FEED_ENDPOINT, params)
+
+                feed_items = data.get('feed', [])
+                if not feed_items:
+                    break
+                posts.extend(feed_items)
+
+                cursor = data.get('cursor')
+                if not cursor:
+                    break
+
+        except DeadlineExceeded as e:
+            logger.warning(f"Stopped fetching posts for {actor}: {e}")
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Failed to fetch posts for {actor}: {e}")
+
+        return posts[:limit]
+
+    async def get_author_feeds(
+        self,
+        actors: Sequence[str],
+        limit: int,
+        concurrency: Optional[int] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Page through several authors' feeds at once.
+
+        Args:
+            actors: DIDs or handles
+            limit: Maximum feed items per author
+            concurrency: Feeds paged at a time (default: config.BLUESKY_FEED_CONCURRENCY)
+
+        Returns:
+            Dictionary mapping each actor to its feed items
+        """
+        semaphore = asyncio.Semaphore(concurrency or config.BLUESKY_FEED_CONCURRENCY)
+
+        async def fetch(actor: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self.get_author_feed(actor, limit)
+
+        feeds = await asyncio.gather(*(fetch(actor) for actor in actors))
+        return dict(zip(actors, feeds))
@@ -0,0 +1,378 @@
+"""
+Shared Playwright browser pool for the NJCIC scrapers.
+
+Launching Chromium and logging in again costs seconds per account. The pool
+keeps warm browsers for the life of the process and lends each platform a
+BrowserContext that keeps its cookies between grantees, so only the first
+account on a platform pays for browser startup and login. A MemoryWatchdog
+replaces a context that has navigated too often, or any released context
+while the browser uses too much memory, with a fresh one carrying the same
+session.
+
+Sync callers run scraper coroutines on the pool's own event loop through
+BrowserPool.run() instead of asyncio.run(). Playwright's async objects belong
+to the loop that created them, so a browser can only outlive one scrape if
+every scrape uses the same long-lived loop.
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import logging
+import sys
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from memory_watchdog import MemoryWatchdog, NavigationCounter, recycle_context
+from route_filters import RouteFilter
+
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for browsers to close when the process exits
+CLOSE_TIMEOUT = 30
+
+
+class ContextLease:
+    """
+    A pooled BrowserContext lent to one scrape at a time.
+
+    Attributes:
+        platform: Platform the context belongs to
+        context: The Playwright BrowserContext
+        state: Scraper-owned values that live as long as the context, e.g.
+            {'logged_in': True} so later scrapes can skip the login check
+        uses: Number of scrapes that have borrowed this context
+        route_filter: RouteFilter installed on the context, if any
+        navigations: Navigation count of the current context
+        options: Keyword arguments the context was created with
+        setup: Coroutine function run on each new context
+    """
+
+    def __init__(self, platform: str, context: Any):
+        self.platform = platform
+        self.context = context
+        self.state: Dict[str, Any] = {}
+        self.uses = 0
+        self.discarded = False
+        self.route_filter: Optional[RouteFilter] = None
+        self.navigations = NavigationCounter(context)
+        self.options: Dict[str, Any] = {}
+        self.setup: Optional[Callable[['ContextLease'], Awaitable[None]]] = None
+
+    @property
+    def reused(self) -> bool:
+        """Return True if an earlier scrape already used this context."""
+        return self.uses > 1
+
+    def discard(self) -> None:
+        """Close the context on release instead of returning it to the pool."""
+        self.discarded = True
+
+    def is_usable(self) -> bool:
+        """Return True if the context's browser is still running."""
+        browser = self.context.browser
+        return not self.discarded and (browser is None or browser.is_connected())
+
+
+def _pool_key(platform: str, headless: bool, args: Sequence[str]) -> Tuple[str, bool, Tuple[str, ...]]:
+    """Build the idle-context key for a platform and launch configuration."""
+    return (platform, headless, tuple(args))
+
+
+class BrowserPool:
+    """Warm Chromium browsers and per-platform contexts on one event loop."""
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._launch_lock: Optional[asyncio.Lock] = None
+        self._playwright = None
+        self._browsers: Dict[Tuple[bool, Tuple[str, ...]], Any] = {}
+        self._idle: Dict[Tuple[str, bool, Tuple[str, ...]], List[ContextLease]] = {}
+        self.stats = {
+            'browsers_launched': 0,
+            'contexts_created': 0,
+            'contexts_reused': 0,
+            'requests_blocked': 0,
+            'bytes_saved': 0,
+        }
+        self.watchdog = MemoryWatchdog(stats=self.stats)
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the pool's event loop thread on first use."""
+        with self._start_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="browser-pool",
+                    daemon=True
+                )
+                self._thread.start()
+        return self._loop
+
+    def run(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """
+        Run a coroutine on the pool's event loop and wait for its result.
+
+        Use this instead of asyncio.run() for anything that leases a
+        context. Safe to call from several threads at once; their coroutines
+        interleave on the pool's loop.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait before cancelling the coroutine (None
+                waits for as long as it takes)
+
+        Returns:
+            The coroutine's result
+
+        Raises:
+            concurrent.futures.TimeoutError: If the coroutine was still
+                running after timeout seconds; it is cancelled
+        """
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            if not future.done():
+                future.cancel()
+            raise
+
+    async def _browser(self, headless: bool, args: Sequence[str]) -> Any:
+        """Return a running browser for a launch configuration, launching it if needed."""
+        if self._launch_lock is None:
+            self._launch_lock = asyncio.Lock()
+
+        async with self._launch_lock:
+            if self._playwright is None:
+                # Imported on first launch so importing the pool stays cheap
+                try:
+                    from playwright.async_api import async_playwright
+                except ImportError:
+                    raise RuntimeError("Playwright not installed")
+                self._playwright = await async_playwright().start()
+
+            key = (headless, tuple(args))
+            browser = self._browsers.get(key)
+
+            if browser is None or not browser.is_connected():
+                logger.info(f"Launching pooled Chromium (headless={headless})")
+                browser = await self._playwright.chromium.launch(headless=headless, args=list(args))
+                self._browsers[key] = browser
+                self.stats['browsers_launched'] += 1
+
+            return browser
+
+    @asynccontextmanager
+    async def lease(
+        self,
+        platform: str,
+        context_options: Optional[Dict[str, Any]] = None,
+        headless: bool = True,
+        args: Sequence[str] = (),
+        setup: Optional[Callable[[ContextLease], Awaitable[None]]] = None
+    ):
+        """
+        Borrow a warm context for a platform.
+
+        Reuses an idle context from an earlier scrape when there is one;
+        otherwise creates one on a pooled browser, installs the platform's
+        RouteFilter and runs setup on it (e.g. to load saved cookies). On release the context's pages are
+        closed and it goes back to the pool with its cookies intact, or is
+        first recycled if the watchdog says so. A context whose scrape
+        raised is closed instead.
+
+        Args:
+            platform: Platform name
+            context_options: Keyword arguments for browser.new_context
+            headless: Launch the browser headless
+            args: Chromium command-line arguments
+            setup: Coroutine function run once on each new context
+
+        Yields:
+            ContextLease for the borrowed context
+        """
+        key = _pool_key(platform, headless, args)
+        lease = await self._take_idle(key)
+
+        if lease is None:
+            browser = await self._browser(headless, args)
+            lease = ContextLease(platform, await browser.new_context(**(context_options or {})))
+            lease.options = dict(context_options or {})
+            lease.setup = setup
+            self.stats['contexts_created'] += 1
+
+            try:
+                await self._prepare(lease)
+            except BaseException:
+                await self._close_context(lease)
+                raise
+        else:
+            self.stats['contexts_reused'] += 1
+            logger.debug(f"Reusing warm {platform} context (use {lease.uses + 1})")
+
+        lease.uses += 1
+        completed = False
+
+        try:
+            yield lease
+            completed = True
+        finally:
+            await self._release(key, lease, completed)
+
+    async def _prepare(self, lease: ContextLease) -> None:
+        """Install the platform's RouteFilter on a new context and run its setup."""
+        lease.route_filter = RouteFilter.for_platform(lease.platform, totals=self.stats)
+        if lease.route_filter is not None:
+            await lease.route_filter.install(lease.context)
+        if lease.setup is not None:
+            await lease.setup(lease)
+
+    async def _recycle(self, lease: ContextLease, reason: str) -> bool:
+        """
+        Swap a lease's context for a fresh one carrying its session.
+
+        The lease keeps its state, so e.g. a logged-in flag still holds.
+
+        Returns:
+            True if the lease has a working new context
+        """
+        try:
+            lease.context = await recycle_context(lease.context, lease.options)
+            lease.navigations = NavigationCounter(lease.context)
+            await self._prepare(lease)
+        except Exception as e:
+            logger.warning(f"Could not recycle {lease.platform} context: {e}")
+            return False
+
+        self.watchdog.record(reason)
+        logger.info(f"Recycled {lease.platform} context ({reason})")
+        return True
+
+    async def _take_idle(self, key: Tuple[str, bool, Tuple[str, ...]]) -> Optional[ContextLease]:
+        """Pop a usable idle context, closing any whose browser has died."""
+        idle = self._idle.get(key, [])
+
+        while idle:
+            lease = idle.pop()
+            if lease.is_usable():
+                return lease
+            await self._close_context(lease)
+
+        return None
+
+    async def _release(
+        self,
+        key: Tuple[str, bool, Tuple[str, ...]],
+        lease: ContextLease,
+        completed: bool
+    ) -> None:
+        """Close a lease's pages and return its context to the pool."""
+        if not completed or not lease.is_usable():
+            await self._close_context(lease)
+            return
+
+        for page in list(lease.context.pages):
+            try:
+                await page.close()
+            except Exception as e:
+                logger.debug(f"Error closing {lease.platform} page: {e}")
+
+        reason = self.watchdog.check(lease.navigations.count)
+        if reason is not None and not await self._recycle(lease, reason):
+            await self._close_context(lease)
+            return
+
+        self._idle.setdefault(key, []).append(lease)
+
+    @staticmethod
+    async def _close_context(lease: ContextLease) -> None:
+        """Close a context, ignoring errors from a dead browser."""
+        try:
+            await lease.context.close()
+        except Exception as e:
+            logger.debug(f"Error closing {lease.platform} context: {e}")
+
+    async def _close_all(self) -> None:
+        """Close every pooled context and browser, stop Playwright and close the shared HTTP connector."""
+        for leases in self._idle.values():
+            for lease in leases:
+                await self._close_context(lease)
+        self._idle.clear()
+
+        for browser in self._browsers.values():
+            try:
+                await browser.close()
+            except Exception as e:
+                logger.debug(f"Error closing pooled browser: {e}")
+        self._browsers.clear()
+
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+        # Only a process that used the shared HTTP client has a connector to close
+        if 'http_client' in sys.modules:
+            from http_client import close_async_connector
+            await close_async_connector()
+
+    def close(self) -> None:
+        """Close all browsers and stop the event loop thread."""
+        with self._start_lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+
+        if loop is None:
+            return
+
+        try:
+            asyncio.run_coroutine_threadsafe(self._close_all(), loop).result(CLOSE_TIMEOUT)
+        except Exception as e:
+            logger.warning(f"Error shutting down browser pool: {e}")
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(CLOSE_TIMEOUT)
+            loop.close()
+            self._launch_lock = None
+
+
+_browser_pool: Optional[BrowserPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """Return the process-wide async browser pool, closed at interpreter exit."""
+    global _browser_pool
+
+    with _pool_lock:
+        if _browser_pool is None:
+            _browser_pool = BrowserPool()
+            atexit.register(_browser_pool.close)
+        return _browser_pool
+
+
+def browser_pool_stats() -> Dict[str, int]:
+    """Return launch, reuse, recycling and request-blocking counts for the browser pool."""
+    totals = {
+        'browsers_launched': 0,
+        'contexts_created': 0,
+        'contexts_reused': 0,
+        'contexts_recycled': 0,
+        'recycled_for_navigations': 0,
+        'recycled_for_memory': 0,
+        'peak_rss_mb': 0,
+        'requests_blocked': 0,
+        'bytes_saved': 0,
+    }
+
+    if _browser_pool is not None:
+        for name in totals:
+            totals[name] += _browser_pool.stats[name]
+
+    return totals
+
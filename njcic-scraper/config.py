@@ -3,25 +3,48 @@ Configuration settings for NJCIC Grantee Social Media Scraper.
 
 This module centralizes all configuration settings including paths,
 rate limiting, platform settings, and environment variables.
+
+Importing this module has no side effects. The .env file is loaded on
+first access to an environment-backed setting (or an explicit load_env()
+call), and output directories are created by ensure_directories().
 """
 
 import os
 from pathlib import Path
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
 
 # Base paths
 BASE_DIR = Path(__file__).resolve().parent
 OUTPUT_DIR = BASE_DIR / "output"
 DATA_DIR = BASE_DIR / "data"
 LOGS_DIR = BASE_DIR / "logs"
+RUNS_DIR = OUTPUT_DIR / "runs"  # Per-run job journals used by main.py --resume
+
+_env_loaded = False
+_directories_created = False
+
+
+def load_env() -> None:
+    """Load environment variables from the .env file (once per process)."""
+    global _env_loaded
+    if _env_loaded:
+        return
+
+    from dotenv import load_dotenv
+    load_dotenv()
+    _env_loaded = True
+
+
+def ensure_directories() -> None:
+    """Create the output, data and logs directories if they don't exist."""
+    global _directories_created
+    if _directories_created:
+        return
+
+    OUTPUT_DIR.mkdir(exist_ok=True)
+    DATA_DIR.mkdir(exist_ok=True)
+    LOGS_DIR.mkdir(exist_ok=True)
+    _directories_created = True
 
-# Create directories if they don't exist
-OUTPUT_DIR.mkdir(exist_ok=True)
-DATA_DIR.mkdir(exist_ok=True)
-LOGS_DIR.mkdir(exist_ok=True)
 
 # Scraping settings
 MAX_POSTS_PER_ACCOUNT = 25  # Maximum posts to download per account
@@ -29,6 +52,194 @@ REQUEST_DELAY = 2  # Delay between requests in seconds
 TIMEOUT = 30  # Request timeout in seconds
 MAX_RETRIES = 3  # Maximum retry attempts for failed requests
 
+# Orchestrator concurrency: maximum simultaneous jobs per platform.
+# API-backed platforms can run wide; browser-based platforms stay at 1 to
+# keep memory down and avoid tripping anti-bot checks on a shared login.
+PLATFORM_CONCURRENCY = {
+    "bluesky": 8,
+    "youtube": 4,
+    "tiktok": 2,
+    "twitter": 1,
+    "facebook": 1,
+    "instagram": 1,
+    "linkedin": 1,
+    "threads": 1,
+}
+DEFAULT_PLATFORM_CONCURRENCY = 1  # Limit for platforms not listed above
+
+# Post pages an Instagram scrape reads at once (tabs in its browser context)
+# when posts have to be fetched one by one from the profile grid
+INSTAGRAM_DETAIL_CONCURRENCY = 3
+
+# Job cost history: average wall-clock seconds per (platform, account),
+# used to balance --shard assignments. Every shard machine needs the same
+# copy; shards only read it, and --merge-reports folds their timings back in.
+JOB_HISTORY_PATH = DATA_DIR / "job_history.json"
+DEFAULT_JOB_SECONDS = {  # Estimates for accounts with no history yet
+    "bluesky": 5,
+    "youtube": 60,
+    "tiktok": 180,
+    "twitter": 60,
+    "facebook": 90,
+    "instagram": 120,
+    "linkedin": 60,
+    "threads": 60,
+}
+DEFAULT_JOB_SECONDS_FALLBACK = 60
+
+# Per-job deadlines: wall-clock budget for one (grantee, platform) job.
+# Scrapers bound their retries, subprocess timeouts and page waits by it,
+# and a job that runs out of time is recorded as timed_out with its partial
+# data. Override for every platform with --job-timeout.
+JOB_TIMEOUT_SECONDS = {
+    "bluesky": 120,
+    "youtube": 600,
+    "tiktok": 900,
+    "twitter": 420,
+    "facebook": 420,
+    "instagram": 600,
+    "linkedin": 300,
+    "threads": 300,
+}
+DEFAULT_JOB_TIMEOUT_SECONDS = 600  # Budget for platforms not listed above
+# A job still running this long after its deadline (e.g. stuck in a
+# Playwright call that never returns) is cancelled and recorded as timed_out
+JOB_TIMEOUT_GRACE_SECONDS = 30
+
+# Activity-aware refresh (main.py --due-only): each account is tiered by
+# the posting frequency of its last successful scrape and skipped until its
+# interval has elapsed. Accounts never scraped are always due.
+REFRESH_STATE_PATH = DATA_DIR / "refresh_state.json"
+REFRESH_INTERVAL_DAYS = {
+    "daily": 1,
+    "weekly": 7,
+    "monthly": 30,
+}
+REFRESH_ACTIVE_POSTS_PER_WEEK = 3  # At or above: refresh daily
+REFRESH_OCCASIONAL_POSTS_PER_WEEK = 0.5  # At or above: weekly, below: monthly
+REFRESH_DORMANT_AFTER_DAYS = 60  # No post for this long: monthly regardless of rate
+REFRESH_GRACE_HOURS = 2  # How early a run may pick up an account before it is due
+
+# Cross-run result cache shared by main.py, scrape_internal.py and
+# scrape_ccm.py: a successful result for (platform, account, max_posts) is
+# reused for this long instead of scraping again. --force bypasses it.
+RESULT_CACHE_DIR = DATA_DIR / "result_cache"
+RESULT_CACHE_TTL_HOURS = 12
+
+# Adaptive fallback selectors (see selector_registry.py): hit/miss counts
+# and match latency per (platform, purpose, selector), used to try the
+# historically best selector first. A selector that used to match and has
+# now missed this many times in a row is reported as stale in the run summary.
+SELECTOR_STATS_PATH = DATA_DIR / "selector_stats.json"
+SELECTOR_STALE_AFTER_MISSES = 10
+
+# Session vault (see session_vault.py): one saved Playwright storage_state
+# per platform, shared by every scraper and process. A session confirmed
+# logged in within SESSION_VALIDATION_TTL_HOURS is used without re-checking
+# it; logins take a per-platform file lock so parallel runs log in once.
+SESSION_DIR = DATA_DIR / "sessions"
+SESSION_VALIDATION_TTL_HOURS = 6
+
+# Bluesky API client (see bluesky_client.py): every Bluesky request in the
+# process shares one rate budget (the public AppView allows about 3000
+# requests per 5 minutes per IP), profile lookups are batched into
+# getProfiles calls, and handle -> DID resolutions are cached on disk.
+BLUESKY_REQUESTS_PER_SECOND = 8
+BLUESKY_PROFILE_BATCH_SIZE = 25  # getProfiles accepts at most 25 actors
+BLUESKY_PROFILE_BATCH_WINDOW_MS = 50  # How long a lookup waits for others to batch with
+BLUESKY_FEED_CONCURRENCY = 8  # Author feeds paged at once by batch scripts
+BLUESKY_DID_CACHE_PATH = DATA_DIR / "bluesky_dids.json"
+BLUESKY_DID_CACHE_TTL_HOURS = 7 * 24
+
+# Shared HTTP client (see http_client.py) for plain HTTP fetches: grantee
+# websites, the grant data file and the Airtable export. GET responses are
+# cached on disk; within a host's TTL the cached copy is used without a
+# request, after it the cached copy is revalidated with a conditional GET.
+# HTTP_CACHE_TTL_SECONDS overrides the default by host suffix: 0 always
+# revalidates, None never caches. The per-host limits also apply to the
+# aiohttp connector the async scrapers share.
+HTTP_CACHE_DIR = DATA_DIR / "http_cache"
+HTTP_CACHE_DEFAULT_TTL_SECONDS = 24 * 3600
+HTTP_CACHE_TTL_SECONDS = {
+    "raw.githubusercontent.com": 0,  # Grant data: always revalidate
+    "api.airtable.com": None,  # API pages are not cacheable
+}
+HTTP_MAX_CONNECTIONS_PER_HOST = 8
+HTTP_MIN_INTERVAL_PER_HOST_SECONDS = 0.5
+
+# Pacing profiles (see pacing.py): every human-like pause, typing delay,
+# scroll floor and between-request delay is scaled by delay_scale, and
+# human_simulation turns the optional mouse-movement and browsing-scroll
+# steps on or off. PLATFORM_PACING picks a profile per platform (main.py
+# --pacing overrides it for a run). Targets matching a platform's
+# PACING_LOW_RISK_TARGETS patterns are paced one profile faster.
+PACING_PROFILES = {
+    "cautious": {"delay_scale": 1.5, "human_simulation": True, "scroll_floor_ms": 800},
+    "standard": {"delay_scale": 1.0, "human_simulation": True, "scroll_floor_ms": 500},
+    "fast": {"delay_scale": 0.3, "human_simulation": False, "scroll_floor_ms": 150},
+}
+PLATFORM_PACING = {
+    "linkedin": "cautious",
+    "bluesky": "fast",
+}
+DEFAULT_PACING = "standard"  # Platforms not listed above
+PACING_LOW_RISK_TARGETS = {
+    "linkedin": [r"linkedin\.com/company/", r"linkedin\.com/showcase/"],
+}
+
+# Memory watchdog (see memory_watchdog.py): a long-lived browser context is
+# replaced by a fresh one, keeping its cookies and local storage, after this
+# many navigations or once the browser's processes together use this much
+# resident memory. Set either to 0 to disable that trigger.
+CONTEXT_RECYCLE_NAVIGATIONS = 150
+BROWSER_MAX_RSS_MB = 1500
+
+# Request blocking for the Playwright scrapers (see route_filters.py). We only
+# read text and counters, so images, video, fonts and ad/analytics hosts are
+# aborted on every pooled context. URLs matching a platform's allow-list
+# (regular expressions, e.g. the GraphQL/XHR endpoints the page needs) always
+# pass, as do top-level documents. A platform entry may set "types" to
+# override ROUTE_BLOCK_RESOURCE_TYPES; map it to None to disable blocking.
+ROUTE_BLOCK_RESOURCE_TYPES = ["image", "media", "font"]
+ROUTE_BLOCK_DOMAINS = [
+    "doubleclick.net",
+    "googlesyndication.com",
+    "google-analytics.com",
+    "googletagmanager.com",
+    "scorecardresearch.com",
+]
+ROUTE_BLOCK_RULES = {
+    "twitter": {
+        "allow": [r"/i/api/", r"//api\.(x|twitter)\.com/"],
+        "domains": ["ads-twitter.com", "ads-api.twitter.com", "analytics.twitter.com"],
+    },
+    "facebook": {
+        "allow": [r"/api/graphql", r"/ajax/"],
+        "domains": ["connect.facebook.net"],
+    },
+    "instagram": {
+        "allow": [r"/api/v1/", r"/graphql"],
+        "domains": [],
+    },
+    "threads": {
+        "allow": [r"/api/graphql", r"/ajax/"],
+        "domains": [],
+    },
+    "linkedin": {
+        "allow": [r"/voyager/api/"],
+        "domains": ["px.ads.linkedin.com", "snap.licdn.com"],
+    },
+}
+# Typical transfer size per blocked request, used to estimate bytes saved
+# (an aborted request never reports its real size).
+ROUTE_BLOCK_BYTE_ESTIMATES = {
+    "image": 40_000,
+    "media": 750_000,
+    "font": 35_000,
+    "script": 60_000,
+}
+DEFAULT_ROUTE_BLOCK_BYTES = 10_000
+
 # Platform settings
 SUPPORTED_PLATFORMS = [
     "facebook",
@@ -39,26 +250,39 @@ SUPPORTED_PLATFORMS = [
     "linkedin"
 ]
 
-# API Keys and Authentication (loaded from environment)
-TWITTER_API_KEY = os.getenv("TWITTER_API_KEY", "")
-TWITTER_API_SECRET = os.getenv("TWITTER_API_SECRET", "")
-TWITTER_ACCESS_TOKEN = os.getenv("TWITTER_ACCESS_TOKEN", "")
-TWITTER_ACCESS_SECRET = os.getenv("TWITTER_ACCESS_SECRET", "")
-TWITTER_BEARER_TOKEN = os.getenv("TWITTER_BEARER_TOKEN", "")
-
-FACEBOOK_ACCESS_TOKEN = os.getenv("FACEBOOK_ACCESS_TOKEN", "")
-INSTAGRAM_USERNAME = os.getenv("INSTAGRAM_USERNAME", "")
-INSTAGRAM_PASSWORD = os.getenv("INSTAGRAM_PASSWORD", "")
-YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY", "")
-LINKEDIN_EMAIL = os.getenv("LINKEDIN_EMAIL", "")
-LINKEDIN_PASSWORD = os.getenv("LINKEDIN_PASSWORD", "")
-
-# TikTok-specific settings
-# TIKTOK_PROXY: Optional HTTP/HTTPS proxy for TikTok requests (e.g., "http://proxy:port")
-# TIKTOK_API_ENDPOINT: Optional custom TikTok API hostname (defaults to rotating endpoints)
-# HTTP_PROXY: Alternative proxy setting (TIKTOK_PROXY takes precedence)
-TIKTOK_PROXY = os.getenv("TIKTOK_PROXY", "")
-TIKTOK_API_ENDPOINT = os.getenv("TIKTOK_API_ENDPOINT", "")
+# Environment-backed settings: name -> default. These are resolved lazily
+# by __getattr__ below, e.g. config.TWITTER_API_KEY.
+_ENV_SETTINGS = {
+    # API Keys and Authentication
+    "TWITTER_API_KEY": "",
+    "TWITTER_API_SECRET": "",
+    "TWITTER_ACCESS_TOKEN": "",
+    "TWITTER_ACCESS_SECRET": "",
+    "TWITTER_BEARER_TOKEN": "",
+    "FACEBOOK_ACCESS_TOKEN": "",
+    "INSTAGRAM_USERNAME": "",
+    "INSTAGRAM_PASSWORD": "",
+    "YOUTUBE_API_KEY": "",
+    "LINKEDIN_EMAIL": "",
+    "LINKEDIN_PASSWORD": "",
+
+    # TikTok-specific settings
+    # TIKTOK_PROXY: Optional HTTP/HTTPS proxy for TikTok requests (e.g., "http://proxy:port")
+    # TIKTOK_API_ENDPOINT: Optional custom TikTok API hostname (defaults to rotating endpoints)
+    # HTTP_PROXY: Alternative proxy setting (TIKTOK_PROXY takes precedence)
+    "TIKTOK_PROXY": "",
+    "TIKTOK_API_ENDPOINT": "",
+
+    # Logging
+    "LOG_LEVEL": "INFO",
+}
+
+
+def __getattr__(name):
+    if name in _ENV_SETTINGS:
+        load_env()
+        return os.getenv(name, _ENV_SETTINGS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # User agent for requests
 USER_AGENT = (
@@ -72,8 +296,7 @@ OUTPUT_FORMAT = "json"  # json, csv, or both
 SAVE_MEDIA = True  # Whether to download media files (images, videos)
 SAVE_METADATA = True  # Whether to save metadata files
 
-# Logging settings
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+# Logging settings (LOG_LEVEL is environment-backed, see _ENV_SETTINGS)
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 LOG_FILE = LOGS_DIR / "scraper.log"
 
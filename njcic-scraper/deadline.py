@@ -0,0 +1,142 @@
+"""
+Per-job deadlines for the NJCIC scrapers.
+
+The orchestrator gives every (grantee, platform) job a Deadline and passes
+it to BaseScraper.scrape. Scrapers bound their retry loops, backoff sleeps,
+subprocess timeouts and Playwright waits by the time left, so one slow or
+pathological account cannot hold a worker for longer than its budget. A job
+that runs out of time is returned with 'timed_out': True and whatever posts
+it had collected so far.
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a job has used up its time budget."""
+
+
+class Deadline:
+    """
+    A monotonic-clock deadline for one scraping job.
+
+    A Deadline created with seconds=None never expires, so scrapers can be
+    called without one (e.g. from scrape_internal.py or test scripts).
+    """
+
+    def __init__(self, seconds: Optional[float] = None):
+        """
+        Start the clock.
+
+        Args:
+            seconds: Time budget in seconds, or None for no limit
+        """
+        self.seconds = seconds
+        self.started_at = time.monotonic()
+        self.expires_at = None if seconds is None else self.started_at + seconds
+
+    @classmethod
+    def unlimited(cls) -> 'Deadline':
+        """Return a deadline that never expires."""
+        return cls(None)
+
+    @property
+    def is_limited(self) -> bool:
+        """Return True if this deadline can expire."""
+        return self.expires_at is not None
+
+    def elapsed(self) -> float:
+        """Return seconds since the clock started."""
+        return time.monotonic() - self.started_at
+
+    def remaining(self) -> Optional[float]:
+        """Return seconds left (never negative), or None if unlimited."""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Return True once the time budget is used up."""
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def check(self, doing: str = "") -> None:
+        """
+        Raise DeadlineExceeded if the deadline has passed.
+
+        Args:
+            doing: Short description of the current step, for the message
+        """
+        if self.expired:
+            suffix = f" while {doing}" if doing else ""
+            raise DeadlineExceeded(f"Job deadline of {self.seconds:g}s exceeded{suffix}")
+
+    def timeout(self, seconds: float) -> float:
+        """
+        Bound a timeout in seconds by the time left.
+
+        Args:
+            seconds: Timeout the caller would use without a deadline
+
+        Returns:
+            The smaller of seconds and the time left
+
+        Raises:
+            DeadlineExceeded: If no time is left
+        """
+        self.check()
+        remaining = self.remaining()
+        return seconds if remaining is None else min(seconds, remaining)
+
+    def timeout_ms(self, milliseconds: float) -> int:
+        """
+        Bound a Playwright timeout in milliseconds by the time left.
+
+        Args:
+            milliseconds: Timeout the caller would use without a deadline
+
+        Returns:
+            Bounded timeout in whole milliseconds (at least 1)
+
+        Raises:
+            DeadlineExceeded: If no time is left
+        """
+        return max(1, int(self.timeout(milliseconds / 1000) * 1000))
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Sleep for a backoff or pacing delay without overrunning the deadline.
+
+        If the delay would end after the deadline there is no point waiting
+        for it, so DeadlineExceeded is raised straight away.
+
+        Args:
+            seconds: Delay in seconds
+
+        Raises:
+            DeadlineExceeded: If the delay would outlast the deadline
+        """
+        remaining = self.remaining()
+        if remaining is not None and seconds >= remaining:
+            self.check()
+            raise DeadlineExceeded(
+                f"Job deadline of {self.seconds:g}s would pass during a {seconds:.1f}s wait"
+            )
+        time.sleep(seconds)
+
+    async def async_sleep(self, seconds: float) -> None:
+        """Async version of sleep() for the Playwright scrapers."""
+        remaining = self.remaining()
+        if remaining is not None and seconds >= remaining:
+            self.check()
+            raise DeadlineExceeded(
+                f"Job deadline of {self.seconds:g}s would pass during a {seconds:.1f}s wait"
+            )
+        await asyncio.sleep(seconds)
+
+    def __repr__(self) -> str:
+        if self.expires_at is None:
+            return "Deadline(unlimited)"
+        return f"Deadline({self.seconds}s, {self.remaining():.1f}s left)"
@@ -0,0 +1,461 @@
+"""
+Shared HTTP client with connection pooling and an on-disk conditional-GET cache.
+
+The website crawl for social links, the grant data download and the
+Airtable export each fetched the same resources on every run, over a fresh
+connection per request. Everything that fetches plain HTTP resources now
+goes through get_http_client():
+
+- one pooled requests.Session, so pages on the same host reuse connections
+- per-host limits: at most config.HTTP_MAX_CONNECTIONS_PER_HOST requests in
+  flight and config.HTTP_MIN_INTERVAL_PER_HOST_SECONDS between them
+- a disk cache under config.HTTP_CACHE_DIR for successful GETs. Within the
+  host's TTL (config.HTTP_CACHE_TTL_SECONDS) a cached response is used
+  without any request; after it the request carries If-None-Match /
+  If-Modified-Since, so an unchanged resource costs a 304.
+
+The async scrapers use async_session() instead, an aiohttp session on a
+connector shared by everything on the running event loop, with the same
+per-host connection limit. API responses they read are live metrics and
+are not cached.
+
+requests and aiohttp are optional: without requests the sync client falls
+back to urllib (no pooling), so stdlib-only tools can still use the cache.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+from urllib.parse import urlencode, urlparse
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+import config
+from time_accounting import measure
+
+
+logger = logging.getLogger(__name__)
+
+# Marker for "use the host's configured TTL"
+DEFAULT_TTL = object()
+
+# Response headers kept with a cached body
+CACHED_HEADERS = ['content-type', 'etag', 'last-modified']
+
+
+class HttpError(Exception):
+    """A request failed: connection error or HTTP error status (status is None for the former)."""
+
+    def __init__(self, message: str, status: Optional[int] = None, url: Optional[str] = None):
+        super().__init__(message)
+        self.status = status
+        self.url = url
+
+
+class HttpTimeout(HttpError):
+    """A request outlived its timeout."""
+
+
+class RateBudget:
+    """
+    Spaces requests evenly to a shared rate.
+
+    reserve() only does arithmetic under a threading lock, so one budget
+    works for coroutines on any event loop and for threads.
+    """
+
+    def __init__(self, per_second: float):
+        """
+        Initialize the budget.
+
+        Args:
+            per_second: Requests allowed per second (0 for no limit)
+        """
+        self.interval = 1 / per_second if per_second > 0 else 0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Claim the next request slot, returning the seconds to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+            return slot - now
+
+    def hold(self, seconds: float) -> None:
+        """Keep every request from starting for the next seconds (e.g. after a 429)."""
+        with self._lock:
+            self._next = max(self._next, time.monotonic() + seconds)
+
+
+class HttpResponse:
+    """
+    A response, fresh or from the cache.
+
+    Attributes:
+        status_code: HTTP status
+        headers: Response headers, keys lowercased
+        content: Body bytes
+        url: Final URL after redirects
+        encoding: Text encoding of the body
+        from_cache: True if the body came from the disk cache
+        revalidated: True if the server confirmed the cached body with a 304
+    """
+
+    def __init__(self, status_code: int, headers: Dict[str, str], content: bytes, url: str,
+                 encoding: Optional[str] = None, from_cache: bool = False, revalidated: bool = False):
+        self.status_code = status_code
+        self.headers = {k.lower(): v for k, v in headers.items()}
+        self.content = content
+        self.url = url
+        self.encoding = encoding or 'utf-8'
+        self.from_cache = from_cache
+        self.revalidated = revalidated
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors='replace')
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        """Raise HttpError for a 4xx or 5xx status."""
+        if not self.ok:
+            raise HttpError(f"HTTP {self.status_code} for {self.url}", self.status_code, self.url)
+
+    def __repr__(self) -> str:
+        source = ' (cached)' if self.from_cache else ''
+        return f"<HttpResponse {self.status_code} {self.url}{source}>"
+
+
+class HttpCache:
+    """GET responses on disk: one .json metadata file and one .body file per URL."""
+
+    def __init__(self, directory: Optional[Path] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Cache directory (default: config.HTTP_CACHE_DIR)
+        """
+        self.directory = Path(directory) if directory else config.HTTP_CACHE_DIR
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return self.directory / f"{key}.json", self.directory / f"{key}.body"
+
+    def load(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached entry for a URL.
+
+        Returns:
+            Metadata dict with the body under 'content' and its age in
+            seconds under 'age', or None if absent or unreadable
+        """
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            entry['content'] = body_path.read_bytes()
+            entry['age'] = (datetime.now() - datetime.fromisoformat(entry['stored_at'])).total_seconds()
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return entry
+
+    def store(self, url: str, response: HttpResponse) -> None:
+        """Atomically write a response to the cache."""
+        meta_path, body_path = self._paths(url)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = body_path.with_suffix('.tmp')
+        tmp_path.write_bytes(response.content)
+        os.replace(tmp_path, body_path)
+
+        self._write_meta(meta_path, {
+            'url': url,
+            'final_url': response.url,
+            'status': response.status_code,
+            'encoding': response.encoding,
+            'headers': {k: response.headers[k] for k in CACHED_HEADERS if k in response.headers},
+            'stored_at': datetime.now().isoformat()
+        })
+
+    def touch(self, url: str, entry: Dict[str, Any]) -> None:
+        """Restart an entry's TTL after the server confirmed it with a 304."""
+        meta = {k: v for k, v in entry.items() if k not in ('content', 'age')}
+        meta['stored_at'] = datetime.now().isoformat()
+        self._write_meta(self._paths(url)[0], meta)
+
+    @staticmethod
+    def _write_meta(path: Path, meta: Dict[str, Any]) -> None:
+        tmp_path = path.with_suffix('.jtmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, indent=2)
+        os.replace(tmp_path, path)
+
+
+class HttpClient:
+    """
+    Pooled, per-host limited and cached GET requests.
+
+    Attributes:
+        headers: Headers sent with every request
+        stats: Request counts: cache_hits (no request sent), revalidated
+            (304), downloads and bytes_downloaded
+    """
+
+    def __init__(self, cache: Optional[HttpCache] = None, headers: Optional[Dict[str, str]] = None):
+        """
+        Initialize the client.
+
+        Args:
+            cache: Disk cache (default: one in config.HTTP_CACHE_DIR)
+            headers: Headers sent with every request (default: the
+                config.USER_AGENT User-Agent)
+        """
+        self.cache = cache or HttpCache()
+        self.headers = headers if headers is not None else {'User-Agent': config.USER_AGENT}
+        self.stats = {'cache_hits': 0, 'revalidated': 0, 'downloads': 0, 'bytes_downloaded': 0}
+        self._lock = threading.Lock()
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_budgets: Dict[str, RateBudget] = {}
+
+        self.session = None
+        if requests is not None:
+            self.session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=config.HTTP_MAX_CONNECTIONS_PER_HOST)
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
+
+    @staticmethod
+    def ttl_for(url: str) -> Optional[float]:
+        """
+        Return the cache TTL for a URL from config.HTTP_CACHE_TTL_SECONDS.
+
+        The longest host suffix that matches wins; hosts not listed use
+        config.HTTP_CACHE_DEFAULT_TTL_SECONDS.
+
+        Returns:
+            Seconds a response is used without revalidating (0 = always
+            revalidate), or None if responses from the host are not cached
+        """
+        host = urlparse(url).hostname or ''
+        matches = [suffix for suffix in config.HTTP_CACHE_TTL_SECONDS
+                   if host == suffix or host.endswith('.' + suffix)]
+        if not matches:
+            return config.HTTP_CACHE_DEFAULT_TTL_SECONDS
+        return config.HTTP_CACHE_TTL_SECONDS[max(matches, key=len)]
+
+    @contextmanager
+    def _host_limit(self, url: str) -> Iterator[None]:
+        """Hold one of the host's request slots, after its minimum interval."""
+        host = (urlparse(url).hostname or '').lower()
+        with self._lock:
+            slots = self._host_slots.setdefault(
+                host, threading.BoundedSemaphore(config.HTTP_MAX_CONNECTIONS_PER_HOST))
+            interval = config.HTTP_MIN_INTERVAL_PER_HOST_SECONDS
+            budget = self._host_budgets.setdefault(host, RateBudget(1 / interval if interval else 0))
+
+        with slots:
+            wait = budget.reserve()
+            if wait > 0:
+                with measure('sleep', 'host_interval'):
+                    time.sleep(wait)
+            yield
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[name] += amount
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        ttl: Any = DEFAULT_TTL
+    ) -> HttpResponse:
+        """
+        GET a URL through the cache.
+
+        Only 200 responses are cached. Error statuses are returned, not
+        raised; call raise_for_status() on the response.
+
+        Args:
+            url: URL to fetch
+            params: Query parameters (dict or (name, value) pairs)
+            headers: Extra request headers
+            timeout: Seconds to wait (default: config.TIMEOUT)
+            ttl: Cache TTL in seconds overriding the host's (0 = always
+                revalidate, None = bypass the cache)
+
+        Returns:
+            HttpResponse; from_cache is True if no body was downloaded
+
+        Raises:
+            HttpTimeout: If the request outlives its timeout
+            HttpError: On connection errors
+        """
+        if params:
+            url = f"{url}{'&' if '?' in url else '?'}{urlencode(params, doseq=True)}"
+        if ttl is DEFAULT_TTL:
+            ttl = self.ttl_for(url)
+
+        entry = self.cache.load(url) if ttl is not None else None
+        if entry is not None and entry['age'] < ttl:
+            self._count('cache_hits')
+            return self._cached_response(entry)
+
+        request_headers = {**self.headers, **(headers or {})}
+        if entry is not None:
+            if entry['headers'].get('etag'):
+                request_headers['If-None-Match'] = entry['headers']['etag']
+            if entry['headers'].get('last-modified'):
+                request_headers['If-Modified-Since'] = entry['headers']['last-modified']
+
+        with self._host_limit(url), measure('network', 'http'):
+            response = self._send(url, request_headers, timeout or config.TIMEOUT)
+
+        if response.status_code == 304 and entry is not None:
+            self._count('revalidated')
+            self.cache.touch(url, entry)
+            return self._cached_response(entry, revalidated=True)
+
+        self._count('downloads')
+        self._count('bytes_downloaded', len(response.content))
+
+        if (ttl is not None and response.status_code == 200
+                and 'no-store' not in response.headers.get('cache-control', '')):
+            try:
+                self.cache.store(url, response)
+            except OSError as e:
+                logger.warning(f"Could not cache {url}: {e}")
+
+        return response
+
+    @staticmethod
+    def _cached_response(entry: Dict[str, Any], revalidated: bool = False) -> HttpResponse:
+        return HttpResponse(entry['status'], entry['headers'], entry['content'],
+                            entry.get('final_url') or entry['url'], entry.get('encoding'),
+                            from_cache=True, revalidated=revalidated)
+
+    def _send(self, url: str, headers: Dict[str, str], timeout: float) -> HttpResponse:
+        """Send one GET over the pooled session, or urllib without requests."""
+        if self.session is not None:
+            try:
+                response = self.session.get(url, headers=headers, timeout=timeout, allow_redirects=True)
+            except requests.exceptions.Timeout as e:
+                raise HttpTimeout(f"Timed out fetching {url}: {e}", url=url)
+            except requests.exceptions.RequestException as e:
+                raise HttpError(f"Error fetching {url}: {e}", url=url)
+
+            return HttpResponse(response.status_code, dict(response.headers), response.content,
+                                response.url, response.encoding or response.apparent_encoding)
+
+        return self._send_urllib(url, headers, timeout)
+
+    @staticmethod
+    def _send_urllib(url: str, headers: Dict[str, str], timeout: float) -> HttpResponse:
+        import socket
+        import urllib.error
+        import urllib.request
+
+        # urllib does not decompress bodies
+        headers = {k: v for k, v in headers.items() if k.lower() != 'accept-encoding'}
+        request = urllib.request.Request(url, headers=headers)
+
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                status, response_headers, content, final_url = (
+                    response.status, response.headers, response.read(), response.geturl())
+        except urllib.error.HTTPError as e:
+            status, response_headers, content, final_url = e.code, e.headers, e.read(), url
+        except (socket.timeout, TimeoutError) as e:
+            raise HttpTimeout(f"Timed out fetching {url}: {e}", url=url)
+        except (urllib.error.URLError, OSError) as e:
+            raise HttpError(f"Error fetching {url}: {e}", url=url)
+
+        return HttpResponse(status, dict(response_headers.items()), content, final_url,
+                            response_headers.get_content_charset())
+
+
+_http_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+_connectors: 'weakref.WeakKeyDictionary[Any, Any]' = weakref.WeakKeyDictionary()
+
+
+def get_http_client() -> HttpClient:
+    """Return the process-wide HTTP client."""
+    global _http_client
+
+    with _client_lock:
+        if _http_client is None:
+            _http_client = HttpClient()
+        return _http_client
+
+
+def http_client_stats() -> Dict[str, int]:
+    """Return cache hit, revalidation and download counts for the HTTP client."""
+    return dict(get_http_client().stats)
+
+
+def _shared_connector() -> Any:
+    """Return the running event loop's shared aiohttp connector."""
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    with _client_lock:
+        connector = _connectors.get(loop)
+        if connector is None or connector.closed:
+            connector = _connectors[loop] = aiohttp.TCPConnector(
+                limit_per_host=config.HTTP_MAX_CONNECTIONS_PER_HOST)
+        return connector
+
+
+@asynccontextmanager
+async def async_session(headers: Optional[Dict[str, str]] = None) -> AsyncIterator[Any]:
+    """
+    Open an aiohttp session on the event loop's shared connector.
+
+    Sessions are cheap; the connector, and with it the pooled connections
+    and the per-host limit, is shared by every session on the loop.
+
+    Args:
+        headers: Default headers for the session
+    """
+    async with aiohttp.ClientSession(connector=_shared_connector(), connector_owner=False,
+                                     headers=headers) as session:
+        yield session
+
+
+async def close_async_connector() -> None:
+    """Close the running event loop's shared connector (call before the loop ends)."""
+    import asyncio
+
+    with _client_lock:
+        connector = _connectors.pop(asyncio.get_running_loop(), None)
+    if connector is not None:
+        await connector.close()
@@ -0,0 +1,186 @@
+"""
+Historical job cost tracking for the NJCIC scraper orchestrator.
+
+Stores an exponentially weighted average of wall-clock seconds per
+(platform, canonical account URL) so that sharding and planning can weigh
+jobs by how long they actually take. Accounts with no history fall back to
+the platform average, then to config.DEFAULT_JOB_SECONDS.
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+import config
+
+
+logger = logging.getLogger(__name__)
+
+# Weight given to the newest observation in the running average
+SMOOTHING = 0.3
+
+
+def canonical_url(url: str) -> str:
+    """
+    Normalise a social media URL so the same account always maps to one key.
+
+    Lowercases the host, drops the scheme, 'www.'/'m.' prefixes, query string,
+    fragment and trailing slash, and treats twitter.com as x.com.
+
+    Args:
+        url: Social media URL (with or without scheme)
+
+    Returns:
+        Canonical 'host/path' string
+    """
+    url = url.strip()
+    if '://' not in url:
+        url = f"https://{url}"
+
+    parsed = urlparse(url)
+    host = parsed.netloc.lower()
+
+    for prefix in ('www.', 'm.', 'mobile.'):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+
+    if host == 'twitter.com':
+        host = 'x.com'
+
+    path = parsed.path.rstrip('/')
+
+    return f"{host}{path}"
+
+
+def account_key(scraper: Any, url: str) -> str:
+    """
+    Return a canonical identifier for the account behind a social URL.
+
+    Uses the platform scraper's extract_username so that different URL
+    forms for one account (www/mobile hosts, tracking parameters, /posts
+    suffixes) map to the same key.
+
+    Args:
+        scraper: Platform scraper instance (None = URL only)
+        url: Social media URL
+
+    Returns:
+        Lowercased username, or the canonical URL if none can be extracted
+    """
+    username = None
+
+    if scraper is not None:
+        try:
+            username = scraper.extract_username(url)
+        except Exception as e:
+            logger.debug(f"Could not extract username from {url}: {e}")
+
+    if username:
+        return username.strip().lstrip('@').lower()
+    return canonical_url(url)
+
+
+class JobHistory:
+    """Persistent average wall-clock time per (platform, account)."""
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Load job history from disk.
+
+        Args:
+            path: History JSON file (default: config.JOB_HISTORY_PATH)
+        """
+        self.path = Path(path) if path else config.JOB_HISTORY_PATH
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    @staticmethod
+    def key(platform: str, url: str) -> str:
+        """Build the history key for a job."""
+        return f"{platform}:{canonical_url(url)}"
+
+    def _load(self) -> None:
+        """Read history from disk, starting empty if missing or unreadable."""
+        if not self.path.exists():
+            return
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f).get('jobs', {})
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable job history {self.path}: {e}")
+            self.entries = {}
+
+    def save(self) -> None:
+        """Atomically write history to disk."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'updated_at': datetime.now().isoformat(),
+                'jobs': self.entries
+            }, f, indent=2, ensure_ascii=False)
+
+        os.replace(tmp_path, self.path)
+
+    def record(self, platform: str, url: str, seconds: float) -> None:
+        """
+        Fold one observed job duration into the running average.
+
+        Args:
+            platform: Platform name
+            url: Account URL
+            seconds: Observed wall-clock duration
+        """
+        key = self.key(platform, url)
+        entry = self.entries.get(key)
+
+        if entry is None:
+            average = seconds
+            runs = 1
+        else:
+            average = SMOOTHING * seconds + (1 - SMOOTHING) * entry['avg_seconds']
+            runs = entry.get('runs', 0) + 1
+
+        self.entries[key] = {
+            'platform': platform,
+            'avg_seconds': round(average, 2),
+            'last_seconds': round(seconds, 2),
+            'runs': runs,
+            'updated_at': datetime.now().isoformat()
+        }
+
+    def platform_average(self, platform: str) -> Optional[float]:
+        """Return the mean of recorded averages for a platform, if any."""
+        values = [
+            entry['avg_seconds']
+            for entry in self.entries.values()
+            if entry.get('platform') == platform
+        ]
+        return sum(values) / len(values) if values else None
+
+    def estimate(self, platform: str, url: str) -> float:
+        """
+        Estimate how long a job will take.
+
+        Args:
+            platform: Platform name
+            url: Account URL
+
+        Returns:
+            Estimated wall-clock seconds
+        """
+        entry = self.entries.get(self.key(platform, url))
+        if entry is not None:
+            return entry['avg_seconds']
+
+        average = self.platform_average(platform)
+        if average is not None:
+            return average
+
+        return config.DEFAULT_JOB_SECONDS.get(platform, config.DEFAULT_JOB_SECONDS_FALLBACK)
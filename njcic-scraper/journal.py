@@ -0,0 +1,166 @@
+"""
+Crash-safe run journal for the NJCIC scraper orchestrator.
+
+Every finished (grantee, platform) job is appended to a JSONL file and
+fsync'd before the orchestrator moves on, so a run that dies partway through
+can be resumed with --resume RUN_ID. Only jobs that are missing from the
+journal, or whose last recorded outcome failed, are scheduled again.
+
+Journal layout (one JSON object per line):
+    {"type": "run_start", "run_id": ..., "platforms": [...], ...}
+    {"type": "job", "grantee": ..., "platform": ..., "url": ..., "result": {...}}
+    {"type": "run_end", "run_id": ..., "finished_at": ...}
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import config
+
+
+logger = logging.getLogger(__name__)
+
+
+def new_run_id() -> str:
+    """Generate a run ID from the current local time."""
+    return datetime.now().strftime("%Y%m%d-%H%M%S")
+
+
+def journal_path(run_id: str, runs_dir: Optional[Path] = None) -> Path:
+    """Return the journal file path for a run ID."""
+    return (runs_dir or config.RUNS_DIR) / f"{run_id}.jsonl"
+
+
+class RunJournal:
+    """Append-only, fsync'd JSONL journal of job outcomes for one run."""
+
+    def __init__(self, run_id: str, runs_dir: Optional[Path] = None):
+        """
+        Open (or create) the journal for a run.
+
+        Args:
+            run_id: Identifier of the run
+            runs_dir: Directory holding journals (default: config.RUNS_DIR)
+        """
+        self.run_id = run_id
+        self.path = journal_path(run_id, runs_dir)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def exists(self) -> bool:
+        """Return True if the journal file already exists on disk."""
+        return self.path.exists()
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        """Append one record and force it to disk."""
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def start(self, **run_info: Any) -> None:
+        """
+        Record the start (or resumption) of a run.
+
+        Args:
+            **run_info: Run parameters to store (platforms, max_posts, range)
+        """
+        record = {
+            'type': 'run_start',
+            'run_id': self.run_id,
+            'started_at': datetime.now().isoformat(),
+            'resumed': self.exists(),
+        }
+        record.update(run_info)
+        self._append(record)
+
+    def record_job(
+        self,
+        grantee: str,
+        platform: str,
+        url: str,
+        result: Dict[str, Any],
+        website: Optional[str] = None
+    ) -> None:
+        """
+        Record the outcome of a finished job.
+
+        Args:
+            grantee: Grantee name
+            platform: Platform name
+            url: Social media URL that was scraped
+            result: Scraper result dictionary
+            website: Grantee website, kept so reports can be rebuilt
+        """
+        self._append({
+            'type': 'job',
+            'grantee': grantee,
+            'website': website,
+            'platform': platform,
+            'url': url,
+            'finished_at': datetime.now().isoformat(),
+            'result': {
+                'success': result.get('success', False),
+                'posts_downloaded': result.get('posts_downloaded', 0),
+                'engagement_metrics': result.get('engagement_metrics', {}),
+                'output_path': result.get('output_path', ''),
+                'error': result.get('error'),
+                'timed_out': result.get('timed_out', False),
+                'duration_seconds': result.get('duration_seconds'),
+            },
+        })
+
+    def finish(self) -> None:
+        """Record that the run completed."""
+        self._append({
+            'type': 'run_end',
+            'run_id': self.run_id,
+            'finished_at': datetime.now().isoformat(),
+        })
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over journal records in write order.
+
+        A torn final line (from a crash mid-write) is skipped with a warning.
+        """
+        if not self.path.exists():
+            return
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping unreadable journal line {line_number} in {self.path}")
+
+    def header(self) -> Optional[Dict[str, Any]]:
+        """Return the first run_start record, or None if there is none."""
+        for record in self.records():
+            if record.get('type') == 'run_start':
+                return record
+        return None
+
+    def job_outcomes(self) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """
+        Replay the journal into the latest outcome per job.
+
+        Returns:
+            Mapping of (grantee, platform) to the last job record for it
+        """
+        outcomes = {}
+
+        for record in self.records():
+            if record.get('type') == 'job':
+                outcomes[(record['grantee'], record['platform'])] = record
+
+        return outcomes
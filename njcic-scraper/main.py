@@ -13,31 +13,50 @@ Usage:
     python main.py --platforms twitter,facebook # Only scrape specific platforms
     python main.py --extract-urls               # Extract URLs before scraping
     python main.py --skip-existing              # Skip grantees with existing data
+    python main.py --concurrency bluesky=8,facebook=1  # Override per-platform limits
+    python main.py --job-timeout 300            # Give every job at most 5 minutes
+    python main.py --resume 20260105-060000     # Resume a crashed run from its journal
+    python main.py --shard 2/3                  # Run the second of three shards
+    python main.py --merge-reports a.json b.json  # Combine per-shard reports
+    python main.py --platforms bluesky --timing-imports  # Report scraper import cost
 """
 
 import argparse
-import asyncio
-import csv
 import json
 import logging
+import queue
 import sys
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Set
+from typing import Dict, List, Any, Optional, Set, Tuple
 
 import config
+from pacing import parse_pacing, set_run_pacing
+from route_filters import format_bytes
+from deadline import Deadline
+from job_history import JobHistory, account_key
+from journal import RunJournal, new_run_id
+from refresh import RefreshSchedule, load_activity
+from result_cache import ResultCache
+from selector_registry import get_selector_registry
+from time_accounting import get_time_ledger, time_accounting_stats
+from report_writer import StreamingReportWriter, write_csv_summary
+from scheduler import (
+    JobScheduler,
+    build_jobs,
+    coalesce_jobs,
+    order_longest_first,
+    parse_concurrency,
+    plan_run,
+)
+from sharding import filter_jobs_for_shard, merge_reports, owns_grantee, parse_shard
 from tqdm import tqdm
 
-# Import all scrapers
-from scrapers.twitter import TwitterScraper
-from scrapers.bluesky import BlueSkyScraper
-from scrapers.instagram_playwright import InstagramPlaywrightScraper
-from scrapers.facebook import FacebookScraper
-from scrapers.linkedin import LinkedInScraper
-from scrapers.tiktok import TikTokScraper
-from scrapers.youtube import YouTubeScraper
-from scrapers.threads import ThreadsScraper
+# Scrapers are imported on first use, so a run only pays for the
+# platforms it scrapes (Playwright, instaloader, etc.)
+from scrapers.registry import SCRAPER_REGISTRY
 
 
 # Constants - Use relative paths based on script location
@@ -46,17 +65,8 @@ GRANTEES_DATA_PATH = BASE_DIR / "data" / "grantees_with_social.json"
 SCRAPING_REPORT_PATH = BASE_DIR / "output" / "scraping_report.json"
 ENGAGEMENT_SUMMARY_PATH = BASE_DIR / "output" / "engagement_summary.csv"
 
-# Platform to scraper class mapping
-PLATFORM_SCRAPERS = {
-    'twitter': TwitterScraper,
-    'bluesky': BlueSkyScraper,
-    'instagram': InstagramPlaywrightScraper,
-    'facebook': FacebookScraper,
-    'linkedin': LinkedInScraper,
-    'tiktok': TikTokScraper,
-    'youtube': YouTubeScraper,
-    'threads': ThreadsScraper,
-}
+# Platform to scraper class mapping (lazy)
+PLATFORM_SCRAPERS = SCRAPER_REGISTRY
 
 
 class ScraperOrchestrator:
@@ -66,7 +76,15 @@ class ScraperOrchestrator:
         self,
         platforms: Optional[List[str]] = None,
         skip_existing: bool = False,
-        max_posts: int = 25
+        max_posts: int = 25,
+        concurrency: Optional[Dict[str, int]] = None,
+        run_id: Optional[str] = None,
+        resume: bool = False,
+        shard: Optional[Tuple[int, int]] = None,
+        job_timeout: Optional[float] = None,
+        due_only: bool = False,
+        force: bool = False,
+        cache_ttl: Optional[float] = None
     ):
         """
         Initialize the scraper orchestrator.
@@ -75,14 +93,51 @@ class ScraperOrchestrator:
             platforms: List of platform names to scrape (None = all platforms)
             skip_existing: Whether to skip grantees that already have data
             max_posts: Maximum posts to scrape per platform
+            concurrency: Per-platform concurrent job limits (None = config defaults)
+            run_id: Identifier for this run's journal (None = generate a new one)
+            resume: Replay the existing journal for run_id and only schedule
+                jobs that are missing or failed
+            shard: (K, N) to run only the jobs assigned to shard K of N
+            job_timeout: Deadline in seconds for every job (None = per-platform
+                config.JOB_TIMEOUT_SECONDS)
+            due_only: Only scrape accounts whose activity-based refresh
+                interval has elapsed (see refresh.py)
+            force: Ignore and invalidate cached results (see result_cache.py)
+            cache_ttl: Maximum age of a reusable cached result in seconds
+                (None = config.RESULT_CACHE_TTL_HOURS)
         """
         self.platforms = platforms or list(PLATFORM_SCRAPERS.keys())
         self.skip_existing = skip_existing
         self.max_posts = max_posts
+        self.job_timeout = job_timeout
+
+        # Activity-aware refresh tiers per account
+        self.due_only = due_only
+        self.refresh_schedule = RefreshSchedule()
+
+        # Results shared with other entry points scraping the same accounts
+        self.result_cache = ResultCache(ttl_seconds=cache_ttl, force=force)
+
+        # Job journal for crash-safe resume
+        self.run_id = run_id or new_run_id()
+        self.resume = resume
+        self.journal = RunJournal(self.run_id)
+
+        # Multi-machine sharding; each shard writes its own report files
+        self.shard = shard
+        self.job_history = JobHistory()
+        self.report_path, self.csv_path = report_paths(shard)
+        self.report_writer = StreamingReportWriter(
+            self.report_path, self.csv_path, self.platforms
+        )
 
         # Initialize logging
+        config.ensure_directories()
         self.logger = self._setup_logging()
 
+        # Job scheduler with per-platform concurrency limits
+        self.scheduler = JobScheduler(concurrency, logger=self.logger)
+
         # Statistics tracking (must be before _initialize_scrapers)
         self.stats = {
             'start_time': None,
@@ -90,12 +145,19 @@ class ScraperOrchestrator:
             'grantees_processed': 0,
             'grantees_skipped': 0,
             'grantees_failed': 0,
-            'platforms': {},
-            'errors': []
+            'jobs_resumed': 0,
+            'jobs_coalesced': 0,
+            'jobs_not_due': 0,
+            'jobs_cached': 0,
+            'grantee_results': 0,
+            'platforms': {}
         }
 
-        # Initialize scrapers
+        # Initialize scrapers. self.scrapers holds one instance per platform;
+        # concurrent jobs borrow extra instances from the idle pools.
         self.scrapers: Dict[str, Any] = {}
+        self._idle_scrapers: Dict[str, queue.Queue] = {}
+        self._scraper_lock = threading.Lock()
         self._initialize_scrapers()
 
     def _setup_logging(self) -> logging.Logger:
@@ -120,6 +182,44 @@ class ScraperOrchestrator:
 
         return logger
 
+    def _create_scraper(self, platform: str) -> Any:
+        """
+        Create a scraper instance with platform-specific parameters.
+
+        Args:
+            platform: Platform name
+
+        Returns:
+            New scraper instance
+        """
+        scraper_class = PLATFORM_SCRAPERS[platform]
+
+        if platform == 'twitter':
+            return scraper_class(
+                output_dir=config.OUTPUT_DIR,
+                max_posts=self.max_posts
+            )
+        elif platform in ['facebook', 'linkedin']:
+            return scraper_class(
+                output_dir=config.OUTPUT_DIR,
+                headless=True
+            )
+        elif platform == 'threads':
+            return scraper_class(
+                output_dir=str(config.OUTPUT_DIR),
+                headless=True,
+                timeout=30000
+            )
+        elif platform == 'instagram':
+            return scraper_class(
+                output_dir=config.OUTPUT_DIR,
+                headless=True
+            )
+        else:
+            return scraper_class(
+                output_dir=config.OUTPUT_DIR
+            )
+
     def _initialize_scrapers(self) -> None:
         """Initialize all platform scrapers."""
         self.logger.info(f"Initializing scrapers for platforms: {', '.join(self.platforms)}")
@@ -129,57 +229,63 @@ class ScraperOrchestrator:
                 self.logger.warning(f"Unknown platform: {platform}, skipping")
                 continue
 
-            try:
-                scraper_class = PLATFORM_SCRAPERS[platform]
-
-                # Initialize with platform-specific parameters
-                if platform == 'twitter':
-                    self.scrapers[platform] = scraper_class(
-                        output_dir=config.OUTPUT_DIR,
-                        max_posts=self.max_posts
-                    )
-                elif platform in ['facebook', 'linkedin']:
-                    self.scrapers[platform] = scraper_class(
-                        output_dir=config.OUTPUT_DIR,
-                        headless=True
-                    )
-                elif platform == 'threads':
-                    self.scrapers[platform] = scraper_class(
-                        output_dir=str(config.OUTPUT_DIR),
-                        headless=True,
-                        timeout=30000
-                    )
-                elif platform == 'instagram':
-                    self.scrapers[platform] = scraper_class(
-                        output_dir=config.OUTPUT_DIR,
-                        headless=True
-                    )
-                else:
-                    self.scrapers[platform] = scraper_class(
-                        output_dir=config.OUTPUT_DIR
-                    )
+            # Initialize stats for this platform
+            self.stats['platforms'][platform] = {
+                'attempted': 0,
+                'successful': 0,
+                'failed': 0,
+                'skipped': 0,
+                'timed_out': 0,
+                'total_posts': 0,
+                'total_engagement': 0
+            }
 
-                self.logger.info(f"✓ Initialized {platform} scraper")
+            try:
+                self.scrapers[platform] = self._create_scraper(platform)
+                self._idle_scrapers[platform] = queue.Queue()
+                self._idle_scrapers[platform].put(self.scrapers[platform])
 
-                # Initialize stats for this platform
-                self.stats['platforms'][platform] = {
-                    'attempted': 0,
-                    'successful': 0,
-                    'failed': 0,
-                    'skipped': 0,
-                    'total_posts': 0,
-                    'total_engagement': 0
-                }
+                self.logger.info(
+                    f"✓ Initialized {platform} scraper "
+                    f"(max {self.scheduler.limit_for(platform)} concurrent)"
+                )
 
             except Exception as e:
                 self.logger.error(f"Failed to initialize {platform} scraper: {e}")
-                self.stats['errors'].append({
+                self._record_error({
                     'type': 'scraper_init',
                     'platform': platform,
                     'error': str(e),
                     'timestamp': datetime.now().isoformat()
                 })
 
+    def _acquire_scraper(self, platform: str) -> Any:
+        """
+        Borrow an idle scraper instance for a platform, creating one if needed.
+
+        The scheduler never runs more jobs per platform than its concurrency
+        limit, so the pool never grows past that limit.
+
+        Args:
+            platform: Platform name
+
+        Returns:
+            Scraper instance reserved for the caller
+        """
+        try:
+            return self._idle_scrapers[platform].get_nowait()
+        except queue.Empty:
+            with self._scraper_lock:
+                return self._create_scraper(platform)
+
+    def _release_scraper(self, platform: str, scraper: Any) -> None:
+        """Return a borrowed scraper instance to its platform pool."""
+        self._idle_scrapers[platform].put(scraper)
+
+    def _record_error(self, error: Dict[str, Any]) -> None:
+        """Stream an error record to the report instead of keeping it in memory."""
+        self.report_writer.write_error(error)
+
     def _should_skip_grantee(self, grantee: Dict[str, Any]) -> bool:
         """
         Check if a grantee should be skipped.
@@ -227,7 +333,8 @@ class ScraperOrchestrator:
         self,
         platform: str,
         url: str,
-        grantee_name: str
+        grantee_name: str,
+        deadline: Optional[Deadline] = None
     ) -> Dict[str, Any]:
         """
         Scrape a single platform for a grantee.
@@ -236,6 +343,7 @@ class ScraperOrchestrator:
             platform: Platform name
             url: Social media URL
             grantee_name: Grantee name
+            deadline: Time budget passed through to the scraper
 
         Returns:
             Scraping result dictionary
@@ -247,14 +355,23 @@ class ScraperOrchestrator:
                 'posts_downloaded': 0
             }
 
-        scraper = self.scrapers[platform]
+        try:
+            scraper = self._acquire_scraper(platform)
+        except Exception as e:
+            self.logger.error(f"Could not create {platform} scraper for {grantee_name}: {e}")
+            return {
+                'success': False,
+                'error': str(e),
+                'posts_downloaded': 0
+            }
 
         try:
             self.logger.debug(f"Scraping {platform} for {grantee_name}: {url}")
             result = scraper.scrape(
                 url=url,
                 grantee_name=grantee_name,
-                max_posts=self.max_posts
+                max_posts=self.max_posts,
+                deadline=deadline
             )
 
             return result
@@ -267,21 +384,111 @@ class ScraperOrchestrator:
                 'posts_downloaded': 0
             }
 
-    def process_grantee(self, grantee: Dict[str, Any]) -> Dict[str, Any]:
+        finally:
+            self._release_scraper(platform, scraper)
+
+    def _account_key(self, platform: str, url: str) -> str:
         """
-        Process a single grantee across all platforms.
+        Return a canonical identifier for the account behind a social URL.
 
         Args:
-            grantee: Grantee dictionary with social media URLs
+            platform: Platform name
+            url: Social media URL
 
         Returns:
-            Results dictionary for this grantee
+            Account key from job_history.account_key
         """
-        grantee_name = grantee.get('name', 'Unknown')
-        social = grantee.get('social', {})
+        return account_key(self.scrapers.get(platform), url)
+
+    def _job_deadline(self, platform: str) -> Deadline:
+        """
+        Start the deadline for one job on a platform.
+
+        Args:
+            platform: Platform name
+
+        Returns:
+            Deadline from --job-timeout or config.JOB_TIMEOUT_SECONDS
+        """
+        return Deadline(self._job_timeout_seconds(platform))
+
+    def _job_timeout_seconds(self, platform: str) -> float:
+        """Return the per-job time budget for a platform."""
+        return self.job_timeout or config.JOB_TIMEOUT_SECONDS.get(
+            platform, config.DEFAULT_JOB_TIMEOUT_SECONDS
+        )
+
+    def _estimate_job(self, job: Dict[str, Any]) -> float:
+        """
+        Estimate a job's duration from the job history.
+
+        Args:
+            job: Job dictionary
+
+        Returns:
+            Estimated seconds, capped at the job's deadline
+        """
+        return min(
+            self.job_history.estimate(job['platform'], job['url']),
+            self._job_timeout_seconds(job['platform'])
+        )
 
-        results = {
-            'name': grantee_name,
+    def _run_job(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute a single (grantee, platform) job on a scheduler thread.
+
+        A result cached within the TTL (by this or another entry point) is
+        returned without scraping. A failed job that finished after its
+        deadline is recorded as timed_out even if the scraper did not flag
+        it itself.
+
+        Args:
+            job: Job dictionary from scheduler.build_jobs
+
+        Returns:
+            Scraping result dictionary
+        """
+        account = job.get('account') or self._account_key(job['platform'], job['url'])
+
+        cached = self.result_cache.get(job['platform'], account, self.max_posts)
+        if cached is not None:
+            self.logger.info(
+                f"Using cached {job['platform']} result for {account} from {cached['cached_at']}"
+            )
+            return cached
+
+        deadline = self._job_deadline(job['platform'])
+        result = self._scrape_platform(job['platform'], job['url'], job['grantee'], deadline)
+
+        if deadline.expired and not result.get('success') and not result.get('timed_out'):
+            result['timed_out'] = True
+            result['error'] = result.get('error') or f"Job deadline of {deadline.seconds:g}s exceeded"
+
+        result['duration_seconds'] = round(deadline.elapsed(), 2)
+
+        # Measure posting activity here, off the main thread, for refresh tiers
+        if result.get('success'):
+            try:
+                result['activity'] = load_activity(result.get('output_path'))
+            except Exception as e:
+                self.logger.debug(f"Could not measure activity for {job['url']}: {e}")
+
+        self.result_cache.put(job['platform'], account, self.max_posts, result)
+        return result
+
+    @staticmethod
+    def _new_grantee_result(grantee: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create an empty results dictionary for a grantee.
+
+        Args:
+            grantee: Grantee dictionary
+
+        Returns:
+            Results dictionary with zeroed summary
+        """
+        return {
+            'name': grantee.get('name', 'Unknown'),
             'website': grantee.get('website'),
             'platforms': {},
             'summary': {
@@ -293,6 +500,146 @@ class ScraperOrchestrator:
             }
         }
 
+    def _record_platform_result(
+        self,
+        results: Dict[str, Any],
+        platform: str,
+        url: str,
+        result: Dict[str, Any],
+        shared_with: Optional[List[str]] = None
+    ) -> None:
+        """
+        Fold one platform result into the grantee results and run statistics.
+
+        Args:
+            results: Grantee results dictionary to update
+            platform: Platform name
+            url: Social media URL that was scraped
+            result: Result dictionary returned by the scraper
+            shared_with: Other grantees whose entry came from the same scrape
+        """
+        grantee_name = results['name']
+        self.stats['platforms'][platform]['attempted'] += 1
+
+        # Update statistics
+        if result.get('success'):
+            self.stats['platforms'][platform]['successful'] += 1
+            self.stats['platforms'][platform]['total_posts'] += result.get('posts_downloaded', 0)
+
+            # Calculate engagement
+            metrics = result.get('engagement_metrics', {})
+            engagement = sum(
+                metrics.get(metric, 0)
+                for metric in config.ENGAGEMENT_METRICS
+            )
+            self.stats['platforms'][platform]['total_engagement'] += engagement
+
+            results['summary']['total_posts'] += result.get('posts_downloaded', 0)
+            results['summary']['total_engagement'] += engagement
+            results['summary']['platforms_scraped'] += 1
+
+        else:
+            self.stats['platforms'][platform]['failed'] += 1
+            results['summary']['platforms_failed'] += 1
+
+            if result.get('timed_out'):
+                self.stats['platforms'][platform]['timed_out'] += 1
+
+            # Log error
+            self._record_error({
+                'type': 'timeout' if result.get('timed_out') else 'scraping',
+                'grantee': grantee_name,
+                'platform': platform,
+                'url': url,
+                'error': result.get('error', 'Unknown error'),
+                'timestamp': datetime.now().isoformat()
+            })
+
+        # Store result
+        results['platforms'][platform] = {
+            'url': url,
+            'success': result.get('success', False),
+            'posts_downloaded': result.get('posts_downloaded', 0),
+            'engagement_metrics': result.get('engagement_metrics', {}),
+            'output_path': result.get('output_path', ''),
+            'error': result.get('error'),
+            'timed_out': result.get('timed_out', False),
+            'duration_seconds': result.get('duration_seconds')
+        }
+
+        if result.get('activity'):
+            results['platforms'][platform]['activity'] = result['activity']
+
+        if result.get('cached'):
+            results['platforms'][platform]['cached_at'] = result['cached_at']
+
+        if shared_with:
+            results['platforms'][platform]['shared_with'] = shared_with
+
+    def _order_platform_results(self, results: Dict[str, Any]) -> None:
+        """Sort a grantee's platform results into configured platform order."""
+        results['platforms'] = {
+            platform: results['platforms'][platform]
+            for platform in self.platforms
+            if platform in results['platforms']
+        }
+
+    def _replay_journal(
+        self,
+        jobs: List[Dict[str, Any]],
+        results_by_index: Dict[int, Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fold successful journaled outcomes into the results and drop their jobs.
+
+        A job is replayed only if its last journal entry succeeded for the
+        same URL; missing, failed or re-pointed jobs are scheduled again.
+
+        Args:
+            jobs: Jobs built for this run
+            results_by_index: Grantee results keyed by job grantee_index
+
+        Returns:
+            Jobs that still need to run
+        """
+        outcomes = self.journal.job_outcomes()
+        pending = []
+
+        for job in jobs:
+            record = outcomes.get((job['grantee'], job['platform']))
+
+            if record and record.get('url') == job['url'] and record['result'].get('success'):
+                self._record_platform_result(
+                    results_by_index[job['grantee_index']],
+                    job['platform'],
+                    job['url'],
+                    record['result']
+                )
+                self.stats['jobs_resumed'] += 1
+            else:
+                pending.append(job)
+
+        self.logger.info(
+            f"Resuming run {self.run_id}: {self.stats['jobs_resumed']} jobs replayed "
+            f"from journal, {len(pending)} to run"
+        )
+
+        return pending
+
+    def process_grantee(self, grantee: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Process a single grantee across all platforms, one platform at a time.
+
+        Args:
+            grantee: Grantee dictionary with social media URLs
+
+        Returns:
+            Results dictionary for this grantee
+        """
+        grantee_name = grantee.get('name', 'Unknown')
+        social = grantee.get('social', {})
+        results = self._new_grantee_result(grantee)
+
         # Process each platform
         for platform in self.platforms:
             url = social.get(platform)
@@ -301,62 +648,60 @@ class ScraperOrchestrator:
                 self.stats['platforms'][platform]['skipped'] += 1
                 continue
 
-            self.stats['platforms'][platform]['attempted'] += 1
-
             # Scrape the platform
-            result = self._scrape_platform(platform, url, grantee_name)
-
-            # Update statistics
-            if result.get('success'):
-                self.stats['platforms'][platform]['successful'] += 1
-                self.stats['platforms'][platform]['total_posts'] += result.get('posts_downloaded', 0)
-
-                # Calculate engagement
-                metrics = result.get('engagement_metrics', {})
-                engagement = sum(
-                    metrics.get(metric, 0)
-                    for metric in config.ENGAGEMENT_METRICS
-                )
-                self.stats['platforms'][platform]['total_engagement'] += engagement
+            result = self._scrape_platform(platform, url, grantee_name, self._job_deadline(platform))
+            self._record_platform_result(results, platform, url, result)
 
-                results['summary']['total_posts'] += result.get('posts_downloaded', 0)
-                results['summary']['total_engagement'] += engagement
-                results['summary']['platforms_scraped'] += 1
+        return results
 
-            else:
-                self.stats['platforms'][platform]['failed'] += 1
-                results['summary']['platforms_failed'] += 1
+    def _filter_due_jobs(
+        self,
+        jobs: List[Dict[str, Any]],
+        results_by_index: Dict[int, Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Drop jobs for accounts whose refresh interval has not elapsed.
 
-                # Log error
-                self.stats['errors'].append({
-                    'type': 'scraping',
-                    'grantee': grantee_name,
-                    'platform': platform,
-                    'url': url,
-                    'error': result.get('error', 'Unknown error'),
-                    'timestamp': datetime.now().isoformat()
-                })
+        Grantees left with nothing due and no replayed results are dropped
+        from this run's report, since there is nothing new to say about them.
 
-            # Store result
-            results['platforms'][platform] = {
-                'url': url,
-                'success': result.get('success', False),
-                'posts_downloaded': result.get('posts_downloaded', 0),
-                'engagement_metrics': result.get('engagement_metrics', {}),
-                'output_path': result.get('output_path', ''),
-                'error': result.get('error')
-            }
+        Args:
+            jobs: Jobs built for this run
+            results_by_index: Grantee results keyed by grantee_index; grantees
+                with no due accounts are removed in place
 
-        return results
+        Returns:
+            Jobs for accounts that are due
+        """
+        now = datetime.now()
+        due_jobs = [
+            job for job in jobs
+            if self.refresh_schedule.is_due(job['platform'], job['url'], now)
+        ]
+        self.stats['jobs_not_due'] = len(jobs) - len(due_jobs)
+
+        with_due = {job['grantee_index'] for job in due_jobs}
+        for index in {job['grantee_index'] for job in jobs} - with_due:
+            if not results_by_index[index]['platforms']:
+                del results_by_index[index]
+
+        self.logger.info(
+            f"Due only: {len(due_jobs)} of {len(jobs)} accounts due for refresh"
+        )
 
-    def process_all_grantees(
+        return due_jobs
+
+    def _prepare_jobs(
         self,
         grantees: List[Dict[str, Any]],
         start_idx: int = 0,
         end_idx: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> Tuple[List[Dict[str, Any]], Dict[int, Dict[str, Any]]]:
         """
-        Process all grantees in the specified range.
+        Build this run's jobs and empty grantee results.
+
+        Applies --skip-existing, --shard, --resume and --due-only, in that
+        order.
 
         Args:
             grantees: List of grantee dictionaries
@@ -364,7 +709,7 @@ class ScraperOrchestrator:
             end_idx: Ending index (None = all)
 
         Returns:
-            List of results for all processed grantees
+            Tuple of (jobs to run, grantee results keyed by grantee_index)
         """
         # Determine range
         end_idx = end_idx or len(grantees)
@@ -372,57 +717,237 @@ class ScraperOrchestrator:
 
         self.logger.info(f"Processing {len(grantees_to_process)} grantees (indices {start_idx}-{end_idx})")
 
-        results = []
+        # Filter out skipped grantees before building jobs
+        active_grantees = []
+        for grantee in grantees_to_process:
+            if self._should_skip_grantee(grantee):
+                self.stats['grantees_skipped'] += 1
+                continue
+
+            active_grantees.append(grantee)
+
+            social = grantee.get('social', {})
+            for platform in self.platforms:
+                if platform in self.stats['platforms'] and not social.get(platform):
+                    self.stats['platforms'][platform]['skipped'] += 1
+
+        jobs = [
+            job for job in build_jobs(active_grantees, self.platforms)
+            if job['platform'] in self.stats['platforms']
+        ]
+
+        results_by_index = {
+            index: self._new_grantee_result(grantee)
+            for index, grantee in enumerate(active_grantees)
+        }
+
+        if self.shard:
+            all_jobs = jobs
+            jobs = filter_jobs_for_shard(all_jobs, self.shard, self._account_key)
+
+            # Report only grantees with work on this shard; grantees with no
+            # jobs at all are reported by exactly one shard.
+            with_jobs = {job['grantee_index'] for job in all_jobs}
+            on_shard = {job['grantee_index'] for job in jobs}
+            results_by_index = {
+                index: result for index, result in results_by_index.items()
+                if index in on_shard
+                or (index not in with_jobs and owns_grantee(result['name'], self.shard))
+            }
+
+            self.logger.info(
+                f"Shard {self.shard[0]}/{self.shard[1]}: {len(jobs)} of {len(all_jobs)} jobs"
+            )
+
+        if self.resume:
+            jobs = self._replay_journal(jobs, results_by_index)
+
+        if self.due_only:
+            jobs = self._filter_due_jobs(jobs, results_by_index)
+
+        return jobs, results_by_index
+
+    def _schedule_jobs(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Coalesce jobs per account and order them longest-first.
+
+        Args:
+            jobs: Jobs from _prepare_jobs
+
+        Returns:
+            One job per account, in submission order
+        """
+        # Scrape each shared account once
+        account_jobs = coalesce_jobs(jobs, self._account_key)
+        self.stats['jobs_coalesced'] = len(jobs) - len(account_jobs)
+
+        # Start the slowest accounts first so they don't stretch the end of the run
+        return order_longest_first(account_jobs, self._estimate_job)
+
+    def plan(
+        self,
+        grantees: List[Dict[str, Any]],
+        start_idx: int = 0,
+        end_idx: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Estimate a run's duration without scraping anything.
+
+        Args:
+            grantees: List of grantee dictionaries
+            start_idx: Starting index
+            end_idx: Ending index (None = all)
+
+        Returns:
+            Plan dictionary from scheduler.plan_run, plus jobs_coalesced
+        """
+        jobs, _ = self._prepare_jobs(grantees, start_idx, end_idx)
+        account_jobs = self._schedule_jobs(jobs)
+
+        plan = plan_run(account_jobs, self._estimate_job, self.scheduler.limit_for)
+        plan['jobs_coalesced'] = self.stats['jobs_coalesced']
+        return plan
+
+    def process_all_grantees(
+        self,
+        grantees: List[Dict[str, Any]],
+        start_idx: int = 0,
+        end_idx: Optional[int] = None
+    ) -> int:
+        """
+        Process all grantees in the specified range.
+
+        Every (grantee, platform) pair becomes a job, and jobs for the same
+        account are coalesced so each account is scraped once per run. Jobs
+        are submitted longest-first by their historical duration, and the
+        scheduler runs platforms side by side within their concurrency
+        limits. Results are fanned out to every grantee sharing the account
+        on the calling thread as jobs finish, and each grantee is streamed to
+        the report writer (then dropped from memory) as soon as its last job
+        completes.
+
+        Args:
+            grantees: List of grantee dictionaries
+            start_idx: Starting index
+            end_idx: Ending index (None = all)
+
+        Returns:
+            Number of grantee results written, in completion order
+        """
+        jobs, results_by_index = self._prepare_jobs(grantees, start_idx, end_idx)
+
+        remaining_jobs = {index: 0 for index in results_by_index}
+        for job in jobs:
+            remaining_jobs[job['grantee_index']] += 1
+
+        failed_grantees: Set[int] = set()
+
+        def finish_grantee(index: int) -> None:
+            result = results_by_index.pop(index)
+            if index in failed_grantees:
+                self.stats['grantees_failed'] += 1
+            else:
+                self._order_platform_results(result)
+                self.report_writer.write_grantee(result)
+                self.stats['grantees_processed'] += 1
+                self.stats['grantee_results'] += 1
+
+        # Grantees with no URLs for the selected platforms are done already
+        for index, count in list(remaining_jobs.items()):
+            if count == 0:
+                finish_grantee(index)
+
+        account_jobs = self._schedule_jobs(jobs)
+
+        self.logger.info(
+            f"Scheduled {len(account_jobs)} jobs across {len(remaining_jobs)} grantees "
+            f"({self.stats['jobs_coalesced']} duplicate accounts coalesced)"
+        )
 
         # Process with progress bar
-        with tqdm(total=len(grantees_to_process), desc="Processing grantees") as pbar:
-            for grantee in grantees_to_process:
-                grantee_name = grantee.get('name', 'Unknown')
-                pbar.set_description(f"Processing: {grantee_name[:40]}")
-
-                # Check if should skip
-                if self._should_skip_grantee(grantee):
-                    self.stats['grantees_skipped'] += 1
-                    pbar.update(1)
-                    continue
-
-                # Process grantee
-                try:
-                    result = self.process_grantee(grantee)
-                    results.append(result)
-                    self.stats['grantees_processed'] += 1
-
-                except Exception as e:
-                    self.logger.error(f"Failed to process {grantee_name}: {e}")
-                    self.stats['grantees_failed'] += 1
-                    self.stats['errors'].append({
-                        'type': 'grantee_processing',
-                        'grantee': grantee_name,
-                        'error': str(e),
-                        'timestamp': datetime.now().isoformat()
-                    })
+        with tqdm(total=len(account_jobs), desc="Scraping jobs") as pbar:
+
+            def on_complete(account_job: Dict[str, Any], result: Dict[str, Any]) -> None:
+                members = account_job['members']
+                pbar.set_description(f"{account_job['platform']}: {account_job['grantee'][:40]}")
+
+                if result.get('cached'):
+                    # Not a new observation of the account's duration or activity
+                    self.stats['jobs_cached'] += 1
+                elif result.get('success'):
+                    self.refresh_schedule.record(
+                        account_job['platform'], account_job['url'], result.get('activity')
+                    )
+
+                if 'duration_seconds' in result and not result.get('cached'):
+                    self.job_history.record(
+                        account_job['platform'], account_job['url'], result['duration_seconds']
+                    )
+
+                for job in members:
+                    index = job['grantee_index']
+                    shared_with = [m['grantee'] for m in members if m is not job]
+
+                    try:
+                        self.journal.record_job(
+                            job['grantee'], job['platform'], job['url'], result,
+                            website=results_by_index[index].get('website')
+                        )
+                        self._record_platform_result(
+                            results_by_index[index], job['platform'], job['url'], result,
+                            shared_with=shared_with
+                        )
+                    except Exception as e:
+                        self.logger.error(f"Failed to process {job['grantee']}: {e}")
+                        failed_grantees.add(index)
+                        self._record_error({
+                            'type': 'grantee_processing',
+                            'grantee': job['grantee'],
+                            'error': str(e),
+                            'timestamp': datetime.now().isoformat()
+                        })
+
+                    remaining_jobs[index] -= 1
+                    if remaining_jobs[index] == 0:
+                        finish_grantee(index)
 
                 pbar.update(1)
 
-        return results
+            try:
+                self.scheduler.run(account_jobs, self._run_job, on_complete)
+            finally:
+                # Shards must keep sharing one history snapshot; their timings
+                # and refresh tiers are folded in when the reports are merged.
+                if not self.shard:
+                    self.job_history.save()
+                    self.refresh_schedule.save()
 
-    def generate_report(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return self.stats['grantee_results']
+
+    def generate_report(self) -> Dict[str, Any]:
         """
-        Generate comprehensive scraping report.
+        Finalize the comprehensive scraping report.
 
-        Args:
-            results: List of grantee results
+        Builds the summary header from run statistics and has the report
+        writer stream the already-written grantee results and errors behind
+        it into scraping_report.json.
 
         Returns:
-            Report dictionary
+            Report header dictionary (metadata, summary and platform stats;
+            grantee results and errors are only on disk)
         """
         self.logger.info("Generating comprehensive report...")
 
+        # Imported here so that starting a run never loads the pool's dependencies
+        from browser_pool import browser_pool_stats
+
         # Calculate duration
         duration = (self.stats['end_time'] - self.stats['start_time']).total_seconds()
 
         report = {
             'metadata': {
+                'run_id': self.run_id,
+                'shard': f"{self.shard[0]}/{self.shard[1]}" if self.shard else None,
                 'generated_at': datetime.now().isoformat(),
                 'duration_seconds': duration,
                 'duration_formatted': f"{int(duration // 3600)}h {int((duration % 3600) // 60)}m {int(duration % 60)}s",
@@ -430,15 +955,19 @@ class ScraperOrchestrator:
                 'max_posts_per_account': self.max_posts
             },
             'summary': {
-                'total_grantees_attempted': len(results),
+                'total_grantees_attempted': self.stats['grantee_results'],
                 'grantees_processed': self.stats['grantees_processed'],
                 'grantees_skipped': self.stats['grantees_skipped'],
                 'grantees_failed': self.stats['grantees_failed'],
-                'total_errors': len(self.stats['errors'])
+                'jobs_resumed': self.stats['jobs_resumed'],
+                'jobs_coalesced': self.stats['jobs_coalesced'],
+                'jobs_not_due': self.stats['jobs_not_due'],
+                'jobs_cached': self.stats['jobs_cached'],
+                'total_errors': self.report_writer.error_count
             },
             'platform_stats': {},
-            'grantee_results': results,
-            'errors': self.stats['errors']
+            'browser_pool': browser_pool_stats(),
+            'time_accounting': time_accounting_stats()
         }
 
         # Add platform statistics
@@ -448,73 +977,19 @@ class ScraperOrchestrator:
                 'successful': stats['successful'],
                 'failed': stats['failed'],
                 'skipped': stats['skipped'],
+                'timed_out': stats['timed_out'],
                 'success_rate': f"{(stats['successful'] / stats['attempted'] * 100) if stats['attempted'] > 0 else 0:.1f}%",
                 'total_posts_collected': stats['total_posts'],
                 'total_engagement': stats['total_engagement']
             }
 
         # Save to file
-        SCRAPING_REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with open(SCRAPING_REPORT_PATH, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        self.report_writer.finalize(report)
 
-        self.logger.info(f"Report saved to: {SCRAPING_REPORT_PATH}")
+        self.logger.info(f"Report saved to: {self.report_path}")
 
         return report
 
-    def generate_csv_summary(self, results: List[Dict[str, Any]]) -> None:
-        """
-        Generate CSV summary of engagement metrics.
-
-        Args:
-            results: List of grantee results
-        """
-        self.logger.info("Generating CSV engagement summary...")
-
-        # Prepare CSV data
-        csv_rows = []
-
-        for result in results:
-            row = {
-                'Grantee Name': result['name'],
-                'Website': result.get('website', ''),
-                'Total Posts': result['summary']['total_posts'],
-                'Total Engagement': result['summary']['total_engagement'],
-                'Platforms Scraped': result['summary']['platforms_scraped'],
-                'Platforms Failed': result['summary']['platforms_failed']
-            }
-
-            # Add per-platform metrics
-            for platform in self.platforms:
-                platform_data = result['platforms'].get(platform, {})
-
-                # Posts
-                row[f'{platform.capitalize()} Posts'] = platform_data.get('posts_downloaded', 0)
-
-                # Engagement
-                metrics = platform_data.get('engagement_metrics', {})
-                engagement = sum(metrics.get(m, 0) for m in config.ENGAGEMENT_METRICS)
-                row[f'{platform.capitalize()} Engagement'] = engagement
-
-                # URL
-                row[f'{platform.capitalize()} URL'] = platform_data.get('url', '')
-
-            csv_rows.append(row)
-
-        # Write CSV
-        if csv_rows:
-            ENGAGEMENT_SUMMARY_PATH.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(ENGAGEMENT_SUMMARY_PATH, 'w', newline='', encoding='utf-8') as f:
-                # Get all field names from first row
-                fieldnames = list(csv_rows[0].keys())
-
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(csv_rows)
-
-            self.logger.info(f"CSV summary saved to: {ENGAGEMENT_SUMMARY_PATH}")
-
     def run(
         self,
         grantees: List[Dict[str, Any]],
@@ -530,9 +1005,10 @@ class ScraperOrchestrator:
             end_idx: Ending index (None = all)
 
         Returns:
-            Final report dictionary
+            Final report header dictionary
         """
         self.stats['start_time'] = datetime.now()
+        get_time_ledger().start()
 
         self.logger.info("=" * 70)
         self.logger.info("NJCIC Social Media Scraper - Starting")
@@ -540,16 +1016,46 @@ class ScraperOrchestrator:
         self.logger.info(f"Platforms: {', '.join(self.platforms)}")
         self.logger.info(f"Max posts per account: {self.max_posts}")
         self.logger.info(f"Skip existing: {self.skip_existing}")
+        self.logger.info(f"Due only: {self.due_only}")
+        self.logger.info(
+            f"Result cache: {'bypassed (--force)' if self.result_cache.force else 'on'}, "
+            f"TTL {self.result_cache.ttl_seconds / 3600:g}h"
+        )
+        self.logger.info(f"Run ID: {self.run_id}{' (resuming)' if self.resume else ''}")
+        self.logger.info(f"Journal: {self.journal.path}")
+        self.logger.info(
+            "Concurrency: " + ", ".join(
+                f"{p}={self.scheduler.limit_for(p)}" for p in self.platforms
+            )
+        )
         self.logger.info("")
 
-        # Process all grantees
-        results = self.process_all_grantees(grantees, start_idx, end_idx)
+        self.journal.start(
+            platforms=self.platforms,
+            max_posts=self.max_posts,
+            start_idx=start_idx,
+            end_idx=end_idx,
+            shard=f"{self.shard[0]}/{self.shard[1]}" if self.shard else None,
+            due_only=self.due_only
+        )
+
+        # Stream results to disk as grantees finish; if the run dies, the
+        # partial NDJSON files and CSV stay behind
+        self.report_writer.open()
+        self.logger.info(f"Partial results: {self.report_writer.results_path}")
+
+        try:
+            self.process_all_grantees(grantees, start_idx, end_idx)
+        finally:
+            self.report_writer.close()
 
         self.stats['end_time'] = datetime.now()
 
-        # Generate reports
-        report = self.generate_report(results)
-        self.generate_csv_summary(results)
+        # Generate report (CSV was written row by row)
+        report = self.generate_report()
+        self.logger.info(f"CSV summary saved to: {self.csv_path}")
+
+        self.journal.finish()
 
         # Print summary
         self._print_summary(report)
@@ -566,21 +1072,239 @@ class ScraperOrchestrator:
         self.logger.info(f"Grantees processed: {report['summary']['grantees_processed']}")
         self.logger.info(f"Grantees skipped: {report['summary']['grantees_skipped']}")
         self.logger.info(f"Grantees failed: {report['summary']['grantees_failed']}")
+        if self.due_only:
+            self.logger.info(f"Accounts not yet due: {report['summary']['jobs_not_due']}")
+        self.logger.info(f"Results from cache: {report['summary']['jobs_cached']}")
         self.logger.info("")
         self.logger.info("Platform Statistics:")
 
         for platform, stats in report['platform_stats'].items():
             self.logger.info(f"  {platform.capitalize():12} - Success: {stats['successful']:3}/{stats['attempted']:3} "
-                           f"({stats['success_rate']:>5}), Posts: {stats['total_posts_collected']:4}, "
+                           f"({stats['success_rate']:>5}), Timed out: {stats['timed_out']:3}, "
+                           f"Posts: {stats['total_posts_collected']:4}, "
                            f"Engagement: {stats['total_engagement']:,}")
 
+        pool_stats = report['browser_pool']
+        if pool_stats['contexts_created']:
+            self.logger.info("")
+            self.logger.info(
+                f"Browser pool: {pool_stats['browsers_launched']} browser(s) launched, "
+                f"{pool_stats['contexts_created']} context(s) created, "
+                f"{pool_stats['contexts_reused']} scrape(s) on a warm context"
+            )
+            self.logger.info(
+                f"Memory watchdog: {pool_stats['contexts_recycled']} context(s) recycled "
+                f"({pool_stats['recycled_for_navigations']} for navigations, "
+                f"{pool_stats['recycled_for_memory']} for memory), "
+                f"peak browser RSS {pool_stats['peak_rss_mb']} MB"
+            )
+            self.logger.info(
+                f"Route filters: {pool_stats['requests_blocked']:,} request(s) blocked, "
+                f"~{format_bytes(pool_stats['bytes_saved'])} saved"
+            )
+
+        self._print_time_accounting(report['time_accounting'])
+
+        stale_selectors = get_selector_registry().stale()
+        if stale_selectors:
+            self.logger.info("")
+            self.logger.warning(f"Stale selectors ({len(stale_selectors)}), no match in their last runs:")
+            for item in stale_selectors:
+                self.logger.warning(
+                    f"  {item['platform']}/{item['purpose']}: {item['selector']} "
+                    f"(missed {item['consecutive_misses']}x, last hit {item['last_hit']})"
+                )
+
         self.logger.info("")
         self.logger.info(f"Reports saved:")
-        self.logger.info(f"  JSON: {SCRAPING_REPORT_PATH}")
-        self.logger.info(f"  CSV:  {ENGAGEMENT_SUMMARY_PATH}")
+        self.logger.info(f"  JSON: {self.report_path}")
+        self.logger.info(f"  CSV:  {self.csv_path}")
+        self.logger.info(f"  Journal: {self.journal.path}")
         self.logger.info("=" * 70)
 
 
+    def _print_time_accounting(self, timing: Dict[str, Any], top: int = 5) -> None:
+        """Log where job time went and the accounts that slept the longest."""
+        job_seconds = timing['job_seconds']
+        if not job_seconds:
+            return
+
+        def share(seconds: float) -> str:
+            return f"{format_duration(seconds)} ({seconds / job_seconds * 100:.0f}%)"
+
+        breakdown = timing['breakdown']
+        self.logger.info("")
+        self.logger.info(
+            f"Time accounting: {format_duration(job_seconds)} of job time in "
+            f"{format_duration(timing['wall_seconds'])} wall-clock, "
+            f"{format_duration(timing['process_cpu_seconds'])} process CPU"
+        )
+        self.logger.info(
+            f"  Sleep {share(breakdown['sleep'])}, network {share(breakdown['network'])}, "
+            f"browser {share(breakdown['browser'])}, cpu/other {share(breakdown['cpu'])}"
+        )
+        if timing['sleep_by_reason']:
+            self.logger.info("  Sleep by reason: " + ", ".join(
+                f"{reason} {format_duration(seconds)}"
+                for reason, seconds in timing['sleep_by_reason'].items()
+            ))
+        for entry in timing['accounts'][:top]:
+            if entry['sleep']:
+                self.logger.info(
+                    f"  {entry['platform']}/{entry['account']}: slept {format_duration(entry['sleep'])} "
+                    f"of {format_duration(entry['job_seconds'])}"
+                )
+
+
+def print_import_timings(process_start: float) -> None:
+    """
+    Print how long startup and each scraper import took.
+
+    Args:
+        process_start: time.perf_counter() value taken when main.py started
+    """
+    timings = SCRAPER_REGISTRY.import_times
+    total = sum(timings.values())
+
+    print("\nImport timing:")
+    for platform, seconds in sorted(timings.items(), key=lambda item: -item[1]):
+        print(f"  {platform:12} {seconds * 1000:8.1f} ms")
+    print(f"  {'scrapers':12} {total * 1000:8.1f} ms total")
+    print(f"  {'startup':12} {(time.perf_counter() - process_start) * 1000:8.1f} ms "
+          f"(main.py start to scrapers ready)")
+
+    skipped = [p for p in SCRAPER_REGISTRY if p not in timings]
+    if skipped:
+        print(f"  Not imported: {', '.join(skipped)}")
+    print()
+
+
+def format_duration(seconds: float) -> str:
+    """Format seconds as e.g. '2h 5m 30s'."""
+    seconds = int(round(seconds))
+    return f"{seconds // 3600}h {(seconds % 3600) // 60}m {seconds % 60}s"
+
+
+def print_plan(plan: Dict[str, Any]) -> None:
+    """
+    Print a run plan from ScraperOrchestrator.plan.
+
+    Args:
+        plan: Plan dictionary with per-platform estimates and the critical path
+    """
+    total_jobs = sum(stats['jobs'] for stats in plan['platforms'].values())
+
+    print(f"\nRun plan: {total_jobs} jobs "
+          f"({plan['jobs_coalesced']} duplicate accounts coalesced)")
+    print(f"Estimated duration: {format_duration(plan['total_seconds'])}")
+    print()
+    print(f"  {'Platform':12} {'Jobs':>5} {'Workers':>8} {'Work':>12} {'Elapsed':>12}")
+
+    for platform, stats in sorted(plan['platforms'].items(), key=lambda item: -item[1]['seconds']):
+        print(f"  {platform:12} {stats['jobs']:5} {stats['workers']:8} "
+              f"{format_duration(stats['work_seconds']):>12} "
+              f"{format_duration(stats['seconds']):>12}")
+
+    if plan['critical_path']:
+        print(f"\nCritical path ({plan['critical_platform']}, "
+              f"{len(plan['critical_path'])} jobs on one worker):")
+        for job, seconds in plan['critical_path']:
+            print(f"  {format_duration(seconds):>12}  {job['grantee'][:40]:40}  {job['url']}")
+    print()
+
+
+def report_paths(shard: Optional[Tuple[int, int]] = None) -> Tuple[Path, Path]:
+    """
+    Return the JSON report and CSV summary paths for a run.
+
+    Args:
+        shard: (K, N) for sharded runs, None for a full run
+
+    Returns:
+        Tuple of (report path, CSV path)
+    """
+    if not shard:
+        return SCRAPING_REPORT_PATH, ENGAGEMENT_SUMMARY_PATH
+
+    suffix = f"_shard{shard[0]}of{shard[1]}"
+    return (
+        SCRAPING_REPORT_PATH.with_name(f"{SCRAPING_REPORT_PATH.stem}{suffix}.json"),
+        ENGAGEMENT_SUMMARY_PATH.with_name(f"{ENGAGEMENT_SUMMARY_PATH.stem}{suffix}.csv"),
+    )
+
+
+def record_shard_history(
+    grantee_results: List[Dict[str, Any]],
+    history: JobHistory,
+    refresh_schedule: RefreshSchedule
+) -> None:
+    """
+    Fold merged shard results into the job history and refresh tiers.
+
+    Cached results are skipped, as in a live run, and an account shared by
+    several grantees is recorded once, not once per grantee row.
+
+    Args:
+        grantee_results: Merged grantee results
+        history: Job history to record durations in
+        refresh_schedule: Refresh schedule to record activity in
+    """
+    seen = set()
+    for result in grantee_results:
+        for platform, platform_data in result['platforms'].items():
+            if platform_data.get('cached'):
+                continue
+
+            key = (platform, account_key(None, platform_data['url']))
+            if key in seen:
+                continue
+            seen.add(key)
+
+            if platform_data.get('duration_seconds') is not None:
+                history.record(platform, platform_data['url'], platform_data['duration_seconds'])
+            if platform_data.get('success'):
+                refresh_schedule.record(platform, platform_data['url'], platform_data.get('activity'))
+
+
+def merge_shard_reports(report_files: List[str]) -> None:
+    """
+    Merge per-shard reports into scraping_report.json and engagement_summary.csv.
+
+    Args:
+        report_files: Paths to per-shard scraping report JSON files
+    """
+    reports = []
+    for report_file in report_files:
+        with open(report_file, 'r', encoding='utf-8') as f:
+            reports.append(json.load(f))
+
+    report = merge_reports(reports)
+
+    # Fold shard job timings and activity into the shared history and tiers
+    history = JobHistory()
+    refresh_schedule = RefreshSchedule()
+    record_shard_history(report['grantee_results'], history, refresh_schedule)
+    history.save()
+    refresh_schedule.save()
+
+    SCRAPING_REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(SCRAPING_REPORT_PATH, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    write_csv_summary(
+        report['grantee_results'],
+        report['metadata']['platforms_enabled'],
+        ENGAGEMENT_SUMMARY_PATH
+    )
+
+    print(f"Merged {len(reports)} shard reports "
+          f"({report['summary']['grantees_processed']} grantees)")
+    print(f"  JSON: {SCRAPING_REPORT_PATH}")
+    print(f"  CSV:  {ENGAGEMENT_SUMMARY_PATH}")
+    print(f"  Job history: {history.path}")
+    print(f"  Refresh state: {refresh_schedule.path}")
+
+
 def load_grantee_data() -> List[Dict[str, Any]]:
     """
     Load grantee data from JSON file.
@@ -640,6 +1364,15 @@ Examples:
   %(prog)s --platforms twitter,facebook # Only scrape Twitter and Facebook
   %(prog)s --extract-urls               # Extract URLs before scraping
   %(prog)s --skip-existing              # Skip grantees with existing data
+  %(prog)s --concurrency bluesky=8,youtube=4,facebook=1
+  %(prog)s --job-timeout 300            # Cap every job at 5 minutes
+  %(prog)s --due-only                   # Only accounts due for refresh
+  %(prog)s --pacing standard,linkedin=cautious
+  %(prog)s --plan                       # Estimate run time without scraping
+  %(prog)s --force                      # Re-scrape even if results are cached
+  %(prog)s --resume 20260105-060000     # Resume a crashed run
+  %(prog)s --shard 2/3                  # Run shard 2 of 3 on this machine
+  %(prog)s --merge-reports output/scraping_report_shard*of3.json
         """
     )
 
@@ -683,6 +1416,35 @@ Examples:
         help='Skip grantees that already have scraped data'
     )
 
+    parser.add_argument(
+        '--resume',
+        type=str,
+        metavar='RUN_ID',
+        help='Resume a previous run from its journal, re-running only missing '
+             'or failed jobs (platforms, range and max posts come from the journal)'
+    )
+
+    parser.add_argument(
+        '--shard',
+        type=str,
+        metavar='K/N',
+        help='Run only shard K of N; accounts are assigned by a stable hash, '
+             'so every machine computes the same split'
+    )
+
+    parser.add_argument(
+        '--timing-imports',
+        action='store_true',
+        help='Print how long startup and each scraper import took'
+    )
+
+    parser.add_argument(
+        '--merge-reports',
+        nargs='+',
+        metavar='FILE',
+        help='Merge per-shard report JSON files into scraping_report.json and exit'
+    )
+
     parser.add_argument(
         '--max-posts',
         type=int,
@@ -691,14 +1453,79 @@ Examples:
         help='Maximum posts to scrape per account (default: 25)'
     )
 
+    parser.add_argument(
+        '--concurrency',
+        type=str,
+        metavar='SPEC',
+        help='Per-platform concurrent job limits, e.g. bluesky=8,youtube=4 '
+             '(default: config.PLATFORM_CONCURRENCY)'
+    )
+
+    parser.add_argument(
+        '--job-timeout',
+        type=float,
+        metavar='SECONDS',
+        help='Deadline for every (grantee, platform) job; jobs that run out of '
+             'time are recorded as timed_out with their partial data '
+             '(default: config.JOB_TIMEOUT_SECONDS per platform)'
+    )
+
+    parser.add_argument(
+        '--plan',
+        action='store_true',
+        help='Print the estimated run time and critical path from job history, '
+             'then exit without scraping'
+    )
+
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Invalidate cached results and scrape every account again'
+    )
+
+    parser.add_argument(
+        '--cache-ttl',
+        type=float,
+        metavar='HOURS',
+        help='Reuse results scraped by any entry point within this many hours '
+             '(default: config.RESULT_CACHE_TTL_HOURS)'
+    )
+
+    parser.add_argument(
+        '--pacing',
+        type=str,
+        metavar='SPEC',
+        help='Pacing profile (cautious, standard, fast) for every platform and/or '
+             'per platform, e.g. fast or standard,linkedin=cautious '
+             '(default: config.PLATFORM_PACING)'
+    )
+
+    parser.add_argument(
+        '--due-only',
+        action='store_true',
+        help='Only scrape accounts due for refresh: daily for active accounts, '
+             'weekly or monthly for quieter ones (data/refresh_state.json)'
+    )
+
     return parser.parse_args()
 
 
 def main():
     """Main entry point."""
+    process_start = time.perf_counter()
+
     # Parse arguments
     args = parse_arguments()
 
+    # Merge shard reports and exit
+    if args.merge_reports:
+        try:
+            merge_shard_reports(args.merge_reports)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Error merging reports: {e}")
+            sys.exit(1)
+        return
+
     # Extract URLs if requested
     if args.extract_urls:
         extract_urls()
@@ -714,6 +1541,22 @@ def main():
         print(f"Error parsing JSON: {e}")
         sys.exit(1)
 
+    # Restore run parameters from the journal when resuming
+    if args.resume:
+        header = RunJournal(args.resume).header()
+        if header is None:
+            print(f"Error: No journal found for run {args.resume} in {config.RUNS_DIR}")
+            sys.exit(1)
+
+        print(f"Resuming run {args.resume} (started {header.get('started_at')})")
+        args.platforms = ','.join(header.get('platforms') or []) or None
+        args.max_posts = header.get('max_posts', args.max_posts)
+        args.start = header.get('start_idx', 0)
+        args.end = header.get('end_idx')
+        args.shard = header.get('shard')
+        args.due_only = header.get('due_only', False)
+        args.test = False
+
     # Parse platforms
     platforms = None
     if args.platforms:
@@ -725,6 +1568,51 @@ def main():
             print(f"Valid platforms: {', '.join(PLATFORM_SCRAPERS.keys())}")
             sys.exit(1)
 
+    # Parse concurrency limits
+    concurrency = None
+    if args.concurrency:
+        try:
+            concurrency = parse_concurrency(args.concurrency)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+
+        invalid = [p for p in concurrency if p not in PLATFORM_SCRAPERS]
+        if invalid:
+            print(f"Error: Invalid platforms in --concurrency: {', '.join(invalid)}")
+            sys.exit(1)
+
+    if args.pacing:
+        try:
+            pacing = parse_pacing(args.pacing)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+
+        invalid = [p for p in pacing if p != '*' and p not in PLATFORM_SCRAPERS]
+        if invalid:
+            print(f"Error: Invalid platforms in --pacing: {', '.join(invalid)}")
+            sys.exit(1)
+
+        set_run_pacing(pacing)
+
+    if args.job_timeout is not None and args.job_timeout <= 0:
+        print("Error: --job-timeout must be a positive number of seconds")
+        sys.exit(1)
+
+    if args.cache_ttl is not None and args.cache_ttl < 0:
+        print("Error: --cache-ttl must not be negative")
+        sys.exit(1)
+
+    # Parse shard
+    shard = None
+    if args.shard:
+        try:
+            shard = parse_shard(args.shard)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+
     # Determine range
     start_idx = args.start
     end_idx = args.end
@@ -747,9 +1635,24 @@ def main():
     orchestrator = ScraperOrchestrator(
         platforms=platforms,
         skip_existing=args.skip_existing,
-        max_posts=args.max_posts
+        max_posts=args.max_posts,
+        concurrency=concurrency,
+        run_id=args.resume,
+        resume=bool(args.resume),
+        shard=shard,
+        job_timeout=args.job_timeout,
+        due_only=args.due_only,
+        force=args.force,
+        cache_ttl=args.cache_ttl * 3600 if args.cache_ttl is not None else None
     )
 
+    if args.timing_imports:
+        print_import_timings(process_start)
+
+    if args.plan:
+        print_plan(orchestrator.plan(grantees, start_idx, end_idx))
+        return
+
     # Run scraping
     try:
         orchestrator.run(grantees, start_idx, end_idx)
@@ -757,6 +1660,7 @@ def main():
 
     except KeyboardInterrupt:
         print("\n\nScraping interrupted by user")
+        print(f"Resume with: python main.py --resume {orchestrator.run_id}")
         sys.exit(1)
     except Exception as e:
         print(f"\n\nFatal error: {e}")
@@ -0,0 +1,283 @@
+"""
+Memory watchdog for long-lived Playwright browsers.
+
+A Chromium that stays up for a whole run slowly grows as DOM, caches and
+leaked handles pile up in its contexts, and on a small box it eventually
+runs out of memory partway through. The watchdog decides when a context
+should be replaced by a fresh one:
+
+- after config.CONTEXT_RECYCLE_NAVIGATIONS main-frame navigations, or
+- when the RSS summed over this process's child processes (the Playwright
+  driver and every Chromium process) reaches config.BROWSER_MAX_RSS_MB
+
+Recycling carries the context's storage_state (cookies and local storage)
+over to its replacement, so logins survive. The pooled scrapers are
+recycled by browser_pool.py; the batch scripts that manage their own
+browser use ContextRecycler. Recycle counts and the peak RSS seen go into
+the run stats.
+
+RSS is read with psutil when it is installed and from /proc otherwise. On
+platforms with neither only the navigation limit applies. Summed RSS counts
+pages shared between Chromium processes once per process, so it overstates
+real usage; the threshold is set with that in mind.
+"""
+
+import logging
+import os
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+import config
+
+
+logger = logging.getLogger(__name__)
+
+
+def _proc_children() -> Dict[int, list]:
+    """Map each pid to its child pids from /proc."""
+    children: Dict[int, list] = {}
+
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # The command name may contain spaces and parentheses; fields after it are fixed
+        ppid = int(stat.rsplit(')', 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(entry))
+
+    return children
+
+
+def _proc_rss(pid: int) -> int:
+    """Return a process's resident set size in bytes from /proc, 0 if it has exited."""
+    try:
+        with open(f'/proc/{pid}/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def process_tree_rss(root_pid: Optional[int] = None) -> Optional[int]:
+    """
+    Sum the RSS of every descendant of a process.
+
+    Args:
+        root_pid: Process whose descendants are measured (default: this one)
+
+    Returns:
+        Total RSS in bytes, or None if it cannot be measured on this platform
+    """
+    root_pid = root_pid or os.getpid()
+
+    if psutil is not None:
+        try:
+            total = 0
+            for child in psutil.Process(root_pid).children(recursive=True):
+                try:
+                    total += child.memory_info().rss
+                except psutil.Error:
+                    pass
+            return total
+        except psutil.Error:
+            return None
+
+    if not os.path.isdir('/proc'):
+        return None
+
+    children = _proc_children()
+    total = 0
+    pending = list(children.get(root_pid, []))
+    while pending:
+        pid = pending.pop()
+        total += _proc_rss(pid)
+        pending.extend(children.get(pid, []))
+
+    return total
+
+
+class NavigationCounter:
+    """Counts main-frame navigations across all pages of a BrowserContext."""
+
+    def __init__(self, context: Any):
+        self.count = 0
+        context.on('page', self._watch)
+        for page in context.pages:
+            self._watch(page)
+
+    def _watch(self, page: Any) -> None:
+        page.on('framenavigated', lambda frame: self._navigated(page, frame))
+
+    def _navigated(self, page: Any, frame: Any) -> None:
+        if frame == page.main_frame:
+            self.count += 1
+
+
+class MemoryWatchdog:
+    """
+    Decides when a browser context should be recycled.
+
+    Attributes:
+        max_navigations: Navigations after which a context is recycled (0 disables)
+        max_rss_mb: Browser RSS in MB at which a context is recycled (0 disables)
+        stats: Counters updated in place; pass the pool's stats dict to
+            have them reported with it
+    """
+
+    def __init__(
+        self,
+        max_navigations: Optional[int] = None,
+        max_rss_mb: Optional[float] = None,
+        stats: Optional[Dict[str, Any]] = None,
+        measure: Callable[[], Optional[int]] = process_tree_rss
+    ):
+        """
+        Initialize the watchdog.
+
+        Args:
+            max_navigations: Defaults to config.CONTEXT_RECYCLE_NAVIGATIONS
+            max_rss_mb: Defaults to config.BROWSER_MAX_RSS_MB
+            stats: Dict to record recycle counts and peak RSS in
+            measure: Function returning the browser RSS in bytes
+        """
+        self.max_navigations = (config.CONTEXT_RECYCLE_NAVIGATIONS
+                                if max_navigations is None else max_navigations)
+        self.max_rss_mb = config.BROWSER_MAX_RSS_MB if max_rss_mb is None else max_rss_mb
+        self.measure = measure
+        self.stats = stats if stats is not None else {}
+        for name in ('contexts_recycled', 'recycled_for_navigations', 'recycled_for_memory'):
+            self.stats.setdefault(name, 0)
+        self.stats.setdefault('peak_rss_mb', 0)
+
+    def rss_mb(self) -> Optional[float]:
+        """Measure the browser RSS in MB and update the peak."""
+        rss = self.measure()
+        if rss is None:
+            return None
+
+        rss_mb = rss / (1024 * 1024)
+        self.stats['peak_rss_mb'] = max(self.stats['peak_rss_mb'], round(rss_mb))
+        return rss_mb
+
+    def check(self, navigations: int) -> Optional[str]:
+        """
+        Decide whether a context should be recycled.
+
+        Args:
+            navigations: Navigations the context has made since it was created
+
+        Returns:
+            'navigations' or 'memory' if it should be recycled, else None
+        """
+        if self.max_navigations and navigations >= self.max_navigations:
+            logger.info(f"Context made {navigations} navigations (limit {self.max_navigations})")
+            return 'navigations'
+
+        if self.max_rss_mb:
+            rss_mb = self.rss_mb()
+            if rss_mb is not None and rss_mb >= self.max_rss_mb:
+                logger.warning(f"Browser RSS {rss_mb:.0f} MB is over the {self.max_rss_mb:g} MB limit")
+                return 'memory'
+
+        return None
+
+    def record(self, reason: str) -> None:
+        """Count one recycle for a reason returned by check()."""
+        self.stats['contexts_recycled'] += 1
+        self.stats[f'recycled_for_{reason}'] += 1
+
+
+async def recycle_context(context: Any, context_options: Optional[Dict[str, Any]] = None) -> Any:
+    """
+    Replace a context with a fresh one on the same browser, keeping its session.
+
+    The old context is closed after its storage_state has been copied, which
+    frees its renderer processes and caches.
+
+    Args:
+        context: BrowserContext to replace
+        context_options: Keyword arguments the context was created with
+
+    Returns:
+        The new BrowserContext
+    """
+    options = dict(context_options or {})
+    options['storage_state'] = await context.storage_state()
+
+    new_context = await context.browser.new_context(**options)
+
+    try:
+        await context.close()
+    except Exception as e:
+        logger.debug(f"Error closing recycled context: {e}")
+
+    return new_context
+
+
+class ContextRecycler:
+    """
+    One context and page for a script that drives its own browser.
+
+    The batch scripts keep one page open for every grantee. Calling
+    maybe_recycle() between grantees replaces the context and page when the
+    watchdog says so; the login carries over.
+    """
+
+    def __init__(
+        self,
+        browser: Any,
+        context_options: Optional[Dict[str, Any]] = None,
+        page_setup: Optional[Callable[[Any], Awaitable[None]]] = None,
+        watchdog: Optional[MemoryWatchdog] = None
+    ):
+        """
+        Initialize the recycler.
+
+        Args:
+            browser: Playwright Browser
+            context_options: Keyword arguments for browser.new_context
+            page_setup: Coroutine function run on each new page (e.g. stealth)
+            watchdog: Watchdog deciding when to recycle
+        """
+        self.browser = browser
+        self.context_options = context_options or {}
+        self.page_setup = page_setup
+        self.watchdog = watchdog or MemoryWatchdog()
+        self.context = None
+        self.page = None
+        self.navigations: Optional[NavigationCounter] = None
+
+    async def _open_page(self) -> Any:
+        self.navigations = NavigationCounter(self.context)
+        self.page = await self.context.new_page()
+        if self.page_setup is not None:
+            await self.page_setup(self.page)
+        return self.page
+
+    async def start(self) -> Any:
+        """Create the context and its page, returning the page."""
+        self.context = await self.browser.new_context(**self.context_options)
+        return await self._open_page()
+
+    async def maybe_recycle(self) -> Any:
+        """
+        Recycle the context if the watchdog says so.
+
+        Returns:
+            The page to carry on with (a new one if recycled)
+        """
+        reason = self.watchdog.check(self.navigations.count)
+        if reason is None:
+            return self.page
+
+        self.context = await recycle_context(self.context, self.context_options)
+        self.watchdog.record(reason)
+        logger.info(f"Recycled browser context ({reason})")
+        return await self._open_page()
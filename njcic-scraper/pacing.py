@@ -0,0 +1,160 @@
+"""
+Pacing profiles for the NJCIC scrapers.
+
+Every human-like pause, login typing delay, politeness floor after a
+scroll and between-request delay used to be a literal in its scraper. A
+Pacing object now scales them together, and decides whether the optional
+human-simulation steps (random mouse movement and browsing scrolls) run at
+all. Profiles are defined in config.PACING_PROFILES:
+
+- cautious: longer pauses, for logged-in scraping of strict platforms
+- standard: the pauses the scrapers were tuned with
+- fast: short pauses and no human simulation, for public APIs and pages
+
+config.PLATFORM_PACING picks a profile per platform; a run can override it
+for all or some platforms (main.py --pacing). A target matching
+config.PACING_LOW_RISK_TARGETS, such as a public LinkedIn company page, is
+paced one profile faster than its platform.
+
+Retry backoff after errors is deliberately not scaled: it reacts to what
+the platform reports, not to how careful a run wants to be.
+"""
+
+import logging
+import random
+import re
+from typing import Any, Dict, Optional
+
+import config
+
+
+logger = logging.getLogger(__name__)
+
+# Profiles from slowest to fastest; low-risk targets move one step right
+PACING_ORDER = ['cautious', 'standard', 'fast']
+
+# Per-run overrides set by set_run_pacing(); '*' applies to every platform
+_run_overrides: Dict[str, str] = {}
+
+
+class Pacing:
+    """
+    One pacing profile.
+
+    Attributes:
+        name: Profile name
+        delay_scale: Factor applied to every pause
+        human_simulation: Whether optional human-simulation steps run
+        scroll_floor_ms: Minimum time a scroll step takes
+    """
+
+    def __init__(self, name: str, delay_scale: float = 1.0, human_simulation: bool = True,
+                 scroll_floor_ms: float = 500):
+        self.name = name
+        self.delay_scale = delay_scale
+        self.human_simulation = human_simulation
+        self.scroll_floor_ms = scroll_floor_ms
+
+    def delay(self, low: float, high: float) -> float:
+        """
+        Pick a random pause between low and high, scaled by the profile.
+
+        The result is in the unit of the bounds (seconds or milliseconds).
+        """
+        return random.uniform(low, high) * self.delay_scale
+
+    def scaled(self, value: float) -> float:
+        """Scale a fixed pause by the profile."""
+        return value * self.delay_scale
+
+    def __repr__(self) -> str:
+        return f"<Pacing {self.name} x{self.delay_scale:g}>"
+
+
+def profile(name: str) -> Pacing:
+    """
+    Build a Pacing from its config.PACING_PROFILES entry.
+
+    Raises:
+        ValueError: If there is no such profile
+    """
+    settings: Optional[Dict[str, Any]] = config.PACING_PROFILES.get(name)
+    if settings is None:
+        raise ValueError(
+            f"Unknown pacing profile '{name}' (expected one of {', '.join(config.PACING_PROFILES)})"
+        )
+    return Pacing(name, **settings)
+
+
+def is_low_risk(platform: str, url: Optional[str]) -> bool:
+    """Return True if a target URL matches one of its platform's low-risk patterns."""
+    if not url:
+        return False
+    return any(re.search(pattern, url, re.IGNORECASE)
+               for pattern in config.PACING_LOW_RISK_TARGETS.get(platform, []))
+
+
+def get_pacing(platform: str, url: Optional[str] = None) -> Pacing:
+    """
+    Return the pacing for a platform, and optionally a specific target.
+
+    Args:
+        platform: Platform name
+        url: Target URL, used to recognise low-risk targets
+
+    Returns:
+        Pacing profile
+    """
+    name = (_run_overrides.get(platform)
+            or _run_overrides.get('*')
+            or config.PLATFORM_PACING.get(platform, config.DEFAULT_PACING))
+
+    if is_low_risk(platform, url) and name in PACING_ORDER:
+        name = PACING_ORDER[min(PACING_ORDER.index(name) + 1, len(PACING_ORDER) - 1)]
+
+    return profile(name)
+
+
+def parse_pacing(spec: str) -> Dict[str, str]:
+    """
+    Parse a --pacing spec.
+
+    Args:
+        spec: A profile name for every platform (e.g. "fast"), comma-separated
+            platform=profile pairs (e.g. "instagram=cautious,bluesky=fast"),
+            or both (e.g. "standard,linkedin=cautious")
+
+    Returns:
+        Dictionary mapping platform name (or '*' for all) to profile name
+
+    Raises:
+        ValueError: If the spec is malformed or names an unknown profile
+    """
+    overrides = {}
+
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+
+        platform, _, name = part.rpartition('=')
+        platform = platform.strip().lower() or '*'
+        name = name.strip().lower()
+
+        profile(name)
+        overrides[platform] = name
+
+    return overrides
+
+
+def set_run_pacing(overrides: Dict[str, str]) -> None:
+    """
+    Override the configured pacing for this run.
+
+    Args:
+        overrides: Output of parse_pacing(); an empty dict restores config
+    """
+    _run_overrides.clear()
+    _run_overrides.update(overrides)
+    if overrides:
+        logger.info("Pacing for this run: " + ", ".join(f"{k}={v}" for k, v in overrides.items()))
@@ -0,0 +1,220 @@
+"""
+Condition-based waits for the Playwright scrapers.
+
+Fixed sleeps after every navigation, login step and scroll were most of a
+browser scrape's wall-clock time, and they were either too long (the page
+was ready after 300 ms) or too short (a slow feed needed 4 s). These helpers
+return as soon as the condition they wait for holds:
+
+- wait_for_selector: any of several selectors is attached, or a timeout
+- wait_for_network_idle: no request in flight for an idle window
+- scroll_and_wait: scroll, then wait for N new matching elements via a
+  MutationObserver (counting insertions, so virtualised feeds that drop
+  old items still register progress)
+
+A timeout is never an error: the helpers return a falsy value and the
+caller carries on with whatever has loaded. A floor_ms argument keeps a
+minimum pause where politeness towards the platform needs one.
+
+Waiting on the page is recorded in the time ledger as browser time
+(network time for wait_for_network_idle), and the floor as a deliberate
+'page_floor' sleep.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Optional, Sequence, Union
+
+try:
+    from playwright.async_api import TimeoutError as PlaywrightTimeout
+except ImportError:
+    PlaywrightTimeout = Exception
+
+from time_accounting import measure
+
+
+logger = logging.getLogger(__name__)
+
+# Minimum time per scroll step, so feeds are not paged through faster than a
+# person could
+SCROLL_FLOOR_MS = 500
+
+# Quiet period that counts as "network idle"
+NETWORK_IDLE_MS = 500
+
+# Poll interval while waiting for the network to go idle
+_POLL_SECONDS = 0.05
+
+# Attaches a MutationObserver, scrolls, and resolves with the number
+# of matching elements inserted once `count` have arrived or time runs out.
+_SCROLL_AND_WAIT_JS = """
+({selector, count, timeoutMs, scrollBy}) => new Promise(resolve => {
+    let added = 0;
+    let timer = null;
+    const observer = new MutationObserver(mutations => {
+        for (const mutation of mutations) {
+            for (const node of mutation.addedNodes) {
+                if (node.nodeType !== 1) continue;
+                if (node.matches(selector)) added += 1;
+                added += node.querySelectorAll(selector).length;
+            }
+        }
+        if (added >= count) finish();
+    });
+    const finish = () => {
+        observer.disconnect();
+        clearTimeout(timer);
+        resolve(added);
+    };
+    observer.observe(document.body, {childList: true, subtree: true});
+    timer = setTimeout(finish, timeoutMs);
+    if (scrollBy === null) {
+        window.scrollTo(0, document.body.scrollHeight);
+    } else {
+        window.scrollBy(0, scrollBy);
+    }
+})
+"""
+
+
+def _selector(selectors: Union[str, Sequence[str]]) -> str:
+    return selectors if isinstance(selectors, str) else ', '.join(selectors)
+
+
+async def _floor(started: float, floor_ms: float) -> None:
+    remaining = floor_ms / 1000 - (time.monotonic() - started)
+    if remaining > 0:
+        with measure('sleep', 'page_floor'):
+            await asyncio.sleep(remaining)
+
+
+async def wait_for_selector(
+    page: Any,
+    selectors: Union[str, Sequence[str]],
+    timeout_ms: float,
+    state: str = 'attached'
+) -> Optional[Any]:
+    """
+    Wait until any of the selectors matches.
+
+    Args:
+        page: Playwright async Page
+        selectors: Selector or list of fallback selectors (matched together)
+        timeout_ms: Maximum wait in milliseconds
+        state: Element state to wait for ('attached' or 'visible')
+
+    Returns:
+        The first matching ElementHandle, or None on timeout
+    """
+    try:
+        with measure('browser', 'wait_for_selector'):
+            return await page.wait_for_selector(_selector(selectors), timeout=timeout_ms, state=state)
+    except PlaywrightTimeout:
+        return None
+
+
+class _RequestTracker:
+    """Counts a page's in-flight requests and when traffic last changed."""
+
+    def __init__(self, page: Any):
+        self.page = page
+        self.in_flight = set()
+        self.last_activity = time.monotonic()
+        page.on('request', self._started)
+        page.on('requestfinished', self._finished)
+        page.on('requestfailed', self._finished)
+
+    def _started(self, request: Any) -> None:
+        self.in_flight.add(request)
+        self.last_activity = time.monotonic()
+
+    def _finished(self, request: Any) -> None:
+        self.in_flight.discard(request)
+        self.last_activity = time.monotonic()
+
+    def idle_for(self, idle_ms: float) -> bool:
+        return not self.in_flight and (time.monotonic() - self.last_activity) * 1000 >= idle_ms
+
+    def stop(self) -> None:
+        for event, handler in (('request', self._started),
+                               ('requestfinished', self._finished),
+                               ('requestfailed', self._finished)):
+            try:
+                self.page.remove_listener(event, handler)
+            except Exception:
+                pass
+
+
+async def wait_for_network_idle(
+    page: Any,
+    timeout_ms: float,
+    idle_ms: float = NETWORK_IDLE_MS,
+    floor_ms: float = 0
+) -> bool:
+    """
+    Wait until the page has had no request in flight for idle_ms.
+
+    Unlike wait_for_load_state('networkidle'), this works at any point,
+    e.g. after a click that triggers XHRs without a navigation.
+
+    Args:
+        page: Playwright async Page
+        timeout_ms: Maximum wait in milliseconds
+        idle_ms: Quiet period that counts as idle
+        floor_ms: Minimum time to wait even if the network is already idle
+
+    Returns:
+        True if the network went idle, False on timeout
+    """
+    started = time.monotonic()
+    tracker = _RequestTracker(page)
+
+    try:
+        with measure('network', 'network_idle'):
+            while (time.monotonic() - started) * 1000 < timeout_ms:
+                if tracker.idle_for(idle_ms):
+                    await _floor(started, floor_ms)
+                    return True
+                await asyncio.sleep(_POLL_SECONDS)
+            return False
+    finally:
+        tracker.stop()
+
+
+async def scroll_and_wait(
+    page: Any,
+    selector: str,
+    timeout_ms: float,
+    count: int = 1,
+    scroll_by: Optional[float] = None,
+    floor_ms: float = 0
+) -> int:
+    """
+    Scroll and wait for new matching elements to be inserted.
+
+    The observer is attached before the scroll runs, in the same evaluate
+    call, so no insertion is missed.
+
+    Args:
+        page: Playwright async Page
+        selector: CSS selector of the items being loaded, e.g. 'article'
+        timeout_ms: Maximum wait in milliseconds
+        count: Number of new elements to wait for
+        scroll_by: Pixels to scroll down (negative scrolls up); None
+            scrolls to the bottom of the page
+        floor_ms: Minimum time the step takes, for politeness
+
+    Returns:
+        Number of matching elements inserted (0 if none arrived in time)
+    """
+    started = time.monotonic()
+    with measure('browser', 'scroll_and_wait'):
+        added = await page.evaluate(_SCROLL_AND_WAIT_JS, {
+            'selector': selector,
+            'count': count,
+            'timeoutMs': max(0, timeout_ms),
+            'scrollBy': scroll_by,
+        })
+    await _floor(started, floor_ms)
+    return added
@@ -0,0 +1,200 @@
+"""
+Activity-aware refresh scheduling for the NJCIC scraper orchestrator.
+
+Accounts that post several times a week are refreshed daily, occasional
+posters weekly, and quiet or dormant accounts monthly. The tier comes from
+the posts saved by the account's last successful scrape, using the same
+posts_per_week / last_post figures the dashboard shows
+(scripts/generate_detailed_dashboard_data.calculate_post_frequency).
+main.py --due-only then runs only the accounts whose interval has elapsed.
+"""
+
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import config
+from job_history import JobHistory
+
+
+logger = logging.getLogger(__name__)
+
+
+def choose_tier(
+    posts_per_week: float,
+    last_post: Optional[str],
+    now: Optional[datetime] = None
+) -> str:
+    """
+    Pick a refresh tier from an account's posting activity.
+
+    Args:
+        posts_per_week: Average posts per week over the scraped posts
+        last_post: ISO timestamp of the newest scraped post, if any
+        now: Reference time (default: now)
+
+    Returns:
+        'daily', 'weekly' or 'monthly' (keys of config.REFRESH_INTERVAL_DAYS)
+    """
+    now = now or datetime.now()
+
+    if not last_post:
+        return 'monthly'
+
+    try:
+        days_since_post = (now - datetime.fromisoformat(last_post)).days
+    except (TypeError, ValueError):
+        return 'weekly'
+
+    if days_since_post >= config.REFRESH_DORMANT_AFTER_DAYS:
+        return 'monthly'
+    if posts_per_week >= config.REFRESH_ACTIVE_POSTS_PER_WEEK:
+        return 'daily'
+    if posts_per_week >= config.REFRESH_OCCASIONAL_POSTS_PER_WEEK:
+        return 'weekly'
+    return 'monthly'
+
+
+def load_activity(output_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Measure posting activity from the posts a scraper saved.
+
+    Args:
+        output_path: Platform output directory from a scrape result
+
+    Returns:
+        Dictionary with posts_per_week and last_post, or None if the
+        directory is missing
+    """
+    if not output_path or not Path(output_path).is_dir():
+        return None
+
+    # Shared with the dashboard so tiers match the published frequencies
+    from scripts.generate_detailed_dashboard_data import (
+        calculate_post_frequency,
+        load_platform_data,
+    )
+
+    posts, _ = load_platform_data(Path(output_path))
+    frequency = calculate_post_frequency([post for post in posts if post])
+
+    return {
+        'posts_per_week': frequency['posts_per_week'],
+        'last_post': frequency['last_post'],
+    }
+
+
+class RefreshSchedule:
+    """Persistent last-scraped time and refresh tier per (platform, account)."""
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Load refresh state from disk.
+
+        Args:
+            path: State JSON file (default: config.REFRESH_STATE_PATH)
+        """
+        self.path = Path(path) if path else config.REFRESH_STATE_PATH
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        """Read state from disk, starting empty if missing or unreadable."""
+        if not self.path.exists():
+            return
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f).get('accounts', {})
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable refresh state {self.path}: {e}")
+            self.entries = {}
+
+    def save(self) -> None:
+        """Atomically write state to disk."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'updated_at': datetime.now().isoformat(),
+                'accounts': self.entries
+            }, f, indent=2, ensure_ascii=False)
+
+        os.replace(tmp_path, self.path)
+
+    def record(
+        self,
+        platform: str,
+        url: str,
+        activity: Optional[Dict[str, Any]],
+        scraped_at: Optional[datetime] = None
+    ) -> str:
+        """
+        Record a successful scrape and re-tier the account.
+
+        Args:
+            platform: Platform name
+            url: Account URL
+            activity: Result of load_activity (None = no posts found)
+            scraped_at: When the scrape finished (default: now)
+
+        Returns:
+            The account's new refresh tier
+        """
+        scraped_at = scraped_at or datetime.now()
+        activity = activity or {}
+        posts_per_week = activity.get('posts_per_week') or 0
+        last_post = activity.get('last_post')
+
+        tier = choose_tier(posts_per_week, last_post, scraped_at)
+
+        self.entries[JobHistory.key(platform, url)] = {
+            'platform': platform,
+            'last_scraped': scraped_at.isoformat(),
+            'posts_per_week': posts_per_week,
+            'last_post': last_post,
+            'tier': tier
+        }
+        return tier
+
+    def next_due(self, platform: str, url: str) -> Optional[datetime]:
+        """
+        Return when an account is next due, or None if it was never scraped.
+
+        Args:
+            platform: Platform name
+            url: Account URL
+        """
+        entry = self.entries.get(JobHistory.key(platform, url))
+        if entry is None:
+            return None
+
+        days = config.REFRESH_INTERVAL_DAYS.get(entry.get('tier'), 1)
+        return datetime.fromisoformat(entry['last_scraped']) + timedelta(days=days)
+
+    def is_due(self, platform: str, url: str, now: Optional[datetime] = None) -> bool:
+        """
+        Check whether an account should be scraped on this run.
+
+        Accounts never scraped are always due. Runs are allowed to start a
+        little early (config.REFRESH_GRACE_HOURS) so a daily cron job does
+        not skip an account scraped slightly later the previous day.
+
+        Args:
+            platform: Platform name
+            url: Account URL
+            now: Reference time (default: now)
+
+        Returns:
+            True if the account's refresh interval has elapsed
+        """
+        due = self.next_due(platform, url)
+        if due is None:
+            return True
+
+        now = now or datetime.now()
+        return now + timedelta(hours=config.REFRESH_GRACE_HOURS) >= due
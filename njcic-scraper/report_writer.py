@@ -0,0 +1,257 @@
+"""
+Streaming report output for the NJCIC scraper orchestrator.
+
+Grantee results and errors are appended to NDJSON files, and a CSV row is
+appended per grantee, as soon as each grantee finishes. Nothing is held in
+memory between grantees, and a partial report is always on disk if the run
+dies. When the run completes, scraping_report.json is assembled by streaming
+the NDJSON files behind a small summary header, so existing consumers such
+as scripts/prepare_dashboard_data.py keep reading the same format.
+"""
+
+import csv
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+import config
+
+
+def csv_fieldnames(platforms: List[str]) -> List[str]:
+    """Return the engagement summary CSV columns for a set of platforms."""
+    fieldnames = [
+        'Grantee Name',
+        'Website',
+        'Total Posts',
+        'Total Engagement',
+        'Platforms Scraped',
+        'Platforms Failed'
+    ]
+
+    for platform in platforms:
+        fieldnames.extend([
+            f'{platform.capitalize()} Posts',
+            f'{platform.capitalize()} Engagement',
+            f'{platform.capitalize()} URL'
+        ])
+
+    return fieldnames
+
+
+def build_csv_row(result: Dict[str, Any], platforms: List[str]) -> Dict[str, Any]:
+    """
+    Build one engagement summary CSV row for a grantee result.
+
+    Args:
+        result: Grantee result dictionary
+        platforms: Platforms to include as columns
+
+    Returns:
+        Row dictionary keyed by csv_fieldnames
+    """
+    row = {
+        'Grantee Name': result['name'],
+        'Website': result.get('website', ''),
+        'Total Posts': result['summary']['total_posts'],
+        'Total Engagement': result['summary']['total_engagement'],
+        'Platforms Scraped': result['summary']['platforms_scraped'],
+        'Platforms Failed': result['summary']['platforms_failed']
+    }
+
+    # Add per-platform metrics
+    for platform in platforms:
+        platform_data = result['platforms'].get(platform, {})
+
+        # Posts
+        row[f'{platform.capitalize()} Posts'] = platform_data.get('posts_downloaded', 0)
+
+        # Engagement
+        metrics = platform_data.get('engagement_metrics', {})
+        engagement = sum(metrics.get(m, 0) for m in config.ENGAGEMENT_METRICS)
+        row[f'{platform.capitalize()} Engagement'] = engagement
+
+        # URL
+        row[f'{platform.capitalize()} URL'] = platform_data.get('url', '')
+
+    return row
+
+
+def write_csv_summary(
+    results: List[Dict[str, Any]],
+    platforms: List[str],
+    csv_path: Path
+) -> bool:
+    """
+    Write a complete engagement summary CSV in one pass.
+
+    Args:
+        results: List of grantee results
+        platforms: Platforms to include as columns
+        csv_path: Destination CSV file
+
+    Returns:
+        True if a file was written, False if there were no results
+    """
+    if not results:
+        return False
+
+    csv_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=csv_fieldnames(platforms))
+        writer.writeheader()
+        for result in results:
+            writer.writerow(build_csv_row(result, platforms))
+
+    return True
+
+
+def _read_ndjson(path: Path) -> Iterator[str]:
+    """Yield the non-empty lines of an NDJSON file."""
+    if not path.exists():
+        return
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield line
+
+
+class StreamingReportWriter:
+    """Writes grantee results, errors and CSV rows incrementally."""
+
+    def __init__(self, report_path: Path, csv_path: Path, platforms: List[str]):
+        """
+        Initialize the writer.
+
+        Args:
+            report_path: Final scraping report JSON path
+            csv_path: Engagement summary CSV path
+            platforms: Platforms included as CSV columns
+        """
+        self.report_path = report_path
+        self.csv_path = csv_path
+        self.platforms = platforms
+
+        # Partial outputs live next to the final report
+        self.results_path = report_path.with_name(f"{report_path.stem}.grantees.ndjson")
+        self.errors_path = report_path.with_name(f"{report_path.stem}.errors.ndjson")
+
+        self.grantee_count = 0
+        self.error_count = 0
+
+        self._results_file = None
+        self._errors_file = None
+        self._csv_file = None
+        self._csv_writer = None
+        self._pending_errors: List[Dict[str, Any]] = []
+
+    @property
+    def is_open(self) -> bool:
+        """Return True while the writer is accepting results."""
+        return self._results_file is not None
+
+    def open(self) -> None:
+        """Truncate the partial output files and write the CSV header."""
+        self.report_path.parent.mkdir(parents=True, exist_ok=True)
+        self.csv_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._results_file = open(self.results_path, 'w', encoding='utf-8')
+        self._errors_file = open(self.errors_path, 'w', encoding='utf-8')
+        self._csv_file = open(self.csv_path, 'w', newline='', encoding='utf-8')
+        self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=csv_fieldnames(self.platforms))
+        self._csv_writer.writeheader()
+        self._csv_file.flush()
+
+        # Errors recorded before the run started (e.g. scraper init)
+        for error in self._pending_errors:
+            self._errors_file.write(json.dumps(error, ensure_ascii=False) + "\n")
+        self._errors_file.flush()
+        self._pending_errors = []
+
+    def write_grantee(self, result: Dict[str, Any]) -> None:
+        """
+        Append one finished grantee to the NDJSON results and the CSV.
+
+        Args:
+            result: Grantee result dictionary
+        """
+        self._results_file.write(json.dumps(result, ensure_ascii=False) + "\n")
+        self._results_file.flush()
+
+        self._csv_writer.writerow(build_csv_row(result, self.platforms))
+        self._csv_file.flush()
+
+        self.grantee_count += 1
+
+    def write_error(self, error: Dict[str, Any]) -> None:
+        """
+        Append one error record, buffering it if the writer is not open yet.
+
+        Args:
+            error: Error dictionary
+        """
+        self.error_count += 1
+
+        if not self.is_open:
+            self._pending_errors.append(error)
+            return
+
+        self._errors_file.write(json.dumps(error, ensure_ascii=False) + "\n")
+        self._errors_file.flush()
+
+    def close(self) -> None:
+        """Close the partial output files."""
+        for f in (self._results_file, self._errors_file, self._csv_file):
+            if f is not None:
+                f.close()
+
+        self._results_file = None
+        self._errors_file = None
+        self._csv_file = None
+        self._csv_writer = None
+
+    def finalize(self, header: Dict[str, Any]) -> None:
+        """
+        Assemble the final scraping report from the header and NDJSON files.
+
+        The report is streamed to a temporary file and moved into place, so
+        readers never see a half-written scraping_report.json. The NDJSON
+        files are removed once their contents are in the report.
+
+        Args:
+            header: Top-level report sections (metadata, summary, platform_stats)
+        """
+        self.close()
+
+        tmp_path = self.report_path.with_suffix('.json.tmp')
+
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write('{\n')
+            for key, value in header.items():
+                f.write(f'  {json.dumps(key)}: ')
+                f.write(json.dumps(value, indent=2, ensure_ascii=False).replace('\n', '\n  '))
+                f.write(',\n')
+
+            for index, (key, path) in enumerate((
+                ('grantee_results', self.results_path),
+                ('errors', self.errors_path)
+            )):
+                f.write(f'  {json.dumps(key)}: [')
+                first = True
+                for line in _read_ndjson(path):
+                    f.write('\n    ' if first else ',\n    ')
+                    f.write(line)
+                    first = False
+                f.write('\n  ]' if not first else ']')
+                f.write(',\n' if index == 0 else '\n')
+
+            f.write('}\n')
+
+        os.replace(tmp_path, self.report_path)
+
+        for path in (self.results_path, self.errors_path):
+            if path.exists():
+                path.unlink()
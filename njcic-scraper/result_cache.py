@@ -0,0 +1,193 @@
+"""
+Cross-run result cache for the NJCIC scrapers.
+
+main.py, scrape_internal.py and scrape_ccm.py can all scrape the same
+accounts, sometimes on the same morning. Successful scrape results are
+stored under config.RESULT_CACHE_DIR keyed by (platform, account,
+max_posts), and any entry point asking for an account scraped within the
+TTL gets the stored result instead of repeating the browser or API work.
+Pass force=True (the --force flag) to invalidate and re-scrape.
+
+Each entry is its own JSON file, written atomically, so concurrent jobs
+and separate processes can share the cache without locking.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import config
+from job_history import account_key
+
+
+logger = logging.getLogger(__name__)
+
+
+class ResultCache:
+    """Time-limited store of successful scrape results per account."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl_seconds: Optional[float] = None,
+        force: bool = False
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for entry files (default: config.RESULT_CACHE_DIR)
+            ttl_seconds: Maximum age of a usable entry
+                (default: config.RESULT_CACHE_TTL_HOURS)
+            force: Ignore and invalidate existing entries
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else config.RESULT_CACHE_DIR
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None
+            else config.RESULT_CACHE_TTL_HOURS * 3600
+        )
+        self.force = force
+
+    @staticmethod
+    def key(platform: str, account: str, max_posts: Optional[int]) -> str:
+        """Build the cache key for an account."""
+        return f"{platform}:{account}:{max_posts}"
+
+    def _entry_path(self, key: str) -> Path:
+        """Return the file holding an entry."""
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def get(self, platform: str, account: str, max_posts: Optional[int]) -> Optional[Dict[str, Any]]:
+        """
+        Return a stored result if it is younger than the TTL.
+
+        Expired entries are deleted. With force=True every lookup misses and
+        the entry is invalidated.
+
+        Args:
+            platform: Platform name
+            account: Account key (see job_history.account_key)
+            max_posts: Post limit the result was scraped with
+
+        Returns:
+            Copy of the stored result with 'cached' and 'cached_at' set, or
+            None on a miss
+        """
+        key = self.key(platform, account, max_posts)
+        path = self._entry_path(key)
+
+        if self.force:
+            self.invalidate(platform, account, max_posts)
+            return None
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+        if entry.get('key') != key or time.time() - entry.get('stored_at', 0) > self.ttl_seconds:
+            self.invalidate(platform, account, max_posts)
+            return None
+
+        result = dict(entry['result'])
+        result['cached'] = True
+        result['cached_at'] = datetime.fromtimestamp(entry['stored_at']).isoformat()
+        return result
+
+    def put(
+        self,
+        platform: str,
+        account: str,
+        max_posts: Optional[int],
+        result: Dict[str, Any]
+    ) -> bool:
+        """
+        Store a result if it succeeded.
+
+        Args:
+            platform: Platform name
+            account: Account key (see job_history.account_key)
+            max_posts: Post limit the result was scraped with
+            result: Result dictionary returned by the scraper
+
+        Returns:
+            True if the result was stored
+        """
+        if not result.get('success') or result.get('cached'):
+            return False
+
+        key = self.key(platform, account, max_posts)
+        path = self._entry_path(key)
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'key': key,
+                    'stored_at': time.time(),
+                    'result': result
+                }, f, ensure_ascii=False, default=str)
+
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not cache {key}: {e}")
+            return False
+
+        return True
+
+    def invalidate(self, platform: str, account: str, max_posts: Optional[int]) -> None:
+        """Delete the entry for an account, if any."""
+        try:
+            self._entry_path(self.key(platform, account, max_posts)).unlink()
+        except FileNotFoundError:
+            pass
+
+    def scrape(
+        self,
+        platform: str,
+        scraper: Any,
+        url: str,
+        grantee_name: str,
+        max_posts: Optional[int] = None,
+        **scrape_kwargs: Any
+    ) -> Dict[str, Any]:
+        """
+        Scrape an account through the cache.
+
+        A cached result is returned without calling the scraper. The output
+        files it points to are those of the run that stored it, which may
+        belong to another grantee or entry point.
+
+        Args:
+            platform: Platform name
+            scraper: Platform scraper instance
+            url: Social media URL
+            grantee_name: Name of the grantee organization
+            max_posts: Maximum posts to scrape
+            **scrape_kwargs: Extra arguments for scraper.scrape
+
+        Returns:
+            Scraping result dictionary
+        """
+        account = account_key(scraper, url)
+
+        cached = self.get(platform, account, max_posts)
+        if cached is not None:
+            logger.info(f"Using cached {platform} result for {account} from {cached['cached_at']}")
+            return cached
+
+        result = scraper.scrape(url, grantee_name, max_posts=max_posts, **scrape_kwargs)
+        self.put(platform, account, max_posts, result)
+        return result
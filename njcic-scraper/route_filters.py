@@ -0,0 +1,151 @@
+"""
+Request-blocking route filters for the Playwright scrapers.
+
+The browser scrapers only read text and counters, yet every profile visit
+used to download its images, video, fonts and ad scripts. A RouteFilter is
+installed on each pooled BrowserContext (see browser_pool.py) and aborts
+those requests, so pages load and scroll faster and use less bandwidth and
+memory. The rules per platform live in config.ROUTE_BLOCK_RULES; URLs on a
+platform's allow-list always go through, so the XHRs a page needs keep
+working.
+
+Aborted requests never report their size, so bytes saved are estimated per
+resource type from config.ROUTE_BLOCK_BYTE_ESTIMATES.
+"""
+
+import logging
+import re
+from typing import Any, Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+import config
+
+
+logger = logging.getLogger(__name__)
+
+def _empty_stats() -> Dict[str, Any]:
+    return {'requests_blocked': 0, 'bytes_saved': 0, 'blocked_by_type': {}}
+
+
+class RouteFilter:
+    """Aborts unneeded requests for one platform and counts what it saved."""
+
+    def __init__(
+        self,
+        platform: str,
+        block_types: Iterable[str] = (),
+        block_domains: Iterable[str] = (),
+        allow: Iterable[str] = (),
+        totals: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize the filter.
+
+        Args:
+            platform: Platform name (for logging)
+            block_types: Playwright resource types to abort, e.g. "image"
+            block_domains: Hosts to abort, matched with their subdomains
+            allow: Regular expressions for URLs that must never be blocked
+            totals: Optional stats dictionary (e.g. a pool's) that is also
+                updated on every block
+        """
+        self.platform = platform
+        self.block_types = frozenset(block_types)
+        self.block_domains = tuple(domain.lower().lstrip('.') for domain in block_domains)
+        self.allow = [re.compile(pattern) for pattern in allow]
+        self.totals = totals
+        self.stats = _empty_stats()
+
+    @classmethod
+    def for_platform(cls, platform: str, totals: Optional[Dict[str, Any]] = None) -> Optional['RouteFilter']:
+        """
+        Build a platform's filter from config.
+
+        Args:
+            platform: Platform name
+            totals: Optional stats dictionary also updated on every block
+
+        Returns:
+            RouteFilter, or None if blocking is disabled for the platform
+        """
+        rules = config.ROUTE_BLOCK_RULES.get(platform, {})
+        if rules is None:
+            return None
+
+        return cls(
+            platform,
+            block_types=rules.get('types', config.ROUTE_BLOCK_RESOURCE_TYPES),
+            block_domains=list(config.ROUTE_BLOCK_DOMAINS) + list(rules.get('domains', [])),
+            allow=rules.get('allow', []),
+            totals=totals
+        )
+
+    def _blocked_domain(self, url: str) -> bool:
+        host = (urlparse(url).hostname or '').lower()
+        return any(host == domain or host.endswith('.' + domain) for domain in self.block_domains)
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        """
+        Decide whether a request can be aborted.
+
+        Documents and allow-listed URLs always pass; otherwise a request is
+        blocked if its resource type or host is on the block lists.
+
+        Args:
+            url: Request URL
+            resource_type: Playwright resource type of the request
+
+        Returns:
+            True if the request should be aborted
+        """
+        if resource_type == 'document' or url.startswith('data:'):
+            return False
+
+        if any(pattern.search(url) for pattern in self.allow):
+            return False
+
+        return resource_type in self.block_types or self._blocked_domain(url)
+
+    def _record(self, resource_type: str) -> None:
+        """Count one blocked request in this filter's stats and the totals."""
+        size = config.ROUTE_BLOCK_BYTE_ESTIMATES.get(resource_type, config.DEFAULT_ROUTE_BLOCK_BYTES)
+
+        for stats in (self.stats, self.totals):
+            if stats is None:
+                continue
+            stats['requests_blocked'] = stats.get('requests_blocked', 0) + 1
+            stats['bytes_saved'] = stats.get('bytes_saved', 0) + size
+            by_type = stats.setdefault('blocked_by_type', {})
+            by_type[resource_type] = by_type.get(resource_type, 0) + 1
+
+    def _decide(self, route: Any) -> bool:
+        request = route.request
+        if self.should_block(request.url, request.resource_type):
+            self._record(request.resource_type)
+            return True
+        return False
+
+    async def handle(self, route: Any) -> None:
+        """Route handler aborting or continuing each request."""
+        try:
+            if self._decide(route):
+                await route.abort()
+            else:
+                await route.continue_()
+        except Exception as e:
+            # The page may have navigated away or closed mid-request
+            logger.debug(f"{self.platform} route handler error: {e}")
+
+    async def install(self, context: Any) -> None:
+        """Route every request of a BrowserContext through the filter."""
+        await context.route("**/*", self.handle)
+
+
+
+def format_bytes(size: float) -> str:
+    """Format a byte count as a short human-readable string, e.g. "12.3 MB"."""
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
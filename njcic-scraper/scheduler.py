@@ -0,0 +1,289 @@
+"""
+Concurrent job scheduler for the NJCIC scraper orchestrator.
+
+Expands grantees into (grantee, platform) jobs and runs them on one thread
+pool per platform, so a slow browser or yt-dlp scrape on one platform never
+holds up API calls on another. Each platform pool is capped by its own
+concurrency limit (see config.PLATFORM_CONCURRENCY).
+
+Jobs are ordered longest-first by their historical duration so the slowest
+accounts start early instead of stretching the end of the run, and
+plan_run() simulates the pools to estimate the run's length up front.
+"""
+
+import heapq
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import config
+
+
+def parse_concurrency(spec: str) -> Dict[str, int]:
+    """
+    Parse a per-platform concurrency spec.
+
+    Args:
+        spec: Comma-separated platform=limit pairs (e.g. "bluesky=8,youtube=4")
+
+    Returns:
+        Dictionary mapping platform name to concurrency limit
+
+    Raises:
+        ValueError: If the spec is malformed or a limit is not a positive integer
+    """
+    limits = {}
+
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+
+        if '=' not in part:
+            raise ValueError(f"Invalid concurrency entry '{part}' (expected platform=N)")
+
+        platform, value = part.split('=', 1)
+        platform = platform.strip().lower()
+
+        try:
+            limit = int(value)
+        except ValueError:
+            raise ValueError(f"Invalid concurrency limit for {platform}: {value}")
+
+        if limit < 1:
+            raise ValueError(f"Concurrency limit for {platform} must be at least 1")
+
+        limits[platform] = limit
+
+    return limits
+
+
+def build_jobs(
+    grantees: Iterable[Dict[str, Any]],
+    platforms: List[str]
+) -> List[Dict[str, Any]]:
+    """
+    Expand grantees into one job per (grantee, platform) with a URL.
+
+    Args:
+        grantees: Grantee dictionaries with a 'social' mapping
+        platforms: Platforms to schedule, in priority order
+
+    Returns:
+        List of job dictionaries in grantee order
+    """
+    jobs = []
+
+    for index, grantee in enumerate(grantees):
+        social = grantee.get('social', {})
+        for platform in platforms:
+            url = social.get(platform)
+            if not url:
+                continue
+
+            jobs.append({
+                'grantee_index': index,
+                'grantee': grantee.get('name', 'Unknown'),
+                'platform': platform,
+                'url': url,
+            })
+
+    return jobs
+
+
+def coalesce_jobs(
+    jobs: List[Dict[str, Any]],
+    account_key: Callable[[str, str], str]
+) -> List[Dict[str, Any]]:
+    """
+    Merge jobs that point at the same account into one job per account.
+
+    Grantees that share a parent organisation often list the same social
+    accounts. Each merged job is the first grantee's job plus an 'account'
+    key and a 'members' list holding every original job for that account,
+    so its result can be fanned back out to all of them.
+
+    Args:
+        jobs: Jobs from build_jobs
+        account_key: Function of (platform, url) returning a canonical
+            account identifier
+
+    Returns:
+        One job per (platform, account), in order of first appearance
+    """
+    accounts: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    for job in jobs:
+        key = (job['platform'], account_key(job['platform'], job['url']))
+
+        if key in accounts:
+            accounts[key]['members'].append(job)
+        else:
+            accounts[key] = dict(job, account=key[1], members=[job])
+
+    return list(accounts.values())
+
+
+def order_longest_first(
+    jobs: List[Dict[str, Any]],
+    estimate: Callable[[Dict[str, Any]], float]
+) -> List[Dict[str, Any]]:
+    """
+    Order jobs by estimated duration, longest first.
+
+    Each platform pool takes its jobs in list order, so this gives every
+    pool a longest-processing-time-first schedule. Ties keep their original
+    order.
+
+    Args:
+        jobs: Jobs to order
+        estimate: Function returning a job's estimated seconds
+
+    Returns:
+        New list of jobs, longest first
+    """
+    return sorted(jobs, key=estimate, reverse=True)
+
+
+def plan_run(
+    jobs: List[Dict[str, Any]],
+    estimate: Callable[[Dict[str, Any]], float],
+    limit_for: Callable[[str], int]
+) -> Dict[str, Any]:
+    """
+    Simulate the per-platform pools to estimate how long a run will take.
+
+    Jobs are assigned in list order to whichever worker of their platform's
+    pool frees up first, as the thread pools do. Platforms run side by side,
+    so the run takes as long as the slowest platform.
+
+    Args:
+        jobs: Jobs in the order they will be submitted
+        estimate: Function returning a job's estimated seconds
+        limit_for: Function returning a platform's concurrency limit
+
+    Returns:
+        Dictionary with total_seconds, per-platform estimates (jobs, workers,
+        work_seconds, seconds), critical_platform and critical_path (the
+        jobs and estimates on the worker that finishes last)
+    """
+    workers: Dict[str, List[Tuple[float, int, List[Tuple[Dict[str, Any], float]]]]] = {}
+
+    for job in jobs:
+        platform = job['platform']
+
+        if platform not in workers:
+            workers[platform] = [(0.0, slot, []) for slot in range(limit_for(platform))]
+
+        finish, slot, assigned = heapq.heappop(workers[platform])
+        seconds = estimate(job)
+        assigned.append((job, seconds))
+        heapq.heappush(workers[platform], (finish + seconds, slot, assigned))
+
+    plan = {
+        'total_seconds': 0.0,
+        'platforms': {},
+        'critical_platform': None,
+        'critical_path': []
+    }
+
+    for platform, pool in workers.items():
+        finish, _, assigned = max(pool, key=lambda worker: worker[0])
+
+        plan['platforms'][platform] = {
+            'jobs': sum(len(worker[2]) for worker in pool),
+            'workers': len(pool),
+            'work_seconds': sum(worker[0] for worker in pool),
+            'seconds': finish
+        }
+
+        if finish > plan['total_seconds']:
+            plan['total_seconds'] = finish
+            plan['critical_platform'] = platform
+            plan['critical_path'] = assigned
+
+    return plan
+
+
+class JobScheduler:
+    """Runs scraping jobs concurrently with a concurrency cap per platform."""
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, int]] = None,
+        default_limit: int = config.DEFAULT_PLATFORM_CONCURRENCY,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            limits: Platform to maximum concurrent jobs (None = config defaults)
+            default_limit: Limit for platforms not listed in limits
+            logger: Logger for scheduler messages
+        """
+        self.limits = dict(config.PLATFORM_CONCURRENCY)
+        if limits:
+            self.limits.update(limits)
+        self.default_limit = default_limit
+        self.logger = logger or logging.getLogger(__name__)
+
+    def limit_for(self, platform: str) -> int:
+        """Return the concurrency limit for a platform."""
+        return max(1, self.limits.get(platform, self.default_limit))
+
+    def run(
+        self,
+        jobs: List[Dict[str, Any]],
+        worker: Callable[[Dict[str, Any]], Dict[str, Any]],
+        on_complete: Callable[[Dict[str, Any], Dict[str, Any]], None]
+    ) -> None:
+        """
+        Run all jobs and report each result as it finishes.
+
+        Jobs are submitted to their platform's pool in list order. The
+        on_complete callback always runs on the calling thread, so callers
+        can update shared statistics without locking.
+
+        Args:
+            jobs: Job dictionaries (must contain 'platform')
+            worker: Function that executes one job and returns its result
+            on_complete: Callback receiving (job, result) for every job
+        """
+        executors: Dict[str, ThreadPoolExecutor] = {}
+        futures = {}
+
+        try:
+            for job in jobs:
+                platform = job['platform']
+
+                if platform not in executors:
+                    limit = self.limit_for(platform)
+                    self.logger.debug(f"Starting {platform} pool with {limit} worker(s)")
+                    executors[platform] = ThreadPoolExecutor(
+                        max_workers=limit,
+                        thread_name_prefix=f"scrape-{platform}"
+                    )
+
+                futures[executors[platform].submit(worker, job)] = job
+
+            for future in as_completed(futures):
+                job = futures[future]
+
+                try:
+                    result = future.result()
+                except Exception as e:
+                    self.logger.error(
+                        f"Job {job['platform']} for {job.get('grantee', 'Unknown')} raised: {e}"
+                    )
+                    result = {
+                        'success': False,
+                        'error': str(e),
+                        'posts_downloaded': 0
+                    }
+
+                on_complete(job, result)
+
+        finally:
+            for executor in executors.values():
+                executor.shutdown(wait=True, cancel_futures=True)
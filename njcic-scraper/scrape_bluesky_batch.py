@@ -2,16 +2,26 @@
 """
 Automated Bluesky scraper for all NJCIC grantees.
 Uses public AT Protocol API - no login required.
+
+Profiles are fetched 25 at a time through getProfiles and author feeds are
+paged for many accounts at once, all under the shared Bluesky rate budget
+(see bluesky_client.py). Feeds are read by DID, taken from the profiles or
+the on-disk DID cache.
 """
 
 import sys
 import json
 import time
 import re
-import requests
+import asyncio
+import aiohttp
 from pathlib import Path
 from datetime import datetime
 
+import config
+from bluesky_client import BlueskyClient, get_did_cache
+from http_client import async_session, close_async_connector
+
 # Load grantee data
 GRANTEES_DIR = Path(__file__).parent.parent / "dashboard" / "data" / "grantees"
 OUTPUT_DIR = Path(__file__).parent / "output"
@@ -45,64 +55,13 @@ def get_bluesky_grantees():
     return grantees
 
 
-def resolve_handle(handle):
-    """Resolve a Bluesky handle to DID."""
-    try:
-        resp = requests.get(
-            f"https://bsky.social/xrpc/com.atproto.identity.resolveHandle",
-            params={"handle": handle},
-            timeout=10
-        )
-        if resp.status_code == 200:
-            return resp.json().get('did')
-    except:
-        pass
-    return None
-
-
-def get_profile(actor):
-    """Get profile info for an actor (handle or DID)."""
-    try:
-        resp = requests.get(
-            "https://public.api.bsky.app/xrpc/app.bsky.actor.getProfile",
-            params={"actor": actor},
-            timeout=10
-        )
-        if resp.status_code == 200:
-            return resp.json()
-    except:
-        pass
-    return None
-
-
-def get_author_feed(actor, limit=50, cursor=None):
-    """Get posts from an author's feed."""
-    try:
-        params = {"actor": actor, "limit": min(limit, 100)}
-        if cursor:
-            params["cursor"] = cursor
-
-        resp = requests.get(
-            "https://public.api.bsky.app/xrpc/app.bsky.feed.getAuthorFeed",
-            params=params,
-            timeout=30
-        )
-        if resp.status_code == 200:
-            return resp.json()
-    except Exception as e:
-        print(f"    Error fetching feed: {e}")
-    return None
-
-
-def scrape_grantee(grantee):
-    """Scrape a single grantee's Bluesky."""
+def save_grantee(grantee, profile, feed):
+    """Save a grantee's Bluesky profile and feed, returning its metadata."""
     print(f"\n{'='*60}")
     print(f"Scraping: {grantee['name']}")
     print(f"Handle: {grantee['handle']}")
     print(f"{'='*60}")
 
-    # Get profile
-    profile = get_profile(grantee['handle'])
     if not profile:
         print(f"  ERROR: Could not fetch profile")
         return None
@@ -115,79 +74,60 @@ def scrape_grantee(grantee):
     print(f"  Profile: {display_name}")
     print(f"  Followers: {followers:,} | Following: {following:,} | Posts: {posts_count:,}")
 
-    # Get posts
+    # Extract posts
     posts = []
-    cursor = None
-
-    while len(posts) < MAX_POSTS:
-        feed_data = get_author_feed(grantee['handle'], limit=50, cursor=cursor)
-        if not feed_data:
-            break
-
-        feed = feed_data.get('feed', [])
-        if not feed:
-            break
-
-        for item in feed:
-            post = item.get('post', {})
-            record = post.get('record', {})
-
-            # Extract post data
-            uri = post.get('uri', '')
-            cid = post.get('cid', '')
-
-            # Get post ID from URI (at://did:plc:xxx/app.bsky.feed.post/yyy)
-            post_id = uri.split('/')[-1] if uri else ''
-
-            text = record.get('text', '')
-            created_at = record.get('createdAt', '')
-
-            # Engagement
-            likes = post.get('likeCount', 0)
-            reposts = post.get('repostCount', 0)
-            replies = post.get('replyCount', 0)
-            quotes = post.get('quoteCount', 0)
-
-            # Determine content type
-            embed = post.get('embed', {}) or record.get('embed', {})
-            embed_type = embed.get('$type', '') if embed else ''
-
-            if 'image' in embed_type:
-                content_type = 'image'
-            elif 'video' in embed_type:
-                content_type = 'video'
-            elif 'external' in embed_type:
-                content_type = 'link'
-            elif 'record' in embed_type:
-                content_type = 'quote'
-            else:
-                content_type = 'text'
-
-            post_data = {
-                'post_id': post_id,
-                'uri': uri,
-                'cid': cid,
-                'url': f"https://bsky.app/profile/{grantee['handle']}/post/{post_id}",
-                'text': text[:500],
-                'created_at': created_at,
-                'likes': likes,
-                'reposts': reposts,
-                'replies': replies,
-                'quotes': quotes,
-                'total_engagement': likes + reposts + replies + quotes,
-                'content_type': content_type,
-                'platform': 'bluesky'
-            }
-            posts.append(post_data)
-
-            if len(posts) >= MAX_POSTS:
-                break
-
-        cursor = feed_data.get('cursor')
-        if not cursor:
-            break
-
-        time.sleep(0.5)  # Rate limiting
+
+    for item in feed[:MAX_POSTS]:
+        post = item.get('post', {})
+        record = post.get('record', {})
+
+        # Extract post data
+        uri = post.get('uri', '')
+        cid = post.get('cid', '')
+
+        # Get post ID from URI (at://did:plc:xxx/app.bsky.feed.post/yyy)
+        post_id = uri.split('/')[-1] if uri else ''
+
+        text = record.get('text', '')
+        created_at = record.get('createdAt', '')
+
+        # Engagement
+        likes = post.get('likeCount', 0)
+        reposts = post.get('repostCount', 0)
+        replies = post.get('replyCount', 0)
+        quotes = post.get('quoteCount', 0)
+
+        # Determine content type
+        embed = post.get('embed', {}) or record.get('embed', {})
+        embed_type = embed.get('$type', '') if embed else ''
+
+        if 'image' in embed_type:
+            content_type = 'image'
+        elif 'video' in embed_type:
+            content_type = 'video'
+        elif 'external' in embed_type:
+            content_type = 'link'
+        elif 'record' in embed_type:
+            content_type = 'quote'
+        else:
+            content_type = 'text'
+
+        post_data = {
+            'post_id': post_id,
+            'uri': uri,
+            'cid': cid,
+            'url': f"https://bsky.app/profile/{grantee['handle']}/post/{post_id}",
+            'text': text[:500],
+            'created_at': created_at,
+            'likes': likes,
+            'reposts': reposts,
+            'replies': replies,
+            'quotes': quotes,
+            'total_engagement': likes + reposts + replies + quotes,
+            'content_type': content_type,
+            'platform': 'bluesky'
+        }
+        posts.append(post_data)
 
     print(f"  Collected {len(posts)} posts")
 
@@ -232,6 +172,34 @@ def scrape_grantee(grantee):
     return metadata
 
 
+async def fetch_all(grantees):
+    """Fetch every grantee's profile and feed, returning {handle: (profile, feed)}."""
+    headers = {'User-Agent': config.USER_AGENT, 'Accept': 'application/json'}
+
+    async with async_session(headers=headers) as session:
+        client = BlueskyClient(session)
+        handles = list(dict.fromkeys(g['handle'] for g in grantees))
+
+        try:
+            profiles = await client.get_profiles(handles)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"ERROR: Could not fetch profiles: {e}")
+            profiles = {}
+
+        # Read feeds by DID; fall back to the cache, then the handle
+        actors = {}
+        for handle in handles:
+            profile = profiles.get(handle.lower())
+            actors[handle] = (profile or {}).get('did') or await client.resolve_did(handle) or handle
+
+        feeds = await client.get_author_feeds(list(actors.values()), MAX_POSTS)
+
+    await close_async_connector()
+    get_did_cache().save()
+    return {handle: (profiles.get(handle.lower()), feeds.get(actor, []))
+            for handle, actor in actors.items()}
+
+
 def main():
     print("="*60)
     print("BLUESKY BATCH SCRAPER")
@@ -240,6 +208,10 @@ def main():
     grantees = get_bluesky_grantees()
     print(f"\nFound {len(grantees)} grantees with Bluesky accounts\n")
 
+    started = time.monotonic()
+    fetched = asyncio.run(fetch_all(grantees))
+    print(f"Fetched {len(fetched)} profiles and feeds in {time.monotonic() - started:.1f}s")
+
     results = []
     success = 0
     failed = 0
@@ -248,7 +220,7 @@ def main():
         print(f"\n[{i}/{len(grantees)}]", end="")
 
         try:
-            result = scrape_grantee(grantee)
+            result = save_grantee(grantee, *fetched[grantee['handle']])
             if result:
                 results.append({
                     'grantee': grantee['name'],
@@ -275,8 +247,6 @@ def main():
             })
             failed += 1
 
-        time.sleep(1)  # Rate limiting between grantees
-
     # Save summary
     summary = {
         'scraped_at': datetime.now().isoformat(),
@@ -2,8 +2,12 @@
 """
 Scrape Center for Cooperative Media social media accounts.
 Collects the last 50 posts from each platform.
+
+Results are shared with main.py and scrape_internal.py through the result
+cache; use --force to scrape again within the cache TTL.
 """
 
+import argparse
 import sys
 import json
 from pathlib import Path
@@ -12,6 +16,7 @@ from datetime import datetime
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from result_cache import ResultCache
 from scrapers.bluesky import BlueSkyScraper
 from scrapers.twitter import TwitterScraper
 from scrapers.youtube import YouTubeScraper
@@ -29,8 +34,9 @@ GRANTEE_NAME = "Center_for_Cooperative_Media"
 MAX_POSTS = 50
 
 
-def main():
+def main(force=False):
     results = {}
+    cache = ResultCache(force=force)
     output_dir = Path("output") / GRANTEE_NAME
     output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -40,7 +46,9 @@ def main():
     print("="*60)
     try:
         scraper = BlueSkyScraper(output_dir=Path("output"))
-        result = scraper.scrape(
+        result = cache.scrape(
+            "bluesky",
+            scraper,
             CCM_ACCOUNTS["bluesky"],
             GRANTEE_NAME,
             max_posts=MAX_POSTS
@@ -61,7 +69,9 @@ def main():
     print("="*60)
     try:
         scraper = TwitterScraper(output_dir=Path("output"))
-        result = scraper.scrape(
+        result = cache.scrape(
+            "twitter",
+            scraper,
             CCM_ACCOUNTS["twitter"],
             GRANTEE_NAME,
             max_posts=MAX_POSTS
@@ -78,7 +88,9 @@ def main():
     print("="*60)
     try:
         scraper = YouTubeScraper(output_dir=Path("output"))
-        result = scraper.scrape(
+        result = cache.scrape(
+            "youtube",
+            scraper,
             CCM_ACCOUNTS["youtube"],
             GRANTEE_NAME,
             max_posts=MAX_POSTS
@@ -95,7 +107,9 @@ def main():
     print("="*60)
     try:
         scraper = TikTokScraper(output_dir=Path("output"))
-        result = scraper.scrape(
+        result = cache.scrape(
+            "tiktok",
+            scraper,
             CCM_ACCOUNTS["tiktok"],
             GRANTEE_NAME,
             max_posts=MAX_POSTS
@@ -137,4 +151,10 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Scrape Center for Cooperative Media social media accounts")
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Invalidate cached results and scrape every account again'
+    )
+    main(force=parser.parse_args().force)
@@ -48,13 +48,8 @@ def scrape_instagram_with_instaloader():
     try:
         from scrapers.instagram import InstagramScraper
 
-        session_file = Path("output/.sessions/instagram_session")
-        session_file.parent.mkdir(parents=True, exist_ok=True)
-
-        scraper = InstagramScraper(
-            output_dir="output",
-            session_file=str(session_file)
-        )
+        # The instaloader session is kept in the shared session vault
+        scraper = InstagramScraper(output_dir="output")
 
         result = scraper.scrape(
             CCM_ACCOUNTS["instagram"],
@@ -16,6 +16,8 @@ sys.path.insert(0, str(Path(__file__).parent))
 from dotenv import load_dotenv
 load_dotenv()
 
+from memory_watchdog import ContextRecycler
+
 try:
     from playwright.async_api import async_playwright
     from playwright_stealth.stealth import Stealth
@@ -244,17 +246,18 @@ async def main():
             ]
         )
 
-        context = await browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            locale='en-US',
-            timezone_id='America/New_York',
-        )
-
-        page = await context.new_page()
-
+        # The context is replaced, keeping the login, when it has navigated
+        # too often or the browser grows too large (see memory_watchdog.py)
         stealth = Stealth()
-        await stealth.apply_stealth_async(page)
+        recycler = ContextRecycler(browser, {
+            'viewport': {'width': 1920, 'height': 1080},
+            'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'locale': 'en-US',
+            'timezone_id': 'America/New_York',
+        }, page_setup=stealth.apply_stealth_async)
+
+        page = await recycler.start()
+        context = recycler.context
 
         # Go to Facebook login
         print("\n>>> Opening Facebook login...")
@@ -339,6 +342,8 @@ async def main():
             # Pause between grantees
             await page.wait_for_timeout(2500)
 
+            page = await recycler.maybe_recycle()
+
         # Save summary
         summary = {
             'scraped_at': datetime.now().isoformat(),
@@ -346,6 +351,8 @@ async def main():
             'success': success,
             'failed': failed,
             'skipped': skipped,
+            'contexts_recycled': recycler.watchdog.stats['contexts_recycled'],
+            'peak_browser_rss_mb': recycler.watchdog.stats['peak_rss_mb'],
             'results': results
         }
 
@@ -358,6 +365,7 @@ async def main():
         print(f"Success: {success}")
         print(f"Skipped: {skipped}")
         print(f"Failed: {failed}")
+        print(f"Contexts recycled: {recycler.watchdog.stats['contexts_recycled']}")
         print(f"Summary saved to: output/facebook_batch_summary.json")
 
         print("\n>>> Browser stays open. Create output/CLOSE_BROWSER to close.")
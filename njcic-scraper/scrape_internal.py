@@ -10,6 +10,7 @@ Usage:
     python scrape_internal.py                    # Run full scrape
     python scrape_internal.py --platforms twitter,instagram  # Specific platforms only
     python scrape_internal.py --output-dir /custom/path      # Custom output directory
+    python scrape_internal.py --force                        # Ignore cached results
 """
 
 import argparse
@@ -21,16 +22,10 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 
 import config
+from result_cache import ResultCache
 
-# Import all scrapers
-from scrapers.twitter import TwitterScraper
-from scrapers.bluesky import BlueSkyScraper
-from scrapers.instagram_playwright import InstagramPlaywrightScraper
-from scrapers.facebook import FacebookScraper
-from scrapers.linkedin import LinkedInScraper
-from scrapers.tiktok import TikTokScraper
-from scrapers.youtube import YouTubeScraper
-from scrapers.threads import ThreadsScraper
+# Scrapers are imported on first use, only for the platforms being scraped
+from scrapers.registry import SCRAPER_REGISTRY
 
 # Constants
 BASE_DIR = Path(__file__).resolve().parent
@@ -38,17 +33,8 @@ INTERNAL_ACCOUNTS_PATH = BASE_DIR / "data" / "njcic-internal-accounts.json"
 INTERNAL_OUTPUT_DIR = BASE_DIR / "output" / "njcic-internal"
 INTERNAL_DASHBOARD_DATA_PATH = BASE_DIR / "output" / "njcic-internal-metrics.json"
 
-# Platform to scraper class mapping
-PLATFORM_SCRAPERS = {
-    'twitter': TwitterScraper,
-    'bluesky': BlueSkyScraper,
-    'instagram': InstagramPlaywrightScraper,
-    'facebook': FacebookScraper,
-    'linkedin': LinkedInScraper,
-    'tiktok': TikTokScraper,
-    'youtube': YouTubeScraper,
-    'threads': ThreadsScraper,
-}
+# Platform to scraper class mapping (lazy)
+PLATFORM_SCRAPERS = SCRAPER_REGISTRY
 
 
 class InternalMetricsScraper:
@@ -58,7 +44,8 @@ class InternalMetricsScraper:
         self,
         platforms: Optional[List[str]] = None,
         output_dir: Optional[Path] = None,
-        max_posts: int = 50
+        max_posts: int = 50,
+        force: bool = False
     ):
         """
         Initialize the internal metrics scraper.
@@ -67,9 +54,11 @@ class InternalMetricsScraper:
             platforms: List of platform names to scrape (None = all enabled platforms)
             output_dir: Custom output directory
             max_posts: Maximum posts to scrape per platform
+            force: Ignore and invalidate cached results (see result_cache.py)
         """
         self.output_dir = output_dir or INTERNAL_OUTPUT_DIR
         self.max_posts = max_posts
+        self.result_cache = ResultCache(force=force)
 
         # Load internal accounts configuration
         self.config = self._load_config()
@@ -226,9 +215,11 @@ class InternalMetricsScraper:
 
         try:
             self.logger.info(f"Scraping {platform} for {org_name}: {url}")
-            result = scraper.scrape(
-                url=url,
-                grantee_name=org_name,
+            result = self.result_cache.scrape(
+                platform,
+                scraper,
+                url,
+                org_name,
                 max_posts=self.max_posts
             )
             return result
@@ -478,6 +469,7 @@ Examples:
   %(prog)s                                    # Run full scrape
   %(prog)s --platforms twitter,instagram      # Specific platforms only
   %(prog)s --max-posts 100                    # More posts per platform
+  %(prog)s --force                            # Re-scrape even if results are cached
         """
     )
 
@@ -503,6 +495,12 @@ Examples:
         help='Custom output directory'
     )
 
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Invalidate cached results and scrape every account again'
+    )
+
     return parser.parse_args()
 
 
@@ -523,7 +521,8 @@ def main():
         scraper = InternalMetricsScraper(
             platforms=platforms,
             output_dir=output_dir,
-            max_posts=args.max_posts
+            max_posts=args.max_posts,
+            force=args.force
         )
 
         scraper.run()
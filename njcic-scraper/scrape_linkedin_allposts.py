@@ -14,6 +14,8 @@ from datetime import datetime
 sys.path.insert(0, str(Path(__file__).parent))
 
 from dotenv import load_dotenv
+from session_vault import get_session_vault
+from scroll_harvest import ScrollHarvester
 load_dotenv()
 
 try:
@@ -28,6 +30,36 @@ GRANTEE_NAME = "Center_for_Cooperative_Media"
 MAX_POSTS = 50
 SIGNAL_FILE = Path("output/READY_TO_SCRAPE")
 
+POST_SELECTOR = '[data-urn*="activity"], .feed-shared-update-v2, .occludable-update, .org-update-card'
+
+# Reads one update's fields, for ScrollHarvester. Updates LinkedIn has not
+# rendered yet (lazy "occludable" placeholders) return null and are read
+# on a later pass.
+POST_FIELDS_JS = """
+(post) => {
+    const urnEl = post.matches('[data-urn]') ? post : post.querySelector('[data-urn*="activity"]');
+    const urn = urnEl ? urnEl.getAttribute('data-urn') : null;
+    const idMatch = urn ? urn.match(/activity[:\\-](\\d+)/) : null;
+    const content = post.innerText || '';
+    if (!idMatch && content.length < 20) return null;
+
+    let text = '';
+    for (const selector of ['.feed-shared-text', '.break-words', '.update-components-text']) {
+        const el = post.querySelector(selector);
+        if (el && el.innerText) { text = el.innerText; break; }
+    }
+    const reactions = post.querySelector('.social-details-social-counts__reactions-count');
+    const comments = post.querySelector('.social-details-social-counts__comments');
+    return {
+        urn: idMatch ? idMatch[1] : null,
+        content_key: content.slice(0, 100),
+        text: text,
+        likes_text: reactions ? reactions.innerText : '',
+        comments_text: comments ? comments.innerText : '',
+    };
+}
+"""
+
 
 async def scrape_linkedin_allposts():
     """Open LinkedIn, let user login, navigate to ALL POSTS, then scrape."""
@@ -87,13 +119,10 @@ async def scrape_linkedin_allposts():
         print(">>> Signal received! Continuing...")
         SIGNAL_FILE.unlink()
 
-        # Save cookies
-        cookies = await context.cookies()
-        cookies_file = Path("output/.cookies/linkedin_cookies.json")
-        cookies_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(cookies_file, 'w') as f:
-            json.dump(cookies, f, indent=2)
-        print(f"Saved {len(cookies)} cookies")
+        # Save the session for the scrapers and later runs
+        vault = get_session_vault()
+        await vault.save_context('linkedin', context)
+        print(f"Saved session to {vault.path('linkedin')}")
 
         # Navigate to company page
         print(f">>> Navigating to company page: {LINKEDIN_URL}")
@@ -192,18 +221,10 @@ async def scrape_linkedin_allposts():
             except:
                 pass
 
-        # Now scroll and collect posts
+        # Now scroll and collect posts, reading each update once as it renders
         print(">>> Scrolling to load posts...")
-        posts = []
-        seen_ids = set()
-        scroll_attempts = 0
-        max_scrolls = 100
-        no_new_posts_count = 0
 
-        while len(posts) < MAX_POSTS and scroll_attempts < max_scrolls:
-            prev_count = len(posts)
-
-            # Try clicking any "Show more" buttons
+        async def click_show_more():
             try:
                 show_more = await page.query_selector_all('button:has-text("Show more"), button:has-text("Load more")')
                 for btn in show_more:
@@ -215,94 +236,40 @@ async def scrape_linkedin_allposts():
             except:
                 pass
 
-            # Find post containers
-            post_elements = await page.query_selector_all(
-                '[data-urn*="activity"], '
-                '.feed-shared-update-v2, '
-                '.occludable-update, '
-                '.org-update-card'
-            )
-
-            for post_el in post_elements:
-                try:
-                    # Get post ID
-                    urn = await post_el.get_attribute('data-urn')
-                    post_id = ""
-                    if urn:
-                        id_match = re.search(r'activity[:\-](\d+)', urn)
-                        if id_match:
-                            post_id = id_match.group(1)
-
-                    if not post_id:
-                        content = await post_el.inner_text()
-                        if len(content) < 20:
-                            continue
-                        post_id = str(hash(content[:100]))
-
-                    if post_id in seen_ids:
-                        continue
-                    seen_ids.add(post_id)
-
-                    # Get text
-                    text = ""
-                    for sel in ['.feed-shared-text', '.break-words', '.update-components-text']:
-                        text_el = await post_el.query_selector(sel)
-                        if text_el:
-                            text = await text_el.inner_text()
-                            if text:
-                                break
-
-                    # Get likes
-                    likes = 0
-                    reactions_el = await post_el.query_selector('.social-details-social-counts__reactions-count')
-                    if reactions_el:
-                        try:
-                            likes = int((await reactions_el.inner_text()).replace(',', ''))
-                        except:
-                            pass
-
-                    # Get comments
-                    comments = 0
-                    comments_el = await post_el.query_selector('.social-details-social-counts__comments')
-                    if comments_el:
-                        try:
-                            comments_text = await comments_el.inner_text()
-                            match = re.search(r'(\d+)', comments_text)
-                            if match:
-                                comments = int(match.group(1))
-                        except:
-                            pass
-
-                    post_data = {
-                        'post_id': post_id,
-                        'text': text[:500] if text else "",
-                        'likes': likes,
-                        'comments': comments,
-                        'total_engagement': likes + comments,
-                        'platform': 'linkedin'
-                    }
-                    posts.append(post_data)
-                    print(f"  Post {len(posts)}: {text[:50]}... | Likes: {likes}")
-
-                except:
-                    continue
-
-            # Check progress
-            if len(posts) == prev_count:
-                no_new_posts_count += 1
-                if no_new_posts_count >= 15:
-                    print(f"  No new posts after {no_new_posts_count} scrolls")
-                    break
-            else:
-                no_new_posts_count = 0
+        harvester = ScrollHarvester(page, POST_SELECTOR, POST_FIELDS_JS, MAX_POSTS, keys=('urn', 'content_key'))
+        await harvester.run(
+            max_scrolls=100,
+            timeout_ms=3000,
+            scroll_by=1500,
+            patience=15,
+            before_scroll=click_show_more
+        )
+        print(f"  Scrolled {harvester.scrolls}x")
 
-            # Scroll
-            await page.evaluate('window.scrollBy(0, 1500)')
-            await page.wait_for_timeout(2000)
-            scroll_attempts += 1
+        posts = []
+        for fields in harvester.items:
+            likes = 0
+            try:
+                likes = int(fields['likes_text'].strip().replace(',', ''))
+            except ValueError:
+                pass
 
-            if scroll_attempts % 10 == 0:
-                print(f"  Scrolled {scroll_attempts}x, found {len(posts)} posts...")
+            comments = 0
+            match = re.search(r'(\d+)', fields['comments_text'])
+            if match:
+                comments = int(match.group(1))
+
+            text = fields['text']
+            post_data = {
+                'post_id': fields['urn'] or str(hash(fields['content_key'])),
+                'text': text[:500] if text else "",
+                'likes': likes,
+                'comments': comments,
+                'total_engagement': likes + comments,
+                'platform': 'linkedin'
+            }
+            posts.append(post_data)
+            print(f"  Post {len(posts)}: {text[:50]}... | Likes: {likes}")
 
         print(f"\n>>> Collected {len(posts)} posts")
 
@@ -15,6 +15,7 @@ from datetime import datetime
 sys.path.insert(0, str(Path(__file__).parent))
 
 from dotenv import load_dotenv
+from session_vault import get_session_vault
 load_dotenv()
 
 try:
@@ -88,13 +89,10 @@ async def scrape_linkedin_manual():
         print(">>> Signal received! Continuing...")
         SIGNAL_FILE.unlink()
 
-        # Save cookies
-        cookies = await context.cookies()
-        cookies_file = Path("output/.cookies/linkedin_cookies.json")
-        cookies_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(cookies_file, 'w') as f:
-            json.dump(cookies, f, indent=2)
-        print(f"Saved {len(cookies)} cookies")
+        # Save the session for the scrapers and later runs
+        vault = get_session_vault()
+        await vault.save_context('linkedin', context)
+        print(f"Saved session to {vault.path('linkedin')}")
 
         # Navigate to company page
         print(f">>> Navigating to company page: {LINKEDIN_URL}")
@@ -16,6 +16,7 @@ from datetime import datetime
 sys.path.insert(0, str(Path(__file__).parent))
 
 from dotenv import load_dotenv
+from session_vault import get_session_vault
 load_dotenv()
 
 try:
@@ -95,12 +96,10 @@ async def scrape_linkedin_stay_open():
         print(">>> Signal received! Starting scrape...")
         SIGNAL_FILE.unlink()
 
-        # Save cookies
-        cookies = await context.cookies()
-        cookies_file = Path("output/.cookies/linkedin_cookies.json")
-        cookies_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(cookies_file, 'w') as f:
-            json.dump(cookies, f, indent=2)
+        # Save the session for the scrapers and later runs
+        vault = get_session_vault()
+        await vault.save_context('linkedin', context)
+        print(f"Saved session to {vault.path('linkedin')}")
 
         # Get current URL (user may have navigated somewhere)
         current_url = page.url
@@ -20,6 +20,7 @@ from datetime import datetime
 sys.path.insert(0, str(Path(__file__).parent))
 
 from dotenv import load_dotenv
+from session_vault import get_session_vault
 load_dotenv()
 
 try:
@@ -96,13 +97,10 @@ async def scrape_twitter_with_signal():
         print(">>> Signal received! Continuing...")
         SIGNAL_FILE.unlink()  # Remove signal file
 
-        # Save cookies
-        cookies = await context.cookies()
-        cookies_file = Path("output/.cookies/twitter_cookies.json")
-        cookies_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(cookies_file, 'w') as f:
-            json.dump(cookies, f, indent=2)
-        print(f"Saved {len(cookies)} cookies")
+        # Save the session for the scrapers and later runs
+        vault = get_session_vault()
+        await vault.save_context('twitter', context)
+        print(f"Saved session to {vault.path('twitter')}")
 
         # Navigate to profile
         print(f">>> Navigating to profile...")
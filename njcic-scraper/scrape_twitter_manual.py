@@ -14,6 +14,7 @@ from datetime import datetime
 sys.path.insert(0, str(Path(__file__).parent))
 
 from dotenv import load_dotenv
+from session_vault import get_session_vault
 load_dotenv()
 
 try:
@@ -72,13 +73,10 @@ async def scrape_twitter_manual():
         print("="*60)
         print()
 
-        # Save cookies for future use
-        cookies = await context.cookies()
-        cookies_file = Path("output/.cookies/twitter_cookies.json")
-        cookies_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(cookies_file, 'w') as f:
-            json.dump(cookies, f, indent=2)
-        print(f"Saved {len(cookies)} cookies for future use")
+        # Save the session for the scrapers and later runs
+        vault = get_session_vault()
+        await vault.save_context('twitter', context)
+        print(f"Saved session to {vault.path('twitter')}")
 
         # Now navigate to the profile
         print(f">>> Navigating to profile: {TWITTER_URL}")
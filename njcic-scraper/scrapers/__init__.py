@@ -2,24 +2,32 @@
 NJCIC Grantee Social Media Scrapers
 
 This package contains scraper implementations for various social media platforms.
+
+Scraper classes are imported lazily on first attribute access, so
+`from scrapers import BlueSkyScraper` does not pull in Playwright or
+instaloader. Use scrapers.registry to look scrapers up by platform name.
 """
 
-from scrapers.base import BaseScraper
-from scrapers.bluesky import BlueSkyScraper
-from scrapers.tiktok import TikTokScraper
-from scrapers.youtube import YouTubeScraper
-from scrapers.twitter import TwitterScraper
-from scrapers.instagram import InstagramScraper
-from scrapers.facebook import FacebookScraper
-from scrapers.threads import ThreadsScraper
+import importlib
+
+# Exported class name -> defining module
+_LAZY_EXPORTS = {
+    "BaseScraper": "scrapers.base",
+    "BlueSkyScraper": "scrapers.bluesky",
+    "TikTokScraper": "scrapers.tiktok",
+    "YouTubeScraper": "scrapers.youtube",
+    "TwitterScraper": "scrapers.twitter",
+    "InstagramScraper": "scrapers.instagram",
+    "FacebookScraper": "scrapers.facebook",
+    "ThreadsScraper": "scrapers.threads",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
 
-__all__ = [
-    "BaseScraper",
-    "BlueSkyScraper",
-    "TikTokScraper",
-    "YouTubeScraper",
-    "TwitterScraper",
-    "InstagramScraper",
-    "FacebookScraper",
-    "ThreadsScraper",
-]
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,9 +3,22 @@ Base scraper class for social media platforms.
 
 This module provides an abstract base class that all platform-specific
 scrapers should inherit from, ensuring consistent interface and behavior.
+
+Scrapers implement the coroutine scrape_async(), so jobs for different
+accounts and platforms can run concurrently on one event loop. scrape() is
+a sync shim for callers outside an event loop: it runs scrape_async() on the
+browser pool's long-lived loop, where the Playwright scrapers' pooled
+browsers live.
+
+Deliberate waits go through wait()/wait_blocking() and page loads through
+goto(), so the time ledger (see time_accounting.py) can attribute them to
+the job's platform and account.
 """
 
+import asyncio
+import concurrent.futures
 import json
+import subprocess
 import time
 import logging
 from abc import ABC, abstractmethod
@@ -14,6 +27,10 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 
 import config
+from deadline import Deadline
+from job_history import account_key
+from pacing import Pacing, get_pacing
+from time_accounting import get_time_ledger, measure
 
 
 class BaseScraper(ABC):
@@ -38,6 +55,11 @@ class BaseScraper(ABC):
         Args:
             output_dir: Base output directory (Path or str). If None, uses config.OUTPUT_DIR
         """
+        # Load .env (scrapers read credentials with os.getenv) and make sure
+        # the logs directory exists before attaching file handlers
+        config.load_env()
+        config.ensure_directories()
+
         # Handle both string and Path objects
         if output_dir is None:
             self.output_dir = config.OUTPUT_DIR
@@ -63,6 +85,8 @@ class BaseScraper(ABC):
             self.logger.addHandler(console_handler)
 
         self._last_request_time = 0
+        self.deadline = Deadline.unlimited()
+        self.pacing = get_pacing(self.platform_name)
         self.logger.info(f"Initialized {self.platform_name} scraper")
 
     def get_output_path(self, grantee_name: str) -> Path:
@@ -114,22 +138,164 @@ class BaseScraper(ABC):
             if not config.SKIP_ON_ERROR:
                 raise
 
-    def rate_limit(self) -> None:
+    def set_deadline(self, deadline: Optional[Deadline]) -> Deadline:
+        """
+        Set the deadline for the job about to be scraped.
+
+        Subclasses call this at the top of scrape_async() so retry loops,
+        sleeps and timeouts can read self.deadline.
+
+        Args:
+            deadline: Deadline from the orchestrator, or None for no limit
+
+        Returns:
+            The deadline now in effect
+        """
+        self.deadline = deadline or Deadline.unlimited()
+        return self.deadline
+
+    def set_pacing(self, url: Optional[str] = None) -> Pacing:
+        """
+        Choose the pacing profile for the target about to be scraped.
+
+        Subclasses with human-like pauses call this next to set_deadline(),
+        so a low-risk target (see config.PACING_LOW_RISK_TARGETS) is paced
+        faster than the rest of its platform.
+
+        Args:
+            url: Target URL
+
+        Returns:
+            The pacing now in effect
+        """
+        self.pacing = get_pacing(self.platform_name, url)
+        return self.pacing
+
+    async def pause(self, min_seconds: float, max_seconds: float) -> None:
+        """
+        Wait a random, pacing-scaled time, bounded by the job deadline.
+
+        Args:
+            min_seconds: Shortest pause at standard pacing
+            max_seconds: Longest pause at standard pacing
+        """
+        await self.wait(self.pacing.delay(min_seconds, max_seconds), 'random_delay')
+
+    async def wait(self, seconds: float, reason: str) -> None:
+        """
+        Sleep for a deliberate delay, bounded by the job deadline.
+
+        The delay is recorded in the time ledger under its reason.
+
+        Args:
+            seconds: Delay in seconds
+            reason: Why we wait, e.g. 'rate_limit' or 'retry_backoff'
+
+        Raises:
+            DeadlineExceeded: If the delay would outlast the deadline
+        """
+        with measure('sleep', reason):
+            await self.deadline.async_sleep(seconds)
+
+    def wait_blocking(self, seconds: float, reason: str) -> None:
+        """Blocking version of wait() for scrapers running in a worker thread."""
+        with measure('sleep', reason):
+            self.deadline.sleep(seconds)
+
+    async def goto(self, page: Any, url: str, **kwargs: Any) -> Any:
+        """
+        Navigate a Playwright page, recording the load as network time.
+
+        Args:
+            page: Playwright async Page
+            url: URL to load
+            **kwargs: Passed to page.goto (wait_until, timeout, ...)
+
+        Returns:
+            The main resource Response, as from page.goto
+        """
+        with measure('network', 'page_load'):
+            return await page.goto(url, **kwargs)
+
+    def mark_timed_out(self, result: Dict[str, Any], message: str) -> Dict[str, Any]:
+        """
+        Flag a result as timed out, keeping any partial data already in it.
+
+        Args:
+            result: Result dictionary being returned from scrape()
+            message: Why the job stopped
+
+        Returns:
+            The same result dictionary
+        """
+        result['success'] = False
+        result['timed_out'] = True
+        result['error'] = message
+        self.logger.warning(
+            f"{message} - keeping {result.get('posts_downloaded', 0)} posts collected so far"
+        )
+        return result
+
+    async def rate_limit(self) -> None:
         """
         Implement rate limiting to respect platform guidelines.
 
-        Ensures minimum delay between requests as specified in config.REQUEST_DELAY.
+        Ensures minimum delay between requests as specified in
+        config.REQUEST_DELAY, scaled by the pacing profile.
         """
         current_time = time.time()
         time_since_last_request = current_time - self._last_request_time
+        request_delay = self.pacing.scaled(config.REQUEST_DELAY)
 
-        if time_since_last_request < config.REQUEST_DELAY:
-            sleep_time = config.REQUEST_DELAY - time_since_last_request
+        if time_since_last_request < request_delay:
+            sleep_time = request_delay - time_since_last_request
             self.logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
-            time.sleep(sleep_time)
+            await self.wait(sleep_time, 'rate_limit')
 
         self._last_request_time = time.time()
 
+    async def run_command(self, cmd: List[str], timeout: float) -> subprocess.CompletedProcess:
+        """
+        Run a command without blocking the event loop.
+
+        Behaves like subprocess.run(cmd, capture_output=True, text=True,
+        timeout=timeout): the process is killed if it outlives the timeout.
+        The run is recorded as network time under the program's name
+        (the module name for "python -m module").
+
+        Args:
+            cmd: Command and arguments
+            timeout: Seconds to wait for the command to finish
+
+        Returns:
+            CompletedProcess with decoded stdout and stderr
+
+        Raises:
+            subprocess.TimeoutExpired: If the command outlives the timeout
+            FileNotFoundError: If the executable does not exist
+        """
+        program = cmd[2] if len(cmd) > 2 and cmd[1] == '-m' else Path(cmd[0]).name
+
+        with measure('network', program):
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                raise subprocess.TimeoutExpired(cmd, timeout)
+
+        return subprocess.CompletedProcess(
+            cmd,
+            process.returncode,
+            stdout.decode('utf-8', errors='replace'),
+            stderr.decode('utf-8', errors='replace')
+        )
+
     def save_posts(
         self,
         posts: List[Dict[str, Any]],
@@ -231,19 +397,30 @@ class BaseScraper(ABC):
         pass
 
     @abstractmethod
-    def scrape(
+    async def scrape_async(
         self,
         url: str,
         grantee_name: str,
-        max_posts: Optional[int] = None
+        max_posts: Optional[int] = None,
+        deadline: Optional[Deadline] = None
     ) -> Dict[str, Any]:
         """
         Scrape posts from the given URL.
 
+        Implementations should call set_deadline(deadline) first and bound
+        every retry loop, sleep and timeout by self.deadline. When the
+        deadline passes they return early via mark_timed_out(), keeping
+        whatever posts were already collected.
+
+        Implementations must not block the event loop: network I/O goes
+        through async clients, waits through wait(), and subprocesses and
+        blocking libraries through asyncio.
+
         Args:
             url: URL to scrape (profile, page, or channel)
             grantee_name: Name of the grantee organization
             max_posts: Maximum number of posts to scrape (defaults to config value)
+            deadline: Time budget for this job (None for no limit)
 
         Returns:
             Dictionary with scraping results:
@@ -252,11 +429,75 @@ class BaseScraper(ABC):
                 'posts_downloaded': int,
                 'errors': List[Dict],
                 'engagement_metrics': Dict[str, Any],
-                'output_path': str
+                'output_path': str,
+                'timed_out': bool  # only present when the deadline passed
             }
         """
         pass
 
+    def scrape(
+        self,
+        url: str,
+        grantee_name: str,
+        max_posts: Optional[int] = None,
+        deadline: Optional[Deadline] = None
+    ) -> Dict[str, Any]:
+        """
+        Scrape posts from the given URL, blocking until done.
+
+        Sync shim around scrape_async() for callers outside an event loop
+        (orchestrator worker threads, scripts). The coroutine runs on the
+        browser pool's event loop, so calls from several threads interleave
+        there. Must not be called from a coroutine; await scrape_async()
+        instead. Time spent in the scrape is charged to the account in the
+        time ledger. A scrape still running config.JOB_TIMEOUT_GRACE_SECONDS
+        after its deadline is cancelled and returned as timed_out.
+
+        Args:
+            url: URL to scrape (profile, page, or channel)
+            grantee_name: Name of the grantee organization
+            max_posts: Maximum number of posts to scrape (None for the
+                scraper's default)
+            deadline: Time budget for this job (None for no limit)
+
+        Returns:
+            The result dictionary from scrape_async(); a successful result
+            without an output_path gets the grantee's platform directory
+        """
+        kwargs: Dict[str, Any] = {'deadline': deadline}
+        if max_posts is not None:
+            kwargs['max_posts'] = max_posts
+
+        timeout = None
+        if deadline is not None and deadline.is_limited:
+            timeout = deadline.remaining() + config.JOB_TIMEOUT_GRACE_SECONDS
+
+        # Imported here so that importing BaseScraper never loads the pool
+        from browser_pool import get_browser_pool
+
+        try:
+            return get_browser_pool().run(self._scrape_accounted(url, grantee_name, kwargs), timeout)
+        except concurrent.futures.TimeoutError:
+            message = (f"Scrape of {url} still running {config.JOB_TIMEOUT_GRACE_SECONDS}s "
+                       f"after its deadline; cancelled")
+            return self.mark_timed_out({
+                'success': False,
+                'posts_downloaded': 0,
+                'errors': [message],
+                'engagement_metrics': {}
+            }, message)
+
+    async def _scrape_accounted(self, url: str, grantee_name: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        # Entered on the pool's loop, so the job context belongs to this task
+        with get_time_ledger().job(self.platform_name, account_key(self, url)):
+            result = await self.scrape_async(url, grantee_name, **kwargs)
+
+        # Refresh tiers read posting activity from output_path; fall back to
+        # the platform directory, which holds the scraper's saved posts
+        if result.get('success') and not result.get('output_path'):
+            result['output_path'] = str(self.get_output_path(grantee_name))
+        return result
+
     def validate_post(self, post: Dict[str, Any]) -> bool:
         """
         Validate that a post contains required fields.
@@ -1,14 +1,23 @@
 """
 BlueSky scraper using the AT Protocol public API.
+
+Requests go through bluesky_client.BlueskyClient, so Bluesky jobs running
+side by side share one rate budget, have their profile lookups batched into
+getProfiles calls and read feeds by cached DID.
 """
+import asyncio
 import re
-import requests
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from urllib.parse import urlparse
 
+import aiohttp
+
 from scrapers.base import BaseScraper
+from bluesky_client import BlueskyClient
+from http_client import async_session
+from deadline import Deadline, DeadlineExceeded
 import config
 
 
@@ -17,11 +26,6 @@ class BlueSkyScraper(BaseScraper):
 
     platform_name = "bluesky"
 
-    # Public API endpoints
-    API_BASE = "https://public.api.bsky.app/xrpc"
-    FEED_ENDPOINT = f"{API_BASE}/app.bsky.feed.getAuthorFeed"
-    PROFILE_ENDPOINT = f"{API_BASE}/app.bsky.actor.getProfile"
-
     def __init__(self, output_dir: Optional[Path] = None):
         """
         Initialize BlueSky scraper.
@@ -30,11 +34,10 @@ class BlueSkyScraper(BaseScraper):
             output_dir: Directory to save scraped data
         """
         super().__init__(output_dir)
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             'User-Agent': config.USER_AGENT,
             'Accept': 'application/json'
-        })
+        }
 
     def extract_username(self, url: str) -> Optional[str]:
         """
@@ -73,84 +76,27 @@ class BlueSkyScraper(BaseScraper):
             self.logger.error(f"Invalid BlueSky URL format: {url}. Error: {str(e)}")
             return None
 
-    def _fetch_profile(self, handle: str) -> Optional[Dict[str, Any]]:
+    async def _fetch_profile(self, client: BlueskyClient, handle: str) -> Optional[Dict[str, Any]]:
         """
         Fetch user profile information.
 
         Args:
+            client: API client for this scrape
             handle: BlueSky handle
 
         Returns:
             Profile data or None if failed
         """
         try:
-            self.rate_limit()
-            params = {'actor': handle}
-            response = self.session.get(
-                self.PROFILE_ENDPOINT,
-                params=params,
-                timeout=config.TIMEOUT
-            )
-            response.raise_for_status()
-            return response.json()
+            profile = await client.get_profile(handle)
+            if profile is None:
+                self.logger.error(f"No profile found for {handle}")
+            return profile
 
-        except requests.exceptions.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             self.logger.error(f"Failed to fetch profile for {handle}: {str(e)}")
             return None
 
-    def _fetch_posts(self, handle: str, limit: int = 25) -> List[Dict[str, Any]]:
-        """
-        Fetch posts from user's feed.
-
-        Args:
-            handle: BlueSky handle
-            limit: Maximum number of posts to fetch
-
-        Returns:
-            List of post data dictionaries
-        """
-        posts = []
-        cursor = None
-        fetched = 0
-
-        try:
-            while fetched < limit:
-                self.rate_limit()
-
-                params = {
-                    'actor': handle,
-                    'limit': min(100, limit - fetched)  # API max is 100 per request
-                }
-                if cursor:
-                    params['cursor'] = cursor
-
-                response = self.session.get(
-                    self.FEED_ENDPOINT,
-                    params=params,
-                    timeout=config.TIMEOUT
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                feed_items = data.get('feed', [])
-                if not feed_items:
-                    break
-
-                posts.extend(feed_items)
-                fetched += len(feed_items)
-
-                # Check if there's more data
-                cursor = data.get('cursor')
-                if not cursor or fetched >= limit:
-                    break
-
-            # Limit to requested number
-            return posts[:limit]
-
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Failed to fetch posts for {handle}: {str(e)}")
-            return posts
-
     def _extract_post_data(self, feed_item: Dict[str, Any]) -> Dict[str, Any]:
         """
         Extract relevant data from a feed item.
@@ -278,11 +224,12 @@ class BlueSkyScraper(BaseScraper):
             'posts_analyzed': posts_count
         }
 
-    def scrape(
+    async def scrape_async(
         self,
         url: str,
         grantee_name: str,
-        max_posts: Optional[int] = None
+        max_posts: Optional[int] = None,
+        deadline: Optional[Deadline] = None
     ) -> Dict[str, Any]:
         """
         Scrape BlueSky profile data.
@@ -291,6 +238,7 @@ class BlueSkyScraper(BaseScraper):
             url: BlueSky profile URL or handle
             grantee_name: Name of the grantee
             max_posts: Maximum number of posts to scrape (defaults to config.MAX_POSTS_PER_ACCOUNT)
+            deadline: Time budget for this job (None for no limit)
 
         Returns:
             Dictionary with:
@@ -300,6 +248,9 @@ class BlueSkyScraper(BaseScraper):
                 - engagement_metrics: dict
                 - output_path: str
         """
+        self.set_deadline(deadline)
+        self.set_pacing(url)
+
         errors = []
         posts_data = []
         profile_data = None
@@ -324,19 +275,23 @@ class BlueSkyScraper(BaseScraper):
 
             self.logger.info(f"Extracted handle: {handle}")
 
-            # Fetch profile
-            self.logger.info(f"Fetching profile for: {handle}")
-            profile_data = self._fetch_profile(handle)
-            if not profile_data:
-                errors.append({
-                    'error': f"Failed to fetch profile for {handle}",
-                    'timestamp': datetime.now().isoformat()
-                })
+            async with async_session(headers=self.headers) as session:
+                client = BlueskyClient(session, self.deadline)
 
-            # Fetch posts
-            self.logger.info(f"Fetching posts for: {handle}")
-            raw_posts = self._fetch_posts(handle, limit=limit)
-            self.logger.info(f"Fetched {len(raw_posts)} posts")
+                # Fetch profile
+                self.logger.info(f"Fetching profile for: {handle}")
+                profile_data = await self._fetch_profile(client, handle)
+                if not profile_data:
+                    errors.append({
+                        'error': f"Failed to fetch profile for {handle}",
+                        'timestamp': datetime.now().isoformat()
+                    })
+
+                # Fetch posts by DID, which survives handle changes
+                actor = (profile_data or {}).get('did') or await client.resolve_did(handle) or handle
+                self.logger.info(f"Fetching posts for: {handle}")
+                raw_posts = await client.get_author_feed(actor, limit=limit)
+                self.logger.info(f"Fetched {len(raw_posts)} posts")
 
             # Process posts
             for feed_item in raw_posts:
@@ -394,7 +349,7 @@ class BlueSkyScraper(BaseScraper):
                 f"{len(posts_data)} posts, {len(errors)} errors"
             )
 
-            return {
+            result = {
                 'success': len(posts_data) > 0 or profile_data is not None,
                 'posts_downloaded': len(posts_data),
                 'errors': errors,
@@ -402,6 +357,11 @@ class BlueSkyScraper(BaseScraper):
                 'output_path': str(output_path)
             }
 
+            if len(raw_posts) < limit and self.deadline.expired:
+                self.mark_timed_out(result, f"Job deadline reached while fetching posts for {handle}")
+
+            return result
+
         except Exception as e:
             error_msg = f"Unexpected error during scraping: {str(e)}"
             self.logger.error(error_msg, exc_info=True)
@@ -421,10 +381,15 @@ class BlueSkyScraper(BaseScraper):
                 except Exception as save_error:
                     self.logger.error(f"Failed to save data after error: {save_error}")
 
-            return {
+            result = {
                 'success': False,
                 'posts_downloaded': len(posts_data),
                 'errors': errors,
                 'engagement_metrics': self._calculate_engagement_metrics(posts_data, profile_data),
                 'output_path': str(output_path) if 'output_path' in locals() else ''
             }
+
+            if isinstance(e, DeadlineExceeded):
+                self.mark_timed_out(result, error_msg)
+
+            return result
@@ -5,23 +5,138 @@ Handles various Facebook URL formats and extracts posts with engagement metrics.
 Enhanced with anti-detection measures and robust error handling.
 """
 
-import asyncio
-import json
 import random
 import re
-import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from urllib.parse import urlparse, unquote
 
 try:
-    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
+    from playwright.async_api import TimeoutError as PlaywrightTimeout
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
 from .base import BaseScraper
+from browser_pool import get_browser_pool
+from deadline import Deadline, DeadlineExceeded
+from page_waits import scroll_and_wait, wait_for_network_idle, wait_for_selector
+from selector_registry import get_selector_registry
+from session_vault import get_session_vault
+
+# Chromium flags for the pooled Facebook browser
+BROWSER_ARGS = (
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+    '--disable-web-security',
+    '--disable-features=IsolateOrigins,site-per-process',
+    '--disable-site-isolation-trials',
+)
+
+# Randomize user agent slightly to avoid fingerprinting
+USER_AGENTS = [
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0'
+]
+
+# Fallback selectors for posts and their parts, tried in order.
+# Facebook frequently changes its DOM structure, so we try several; the
+# post list is ranked by past hit rate (selector_registry.py).
+POST_SELECTORS = {
+    'post': [
+        '[role="article"]',
+        '[data-ad-preview="message"]',
+        'div[data-pagelet*="FeedUnit"]',
+        'div[data-pagelet*="ProfileTimeline"]',
+        '.userContentWrapper',
+        'div.story_body_container',
+        '[data-testid="story-subtitle"]',
+    ],
+    'text': [
+        '[data-ad-preview="message"]',
+        '[data-ad-comet-preview="message"]',
+        '.userContent',
+        'div[dir="auto"]',
+    ],
+    'time': ['abbr', 'a[href*="/posts/"]', 'a[href*="/permalink/"]', 'span[id^="jsc"]'],
+    'engagement': '[aria-label*="reaction"], [aria-label*="comment"], [aria-label*="share"]',
+    'link': 'a[href*="/posts/"], a[href*="/permalink/"]',
+}
+
+# Reads every post's raw fields in one page.evaluate call: the first post
+# selector with elements holding more than 10 characters of text wins.
+EXTRACT_POSTS_JS = """
+({selectors, maxPosts}) => {
+    let elements = [];
+    let used = null;
+    for (const selector of selectors.post) {
+        elements = Array.from(document.querySelectorAll(selector))
+            .filter(el => (el.innerText || '').trim().length > 10);
+        if (elements.length) { used = selector; break; }
+    }
+
+    const posts = elements.slice(0, maxPosts).map(el => {
+        let text = '';
+        for (const selector of selectors.text) {
+            const textEl = el.querySelector(selector);
+            const value = textEl ? (textEl.innerText || '').trim() : '';
+            if (value) { text = value; break; }
+        }
+
+        let timestamp = null;
+        let timeText = null;
+        for (const selector of selectors.time) {
+            const timeEl = el.querySelector(selector);
+            if (!timeEl) continue;
+            for (const attr of ['data-utime', 'data-timestamp', 'title']) {
+                const value = timeEl.getAttribute(attr);
+                if (value && /^\\d+$/.test(value)) { timestamp = value; break; }
+            }
+            if (timestamp) break;
+            const value = (timeEl.innerText || '').trim();
+            if (value) { timeText = value; break; }
+        }
+
+        const link = el.querySelector(selectors.link);
+        return {
+            text: text,
+            fullText: el.innerText || '',
+            timestamp: timestamp,
+            timeText: timeText,
+            ariaLabels: Array.from(el.querySelectorAll(selectors.engagement), e => e.getAttribute('aria-label')),
+            href: link ? link.getAttribute('href') : null,
+        };
+    });
+    return {selector: used, posts: posts};
+}
+"""
+
+# Engagement count patterns matched against a post's full text
+REACTION_PATTERNS = [
+    r'(\d[\d,]*)\s+reactions?',
+    r'(\d[\d,]*)\s+likes?',
+    r'(\d[\d,]*)\s+(?:others?|people)\s+(?:reacted|like)',
+    r'(\d[\d,]*)\s+All\s+reactions?',
+    r'Like:\s*(\d[\d,]*)',
+    r'(\d[\d,]*)\s+(?:👍|❤|😆|😮|😢|😡)',  # Emoji reactions
+]
+COMMENT_PATTERNS = [
+    r'(\d[\d,]*)\s+comments?',
+    r'(\d[\d,]*)\s+comment\s',
+    r'Comment:\s*(\d[\d,]*)',
+    r'View\s+(\d[\d,]*)\s+comments?',
+    r'See\s+all\s+(\d[\d,]*)\s+comments?',
+]
+SHARE_PATTERNS = [
+    r'(\d[\d,]*)\s+shares?',
+    r'(\d[\d,]*)\s+share\s',
+    r'Share:\s*(\d[\d,]*)',
+    r'Shared\s+(\d[\d,]*)\s+times?',
+]
 
 
 class FacebookScraper(BaseScraper):
@@ -46,7 +161,7 @@ class FacebookScraper(BaseScraper):
         super().__init__(output_dir)
         self.headless = headless
         self.max_retries = max_retries
-        self.cookies_file = Path("output/facebook_cookies.json")
+        self.vault = get_session_vault()
 
         if not PLAYWRIGHT_AVAILABLE:
             self.logger.error(
@@ -154,12 +269,14 @@ class FacebookScraper(BaseScraper):
         return username_path
 
     async def _random_delay(self, min_ms: int = 500, max_ms: int = 2000):
-        """Add random delay to simulate human behavior."""
-        delay = random.randint(min_ms, max_ms)
-        await asyncio.sleep(delay / 1000)
+        """Add a random, pacing-scaled delay to simulate human behavior."""
+        await self.pause(min_ms / 1000, max_ms / 1000)
 
     async def _human_like_mouse_movement(self, page):
-        """Simulate human-like mouse movements."""
+        """Simulate human-like mouse movements, unless the pacing profile skips them."""
+        if not self.pacing.human_simulation:
+            return
+
         try:
             # Move mouse to random positions
             for _ in range(random.randint(2, 4)):
@@ -170,29 +287,9 @@ class FacebookScraper(BaseScraper):
         except Exception as e:
             self.logger.debug(f"Mouse movement error: {e}")
 
-    async def _save_cookies(self, context):
-        """Save cookies for session persistence."""
-        try:
-            cookies = await context.cookies()
-            self.cookies_file.parent.mkdir(exist_ok=True, parents=True)
-            with open(self.cookies_file, 'w') as f:
-                json.dump(cookies, f)
-            self.logger.debug(f"Saved {len(cookies)} cookies")
-        except Exception as e:
-            self.logger.debug(f"Could not save cookies: {e}")
-
-    async def _load_cookies(self, context):
-        """Load cookies for session persistence."""
-        try:
-            if self.cookies_file.exists():
-                with open(self.cookies_file, 'r') as f:
-                    cookies = json.load(f)
-                await context.add_cookies(cookies)
-                self.logger.debug(f"Loaded {len(cookies)} cookies")
-                return True
-        except Exception as e:
-            self.logger.debug(f"Could not load cookies: {e}")
-        return False
+    async def _save_session(self, context):
+        """Save the context's cookies to the session vault for later runs."""
+        await self.vault.save_context(self.platform_name, context, validated=False)
 
     async def _detect_blocks(self, page) -> bool:
         """
@@ -252,23 +349,25 @@ class FacebookScraper(BaseScraper):
                 'div[aria-label*="Close"]'
             ]
 
-            for selector in close_selectors:
-                try:
-                    element = await page.wait_for_selector(selector, timeout=2000)
-                    if element:
-                        await element.click()
-                        self.logger.info("Closed login wall")
-                        await self._random_delay(1000, 2000)
-                        return True
-                except:
-                    continue
+            element = await wait_for_selector(page, close_selectors, self.deadline.timeout_ms(3000), state='visible')
+            if element:
+                await element.click()
+                self.logger.info("Closed login wall")
+                await wait_for_network_idle(page, self.deadline.timeout_ms(3000))
+                return True
 
         except Exception as e:
             self.logger.debug(f"Could not handle login wall: {e}")
 
         return False
 
-    def scrape(self, url: str, grantee_name: str, max_posts: int = 25) -> Dict[str, Any]:
+    async def scrape_async(
+        self,
+        url: str,
+        grantee_name: str,
+        max_posts: int = 25,
+        deadline: Optional[Deadline] = None
+    ) -> Dict[str, Any]:
         """
         Scrape Facebook page/profile for posts and engagement metrics.
 
@@ -276,6 +375,7 @@ class FacebookScraper(BaseScraper):
             url: Facebook URL to scrape
             grantee_name: Name of the grantee
             max_posts: Maximum posts to scrape
+            deadline: Time budget for this job (None for no limit)
 
         Returns:
             Dictionary with:
@@ -284,6 +384,9 @@ class FacebookScraper(BaseScraper):
                 - errors (List[str]): Error messages
                 - engagement_metrics (Dict): Engagement statistics
         """
+        self.set_deadline(deadline)
+        self.set_pacing(url)
+
         if not PLAYWRIGHT_AVAILABLE:
             return {
                 'success': False,
@@ -306,21 +409,32 @@ class FacebookScraper(BaseScraper):
 
         # Run async scraping with retry logic
         last_error = None
+        last_result = None
         for attempt in range(self.max_retries):
             try:
                 if attempt > 0:
                     # Exponential backoff
                     wait_time = (2 ** attempt) + random.uniform(0, 1)
                     self.logger.info(f"Retry attempt {attempt + 1}/{self.max_retries} after {wait_time:.1f}s")
-                    time.sleep(wait_time)
+                    await self.wait(wait_time, 'retry_backoff')
 
-                result = asyncio.run(self._scrape_async(url, username, grantee_name, max_posts))
+                result = await self._scrape_async(url, username, grantee_name, max_posts)
 
-                # If successful or partially successful, return result
-                if result['success'] or result['posts_downloaded'] > 0:
+                # If successful, partially successful or out of time, return result
+                if result['success'] or result['posts_downloaded'] > 0 or result.get('timed_out'):
                     return result
 
                 last_error = result.get('errors', ['Unknown error'])
+                last_result = result
+
+            except DeadlineExceeded as e:
+                # Keep what the last attempt found (e.g. the follower count)
+                return self.mark_timed_out({
+                    'success': False,
+                    'posts_downloaded': (last_result or {}).get('posts_downloaded', 0),
+                    'errors': (last_error or []) + [str(e)],
+                    'engagement_metrics': (last_result or {}).get('engagement_metrics', {})
+                }, f"Timed out scraping {username}: {e}")
 
             except Exception as e:
                 last_error = [f'Fatal error: {str(e)}']
@@ -339,6 +453,10 @@ class FacebookScraper(BaseScraper):
         """
         Async scraping implementation using Playwright.
 
+        Runs on a warm context from the shared browser pool, which keeps its
+        cookies between grantees and starts from the session vault's. A context that hits a block page is
+        discarded rather than reused.
+
         Args:
             url: Facebook URL
             username: Extracted username
@@ -358,41 +476,24 @@ class FacebookScraper(BaseScraper):
             'avg_engagement_rate': 0.0
         }
 
-        async with async_playwright() as p:
+        # Context settings for a new pooled context (reused contexts keep theirs)
+        context_options = {
+            'viewport': {'width': 1920, 'height': 1080},
+            'user_agent': random.choice(USER_AGENTS),
+            'locale': 'en-US',
+            'timezone_id': 'America/New_York',
+            'permissions': ['geolocation']
+        }
+        context_options = self.vault.context_options(self.platform_name, context_options)
+
+        async with get_browser_pool().lease(
+            self.platform_name,
+            context_options=context_options,
+            headless=self.headless,
+            args=BROWSER_ARGS
+        ) as lease:
+            context = lease.context
             try:
-                # Launch browser with enhanced stealth settings
-                browser = await p.chromium.launch(
-                    headless=self.headless,
-                    args=[
-                        '--disable-blink-features=AutomationControlled',
-                        '--disable-dev-shm-usage',
-                        '--no-sandbox',
-                        '--disable-web-security',
-                        '--disable-features=IsolateOrigins,site-per-process',
-                        '--disable-site-isolation-trials'
-                    ]
-                )
-
-                # Randomize user agent slightly to avoid fingerprinting
-                user_agents = [
-                    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-                    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0'
-                ]
-
-                # Create context with realistic settings
-                context = await browser.new_context(
-                    viewport={'width': 1920, 'height': 1080},
-                    user_agent=random.choice(user_agents),
-                    locale='en-US',
-                    timezone_id='America/New_York',
-                    permissions=['geolocation']
-                )
-
-                # Load cookies if available
-                await self._load_cookies(context)
-
                 page = await context.new_page()
 
                 # Add stealth JavaScript to hide automation
@@ -414,11 +515,12 @@ class FacebookScraper(BaseScraper):
                 # Navigate to page
                 self.logger.info(f"Navigating to {url}")
                 try:
-                    await page.goto(url, wait_until='domcontentloaded', timeout=30000)
-                    await self._random_delay(2000, 4000)
+                    await self.goto(page, url, wait_until='domcontentloaded', timeout=self.deadline.timeout_ms(30000))
                 except PlaywrightTimeout:
                     self.logger.warning("Page load timeout, continuing anyway")
-                    await self._random_delay(1000, 2000)
+
+                # Ready once the page's main column or first post renders
+                await wait_for_selector(page, ['[role="main"]', '[role="article"]'], self.deadline.timeout_ms(10000))
 
                 # Simulate human-like mouse movement
                 await self._human_like_mouse_movement(page)
@@ -426,8 +528,8 @@ class FacebookScraper(BaseScraper):
                 # Check for blocks or captcha
                 if await self._detect_blocks(page):
                     errors.append("Page appears to be blocked or requires verification")
-                    await self._save_cookies(context)
-                    await browser.close()
+                    await self._save_session(context)
+                    lease.discard()
                     return {
                         'success': False,
                         'posts_downloaded': 0,
@@ -437,7 +539,6 @@ class FacebookScraper(BaseScraper):
 
                 # Try to handle login wall
                 await self._handle_login_wall(page)
-                await self._random_delay(1000, 2000)
 
                 # Try to extract follower count
                 followers_count = await self._extract_followers(page)
@@ -454,22 +555,7 @@ class FacebookScraper(BaseScraper):
                 posts = await self._extract_posts(page, max_posts=max_posts)
 
                 # Calculate engagement metrics
-                if posts:
-                    total_reactions = sum(p.get('reactions', 0) for p in posts)
-                    total_comments = sum(p.get('comments', 0) for p in posts)
-                    total_shares = sum(p.get('shares', 0) for p in posts)
-
-                    engagement_metrics['total_reactions'] = total_reactions
-                    engagement_metrics['total_comments'] = total_comments
-                    engagement_metrics['total_shares'] = total_shares
-
-                    # Calculate average engagement rate
-                    total_engagement = total_reactions + total_comments + total_shares
-                    if followers_count and followers_count > 0:
-                        avg_engagement = (total_engagement / len(posts)) / followers_count * 100
-                        engagement_metrics['avg_engagement_rate'] = round(avg_engagement, 2)
-
-                    self.logger.info(f"Extracted {len(posts)} posts with {total_engagement} total engagements")
+                self._update_engagement_metrics(engagement_metrics, posts)
 
                 # Save data
                 output_dir = self._create_output_directory(grantee_name, username)
@@ -487,39 +573,73 @@ class FacebookScraper(BaseScraper):
 
                 # Save posts
                 if posts:
-                    posts_file = output_dir / "posts.json"
-                    with open(posts_file, 'w', encoding='utf-8') as f:
-                        json.dump(posts, f, indent=2, ensure_ascii=False)
-                    self.logger.info(f"Saved posts to {posts_file}")
+                    self.save_posts(posts, output_dir, "posts.json")
 
                 # Save cookies for future use
-                await self._save_cookies(context)
-
-                await browser.close()
+                await self._save_session(context)
 
-                return {
+                result = {
                     'success': True,
                     'posts_downloaded': len(posts),
                     'errors': errors,
-                    'engagement_metrics': engagement_metrics
+                    'engagement_metrics': engagement_metrics,
+                    'output_path': str(output_dir)
                 }
 
+                if self.deadline.expired:
+                    self.mark_timed_out(result, f"Job deadline reached while scraping {username}")
+
+                return result
+
             except Exception as e:
                 self.logger.error(f"Error during scraping: {e}", exc_info=True)
                 errors.append(str(e))
 
-                try:
-                    await browser.close()
-                except:
-                    pass
-
-                return {
+                result = {
                     'success': False,
                     'posts_downloaded': len(posts),
                     'errors': errors,
                     'engagement_metrics': engagement_metrics
                 }
 
+                if isinstance(e, DeadlineExceeded):
+                    # Keep the posts extracted before the deadline
+                    if posts:
+                        self._update_engagement_metrics(engagement_metrics, posts)
+                        self.save_posts(posts, self._create_output_directory(grantee_name, username), "posts.json")
+                    self.mark_timed_out(result, f"Timed out scraping {username}: {e}")
+
+                return result
+
+    def _update_engagement_metrics(self, engagement_metrics: Dict[str, Any],
+                                   posts: List[Dict[str, Any]]) -> None:
+        """
+        Add engagement totals over the posts to the engagement metrics.
+
+        Args:
+            engagement_metrics: Metrics dictionary (with followers_count), updated in place
+            posts: Extracted posts
+        """
+        if not posts:
+            return
+
+        total_reactions = sum(p.get('reactions', 0) for p in posts)
+        total_comments = sum(p.get('comments', 0) for p in posts)
+        total_shares = sum(p.get('shares', 0) for p in posts)
+
+        engagement_metrics['total_reactions'] = total_reactions
+        engagement_metrics['total_comments'] = total_comments
+        engagement_metrics['total_shares'] = total_shares
+
+        # Calculate average engagement rate
+        total_engagement = total_reactions + total_comments + total_shares
+        followers_count = engagement_metrics.get('followers_count')
+        if followers_count and followers_count > 0:
+            avg_engagement = (total_engagement / len(posts)) / followers_count * 100
+            engagement_metrics['avg_engagement_rate'] = round(avg_engagement, 2)
+
+        self.logger.info(f"Extracted {len(posts)} posts with {total_engagement} total engagements")
+
     async def _extract_followers(self, page) -> Optional[int]:
         """
         Extract follower/likes count from page with multiple fallback strategies.
@@ -607,17 +727,19 @@ class FacebookScraper(BaseScraper):
         Args:
             page: Playwright page object
             max_scrolls: Maximum number of scrolls
-            scroll_delay: Delay between scrolls in seconds
+            scroll_delay: Longest wait for new posts after each scroll, in seconds
         """
         for i in range(max_scrolls):
             try:
-                # Scroll to bottom
-                await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-
-                # Wait for content to load
-                await page.wait_for_timeout(int(scroll_delay * 1000))
+                # Scroll to bottom and wait for new posts
+                added = await scroll_and_wait(
+                    page, '[role="article"]', self.deadline.timeout_ms(scroll_delay * 1000),
+                    floor_ms=self.pacing.scroll_floor_ms
+                )
 
-                self.logger.debug(f"Scroll {i+1}/{max_scrolls} completed")
+                self.logger.debug(f"Scroll {i+1}/{max_scrolls} completed ({added} new posts)")
+                if not added:
+                    break
 
             except Exception as e:
                 self.logger.debug(f"Error during scroll {i+1}: {e}")
@@ -633,26 +755,18 @@ class FacebookScraper(BaseScraper):
         """
         for i in range(max_scrolls):
             try:
-                # Get current scroll position
-                prev_height = await page.evaluate('document.body.scrollHeight')
-
-                # Scroll in multiple smaller increments (more human-like)
-                scroll_distance = random.randint(400, 800)
-                for _ in range(3):
-                    await page.evaluate(f'window.scrollBy(0, {scroll_distance})')
-                    await self._random_delay(200, 500)
-
-                # Random chance to scroll back up a bit (like reading)
-                if random.random() < 0.3:
-                    await page.evaluate(f'window.scrollBy(0, -{random.randint(100, 300)})')
-                    await self._random_delay(300, 600)
-
-                # Wait for new content to load with random delay
-                await self._random_delay(1500, 3000)
+                # Scroll a random distance (more human-like) and wait for
+                # new posts instead of a fixed reading delay
+                added = await scroll_and_wait(
+                    page,
+                    '[role="article"]',
+                    self.deadline.timeout_ms(4000),
+                    scroll_by=random.randint(1200, 2400),
+                    floor_ms=self.pacing.scroll_floor_ms
+                )
 
                 # Check if new content loaded
-                new_height = await page.evaluate('document.body.scrollHeight')
-                if new_height == prev_height:
+                if not added:
                     self.logger.debug(f"No new content after scroll {i+1}, stopping")
                     break
 
@@ -666,6 +780,12 @@ class FacebookScraper(BaseScraper):
         """
         Extract posts from page with multiple fallback strategies.
 
+        Every selector runs inside one injected function (EXTRACT_POSTS_JS),
+        so all posts are read in a single page.evaluate round trip; the
+        engagement numbers are then parsed here from the returned text.
+        Post selectors are handed to the page best first, per the selector
+        registry, and the one that matched is recorded.
+
         Args:
             page: Playwright page object
             max_posts: Maximum number of posts to extract
@@ -674,63 +794,27 @@ class FacebookScraper(BaseScraper):
             List of post dictionaries
         """
         posts = []
+        registry = get_selector_registry()
 
         try:
-            # Common selectors for Facebook posts
-            # Note: Facebook frequently changes their DOM structure, so we try multiple selectors
-            post_selectors = [
-                '[role="article"]',
-                '[data-ad-preview="message"]',
-                'div[data-pagelet*="FeedUnit"]',
-                'div[data-pagelet*="ProfileTimeline"]',
-                '.userContentWrapper',
-                'div.story_body_container',
-                '[data-testid="story-subtitle"]'
-            ]
-
-            post_elements = []
-            used_selector = None
-            for selector in post_selectors:
-                try:
-                    elements = await page.query_selector_all(selector)
-                    if elements and len(elements) > 0:
-                        # Filter out empty or invalid elements
-                        valid_elements = []
-                        for elem in elements:
-                            try:
-                                # Check if element has meaningful content
-                                text = await elem.inner_text()
-                                if text and len(text.strip()) > 10:
-                                    valid_elements.append(elem)
-                            except:
-                                continue
-
-                        if valid_elements:
-                            post_elements = valid_elements
-                            used_selector = selector
-                            self.logger.debug(f"Found {len(valid_elements)} valid posts using selector: {selector}")
-                            break
-                except Exception as e:
-                    self.logger.debug(f"Error with selector {selector}: {e}")
-                    continue
-
-            if not post_elements:
+            ordered = registry.order('facebook', 'post', POST_SELECTORS['post'])
+            found = await page.evaluate(EXTRACT_POSTS_JS, {
+                'selectors': {**POST_SELECTORS, 'post': ordered},
+                'maxPosts': max_posts
+            })
+            registry.record_first_match('facebook', 'post', ordered, found['selector'])
+
+            if not found['posts']:
                 self.logger.warning("Could not find any posts on the page")
                 return posts
 
-            # Limit to max_posts
-            post_elements = post_elements[:max_posts]
+            self.logger.debug(f"Found {len(found['posts'])} valid posts using selector: {found['selector']}")
 
-            # Extract data from each post
-            for idx, element in enumerate(post_elements):
+            for idx, fields in enumerate(found['posts']):
                 try:
-                    post_data = await self._extract_post_data(element, idx)
+                    post_data = self._post_from_fields(fields, idx)
                     if post_data:
                         posts.append(post_data)
-
-                    if len(posts) >= max_posts:
-                        break
-
                 except Exception as e:
                     self.logger.debug(f"Error extracting post {idx}: {e}")
                     continue
@@ -742,202 +826,78 @@ class FacebookScraper(BaseScraper):
 
         return posts
 
-    async def _extract_post_data(self, element, index: int) -> Optional[Dict[str, Any]]:
+    @staticmethod
+    def _max_count(text: str, patterns: List[str]) -> int:
+        """Return the largest count any of the patterns finds in text (0 if none)."""
+        best = 0
+        for pattern in patterns:
+            for match in re.finditer(pattern, text, re.IGNORECASE):
+                try:
+                    best = max(best, int(match.group(1).replace(',', '')))
+                except (ValueError, IndexError):
+                    continue
+        return best
+
+    def _post_from_fields(self, fields: Dict[str, Any], index: int) -> Optional[Dict[str, Any]]:
         """
-        Extract data from a single post element.
+        Build a post dictionary from the raw fields EXTRACT_POSTS_JS returned.
 
         Args:
-            element: Playwright element for the post
+            fields: Raw fields for one post element
             index: Post index
 
         Returns:
-            Post data dictionary or None
+            Post data dictionary, or None if it has no usable content
         """
-        try:
-            post_data = {
-                'id': f'post_{index}',
-                'text': '',
-                'date': None,
-                'reactions': 0,
-                'comments': 0,
-                'shares': 0,
-                'url': None
-            }
-
-            # Extract post text
-            try:
-                # Try multiple selectors for post content
-                text_selectors = [
-                    '[data-ad-preview="message"]',
-                    '[data-ad-comet-preview="message"]',
-                    '.userContent',
-                    'div[dir="auto"]'
-                ]
-
-                for selector in text_selectors:
-                    text_elem = await element.query_selector(selector)
-                    if text_elem:
-                        text = await text_elem.inner_text()
-                        if text and len(text.strip()) > 0:
-                            post_data['text'] = text.strip()
-                            break
-
-                # If still no text, get all text content (may include extra info)
-                if not post_data['text']:
-                    text = await element.inner_text()
-                    # Take first 500 chars to avoid getting too much extra content
-                    post_data['text'] = text[:500].strip()
-
-            except Exception as e:
-                self.logger.debug(f"Could not extract post text: {e}")
-
-            # Extract date/timestamp
-            try:
-                time_selectors = [
-                    'abbr',
-                    'a[href*="/posts/"]',
-                    'a[href*="/permalink/"]',
-                    'span[id^="jsc"]'
-                ]
-
-                for selector in time_selectors:
-                    time_elem = await element.query_selector(selector)
-                    if time_elem:
-                        # Try to get timestamp from various attributes
-                        for attr in ['data-utime', 'data-timestamp', 'title']:
-                            timestamp = await time_elem.get_attribute(attr)
-                            if timestamp:
-                                try:
-                                    # Try to parse as unix timestamp
-                                    if timestamp.isdigit():
-                                        dt = datetime.fromtimestamp(int(timestamp))
-                                        post_data['date'] = dt.isoformat()
-                                        break
-                                except:
-                                    pass
-
-                        # If still no date, try to get text content
-                        if not post_data['date']:
-                            time_text = await time_elem.inner_text()
-                            if time_text:
-                                post_data['date'] = time_text.strip()
-                                break
-
-            except Exception as e:
-                self.logger.debug(f"Could not extract post date: {e}")
+        full_text = fields.get('fullText') or ''
+
+        post_data = {
+            'id': f'post_{index}',
+            'text': fields.get('text') or full_text[:500].strip(),
+            'date': None,
+            'reactions': self._max_count(full_text, REACTION_PATTERNS),
+            'comments': self._max_count(full_text, COMMENT_PATTERNS),
+            'shares': self._max_count(full_text, SHARE_PATTERNS),
+            'url': None
+        }
 
-            # Extract engagement metrics with multiple strategies
+        # Date from a unix timestamp attribute, else the visible relative time
+        timestamp = fields.get('timestamp')
+        if timestamp:
             try:
-                # Get all text from element to find engagement numbers
-                full_text = await element.inner_text()
-
-                # Strategy 1: Look for reactions (likes, love, etc.)
-                reaction_patterns = [
-                    r'(\d[\d,]*)\s+reactions?',
-                    r'(\d[\d,]*)\s+likes?',
-                    r'(\d[\d,]*)\s+(?:others?|people)\s+(?:reacted|like)',
-                    r'(\d[\d,]*)\s+All\s+reactions?',
-                    r'Like:\s*(\d[\d,]*)',
-                    r'(\d[\d,]*)\s+(?:👍|❤|😆|😮|😢|😡)',  # Emoji reactions
-                ]
-
-                for pattern in reaction_patterns:
-                    matches = re.finditer(pattern, full_text, re.IGNORECASE)
-                    for match in matches:
-                        try:
-                            count = int(match.group(1).replace(',', ''))
-                            # Only update if we found a larger number (more specific)
-                            if count > post_data['reactions']:
-                                post_data['reactions'] = count
-                        except (ValueError, IndexError):
-                            continue
-
-                # Strategy 2: Look for comments
-                comment_patterns = [
-                    r'(\d[\d,]*)\s+comments?',
-                    r'(\d[\d,]*)\s+comment\s',
-                    r'Comment:\s*(\d[\d,]*)',
-                    r'View\s+(\d[\d,]*)\s+comments?',
-                    r'See\s+all\s+(\d[\d,]*)\s+comments?',
-                ]
-
-                for pattern in comment_patterns:
-                    matches = re.finditer(pattern, full_text, re.IGNORECASE)
-                    for match in matches:
-                        try:
-                            count = int(match.group(1).replace(',', ''))
-                            if count > post_data['comments']:
-                                post_data['comments'] = count
-                        except (ValueError, IndexError):
-                            continue
-
-                # Strategy 3: Look for shares
-                share_patterns = [
-                    r'(\d[\d,]*)\s+shares?',
-                    r'(\d[\d,]*)\s+share\s',
-                    r'Share:\s*(\d[\d,]*)',
-                    r'Shared\s+(\d[\d,]*)\s+times?',
-                ]
-
-                for pattern in share_patterns:
-                    matches = re.finditer(pattern, full_text, re.IGNORECASE)
-                    for match in matches:
-                        try:
-                            count = int(match.group(1).replace(',', ''))
-                            if count > post_data['shares']:
-                                post_data['shares'] = count
-                        except (ValueError, IndexError):
-                            continue
-
-                # Strategy 4: Look for engagement in aria-labels and specific elements
+                post_data['date'] = datetime.fromtimestamp(int(timestamp)).isoformat()
+            except (ValueError, OverflowError, OSError):
+                pass
+        if not post_data['date'] and fields.get('timeText'):
+            post_data['date'] = fields['timeText']
+
+        # Engagement in aria-labels, e.g. "Like: 1,234 people"
+        for aria_label in fields.get('ariaLabels') or []:
+            aria_lower = aria_label.lower()
+            if 'reaction' in aria_lower or 'like' in aria_lower:
+                key = 'reactions'
+            elif 'comment' in aria_lower:
+                key = 'comments'
+            elif 'share' in aria_lower:
+                key = 'shares'
+            else:
+                continue
+
+            for num_str in re.findall(r'(\d[\d,]*)', aria_label):
                 try:
-                    engagement_elements = await element.query_selector_all('[aria-label*="reaction"], [aria-label*="comment"], [aria-label*="share"]')
-                    for eng_elem in engagement_elements:
-                        aria_label = await eng_elem.get_attribute('aria-label')
-                        if aria_label:
-                            # Extract numbers from aria-label
-                            numbers = re.findall(r'(\d[\d,]*)', aria_label)
-                            for num_str in numbers:
-                                try:
-                                    count = int(num_str.replace(',', ''))
-                                    # Heuristic: assign based on aria-label content
-                                    aria_lower = aria_label.lower()
-                                    if 'reaction' in aria_lower or 'like' in aria_lower:
-                                        if count > post_data['reactions']:
-                                            post_data['reactions'] = count
-                                    elif 'comment' in aria_lower:
-                                        if count > post_data['comments']:
-                                            post_data['comments'] = count
-                                    elif 'share' in aria_lower:
-                                        if count > post_data['shares']:
-                                            post_data['shares'] = count
-                                except (ValueError, AttributeError):
-                                    continue
-                except Exception as e:
-                    self.logger.debug(f"Could not extract from aria-labels: {e}")
-
-            except Exception as e:
-                self.logger.debug(f"Could not extract engagement metrics: {e}")
-
-            # Try to extract post URL
-            try:
-                link_elem = await element.query_selector('a[href*="/posts/"], a[href*="/permalink/"]')
-                if link_elem:
-                    href = await link_elem.get_attribute('href')
-                    if href:
-                        # Make absolute URL
-                        if href.startswith('/'):
-                            href = 'https://www.facebook.com' + href
-                        post_data['url'] = href
-            except Exception as e:
-                self.logger.debug(f"Could not extract post URL: {e}")
+                    post_data[key] = max(post_data[key], int(num_str.replace(',', '')))
+                except ValueError:
+                    continue
 
-            # Only return post if we extracted at least some content
-            if post_data['text'] or post_data['reactions'] > 0 or post_data['comments'] > 0:
-                return post_data
+        href = fields.get('href')
+        if href:
+            # Make absolute URL
+            if href.startswith('/'):
+                href = 'https://www.facebook.com' + href
+            post_data['url'] = href
 
-            return None
+        # Only return post if we extracted at least some content
+        if post_data['text'] or post_data['reactions'] > 0 or post_data['comments'] > 0:
+            return post_data
 
-        except Exception as e:
-            self.logger.debug(f"Error extracting post data: {e}")
-            return None
+        return None
@@ -3,6 +3,7 @@ Instagram scraper using instaloader library.
 Scrapes post metadata without downloading media files for speed.
 """
 
+import asyncio
 import json
 import os
 import random
@@ -15,12 +16,15 @@ from typing import Dict, Any, Optional, List
 import instaloader
 
 from .base import BaseScraper
+from deadline import Deadline, DeadlineExceeded
+from session_vault import get_session_vault
+from time_accounting import measure
 
 # Rate limiting constants with exponential backoff support
 INITIAL_DELAY = 2.0  # seconds - start small and increase if needed
 MAX_DELAY = 120.0  # seconds - cap for exponential backoff
-DELAY_AFTER_LOGIN = 5  # seconds
-DELAY_BETWEEN_POSTS = 0.5  # seconds between posts
+DELAY_AFTER_LOGIN = 5  # seconds at standard pacing
+DELAY_BETWEEN_POSTS = 0.5  # seconds between posts at standard pacing
 MAX_RETRIES = 3  # number of retries for failed requests
 BACKOFF_MULTIPLIER = 2.0  # exponential backoff multiplier
 JITTER_FACTOR = 0.3  # add ±30% jitter to delays
@@ -37,10 +41,14 @@ class InstagramScraper(BaseScraper):
 
         Args:
             output_dir: Base directory for storing scraped data
-            session_file: Optional path to instaloader session file
+            session_file: Optional path to instaloader session file (default:
+                a file in the session vault's directory)
         """
         super().__init__(Path(output_dir) if output_dir else None)
-        self.session_file = session_file
+        self.vault = get_session_vault()
+        self.session_file = session_file or str(
+            self.vault.path('instaloader', os.getenv('INSTAGRAM_USERNAME'), suffix='.session')
+        )
         self.loader = instaloader.Instaloader(
             download_pictures=False,
             download_videos=False,
@@ -277,19 +285,39 @@ class InstagramScraper(BaseScraper):
             )
             return False
 
+        # Log in under the vault's lock; a parallel run may have saved a
+        # session while this one waited for it
+        with self.vault.lock('instaloader', username):
+            if self._load_session():
+                return True
+            return self._login_with_credentials(username, password)
+
+    def _login_with_credentials(self, username: str, password: str) -> bool:
+        """
+        Log in with the given credentials, retrying with backoff, and save the session.
+
+        Args:
+            username: Instagram username
+            password: Instagram password
+
+        Returns:
+            True if login successful, False otherwise
+        """
         # Try login with exponential backoff on failure
         for attempt in range(MAX_RETRIES):
             try:
                 if attempt > 0:
                     delay = self._calculate_backoff_delay(attempt, base_delay=5.0)
                     self.logger.info(f"Retrying login (attempt {attempt + 1}/{MAX_RETRIES}) after {delay:.1f}s...")
-                    time.sleep(delay)
+                    with measure('sleep', 'retry_backoff'):
+                        time.sleep(delay)
 
                 self.loader.login(username, password)
                 self.logger.info(f"Successfully logged in as {username}")
 
                 # Rate limit: delay after login
-                time.sleep(DELAY_AFTER_LOGIN)
+                with measure('sleep', 'login_delay'):
+                    time.sleep(self.pacing.scaled(DELAY_AFTER_LOGIN))
 
                 # Save session for future use
                 if self.session_file:
@@ -424,7 +452,40 @@ class InstagramScraper(BaseScraper):
 
         return metrics
 
-    def scrape(self, url: str, grantee_name: str, max_posts: int = 25) -> Dict[str, Any]:
+    async def scrape_async(
+        self,
+        url: str,
+        grantee_name: str,
+        max_posts: int = 25,
+        deadline: Optional[Deadline] = None
+    ) -> Dict[str, Any]:
+        """
+        Scrape Instagram profile posts.
+
+        instaloader is a blocking library, so the scrape runs in a worker
+        thread and the event loop stays free for other jobs.
+
+        Args:
+            url: Instagram profile URL
+            grantee_name: Name of the grantee
+            max_posts: Maximum number of posts to scrape (default: 25)
+            deadline: Time budget for this job (None for no limit)
+
+        Returns:
+            Same dictionary as _scrape_blocking()
+        """
+        # Instaloader time is mostly HTTP; its deliberate waits are measured
+        # inside and left out
+        with measure('network', 'instaloader'):
+            return await asyncio.to_thread(self._scrape_blocking, url, grantee_name, max_posts, deadline)
+
+    def _scrape_blocking(
+        self,
+        url: str,
+        grantee_name: str,
+        max_posts: int = 25,
+        deadline: Optional[Deadline] = None
+    ) -> Dict[str, Any]:
         """
         Scrape Instagram profile posts.
 
@@ -434,6 +495,7 @@ class InstagramScraper(BaseScraper):
             url: Instagram profile URL
             grantee_name: Name of the grantee
             max_posts: Maximum number of posts to scrape (default: 25)
+            deadline: Time budget for this job (None for no limit)
 
         Returns:
             Dictionary containing:
@@ -442,6 +504,9 @@ class InstagramScraper(BaseScraper):
                 - errors (List[str]): List of errors encountered
                 - engagement_metrics (Dict): Engagement metrics
         """
+        self.set_deadline(deadline)
+        self.set_pacing(url)
+
         errors = []
         posts_downloaded = 0
         posts_metadata = []
@@ -471,7 +536,7 @@ class InstagramScraper(BaseScraper):
             if self._profiles_scraped > 0:
                 delay = self._add_jitter(self._current_delay)
                 self.logger.debug(f"Rate limit: waiting {delay:.1f}s before loading profile")
-                time.sleep(delay)
+                self.wait_blocking(delay, 'rate_limit')
 
             # Load profile with retry logic
             profile = None
@@ -483,7 +548,7 @@ class InstagramScraper(BaseScraper):
                             f"Retrying profile load (attempt {attempt + 1}/{MAX_RETRIES}) "
                             f"after {delay:.1f}s..."
                         )
-                        time.sleep(delay)
+                        self.wait_blocking(delay, 'retry_backoff')
 
                     profile = instaloader.Profile.from_username(
                         self.loader.context,
@@ -504,6 +569,8 @@ class InstagramScraper(BaseScraper):
                         'errors': [error_msg],
                         'engagement_metrics': {}
                     }
+                except DeadlineExceeded:
+                    raise
                 except Exception as e:
                     self.logger.error(f"Profile load attempt {attempt + 1} failed: {str(e)}")
 
@@ -584,6 +651,10 @@ class InstagramScraper(BaseScraper):
                     if post_count >= max_posts:
                         break
 
+                    if self.deadline.expired:
+                        self.logger.warning(f"Job deadline reached after {post_count}/{max_posts} posts")
+                        break
+
                     try:
                         post_metadata = self._extract_post_metadata(post)
                         posts_metadata.append(post_metadata)
@@ -594,7 +665,9 @@ class InstagramScraper(BaseScraper):
                         )
 
                         # Rate limit: small delay between posts
-                        time.sleep(DELAY_BETWEEN_POSTS)
+                        self.wait_blocking(self.pacing.scaled(DELAY_BETWEEN_POSTS), 'rate_limit')
+                    except DeadlineExceeded:
+                        break
                     except Exception as e:
                         error_msg = f"Error extracting post {post.shortcode}: {str(e)}"
                         self.logger.error(error_msg)
@@ -652,21 +725,32 @@ class InstagramScraper(BaseScraper):
                 f"Errors: {len(errors)}, Current delay: {self._current_delay:.1f}s"
             )
 
-            return {
+            result = {
                 'success': success,
                 'posts_downloaded': posts_downloaded,
                 'errors': errors,
-                'engagement_metrics': engagement_metrics
+                'engagement_metrics': engagement_metrics,
+                'output_path': str(output_dir)
             }
 
+            if self.deadline.expired:
+                self.mark_timed_out(result, f"Job deadline reached while scraping {username}")
+
+            return result
+
         except Exception as e:
             error_msg = f"Unexpected error during scrape: {str(e)}"
             self.logger.error(error_msg)
             errors.append(error_msg)
 
-            return {
+            result = {
                 'success': False,
                 'posts_downloaded': posts_downloaded,
                 'errors': errors,
                 'engagement_metrics': {}
             }
+
+            if isinstance(e, DeadlineExceeded):
+                self.mark_timed_out(result, error_msg)
+
+            return result
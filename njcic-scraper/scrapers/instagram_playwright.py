@@ -4,21 +4,175 @@ No login required - scrapes public profile data only.
 """
 
 import asyncio
-import json
 import random
 import re
-import time
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
 try:
-    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
+    from playwright.async_api import TimeoutError as PlaywrightTimeout
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
+import config
 from .base import BaseScraper
+from browser_pool import get_browser_pool
+from deadline import Deadline, DeadlineExceeded
+from page_waits import scroll_and_wait, wait_for_network_idle, wait_for_selector
+from response_capture import ResponseCapture, dig, iter_dicts, parse_json_payload
+from selector_registry import get_selector_registry
+from session_vault import get_session_vault
+
+# Chromium flags for the pooled Instagram browser
+BROWSER_ARGS = (
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+    '--disable-web-security',
+    '--disable-features=IsolateOrigins,site-per-process',
+)
+
+USER_AGENTS = [
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+]
+
+# Endpoints the profile page loads the user record and post grid from
+PROFILE_RESPONSE_PATTERN = r"/api/v1/users/web_profile_info/|/api/v1/feed/user/|/graphql/query"
+
+# Fallback selectors for post links in the profile grid, ranked by past hit
+# rate (selector_registry.py)
+POST_LINK_SELECTORS = [
+    'main article a[href*="/p/"]',
+    'main a[href*="/p/"]',
+    'article a[href*="/p/"]',
+    'a[href*="/p/"]',
+    'main article a[href*="/reel/"]',
+    'a[href*="/reel/"]',
+]
+
+# Reads a post page's og meta tags, timestamp and the embedded JSON blobs
+# that mention the post (its media record with exact counts) in one call
+POST_DETAIL_JS = """
+(shortcode) => {
+    const meta = property => {
+        const el = document.querySelector(`meta[property="${property}"]`);
+        return el ? el.getAttribute('content') : null;
+    };
+    const time = document.querySelector('time[datetime]');
+    return {
+        description: meta('og:description'),
+        video: meta('og:video') !== null,
+        date: time ? time.getAttribute('datetime') : null,
+        json: Array.from(document.querySelectorAll('script[type="application/json"]'), s => s.textContent)
+            .filter(text => text.includes(shortcode) && text.includes('like_count')),
+    };
+}
+"""
+
+# og:description of a post: '1,234 likes, 56 comments - njnews on March 1, 2024: "..."'
+OG_COUNTS_PATTERN = re.compile(
+    r'^([\d,.]+)([KM])?\s+likes?,\s+([\d,.]+)([KM])?\s+comments?\s+-\s+',
+    re.IGNORECASE
+)
+
+
+def _iso_from_timestamp(value: Any) -> Optional[str]:
+    try:
+        return datetime.fromtimestamp(int(value), tz=timezone.utc).isoformat()
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def parse_profile_posts(payload: Any, username: str) -> List[Dict[str, Any]]:
+    """
+    Turn an Instagram profile payload into post dicts.
+
+    Handles both the web_profile_info/GraphQL layout (timeline media nodes
+    with edge counts) and the v1 feed layout (items with like_count).
+
+    Args:
+        payload: Decoded JSON
+        username: Profile handle; posts owned by other accounts are skipped
+
+    Returns:
+        Post dicts with the same fields as DOM extraction
+    """
+    posts = []
+
+    def is_post(node):
+        return ('shortcode' in node and 'taken_at_timestamp' in node) or \
+               ('code' in node and 'taken_at' in node and 'like_count' in node)
+
+    for node in iter_dicts(payload, is_post):
+        owner = dig(node, 'owner', 'username') or dig(node, 'user', 'username')
+        if owner and owner.lower() != username.lower():
+            continue
+
+        if 'shortcode' in node:
+            shortcode = node['shortcode']
+            post = {
+                'likes': dig(node, 'edge_liked_by', 'count') or dig(node, 'edge_media_preview_like', 'count', default=0),
+                'comments': dig(node, 'edge_media_to_comment', 'count', default=0),
+                'caption': dig(node, 'edge_media_to_caption', 'edges', 0, 'node', 'text', default=''),
+                'date': _iso_from_timestamp(node['taken_at_timestamp']),
+                'is_video': bool(node.get('is_video')),
+            }
+        else:
+            shortcode = node['code']
+            post = {
+                'likes': node.get('like_count') or 0,
+                'comments': node.get('comment_count') or 0,
+                'caption': dig(node, 'caption', 'text', default=''),
+                'date': _iso_from_timestamp(node['taken_at']),
+                'is_video': node.get('media_type') == 2,
+            }
+
+        post.update({
+            'id': str(node.get('id') or node.get('pk') or shortcode),
+            'url': f"https://www.instagram.com/p/{shortcode}/",
+            'shortcode': shortcode,
+        })
+        posts.append(post)
+
+    return posts
+
+
+def parse_profile_stats(payload: Any, username: str) -> Optional[Dict[str, int]]:
+    """
+    Find follower, following and post counts in an Instagram profile payload.
+
+    Args:
+        payload: Decoded JSON
+        username: Profile handle
+
+    Returns:
+        Dict with followers_count, following_count and posts_count, or None
+    """
+    def is_user(node):
+        return 'username' in node and ('edge_followed_by' in node or 'follower_count' in node)
+
+    for user in iter_dicts(payload, is_user):
+        if str(user['username']).lower() != username.lower():
+            continue
+
+        if 'edge_followed_by' in user:
+            return {
+                'followers_count': dig(user, 'edge_followed_by', 'count', default=0),
+                'following_count': dig(user, 'edge_follow', 'count', default=0),
+                'posts_count': dig(user, 'edge_owner_to_timeline_media', 'count', default=0),
+            }
+        return {
+            'followers_count': user.get('follower_count') or 0,
+            'following_count': user.get('following_count') or 0,
+            'posts_count': user.get('media_count') or 0,
+        }
+
+    return None
 
 
 class InstagramPlaywrightScraper(BaseScraper):
@@ -41,7 +195,7 @@ class InstagramPlaywrightScraper(BaseScraper):
         super().__init__(output_dir)
         self.headless = headless
         self.max_retries = max_retries
-        self.cookies_file = Path("output/instagram_cookies.json")
+        self.vault = get_session_vault()
 
         if not PLAYWRIGHT_AVAILABLE:
             self.logger.error(
@@ -91,12 +245,14 @@ class InstagramPlaywrightScraper(BaseScraper):
         return username_path
 
     async def _random_delay(self, min_ms: int = 500, max_ms: int = 2000):
-        """Add random delay to simulate human behavior."""
-        delay = random.randint(min_ms, max_ms)
-        await asyncio.sleep(delay / 1000)
+        """Add a random, pacing-scaled delay to simulate human behavior."""
+        await self.pause(min_ms / 1000, max_ms / 1000)
 
     async def _human_like_mouse_movement(self, page):
-        """Simulate human-like mouse movements."""
+        """Simulate human-like mouse movements, unless the pacing profile skips them."""
+        if not self.pacing.human_simulation:
+            return
+
         try:
             for _ in range(random.randint(2, 4)):
                 x = random.randint(100, 800)
@@ -106,29 +262,9 @@ class InstagramPlaywrightScraper(BaseScraper):
         except Exception as e:
             self.logger.debug(f"Mouse movement error: {e}")
 
-    async def _save_cookies(self, context):
-        """Save cookies for session persistence."""
-        try:
-            cookies = await context.cookies()
-            self.cookies_file.parent.mkdir(exist_ok=True, parents=True)
-            with open(self.cookies_file, 'w') as f:
-                json.dump(cookies, f)
-            self.logger.debug(f"Saved {len(cookies)} cookies")
-        except Exception as e:
-            self.logger.debug(f"Could not save cookies: {e}")
-
-    async def _load_cookies(self, context):
-        """Load cookies for session persistence."""
-        try:
-            if self.cookies_file.exists():
-                with open(self.cookies_file, 'r') as f:
-                    cookies = json.load(f)
-                await context.add_cookies(cookies)
-                self.logger.debug(f"Loaded {len(cookies)} cookies")
-                return True
-        except Exception as e:
-            self.logger.debug(f"Could not load cookies: {e}")
-        return False
+    async def _save_session(self, context):
+        """Save the context's cookies to the session vault for later runs."""
+        await self.vault.save_context(self.platform_name, context, validated=False)
 
     async def _handle_login_wall(self, page) -> bool:
         """Try to dismiss login popup without authenticating."""
@@ -137,14 +273,12 @@ class InstagramPlaywrightScraper(BaseScraper):
             for _ in range(3):
                 try:
                     await page.keyboard.press('Escape')
-                    await self._random_delay(300, 500)
                 except:
                     pass
 
             # Try clicking outside the modal
             try:
                 await page.mouse.click(10, 10)
-                await self._random_delay(300, 500)
             except:
                 pass
 
@@ -157,16 +291,15 @@ class InstagramPlaywrightScraper(BaseScraper):
                 'div[role="dialog"] button',
             ]
 
-            for selector in close_selectors:
+            element = await wait_for_selector(page, close_selectors, self.deadline.timeout_ms(2000), state='visible')
+            if element:
                 try:
-                    element = await page.wait_for_selector(selector, timeout=1500)
-                    if element:
-                        await element.click()
-                        self.logger.info(f"Closed login popup using: {selector}")
-                        await self._random_delay(500, 1000)
-                        return True
-                except:
-                    continue
+                    await element.click()
+                    self.logger.info("Closed login popup")
+                    await wait_for_network_idle(page, self.deadline.timeout_ms(2000))
+                    return True
+                except Exception as e:
+                    self.logger.debug(f"Could not click login popup close button: {e}")
 
             # Try clicking somewhere to dismiss overlay
             try:
@@ -180,7 +313,13 @@ class InstagramPlaywrightScraper(BaseScraper):
 
         return False
 
-    def scrape(self, url: str, grantee_name: str, max_posts: int = 25) -> Dict[str, Any]:
+    async def scrape_async(
+        self,
+        url: str,
+        grantee_name: str,
+        max_posts: int = 25,
+        deadline: Optional[Deadline] = None
+    ) -> Dict[str, Any]:
         """
         Scrape Instagram profile for posts and engagement metrics.
 
@@ -188,10 +327,14 @@ class InstagramPlaywrightScraper(BaseScraper):
             url: Instagram URL to scrape
             grantee_name: Name of the grantee
             max_posts: Maximum posts to scrape
+            deadline: Time budget for this job (None for no limit)
 
         Returns:
             Dictionary with scraping results
         """
+        self.set_deadline(deadline)
+        self.set_pacing(url)
+
         if not PLAYWRIGHT_AVAILABLE:
             return {
                 'success': False,
@@ -217,15 +360,23 @@ class InstagramPlaywrightScraper(BaseScraper):
                 if attempt > 0:
                     wait_time = (2 ** attempt) + random.uniform(0, 1)
                     self.logger.info(f"Retry attempt {attempt + 1}/{self.max_retries} after {wait_time:.1f}s")
-                    time.sleep(wait_time)
+                    await self.wait(wait_time, 'retry_backoff')
 
-                result = asyncio.run(self._scrape_async(url, username, grantee_name, max_posts))
+                result = await self._scrape_async(url, username, grantee_name, max_posts)
 
-                if result['success'] or result['posts_downloaded'] > 0:
+                if result['success'] or result['posts_downloaded'] > 0 or result.get('timed_out'):
                     return result
 
                 last_error = result.get('errors', ['Unknown error'])
 
+            except DeadlineExceeded as e:
+                return self.mark_timed_out({
+                    'success': False,
+                    'posts_downloaded': 0,
+                    'errors': (last_error or []) + [str(e)],
+                    'engagement_metrics': {}
+                }, f"Timed out scraping @{username}: {e}")
+
             except Exception as e:
                 last_error = [f'Fatal error: {str(e)}']
                 self.logger.error(f"Error during scrape attempt {attempt + 1}: {e}", exc_info=True)
@@ -239,7 +390,7 @@ class InstagramPlaywrightScraper(BaseScraper):
         }
 
     async def _scrape_async(self, url: str, username: str, grantee_name: str, max_posts: int = 25) -> Dict[str, Any]:
-        """Async scraping implementation using Playwright."""
+        """Async scraping implementation using a warm context from the shared browser pool."""
         errors = []
         posts = []
         engagement_metrics = {
@@ -251,37 +402,33 @@ class InstagramPlaywrightScraper(BaseScraper):
             'avg_engagement_rate': 0.0
         }
 
-        async with async_playwright() as p:
+        # Context settings for a new pooled context (reused contexts keep theirs)
+        context_options = {
+            'viewport': {'width': 1920, 'height': 1080},
+            'user_agent': random.choice(USER_AGENTS),
+            'locale': 'en-US',
+            'timezone_id': 'America/New_York',
+        }
+        context_options = self.vault.context_options(self.platform_name, context_options)
+
+        async with get_browser_pool().lease(
+            self.platform_name,
+            context_options=context_options,
+            headless=self.headless,
+            args=BROWSER_ARGS
+        ) as lease:
+            context = lease.context
             try:
-                # Launch browser with stealth settings
-                browser = await p.chromium.launch(
-                    headless=self.headless,
-                    args=[
-                        '--disable-blink-features=AutomationControlled',
-                        '--disable-dev-shm-usage',
-                        '--no-sandbox',
-                        '--disable-web-security',
-                        '--disable-features=IsolateOrigins,site-per-process',
-                    ]
-                )
+                page = await context.new_page()
 
-                user_agents = [
-                    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-                    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                ]
-
-                context = await browser.new_context(
-                    viewport={'width': 1920, 'height': 1080},
-                    user_agent=random.choice(user_agents),
-                    locale='en-US',
-                    timezone_id='America/New_York',
+                # Read the profile and post grid from the page's JSON requests
+                capture = ResponseCapture(
+                    page,
+                    PROFILE_RESPONSE_PATTERN,
+                    partial(parse_profile_posts, username=username),
+                    partial(parse_profile_stats, username=username)
                 )
 
-                await self._load_cookies(context)
-
-                page = await context.new_page()
-
                 # Add stealth JavaScript
                 await page.add_init_script("""
                     Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
@@ -295,23 +442,22 @@ class InstagramPlaywrightScraper(BaseScraper):
                 self.logger.info(f"Navigating to {profile_url}")
 
                 try:
-                    await page.goto(profile_url, wait_until='domcontentloaded', timeout=30000)
-                    await self._random_delay(2000, 4000)
+                    await self.goto(page, profile_url, wait_until='domcontentloaded', timeout=self.deadline.timeout_ms(30000))
                 except PlaywrightTimeout:
                     self.logger.warning("Page load timeout, continuing anyway")
-                    await self._random_delay(1000, 2000)
+
+                # The profile JSON arrives by XHR after the document loads
+                await wait_for_network_idle(page, self.deadline.timeout_ms(8000), floor_ms=self.pacing.scaled(1000))
 
                 await self._human_like_mouse_movement(page)
 
                 # Handle login popup
                 await self._handle_login_wall(page)
-                await self._random_delay(1000, 2000)
 
                 # Check if profile exists / is accessible
                 page_content = await page.content()
                 if "Sorry, this page isn't available" in page_content:
                     errors.append(f"Profile @{username} does not exist or is not available")
-                    await browser.close()
                     return {
                         'success': False,
                         'posts_downloaded': 0,
@@ -342,21 +488,35 @@ class InstagramPlaywrightScraper(BaseScraper):
                         'success': True,
                         'posts_downloaded': 0,
                         'errors': ['Profile is private'],
-                        'engagement_metrics': engagement_metrics
+                        'engagement_metrics': engagement_metrics,
+                        'output_path': str(output_dir)
                     }
 
+                await capture.capture_embedded()
+                await capture.drain()
+                capture.stop()
+
                 # Extract profile stats (followers, following, posts count)
-                profile_stats = await self._extract_profile_stats(page)
+                if capture.profile.get('followers_count'):
+                    profile_stats = dict(capture.profile)
+                else:
+                    profile_stats = await self._extract_profile_stats(page)
                 engagement_metrics.update(profile_stats)
                 self.logger.info(f"Profile stats: {profile_stats}")
 
-                # Note: Instagram blocks post extraction without login
-                # We can only get profile stats (followers, following, posts count)
-                # Individual posts require authentication
-                posts = []
+                # The post grid arrives in the profile's JSON when Instagram
+                # serves it; without login it often does not, and the page
+                # itself only exposes profile stats
+                posts = capture.posts[:max_posts]
+                if posts:
+                    self.logger.info(f"Captured {len(posts)} posts from "
+                                     f"{capture.responses_parsed} profile payloads")
+                elif profile_stats.get('posts_count', 0) > 0:
+                    # Read the rendered grid's posts one page each instead
+                    posts = await self._extract_posts(page, username, max_posts)
 
                 # Log the limitation
-                if profile_stats.get('posts_count', 0) > 0:
+                if not posts and profile_stats.get('posts_count', 0) > 0:
                     self.logger.info(
                         f"Profile has {profile_stats['posts_count']} posts but Instagram requires login to view them. "
                         f"Only profile stats collected."
@@ -393,34 +553,39 @@ class InstagramPlaywrightScraper(BaseScraper):
                 }
                 self.save_metadata(output_dir, metadata)
 
-                await self._save_cookies(context)
-                await browser.close()
-
-                self.logger.info(f"Successfully scraped @{username}: {len(posts)} posts")
+                await self._save_session(context)
 
-                return {
+                result = {
                     'success': True,
                     'posts_downloaded': len(posts),
                     'errors': errors,
-                    'engagement_metrics': engagement_metrics
+                    'engagement_metrics': engagement_metrics,
+                    'output_path': str(output_dir)
                 }
 
+                if self.deadline.expired:
+                    return self.mark_timed_out(result, f"Job deadline reached while scraping @{username}")
+
+                self.logger.info(f"Successfully scraped @{username}: {len(posts)} posts")
+
+                return result
+
             except Exception as e:
                 self.logger.error(f"Error during scraping: {e}", exc_info=True)
                 errors.append(str(e))
 
-                try:
-                    await browser.close()
-                except:
-                    pass
-
-                return {
+                result = {
                     'success': False,
                     'posts_downloaded': len(posts),
                     'errors': errors,
                     'engagement_metrics': engagement_metrics
                 }
 
+                if isinstance(e, DeadlineExceeded):
+                    self.mark_timed_out(result, f"Timed out scraping @{username}: {e}")
+
+                return result
+
     async def _extract_profile_stats(self, page) -> Dict[str, int]:
         """Extract followers, following, and posts count from profile."""
         stats = {
@@ -501,23 +666,16 @@ class InstagramPlaywrightScraper(BaseScraper):
         """Scroll page with human-like behavior to load more posts."""
         for i in range(max_scrolls):
             try:
-                prev_height = await page.evaluate('document.body.scrollHeight')
-
-                # Scroll in smaller increments
-                scroll_distance = random.randint(400, 800)
-                for _ in range(3):
-                    await page.evaluate(f'window.scrollBy(0, {scroll_distance})')
-                    await self._random_delay(200, 500)
-
-                # Random chance to scroll back up
-                if random.random() < 0.3:
-                    await page.evaluate(f'window.scrollBy(0, -{random.randint(100, 300)})')
-                    await self._random_delay(300, 600)
-
-                await self._random_delay(1500, 3000)
+                # Scroll a random distance and wait for new grid posts
+                added = await scroll_and_wait(
+                    page,
+                    'a[href*="/p/"], a[href*="/reel/"]',
+                    self.deadline.timeout_ms(4000),
+                    scroll_by=random.randint(1200, 2400),
+                    floor_ms=self.pacing.scroll_floor_ms
+                )
 
-                new_height = await page.evaluate('document.body.scrollHeight')
-                if new_height == prev_height:
+                if not added:
                     self.logger.debug(f"No new content after scroll {i+1}, stopping")
                     break
 
@@ -572,14 +730,23 @@ class InstagramPlaywrightScraper(BaseScraper):
 
         return posts
 
-    async def _extract_posts(self, page, max_posts: int = 25) -> List[Dict[str, Any]]:
-        """Extract posts from the profile page."""
+    async def _extract_posts(self, page, username: str, max_posts: int = 25) -> List[Dict[str, Any]]:
+        """
+        Extract posts from the profile grid by reading each post's page.
+
+        Used when the profile's JSON did not include the post grid.
+
+        Args:
+            page: Profile page (already loaded)
+            username: Profile handle
+            max_posts: Maximum number of posts to extract
+
+        Returns:
+            List of post dictionaries
+        """
         posts = []
 
         try:
-            # Wait for main content to load
-            await self._random_delay(2000, 3000)
-
             # Try to remove any blocking overlays first
             try:
                 await page.evaluate('''
@@ -590,15 +757,10 @@ class InstagramPlaywrightScraper(BaseScraper):
             except:
                 pass
 
-            # Instagram post grid selectors - try multiple approaches
-            post_selectors = [
-                'main article a[href*="/p/"]',
-                'main a[href*="/p/"]',
-                'article a[href*="/p/"]',
-                'a[href*="/p/"]',
-                'main article a[href*="/reel/"]',
-                'a[href*="/reel/"]',
-            ]
+            # Instagram post grid selectors, historically best first
+            registry = get_selector_registry()
+            post_selectors = registry.order('instagram', 'post_link', POST_LINK_SELECTORS)
+            matched = None
 
             post_links = []
             for selector in post_selectors:
@@ -615,10 +777,12 @@ class InstagramPlaywrightScraper(BaseScraper):
                                     post_links.append(href)
                         if post_links:
                             self.logger.info(f"Found {len(post_links)} posts using selector: {selector}")
+                            matched = selector
                             break
                 except Exception as e:
                     self.logger.debug(f"Error with selector {selector}: {e}")
                     continue
+            registry.record_first_match('instagram', 'post_link', post_selectors, matched)
 
             # If no posts found via selectors, try extracting from page HTML
             if not post_links:
@@ -653,20 +817,8 @@ class InstagramPlaywrightScraper(BaseScraper):
             post_links = list(dict.fromkeys(post_links))[:max_posts]  # Remove duplicates and limit
             self.logger.info(f"Processing {len(post_links)} unique post links...")
 
-            # Extract data from each post by visiting it
-            for idx, link in enumerate(post_links):
-                try:
-                    post_data = await self._extract_post_data(page, link, idx)
-                    if post_data:
-                        posts.append(post_data)
-                        self.logger.debug(f"Extracted post {idx + 1}/{len(post_links)}: {post_data.get('likes', 0)} likes")
-
-                    # Small delay between post extractions
-                    await self._random_delay(800, 1500)
-
-                except Exception as e:
-                    self.logger.debug(f"Error extracting post {idx}: {e}")
-                    continue
+            # Read each post's page, a few tabs at a time
+            posts = await self._fetch_post_details(page.context, post_links, username)
 
             self.logger.info(f"Successfully extracted {len(posts)} posts")
 
@@ -675,92 +827,147 @@ class InstagramPlaywrightScraper(BaseScraper):
 
         return posts
 
-    async def _extract_post_data(self, page, link: str, index: int) -> Optional[Dict[str, Any]]:
-        """Extract data from a single post by visiting it."""
-        try:
-            # Make absolute URL
-            if link.startswith('/'):
-                link = 'https://www.instagram.com' + link
-
-            # Navigate to post
-            await page.goto(link, wait_until='domcontentloaded', timeout=15000)
-            await self._random_delay(1000, 2000)
-
-            # Handle login popup if it appears
-            await self._handle_login_wall(page)
-
-            post_data = {
-                'id': f'post_{index}',
-                'url': link,
-                'shortcode': link.split('/p/')[-1].split('/')[0] if '/p/' in link else link.split('/reel/')[-1].split('/')[0],
-                'caption': '',
-                'likes': 0,
-                'comments': 0,
-                'date': None,
-                'is_video': '/reel/' in link
-            }
-
-            page_text = await page.evaluate('() => document.body.innerText')
+    async def _fetch_post_details(
+        self,
+        context,
+        links: List[str],
+        username: str,
+        concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Read post details from their pages using a few tabs in parallel.
 
-            # Extract likes
-            like_patterns = [
-                r'([\d,]+)\s+likes?',
-                r'Liked by.*?and\s+([\d,]+)\s+others?',
-                r'([\d,]+)\s+views?',  # For videos
-            ]
+        Each tab takes the next link from a shared queue and pauses between
+        posts as a single tab did, so the per-tab pace towards Instagram is
+        unchanged while several posts load at once. Tabs never navigate
+        back to the profile.
 
-            for pattern in like_patterns:
-                match = re.search(pattern, page_text, re.IGNORECASE)
-                if match:
-                    post_data['likes'] = self._parse_count(match.group(1))
-                    break
+        Args:
+            context: Logged-in BrowserContext the profile page belongs to
+            links: Post URLs
+            username: Profile handle, to pick the post's own media record
+            concurrency: Number of tabs (default: config.INSTAGRAM_DETAIL_CONCURRENCY)
 
-            # Extract comments count
-            comment_patterns = [
-                r'View all\s+([\d,]+)\s+comments?',
-                r'([\d,]+)\s+comments?',
-            ]
+        Returns:
+            Post dictionaries in the order of links (failed posts omitted)
+        """
+        if not links:
+            return []
 
-            for pattern in comment_patterns:
-                match = re.search(pattern, page_text, re.IGNORECASE)
-                if match:
-                    post_data['comments'] = self._parse_count(match.group(1))
-                    break
+        concurrency = max(1, min(concurrency or config.INSTAGRAM_DETAIL_CONCURRENCY, len(links)))
+        queue = asyncio.Queue()
+        for index, link in enumerate(links):
+            queue.put_nowait((index, link))
+        found: Dict[int, Dict[str, Any]] = {}
 
-            # Extract caption
+        async def worker(number: int) -> None:
+            tab = await context.new_page()
             try:
-                # Try meta description first
-                meta_desc = await page.query_selector('meta[property="og:description"]')
-                if meta_desc:
-                    content = await meta_desc.get_attribute('content')
-                    if content:
-                        # Remove "X likes, X comments - " prefix
-                        caption = re.sub(r'^[\d,]+\s+likes?,\s+[\d,]+\s+comments?\s+-\s+', '', content)
-                        post_data['caption'] = caption[:500]  # Limit length
-            except:
+                # Stagger the tabs so they do not request at the same moment
+                await self._random_delay(number * 400, number * 800)
+                while not queue.empty() and not self.deadline.expired:
+                    index, link = queue.get_nowait()
+                    post_data = await self._extract_post_data(tab, link, index, username)
+                    if post_data:
+                        found[index] = post_data
+                        self.logger.debug(f"Extracted post {index + 1}/{len(links)}: {post_data.get('likes', 0)} likes")
+                    await self._random_delay(800, 1500)
+            except DeadlineExceeded:
                 pass
+            finally:
+                await tab.close()
 
-            # Extract date
-            try:
-                time_elem = await page.query_selector('time')
-                if time_elem:
-                    datetime_attr = await time_elem.get_attribute('datetime')
-                    if datetime_attr:
-                        post_data['date'] = datetime_attr
-            except:
-                pass
+        # A tab that fails leaves its queue to the others and keeps what it found
+        outcomes = await asyncio.gather(*(worker(number) for number in range(concurrency)),
+                                        return_exceptions=True)
+        for number, outcome in enumerate(outcomes):
+            if isinstance(outcome, Exception):
+                self.logger.warning(f"Post detail tab {number + 1} failed: {outcome}")
+
+        if len(found) < len(links) and self.deadline.expired:
+            self.logger.warning(f"Job deadline reached after {len(found)}/{len(links)} posts")
+        return [found[index] for index in sorted(found)]
+
+    async def _extract_post_data(self, page, link: str, index: int, username: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract data from a single post by visiting it.
+
+        Reads the post's media record from the JSON embedded in the page
+        when present, else the counts and caption from its og:description.
+        Both are in the served HTML, so no rendering wait is needed.
+
+        Args:
+            page: Tab to load the post in
+            link: Post URL
+            index: Position of the post in the grid
+            username: Profile handle
+
+        Returns:
+            Post dictionary, or None if the page held no post data
+        """
+        try:
+            # Make absolute URL
+            if link.startswith('/'):
+                link = 'https://www.instagram.com' + link
 
-            # Go back to profile
-            await page.go_back()
-            await self._random_delay(500, 1000)
+            await self.goto(page, link, wait_until='domcontentloaded', timeout=self.deadline.timeout_ms(15000))
 
-            return post_data
+            shortcode = link.split('/p/')[-1].split('/')[0] if '/p/' in link else link.split('/reel/')[-1].split('/')[0]
+            detail = await page.evaluate(POST_DETAIL_JS, shortcode)
+            return self._post_from_detail(detail, link, shortcode, index, username)
 
         except Exception as e:
             self.logger.debug(f"Error extracting post data from {link}: {e}")
-            # Try to go back to profile
-            try:
-                await page.go_back()
-            except:
-                pass
             return None
+
+    def _post_from_detail(
+        self,
+        detail: Dict[str, Any],
+        link: str,
+        shortcode: str,
+        index: int,
+        username: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build a post dictionary from what POST_DETAIL_JS read off a post page.
+
+        Args:
+            detail: Fields returned by POST_DETAIL_JS
+            link: Post URL
+            shortcode: Post shortcode
+            index: Position of the post in the grid
+            username: Profile handle
+
+        Returns:
+            Post dictionary, or None if the page held no post data
+        """
+        for text in detail.get('json') or []:
+            for payload in parse_json_payload(text):
+                for post in parse_profile_posts(payload, username):
+                    if post['shortcode'] == shortcode:
+                        return dict(post, url=link)
+
+        description = detail.get('description')
+        if not description and not detail.get('date'):
+            return None
+
+        post_data = {
+            'id': f'post_{index}',
+            'url': link,
+            'shortcode': shortcode,
+            'caption': '',
+            'likes': 0,
+            'comments': 0,
+            'date': detail.get('date'),
+            'is_video': '/reel/' in link or bool(detail.get('video'))
+        }
+
+        if description:
+            match = OG_COUNTS_PATTERN.match(description)
+            if match:
+                post_data['likes'] = self._parse_count(match.group(1), match.group(2))
+                post_data['comments'] = self._parse_count(match.group(3), match.group(4))
+                description = description[match.end():]
+            post_data['caption'] = description[:500]  # Limit length
+
+        return post_data
@@ -10,27 +10,41 @@ from __future__ import annotations
 
 import os
 import re
-import time
 import random
 from pathlib import Path
 from typing import Dict, Any, Optional, TYPE_CHECKING
 from urllib.parse import urlparse, unquote
 from datetime import datetime
+from functools import partial
 
 if TYPE_CHECKING:
-    from playwright.sync_api import Page, Browser, BrowserContext
+    from playwright.async_api import Page
 
 try:
-    from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
 except ImportError:
-    sync_playwright = None
+    async_playwright = None
 
 from dotenv import load_dotenv
 from .base import BaseScraper
+from browser_pool import get_browser_pool
+from deadline import Deadline, DeadlineExceeded
+from page_waits import wait_for_network_idle, wait_for_selector
+from session_vault import get_session_vault
 
 # Load environment variables
 load_dotenv()
 
+# Chromium flags for the pooled LinkedIn browser
+BROWSER_ARGS = (
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-web-security',
+    '--disable-features=IsolateOrigins,site-per-process',
+)
+
 
 class LinkedInScraper(BaseScraper):
     """
@@ -59,28 +73,26 @@ class LinkedInScraper(BaseScraper):
         self.password = os.getenv('LINKEDIN_PASSWORD')
         self._logged_in = False
 
-        # Session persistence
-        self.session_dir = self.output_dir / ".sessions" / "linkedin"
-        self.session_dir.mkdir(parents=True, exist_ok=True)
+        # Saved sessions shared with other runs
+        self.vault = get_session_vault()
 
-        if sync_playwright is None:
+        if async_playwright is None:
             raise ImportError(
                 "Playwright is required for LinkedIn scraping. "
                 "Install with: pip install playwright && playwright install chromium"
             )
 
-    def _random_delay(self, min_seconds: float = 0.5, max_seconds: float = 2.5) -> None:
+    async def _random_delay(self, min_seconds: float = 0.5, max_seconds: float = 2.5) -> None:
         """
-        Add a random delay to simulate human behavior.
+        Add a random, pacing-scaled delay to simulate human behavior.
 
         Args:
-            min_seconds: Minimum delay in seconds
-            max_seconds: Maximum delay in seconds
+            min_seconds: Minimum delay in seconds at standard pacing
+            max_seconds: Maximum delay in seconds at standard pacing
         """
-        delay = random.uniform(min_seconds, max_seconds)
-        time.sleep(delay)
+        await self.pause(min_seconds, max_seconds)
 
-    def _apply_stealth_techniques(self, page: Page) -> None:
+    async def _apply_stealth_techniques(self, page: Page) -> None:
         """
         Apply stealth techniques to avoid detection.
         Removes webdriver properties and adds realistic browser fingerprints.
@@ -121,18 +133,23 @@ class LinkedInScraper(BaseScraper):
                 );
             }
             """
-            page.add_init_script(stealth_js)
+            await page.add_init_script(stealth_js)
             self.logger.debug("Applied stealth techniques to page")
         except Exception as e:
             self.logger.warning(f"Could not apply stealth techniques: {e}")
 
-    def _simulate_human_behavior(self, page: Page) -> None:
+    async def _simulate_human_behavior(self, page: Page) -> None:
         """
         Simulate human-like browsing behavior with scrolling and mouse movements.
 
+        Skipped when the pacing profile turns human simulation off.
+
         Args:
             page: Playwright page object
         """
+        if not self.pacing.human_simulation:
+            return
+
         try:
             # Random scrolling
             scroll_script = """
@@ -147,65 +164,45 @@ class LinkedInScraper(BaseScraper):
             # Scroll down in random increments
             for _ in range(random.randint(2, 4)):
                 scroll_amount = random.randint(200, 500)
-                page.evaluate(scroll_script, scroll_amount)
-                self._random_delay(0.3, 0.8)
+                await page.evaluate(scroll_script, scroll_amount)
+                await self._random_delay(0.3, 0.8)
 
             # Scroll back up a bit
-            page.evaluate(scroll_script, -random.randint(100, 300))
-            self._random_delay(0.5, 1.0)
+            await page.evaluate(scroll_script, -random.randint(100, 300))
+            await self._random_delay(0.5, 1.0)
 
             # Random mouse movements
             for _ in range(random.randint(1, 3)):
                 x = random.randint(100, 800)
                 y = random.randint(100, 600)
-                page.mouse.move(x, y)
-                self._random_delay(0.2, 0.5)
+                await page.mouse.move(x, y)
+                await self._random_delay(0.2, 0.5)
 
             self.logger.debug("Simulated human browsing behavior")
         except Exception as e:
             self.logger.warning(f"Could not simulate human behavior: {e}")
 
-    def _save_session(self, context: BrowserContext, username: str) -> None:
+    async def _check_login_status(self, page: Page) -> bool:
         """
-        Save browser session state for future use.
+        Check whether the context's saved session is still logged in.
 
         Args:
-            context: Playwright browser context
-            username: Username identifier for the session
-        """
-        try:
-            session_file = self.session_dir / f"{username}_state.json"
-            context.storage_state(path=str(session_file))
-            self.logger.info(f"Saved session state to {session_file}")
-        except Exception as e:
-            self.logger.warning(f"Could not save session: {e}")
-
-    def _load_session(self, username: str) -> Optional[str]:
-        """
-        Load saved browser session state.
-
-        Args:
-            username: Username identifier for the session
+            page: Playwright page object
 
         Returns:
-            Path to session file if it exists and is recent, None otherwise
+            True if the feed loads, False if LinkedIn redirects to a login wall
         """
         try:
-            session_file = self.session_dir / f"{username}_state.json"
-            if session_file.exists():
-                # Check if session is less than 24 hours old
-                file_age = time.time() - session_file.stat().st_mtime
-                if file_age < 86400:  # 24 hours
-                    self.logger.info(f"Loading session state from {session_file}")
-                    return str(session_file)
-                else:
-                    self.logger.debug("Session file is too old, will create new session")
-            return None
+            await self.goto(page, 'https://www.linkedin.com/feed/', wait_until='domcontentloaded', timeout=self.deadline.timeout_ms(30000))
+            current_url = page.url
+            return '/feed' in current_url and 'login' not in current_url and 'authwall' not in current_url
+        except DeadlineExceeded:
+            raise
         except Exception as e:
-            self.logger.warning(f"Could not load session: {e}")
-            return None
+            self.logger.debug(f"Login check failed: {e}")
+            return False
 
-    def _retry_with_backoff(self, func, max_retries: int = 3, *args, **kwargs) -> Any:
+    async def _retry_with_backoff(self, func, max_retries: int = 3, *args, **kwargs) -> Any:
         """
         Retry a function with exponential backoff.
 
@@ -224,7 +221,9 @@ class LinkedInScraper(BaseScraper):
         last_exception = None
         for attempt in range(max_retries):
             try:
-                return func(*args, **kwargs)
+                return await func(*args, **kwargs)
+            except DeadlineExceeded:
+                raise
             except Exception as e:
                 last_exception = e
                 if attempt < max_retries - 1:
@@ -233,13 +232,13 @@ class LinkedInScraper(BaseScraper):
                         f"Attempt {attempt + 1} failed: {e}. "
                         f"Retrying in {wait_time:.2f}s..."
                     )
-                    time.sleep(wait_time)
+                    await self.wait(wait_time, 'retry_backoff')
                 else:
                     self.logger.error(f"All {max_retries} attempts failed")
 
         raise last_exception
 
-    def _login(self, page: Page) -> bool:
+    async def _login(self, page: Page) -> bool:
         """
         Log in to LinkedIn using credentials from environment variables.
 
@@ -257,22 +256,22 @@ class LinkedInScraper(BaseScraper):
             self.logger.info("Attempting LinkedIn login...")
 
             # Navigate to login page
-            page.goto('https://www.linkedin.com/login', wait_until='domcontentloaded', timeout=30000)
-            self._random_delay(1.5, 3.0)
+            await self.goto(page, 'https://www.linkedin.com/login', wait_until='domcontentloaded', timeout=self.deadline.timeout_ms(30000))
 
             # Fill in credentials with human-like typing
             email_selectors = ['#username', 'input[name="session_key"]', 'input[autocomplete="username"]']
             password_selectors = ['#password', 'input[name="session_password"]', 'input[autocomplete="current-password"]']
+            await wait_for_selector(page, email_selectors, self.deadline.timeout_ms(10000))
 
             email_input = None
             for selector in email_selectors:
-                email_input = page.query_selector(selector)
+                email_input = await page.query_selector(selector)
                 if email_input:
                     break
 
             password_input = None
             for selector in password_selectors:
-                password_input = page.query_selector(selector)
+                password_input = await page.query_selector(selector)
                 if password_input:
                     break
 
@@ -281,15 +280,15 @@ class LinkedInScraper(BaseScraper):
                 return False
 
             # Type with realistic delays
-            email_input.click()
-            self._random_delay(0.3, 0.7)
-            email_input.type(self.email, delay=random.randint(50, 150))
-            self._random_delay(0.5, 1.0)
+            await email_input.click()
+            await self._random_delay(0.3, 0.7)
+            await email_input.type(self.email, delay=self.pacing.delay(50, 150))
+            await self._random_delay(0.5, 1.0)
 
-            password_input.click()
-            self._random_delay(0.3, 0.7)
-            password_input.type(self.password, delay=random.randint(50, 150))
-            self._random_delay(0.5, 1.5)
+            await password_input.click()
+            await self._random_delay(0.3, 0.7)
+            await password_input.type(self.password, delay=self.pacing.delay(50, 150))
+            await self._random_delay(0.5, 1.5)
 
             # Click sign in button
             button_selectors = [
@@ -300,17 +299,17 @@ class LinkedInScraper(BaseScraper):
 
             sign_in_btn = None
             for selector in button_selectors:
-                sign_in_btn = page.query_selector(selector)
+                sign_in_btn = await page.query_selector(selector)
                 if sign_in_btn:
                     break
 
             if sign_in_btn:
-                sign_in_btn.click()
+                await sign_in_btn.click()
             else:
-                page.keyboard.press('Enter')
+                await page.keyboard.press('Enter')
 
-            # Wait for navigation with timeout
-            self._random_delay(3.0, 6.0)
+            # Wait for the sign-in requests and redirect to settle
+            await wait_for_network_idle(page, self.deadline.timeout_ms(10000), floor_ms=self.pacing.scaled(1000))
 
             # Check if login was successful
             current_url = page.url
@@ -328,7 +327,7 @@ class LinkedInScraper(BaseScraper):
                 # Give user time to manually solve if not headless
                 if not self.headless:
                     self.logger.info("Waiting 30 seconds for manual challenge resolution...")
-                    time.sleep(30)
+                    await self.wait(30, 'challenge_wait')
                     if '/feed' in page.url or '/mynetwork' in page.url:
                         self.logger.info("Challenge appears to be resolved")
                         self._logged_in = True
@@ -338,9 +337,9 @@ class LinkedInScraper(BaseScraper):
             # Check for error messages
             error_selectors = ['.form__label--error', '.alert-content', '.error-message', '[role="alert"]']
             for selector in error_selectors:
-                error_msg = page.query_selector(selector)
+                error_msg = await page.query_selector(selector)
                 if error_msg:
-                    self.logger.error(f"Login failed: {error_msg.inner_text()}")
+                    self.logger.error(f"Login failed: {await error_msg.inner_text()}")
                     return False
 
             self.logger.warning(f"Login status unclear, current URL: {current_url}")
@@ -400,7 +399,7 @@ class LinkedInScraper(BaseScraper):
         """Check if URL is a company page (vs personal profile)."""
         return '/company/' in url.lower()
 
-    def _wait_for_content(self, page: Page, timeout: int = 10000) -> bool:
+    async def _wait_for_content(self, page: Page, timeout: int = 10000) -> bool:
         """
         Wait for page content to load.
 
@@ -413,8 +412,9 @@ class LinkedInScraper(BaseScraper):
         """
         try:
             # Wait for main content container
-            page.wait_for_selector('main', timeout=timeout)
-            time.sleep(2)  # Additional wait for dynamic content
+            await page.wait_for_selector('main', timeout=self.deadline.timeout_ms(timeout))
+            # Let the dynamic content requests settle
+            await wait_for_network_idle(page, self.deadline.timeout_ms(3000))
             return True
         except PlaywrightTimeout:
             self.logger.warning("Timeout waiting for page content")
@@ -423,14 +423,14 @@ class LinkedInScraper(BaseScraper):
             self.logger.error(f"Error waiting for content: {e}")
             return False
 
-    def _check_access_restrictions(self, page: Page) -> Optional[str]:
+    async def _check_access_restrictions(self, page: Page) -> Optional[str]:
         """
         Check if page access is restricted.
 
         Returns:
             Error message if restricted, None if accessible
         """
-        content = page.content().lower()
+        content = (await page.content()).lower()
 
         # Check for login wall
         authwall_indicators = [
@@ -447,7 +447,7 @@ class LinkedInScraper(BaseScraper):
                 '[data-tracking-control-name="guest_homepage-basic_nav-header-signin"]'
             ]
             for selector in signin_selectors:
-                if page.query_selector(selector):
+                if await page.query_selector(selector):
                     self.logger.debug(f"Auth wall detected with selector: {selector}")
                     return "LinkedIn requires authentication to view this content"
 
@@ -483,7 +483,7 @@ class LinkedInScraper(BaseScraper):
 
         return None
 
-    def _extract_company_data(self, page: Page) -> Dict[str, Any]:
+    async def _extract_company_data(self, page: Page) -> Dict[str, Any]:
         """
         Extract company page data with graceful degradation.
 
@@ -519,9 +519,9 @@ class LinkedInScraper(BaseScraper):
             ]
             for selector in name_selectors:
                 try:
-                    element = page.query_selector(selector)
+                    element = await page.query_selector(selector)
                     if element:
-                        name = element.inner_text().strip()
+                        name = (await element.inner_text()).strip()
                         if name:
                             data['company_name'] = name
                             fields_extracted += 1
@@ -541,9 +541,9 @@ class LinkedInScraper(BaseScraper):
             ]
             for selector in follower_selectors:
                 try:
-                    elements = page.query_selector_all(selector)
+                    elements = await page.query_selector_all(selector)
                     for element in elements:
-                        text = element.inner_text().lower()
+                        text = (await element.inner_text()).lower()
                         if 'follower' in text:
                             # Extract number - handles K, M notation
                             match = re.search(r'([\d,\.]+)\s*([km])?\s*follower', text, re.IGNORECASE)
@@ -570,9 +570,9 @@ class LinkedInScraper(BaseScraper):
             ]
             for selector in employee_selectors:
                 try:
-                    elements = page.query_selector_all(selector)
+                    elements = await page.query_selector_all(selector)
                     for element in elements:
-                        text = element.inner_text().lower()
+                        text = (await element.inner_text()).lower()
                         if 'employee' in text or 'employees' in text:
                             # Extract range or number
                             match = re.search(r'([\d,\-]+)\s*employee', text)
@@ -597,9 +597,9 @@ class LinkedInScraper(BaseScraper):
             ]
             for selector in desc_selectors:
                 try:
-                    element = page.query_selector(selector)
+                    element = await page.query_selector(selector)
                     if element:
-                        desc = element.inner_text().strip()
+                        desc = (await element.inner_text()).strip()
                         if len(desc) > 10:  # Ensure it's meaningful
                             data['description'] = desc
                             fields_extracted += 1
@@ -620,7 +620,7 @@ class LinkedInScraper(BaseScraper):
             ]
             for selector in post_selectors:
                 try:
-                    posts = page.query_selector_all(selector)
+                    posts = await page.query_selector_all(selector)
                     if posts and len(posts) > 0:
                         data['posts_found'] = len(posts)
                         self.logger.debug(f"Found {len(posts)} posts")
@@ -642,7 +642,7 @@ class LinkedInScraper(BaseScraper):
 
         return data
 
-    def _extract_profile_data(self, page: Page) -> Dict[str, Any]:
+    async def _extract_profile_data(self, page: Page) -> Dict[str, Any]:
         """
         Extract personal profile data with graceful degradation.
 
@@ -675,9 +675,9 @@ class LinkedInScraper(BaseScraper):
             ]
             for selector in name_selectors:
                 try:
-                    element = page.query_selector(selector)
+                    element = await page.query_selector(selector)
                     if element:
-                        name = element.inner_text().strip()
+                        name = (await element.inner_text()).strip()
                         if name:
                             data['name'] = name
                             fields_extracted += 1
@@ -697,9 +697,9 @@ class LinkedInScraper(BaseScraper):
             ]
             for selector in headline_selectors:
                 try:
-                    element = page.query_selector(selector)
+                    element = await page.query_selector(selector)
                     if element:
-                        headline = element.inner_text().strip()
+                        headline = (await element.inner_text()).strip()
                         if len(headline) > 5 and headline != data['name']:
                             data['headline'] = headline
                             fields_extracted += 1
@@ -720,9 +720,9 @@ class LinkedInScraper(BaseScraper):
 
             for selector in count_selectors:
                 try:
-                    info_elements = page.query_selector_all(selector)
+                    info_elements = await page.query_selector_all(selector)
                     for element in info_elements:
-                        text = element.inner_text().lower()
+                        text = (await element.inner_text()).lower()
 
                         # Check for followers
                         if 'follower' in text and not data['followers_count']:
@@ -762,7 +762,7 @@ class LinkedInScraper(BaseScraper):
             ]
             for selector in post_selectors:
                 try:
-                    posts = page.query_selector_all(selector)
+                    posts = await page.query_selector_all(selector)
                     if posts and len(posts) > 0:
                         data['posts_found'] = len(posts)
                         self.logger.debug(f"Found {len(posts)} posts")
@@ -784,7 +784,13 @@ class LinkedInScraper(BaseScraper):
 
         return data
 
-    def scrape(self, url: str, grantee_name: str, max_posts: int = 25) -> Dict[str, Any]:
+    async def scrape_async(
+        self,
+        url: str,
+        grantee_name: str,
+        max_posts: int = 25,
+        deadline: Optional[Deadline] = None
+    ) -> Dict[str, Any]:
         """
         Scrape LinkedIn company or profile page.
 
@@ -792,6 +798,7 @@ class LinkedInScraper(BaseScraper):
             url: LinkedIn URL to scrape
             grantee_name: Name of the grantee (for organization)
             max_posts: Maximum posts to scrape
+            deadline: Time budget for this job (None for no limit)
 
         Returns:
             Dictionary with:
@@ -800,6 +807,9 @@ class LinkedInScraper(BaseScraper):
                 - errors: list
                 - engagement_metrics: dict
         """
+        self.set_deadline(deadline)
+        self.set_pacing(url)
+
         errors = []
         engagement_metrics = {}
         posts_downloaded = 0
@@ -817,72 +827,63 @@ class LinkedInScraper(BaseScraper):
             output_path = base_output / username
             output_path.mkdir(parents=True, exist_ok=True)
 
-            # Initialize Playwright
-            with sync_playwright() as p:
-                # Launch browser with enhanced stealth settings
-                browser: Browser = p.chromium.launch(
-                    headless=self.headless,
-                    args=[
-                        '--disable-blink-features=AutomationControlled',
-                        '--disable-dev-shm-usage',
-                        '--no-sandbox',
-                        '--disable-setuid-sandbox',
-                        '--disable-web-security',
-                        '--disable-features=IsolateOrigins,site-per-process',
-                    ]
-                )
+            # Context settings with the saved session, used only if the pool
+            # has no warm LinkedIn context to reuse
+            context_params = {
+                'viewport': {
+                    'width': random.randint(1366, 1920),
+                    'height': random.randint(768, 1080)
+                },
+                'user_agent': (
+                    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+                    'AppleWebKit/537.36 (KHTML, like Gecko) '
+                    f'Chrome/{random.randint(118, 122)}.0.0.0 Safari/537.36'
+                ),
+                'locale': 'en-US',
+                'timezone_id': 'America/New_York',
+                'permissions': ['geolocation'],
+                'device_scale_factor': random.choice([1, 1.25, 1.5, 2]),
+                'has_touch': random.choice([True, False]),
+            }
 
-                # Try to load existing session
-                session_state = self._load_session(username)
-
-                # Create context with realistic settings and optional session
-                context_params = {
-                    'viewport': {
-                        'width': random.randint(1366, 1920),
-                        'height': random.randint(768, 1080)
-                    },
-                    'user_agent': (
-                        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-                        'AppleWebKit/537.36 (KHTML, like Gecko) '
-                        f'Chrome/{random.randint(118, 122)}.0.0.0 Safari/537.36'
-                    ),
-                    'locale': 'en-US',
-                    'timezone_id': 'America/New_York',
-                    'permissions': ['geolocation'],
-                    'device_scale_factor': random.choice([1, 1.25, 1.5, 2]),
-                    'has_touch': random.choice([True, False]),
-                }
-
-                # Add session state if available
-                if session_state:
-                    context_params['storage_state'] = session_state
-
-                context = browser.new_context(**context_params)
-
-                page = context.new_page()
+            context_params = self.vault.context_options(self.platform_name, context_params)
+
+            async with get_browser_pool().lease(
+                self.platform_name,
+                context_options=context_params,
+                headless=self.headless,
+                args=BROWSER_ARGS
+            ) as lease:
+                context = lease.context
+                lease.state.setdefault('session_loaded', 'storage_state' in context_params)
+
+                page = await context.new_page()
 
                 # Apply stealth techniques
-                self._apply_stealth_techniques(page)
+                await self._apply_stealth_techniques(page)
 
                 try:
-                    # Attempt login if credentials are available and no session loaded
-                    if self.email and self.password and not session_state:
-                        if not self._login(page):
+                    # Log in only if credentials are available and neither the
+                    # context nor the vault has a valid session
+                    if self.email and self.password:
+                        if not await self.vault.authenticate(
+                            self.platform_name,
+                            lease,
+                            partial(self._check_login_status, page),
+                            partial(self._login, page)
+                        ):
                             self.logger.warning("Login failed, continuing without authentication")
-                        else:
-                            self._random_delay(1.5, 3.0)
-                            # Save session for future use
-                            self._save_session(context, username)
+                    self._logged_in = self._logged_in or lease.state.get('logged_in', False)
 
                     # Navigate to page with timeout
                     self.logger.info(f"Navigating to: {url}")
 
                     # Use retry logic for navigation
-                    def navigate():
-                        return page.goto(url, wait_until='domcontentloaded', timeout=30000)
+                    async def navigate():
+                        return await self.goto(page, url, wait_until='domcontentloaded', timeout=self.deadline.timeout_ms(30000))
 
                     try:
-                        response = self._retry_with_backoff(navigate, max_retries=2)
+                        response = await self._retry_with_backoff(navigate, max_retries=2)
                     except Exception as e:
                         error_msg = f"Failed to navigate to page after retries: {e}"
                         errors.append(error_msg)
@@ -905,18 +906,15 @@ class LinkedInScraper(BaseScraper):
                             'engagement_metrics': {},
                         }
 
-                    # Random delay after page load
-                    self._random_delay(1.0, 2.5)
-
                     # Wait for content
-                    if not self._wait_for_content(page):
+                    if not await self._wait_for_content(page):
                         errors.append("Page content did not load within timeout")
 
                     # Simulate human browsing behavior
-                    self._simulate_human_behavior(page)
+                    await self._simulate_human_behavior(page)
 
                     # Check for access restrictions
-                    restriction = self._check_access_restrictions(page)
+                    restriction = await self._check_access_restrictions(page)
                     if restriction:
                         errors.append(restriction)
                         self.logger.warning(f"Access restricted: {restriction}")
@@ -924,14 +922,14 @@ class LinkedInScraper(BaseScraper):
 
                     # Extract data based on page type
                     if is_company:
-                        extracted_data = self._extract_company_data(page)
+                        extracted_data = await self._extract_company_data(page)
                         engagement_metrics = {
                             'followers_count': extracted_data.get('followers_count'),
                             'employee_count': extracted_data.get('employee_count'),
                             'posts_found': extracted_data.get('posts_found', 0),
                         }
                     else:
-                        extracted_data = self._extract_profile_data(page)
+                        extracted_data = await self._extract_profile_data(page)
                         engagement_metrics = {
                             'followers_count': extracted_data.get('followers_count'),
                             'connections_count': extracted_data.get('connections_count'),
@@ -943,7 +941,7 @@ class LinkedInScraper(BaseScraper):
                     # Take screenshot for reference
                     screenshot_path = output_path / 'screenshot.png'
                     try:
-                        page.screenshot(path=str(screenshot_path), full_page=False)
+                        await page.screenshot(path=str(screenshot_path), full_page=False)
                         self.logger.info(f"Screenshot saved to {screenshot_path}")
                     except Exception as e:
                         self.logger.warning(f"Could not save screenshot: {e}")
@@ -961,7 +959,7 @@ class LinkedInScraper(BaseScraper):
                         'success': len(errors) == 0 or any(v is not None for v in engagement_metrics.values()),
                         'partial_data': extracted_data.get('partial_data', False),
                         'authenticated': self._logged_in,
-                        'session_used': session_state is not None,
+                        'session_used': bool(lease.state.get('session_loaded')),
                         'errors': errors,
                         'notes': [
                             "LinkedIn heavily restricts scraping",
@@ -985,13 +983,11 @@ class LinkedInScraper(BaseScraper):
                     self.logger.error(error_msg)
 
                 finally:
-                    # Cleanup
+                    # The context goes back to the pool; only the page is ours
                     try:
-                        page.close()
-                        context.close()
-                        browser.close()
+                        await page.close()
                     except Exception as e:
-                        self.logger.warning(f"Error closing browser: {e}")
+                        self.logger.warning(f"Error closing page: {e}")
 
             # Determine overall success
             # Success if we extracted at least some data
@@ -1000,18 +996,24 @@ class LinkedInScraper(BaseScraper):
                 any(v is not None and v != 0 for v in engagement_metrics.values())
             )
 
-            if success:
-                self.logger.info(f"Successfully scraped LinkedIn {page_type}: {username}")
-            else:
-                self.logger.warning(f"Scrape completed with errors for: {username}")
-
-            return {
+            result = {
                 'success': success,
                 'posts_downloaded': posts_downloaded,
                 'errors': errors,
                 'engagement_metrics': engagement_metrics,
+                'output_path': str(output_path),
             }
 
+            if self.deadline.expired:
+                return self.mark_timed_out(result, f"Job deadline reached while scraping LinkedIn {page_type}: {username}")
+
+            if success:
+                self.logger.info(f"Successfully scraped LinkedIn {page_type}: {username}")
+            else:
+                self.logger.warning(f"Scrape completed with errors for: {username}")
+
+            return result
+
         except ValueError as e:
             # URL parsing error
             error_msg = str(e)
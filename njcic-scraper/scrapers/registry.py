@@ -0,0 +1,73 @@
+"""
+Lazy registry of platform scrapers.
+
+Maps platform names to import paths so that callers only pay for the
+scrapers a run actually uses. Importing a browser scraper pulls in
+Playwright and playwright-stealth, and Instagram pulls in instaloader, so a
+`--platforms bluesky` run should never import them.
+"""
+
+import importlib
+import time
+from collections.abc import Mapping
+from typing import Dict, Iterator, Type
+
+# Platform name -> "module:ClassName"
+SCRAPER_PATHS: Dict[str, str] = {
+    'twitter': 'scrapers.twitter:TwitterScraper',
+    'bluesky': 'scrapers.bluesky:BlueSkyScraper',
+    'instagram': 'scrapers.instagram_playwright:InstagramPlaywrightScraper',
+    'facebook': 'scrapers.facebook:FacebookScraper',
+    'linkedin': 'scrapers.linkedin:LinkedInScraper',
+    'tiktok': 'scrapers.tiktok:TikTokScraper',
+    'youtube': 'scrapers.youtube:YouTubeScraper',
+    'threads': 'scrapers.threads:ThreadsScraper',
+}
+
+
+class ScraperRegistry(Mapping):
+    """
+    Read-only mapping of platform name to scraper class, imported on first use.
+
+    Membership tests and iteration never import anything; looking up a
+    platform imports its module once and records how long that took.
+    """
+
+    def __init__(self, paths: Dict[str, str]):
+        """
+        Initialize the registry.
+
+        Args:
+            paths: Platform name to "module:ClassName" import path
+        """
+        self._paths = dict(paths)
+        self._classes: Dict[str, Type] = {}
+        self.import_times: Dict[str, float] = {}
+
+    def __getitem__(self, platform: str) -> Type:
+        if platform not in self._classes:
+            module_name, class_name = self._paths[platform].split(':')
+
+            started = time.perf_counter()
+            module = importlib.import_module(module_name)
+            self.import_times[platform] = time.perf_counter() - started
+
+            self._classes[platform] = getattr(module, class_name)
+
+        return self._classes[platform]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __contains__(self, platform: object) -> bool:
+        return platform in self._paths
+
+    def loaded(self) -> Dict[str, Type]:
+        """Return the scraper classes imported so far."""
+        return dict(self._classes)
+
+
+SCRAPER_REGISTRY = ScraperRegistry(SCRAPER_PATHS)
@@ -12,21 +12,19 @@ from __future__ import annotations
 
 import os
 import re
-import json
-import asyncio
 import logging
 import random
 import time
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+from typing import Callable, Optional, Dict, Any, List
+from datetime import datetime, timezone
+from functools import partial
 
 try:
-    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
+    from playwright.async_api import TimeoutError as PlaywrightTimeout
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
-    async_playwright = None
     PlaywrightTimeout = Exception
 
 try:
@@ -38,6 +36,229 @@ except ImportError:
 
 from dotenv import load_dotenv
 from .base import BaseScraper
+from browser_pool import get_browser_pool
+from deadline import Deadline, DeadlineExceeded
+from page_waits import wait_for_network_idle, wait_for_selector
+from response_capture import ResponseCapture, dig, iter_dicts
+from scroll_harvest import ScrollHarvester
+from session_vault import get_session_vault
+
+# Chromium flags for the pooled Threads browser
+BROWSER_ARGS = (
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-web-security',
+    '--disable-features=IsolateOrigins,site-per-process',
+)
+
+# GraphQL endpoints the profile feed pages through while scrolling
+FEED_RESPONSE_PATTERN = r"/(api/)?graphql"
+
+# Reads one post article's fields, for ScrollHarvester (scroll_harvest.py)
+POST_FIELDS_JS = """
+(article) => {
+    // Extract post text with multiple fallback strategies
+    let postText = '';
+
+    // Strategy 1: Look for text in [dir="auto"] elements
+    const dirAutoElements = article.querySelectorAll('[dir="auto"]');
+    dirAutoElements.forEach(el => {
+        const text = el.textContent?.trim();
+        // Skip if it's just engagement text (likes, replies, etc.)
+        if (text && !text.match(/^\\d+\\s+(like|repl|repost|quote)/i)) {
+            if (text.length > postText.length) {
+                postText = text;
+            }
+        }
+    });
+
+    // Strategy 2: Look for specific content divs
+    if (!postText) {
+        const contentSelectors = [
+            '[data-testid="post-text"]',
+            '.post-text',
+            '[role="article"] > div > div',
+            'span[dir="auto"]'
+        ];
+
+        for (const selector of contentSelectors) {
+            const el = article.querySelector(selector);
+            if (el?.textContent?.trim()) {
+                postText = el.textContent.trim();
+                break;
+            }
+        }
+    }
+
+    // Strategy 3: Get all text and filter
+    if (!postText) {
+        const allText = article.textContent || '';
+        const lines = allText.split('\\n').filter(line => {
+            const trimmed = line.trim();
+            return trimmed.length > 10 &&
+                   !trimmed.match(/^\\d+\\s+(like|repl|repost|quote|hour|min|day)/i);
+        });
+        if (lines.length > 0) {
+            postText = lines[0].trim();
+        }
+    }
+
+    // Extract timestamp with multiple fallback selectors
+    let timestamp = new Date().toISOString();
+    const timeSelectors = [
+        'time[datetime]',
+        'time',
+        '[data-testid="timestamp"]',
+        'a[href*="/post/"] time'
+    ];
+
+    for (const selector of timeSelectors) {
+        const timeElement = article.querySelector(selector);
+        if (timeElement) {
+            timestamp = timeElement.getAttribute('datetime') ||
+                       timeElement.textContent ||
+                       timestamp;
+            break;
+        }
+    }
+
+    // Extract engagement metrics with improved regex
+    const allText = article.textContent || '';
+
+    // Try to find likes (matches "X likes", "1 like", "123K likes")
+    const likesMatch = allText.match(/([\\d,\\.]+[KMB]?)\\s+likes?/i);
+    let likes = 0;
+    if (likesMatch) {
+        const likeText = likesMatch[1].replace(/,/g, '');
+        if (likeText.includes('K')) {
+            likes = Math.floor(parseFloat(likeText) * 1000);
+        } else if (likeText.includes('M')) {
+            likes = Math.floor(parseFloat(likeText) * 1000000);
+        } else {
+            likes = parseInt(likeText) || 0;
+        }
+    }
+
+    // Try to find replies (matches "X replies", "1 reply")
+    const repliesMatch = allText.match(/([\\d,\\.]+[KMB]?)\\s+repl(?:y|ies)/i);
+    let replies = 0;
+    if (repliesMatch) {
+        const replyText = repliesMatch[1].replace(/,/g, '');
+        if (replyText.includes('K')) {
+            replies = Math.floor(parseFloat(replyText) * 1000);
+        } else if (replyText.includes('M')) {
+            replies = Math.floor(parseFloat(replyText) * 1000000);
+        } else {
+            replies = parseInt(replyText) || 0;
+        }
+    }
+
+    // Try to find reposts/quotes
+    const repostsMatch = allText.match(/([\\d,\\.]+[KMB]?)\\s+(?:repost|quote)s?/i);
+    let reposts = 0;
+    if (repostsMatch) {
+        const repostText = repostsMatch[1].replace(/,/g, '');
+        if (repostText.includes('K')) {
+            reposts = Math.floor(parseFloat(repostText) * 1000);
+        } else if (repostText.includes('M')) {
+            reposts = Math.floor(parseFloat(repostText) * 1000000);
+        } else {
+            reposts = parseInt(repostText) || 0;
+        }
+    }
+
+    // Get post URL with fallback selectors
+    let postUrl = '';
+    const linkSelectors = [
+        'a[href*="/post/"]',
+        'a[role="link"][href*="/post/"]',
+        '[data-testid="post-link"]'
+    ];
+
+    for (const selector of linkSelectors) {
+        const linkElement = article.querySelector(selector);
+        if (linkElement?.href) {
+            postUrl = linkElement.href;
+            break;
+        }
+    }
+
+    return {
+        text: postText || '[No text content]',
+        timestamp: timestamp,
+        likes: likes,
+        replies: replies,
+        reposts: reposts,
+        url: postUrl,
+        raw_html_length: article.innerHTML?.length || 0
+    };
+}
+"""
+
+
+def parse_feed_posts(payload: Any, username: str) -> List[Dict[str, Any]]:
+    """
+    Turn a Threads feed payload (GraphQL or embedded page JSON) into post dicts.
+
+    Args:
+        payload: Decoded JSON
+        username: Profile handle; posts by other accounts are skipped
+
+    Returns:
+        Post dicts with the same fields as DOM extraction, plus 'id'
+    """
+    posts = []
+
+    def is_post(node):
+        return 'taken_at' in node and 'like_count' in node and 'caption' in node
+
+    for post in iter_dicts(payload, is_post):
+        author = dig(post, 'user', 'username')
+        if author and author.lower() != username.lower():
+            continue
+
+        info = post.get('text_post_app_info') or {}
+        code = post.get('code')
+
+        try:
+            timestamp = datetime.fromtimestamp(int(post['taken_at']), tz=timezone.utc).isoformat()
+        except (TypeError, ValueError, OverflowError):
+            timestamp = None
+
+        posts.append({
+            'id': post.get('pk') or post.get('id') or code,
+            'text': dig(post, 'caption', 'text', default='') or '[No text content]',
+            'timestamp': timestamp,
+            'likes': post.get('like_count') or 0,
+            'replies': info.get('direct_reply_count') or 0,
+            'reposts': (info.get('repost_count') or 0) + (info.get('quote_count') or 0),
+            'url': f"https://www.threads.net/@{author or username}/post/{code}" if code else '',
+        })
+
+    return posts
+
+
+def parse_feed_profile(payload: Any, username: str) -> Optional[Dict[str, Any]]:
+    """
+    Find the profile's follower count in a Threads payload.
+
+    Args:
+        payload: Decoded JSON
+        username: Profile handle
+
+    Returns:
+        {'followers_count': int}, or None if the user is not in the payload
+    """
+    def is_profile(node):
+        return 'follower_count' in node and 'username' in node
+
+    for user in iter_dicts(payload, is_profile):
+        if str(user['username']).lower() == username.lower() and user['follower_count'] is not None:
+            return {'followers_count': user['follower_count']}
+
+    return None
 
 # Load environment variables
 load_dotenv()
@@ -65,8 +286,8 @@ class ThreadsScraper(BaseScraper):
         self.password = os.getenv('INSTAGRAM_PASSWORD')
         self._logged_in = False
 
-        # Cookie persistence for session reuse
-        self.cookies_file = Path(output_dir) / ".threads_cookies.json"
+        # Saved sessions shared with other runs
+        self.vault = get_session_vault()
 
         # Retry configuration
         self.max_retries = 3
@@ -84,14 +305,13 @@ class ThreadsScraper(BaseScraper):
 
     async def _random_delay(self, min_sec: float = 0.5, max_sec: float = 2.0):
         """
-        Add random delay to simulate human behavior.
+        Add a random, pacing-scaled delay to simulate human behavior.
 
         Args:
-            min_sec: Minimum delay in seconds
-            max_sec: Maximum delay in seconds
+            min_sec: Minimum delay in seconds at standard pacing
+            max_sec: Maximum delay in seconds at standard pacing
         """
-        delay = random.uniform(min_sec, max_sec)
-        await asyncio.sleep(delay)
+        await self.pause(min_sec, max_sec)
 
     async def _human_type(self, element, text: str):
         """
@@ -102,48 +322,11 @@ class ThreadsScraper(BaseScraper):
             text: Text to type
         """
         for char in text:
-            await element.type(char, delay=random.uniform(50, 150))
+            await element.type(char, delay=self.pacing.delay(50, 150))
             # Occasionally pause longer (simulating thinking)
             if random.random() < 0.1:
                 await self._random_delay(0.2, 0.5)
 
-    async def _save_cookies(self, context):
-        """
-        Save browser cookies for session reuse.
-
-        Args:
-            context: Playwright browser context
-        """
-        try:
-            cookies = await context.cookies()
-            self.cookies_file.parent.mkdir(exist_ok=True, parents=True)
-            with open(self.cookies_file, 'w') as f:
-                json.dump(cookies, f)
-            self.logger.info(f"Cookies saved to {self.cookies_file}")
-        except Exception as e:
-            self.logger.warning(f"Failed to save cookies: {e}")
-
-    async def _load_cookies(self, context):
-        """
-        Load saved cookies into browser context.
-
-        Args:
-            context: Playwright browser context
-
-        Returns:
-            True if cookies were loaded successfully, False otherwise
-        """
-        try:
-            if self.cookies_file.exists():
-                with open(self.cookies_file, 'r') as f:
-                    cookies = json.load(f)
-                await context.add_cookies(cookies)
-                self.logger.info("Loaded saved cookies")
-                return True
-        except Exception as e:
-            self.logger.warning(f"Failed to load cookies: {e}")
-        return False
-
     async def _get_random_user_agent(self) -> str:
         """
         Get a random realistic user agent.
@@ -196,6 +379,8 @@ class ThreadsScraper(BaseScraper):
         for attempt in range(self.max_retries):
             try:
                 return await func(*args, **kwargs)
+            except DeadlineExceeded:
+                raise
             except Exception as e:
                 last_exception = e
                 if attempt < self.max_retries - 1:
@@ -206,7 +391,7 @@ class ThreadsScraper(BaseScraper):
                         f"Attempt {attempt + 1}/{self.max_retries} failed: {e}. "
                         f"Retrying in {total_delay:.1f}s..."
                     )
-                    await asyncio.sleep(total_delay)
+                    await self.wait(total_delay, 'retry_backoff')
                 else:
                     self.logger.error(f"All {self.max_retries} attempts failed")
 
@@ -232,8 +417,8 @@ class ThreadsScraper(BaseScraper):
             self.logger.info("Attempting Threads login via Instagram...")
 
             # Navigate to Threads login page
-            await page.goto('https://www.threads.net/login', timeout=self.timeout)
-            await self._random_delay(2, 4)
+            await self.goto(page, 'https://www.threads.net/login', timeout=self.deadline.timeout_ms(self.timeout))
+            await wait_for_network_idle(page, self.deadline.timeout_ms(8000), floor_ms=self.pacing.scaled(500))
 
             # Look for "Log in with Instagram" button or direct login form
             # Threads may show different login flows
@@ -255,7 +440,7 @@ class ThreadsScraper(BaseScraper):
 
                 if ig_login_btn:
                     await ig_login_btn.click()
-                    await self._random_delay(2, 4)
+                    await wait_for_network_idle(page, self.deadline.timeout_ms(8000), floor_ms=self.pacing.scaled(500))
             except Exception as e:
                 self.logger.warning(f"Could not find Instagram login button: {e}")
 
@@ -305,7 +490,7 @@ class ThreadsScraper(BaseScraper):
                         login_link = await page.query_selector(selector)
                         if login_link:
                             await login_link.click()
-                            await self._random_delay(1, 2)
+                            await wait_for_selector(page, password_selectors, self.deadline.timeout_ms(5000))
                             break
 
                     # Try finding inputs again
@@ -360,8 +545,8 @@ class ThreadsScraper(BaseScraper):
                 self.logger.warning("Could not find submit button, pressing Enter")
                 await page.keyboard.press('Enter')
 
-            # Wait for navigation with realistic delay
-            await self._random_delay(3, 6)
+            # Wait for the login requests and redirect to settle
+            await wait_for_network_idle(page, self.deadline.timeout_ms(15000), floor_ms=self.pacing.scaled(1000))
 
             # Check if login was successful
             current_url = page.url
@@ -469,268 +654,62 @@ class ThreadsScraper(BaseScraper):
             selector: CSS selector to wait for
             max_wait: Maximum wait time in seconds
         """
-        try:
-            await page.wait_for_selector(selector, timeout=max_wait * 1000)
-        except PlaywrightTimeout:
+        if not await wait_for_selector(page, selector, self.deadline.timeout_ms(max_wait * 1000)):
             self.logger.warning(f"Timeout waiting for selector: {selector}")
 
-    async def _scroll_to_load_posts(self, page, target_posts: int = 25, max_scrolls: int = 10):
+    async def _scroll_to_load_posts(
+        self,
+        page,
+        target_posts: int = 25,
+        max_scrolls: int = 10,
+        have_enough: Optional[Callable[[], bool]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Scroll page to trigger lazy loading of posts with realistic human-like behavior.
 
+        Each scroll waits for new posts to be inserted rather than for a
+        fixed reading delay, with a short floor between scrolls. Posts are
+        read as they render (only the ones added since the last scroll), so
+        posts the feed unmounts while scrolling are still collected.
+
         Args:
             page: Playwright page object
             target_posts: Target number of posts to load
             max_scrolls: Maximum scroll attempts
+            have_enough: Optional check that ends scrolling early, e.g. once
+                enough posts have been captured from the feed's JSON
 
         Returns:
-            Number of posts loaded
+            Posts read from the page, de-duplicated by URL
         """
-        previous_height = 0
-        scrolls = 0
-        no_change_count = 0
+        viewport_height = (page.viewport_size or {}).get('height', 900)
 
-        while scrolls < max_scrolls:
+        def scroll_by():
             # Realistic scroll behavior: scroll in chunks, not always to bottom
-            scroll_type = random.choice(['full', 'partial', 'partial', 'slow'])
-
-            if scroll_type == 'full':
-                # Scroll to bottom in one go
-                await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-            elif scroll_type == 'partial':
-                # Scroll down by a partial amount (60-90% of viewport)
-                scroll_amount = random.randint(60, 90)
-                await page.evaluate(f'window.scrollBy(0, window.innerHeight * {scroll_amount / 100})')
-            else:  # slow
-                # Simulate slow scroll with multiple small steps
-                steps = random.randint(3, 6)
-                scroll_per_step = await page.evaluate('Math.floor(window.innerHeight / arguments[0])', steps)
-                for _ in range(steps):
-                    await page.evaluate(f'window.scrollBy(0, {scroll_per_step})')
-                    await self._random_delay(0.1, 0.3)
-
-            # Random delay after scrolling (simulating reading)
-            await self._random_delay(1.5, 4.0)
-
-            # Occasionally scroll up a bit (like a human re-reading)
-            if random.random() < 0.2:
-                await page.evaluate('window.scrollBy(0, -window.innerHeight * 0.3)')
-                await self._random_delay(0.5, 1.0)
-
-            # Check current height
-            current_height = await page.evaluate('document.body.scrollHeight')
-
-            # Count visible articles (posts) with error handling
-            try:
-                post_count = await page.evaluate('document.querySelectorAll("article").length')
-            except Exception as e:
-                self.logger.warning(f"Error counting posts: {e}")
-                post_count = 0
-
-            self.logger.info(f"Loaded {post_count} posts (scroll {scrolls + 1}/{max_scrolls})")
-
-            # Break if we have enough posts
-            if post_count >= target_posts:
-                self.logger.info(f"Reached target of {target_posts} posts")
-                break
-
-            # Track if page stopped growing
-            if current_height == previous_height:
-                no_change_count += 1
-                if no_change_count >= 3:
-                    self.logger.info("Page stopped growing, ending scroll")
-                    break
-            else:
-                no_change_count = 0
-
-            previous_height = current_height
-            scrolls += 1
-
-        return post_count
-
-    async def _extract_post_data(self, page) -> List[Dict[str, Any]]:
-        """
-        Extract post data from the loaded page with robust fallback selectors.
-
-        Args:
-            page: Playwright page object
-
-        Returns:
-            List of post dictionaries with metadata
-        """
-        posts = []
+            if random.random() < 0.25:
+                return None
+            return int(viewport_height * random.uniform(0.6, 0.9))
 
+        harvester = ScrollHarvester(page, 'article', POST_FIELDS_JS, target_posts)
         try:
-            # Extract posts using JavaScript in the browser context
-            posts_data = await page.evaluate('''() => {
-                const articles = document.querySelectorAll('article');
-                const posts = [];
-
-                articles.forEach((article, index) => {
-                    try {
-                        // Extract post text with multiple fallback strategies
-                        let postText = '';
-
-                        // Strategy 1: Look for text in [dir="auto"] elements
-                        const dirAutoElements = article.querySelectorAll('[dir="auto"]');
-                        dirAutoElements.forEach(el => {
-                            const text = el.textContent?.trim();
-                            // Skip if it's just engagement text (likes, replies, etc.)
-                            if (text && !text.match(/^\\d+\\s+(like|repl|repost|quote)/i)) {
-                                if (text.length > postText.length) {
-                                    postText = text;
-                                }
-                            }
-                        });
-
-                        // Strategy 2: Look for specific content divs
-                        if (!postText) {
-                            const contentSelectors = [
-                                '[data-testid="post-text"]',
-                                '.post-text',
-                                '[role="article"] > div > div',
-                                'span[dir="auto"]'
-                            ];
-
-                            for (const selector of contentSelectors) {
-                                const el = article.querySelector(selector);
-                                if (el?.textContent?.trim()) {
-                                    postText = el.textContent.trim();
-                                    break;
-                                }
-                            }
-                        }
-
-                        // Strategy 3: Get all text and filter
-                        if (!postText) {
-                            const allText = article.textContent || '';
-                            const lines = allText.split('\\n').filter(line => {
-                                const trimmed = line.trim();
-                                return trimmed.length > 10 &&
-                                       !trimmed.match(/^\\d+\\s+(like|repl|repost|quote|hour|min|day)/i);
-                            });
-                            if (lines.length > 0) {
-                                postText = lines[0].trim();
-                            }
-                        }
-
-                        // Extract timestamp with multiple fallback selectors
-                        let timestamp = new Date().toISOString();
-                        const timeSelectors = [
-                            'time[datetime]',
-                            'time',
-                            '[data-testid="timestamp"]',
-                            'a[href*="/post/"] time'
-                        ];
-
-                        for (const selector of timeSelectors) {
-                            const timeElement = article.querySelector(selector);
-                            if (timeElement) {
-                                timestamp = timeElement.getAttribute('datetime') ||
-                                           timeElement.textContent ||
-                                           timestamp;
-                                break;
-                            }
-                        }
-
-                        // Extract engagement metrics with improved regex
-                        const allText = article.textContent || '';
-
-                        // Try to find likes (matches "X likes", "1 like", "123K likes")
-                        const likesMatch = allText.match(/([\\d,\\.]+[KMB]?)\\s+likes?/i);
-                        let likes = 0;
-                        if (likesMatch) {
-                            const likeText = likesMatch[1].replace(/,/g, '');
-                            if (likeText.includes('K')) {
-                                likes = Math.floor(parseFloat(likeText) * 1000);
-                            } else if (likeText.includes('M')) {
-                                likes = Math.floor(parseFloat(likeText) * 1000000);
-                            } else {
-                                likes = parseInt(likeText) || 0;
-                            }
-                        }
-
-                        // Try to find replies (matches "X replies", "1 reply")
-                        const repliesMatch = allText.match(/([\\d,\\.]+[KMB]?)\\s+repl(?:y|ies)/i);
-                        let replies = 0;
-                        if (repliesMatch) {
-                            const replyText = repliesMatch[1].replace(/,/g, '');
-                            if (replyText.includes('K')) {
-                                replies = Math.floor(parseFloat(replyText) * 1000);
-                            } else if (replyText.includes('M')) {
-                                replies = Math.floor(parseFloat(replyText) * 1000000);
-                            } else {
-                                replies = parseInt(replyText) || 0;
-                            }
-                        }
-
-                        // Try to find reposts/quotes
-                        const repostsMatch = allText.match(/([\\d,\\.]+[KMB]?)\\s+(?:repost|quote)s?/i);
-                        let reposts = 0;
-                        if (repostsMatch) {
-                            const repostText = repostsMatch[1].replace(/,/g, '');
-                            if (repostText.includes('K')) {
-                                reposts = Math.floor(parseFloat(repostText) * 1000);
-                            } else if (repostText.includes('M')) {
-                                reposts = Math.floor(parseFloat(repostText) * 1000000);
-                            } else {
-                                reposts = parseInt(repostText) || 0;
-                            }
-                        }
-
-                        // Get post URL with fallback selectors
-                        let postUrl = '';
-                        const linkSelectors = [
-                            'a[href*="/post/"]',
-                            'a[role="link"][href*="/post/"]',
-                            '[data-testid="post-link"]'
-                        ];
-
-                        for (const selector of linkSelectors) {
-                            const linkElement = article.querySelector(selector);
-                            if (linkElement?.href) {
-                                postUrl = linkElement.href;
-                                break;
-                            }
-                        }
-
-                        posts.push({
-                            index: index,
-                            text: postText || '[No text content]',
-                            timestamp: timestamp,
-                            likes: likes,
-                            replies: replies,
-                            reposts: reposts,
-                            url: postUrl,
-                            raw_html_length: article.innerHTML?.length || 0
-                        });
-                    } catch (err) {
-                        console.error('Error extracting post:', err);
-                        // Add placeholder for failed extraction
-                        posts.push({
-                            index: index,
-                            text: '[Extraction failed]',
-                            timestamp: new Date().toISOString(),
-                            likes: 0,
-                            replies: 0,
-                            reposts: 0,
-                            url: '',
-                            raw_html_length: 0,
-                            error: err.message
-                        });
-                    }
-                });
-
-                return posts;
-            }''')
-
-            posts = posts_data if posts_data else []
-            self.logger.info(f"Successfully extracted {len(posts)} posts")
-
+            # Partial scrolls may not reach the loading edge, so allow a few misses
+            await harvester.run(
+                max_scrolls,
+                timeout_ms=4000,
+                scroll_by=scroll_by,
+                floor_ms=self.pacing.scroll_floor_ms,
+                patience=3,
+                have_enough=have_enough,
+                deadline=self.deadline
+            )
+        except DeadlineExceeded as e:
+            # Out of time: keep whatever has been read so far
+            self.logger.warning(f"Stopped scrolling: {e}")
         except Exception as e:
             self.logger.error(f"Error extracting post data: {e}")
 
-        return posts
+        self.logger.info(f"Loaded {len(harvester.items)} posts over {harvester.scrolls} scrolls")
+        return [dict(post, index=index) for index, post in enumerate(harvester.items)]
 
     async def _extract_follower_count(self, page) -> int:
         """
@@ -791,52 +770,47 @@ class ThreadsScraper(BaseScraper):
             }
         }
 
-        async with async_playwright() as p:
-            browser = None
+        # Context with random user agent, viewport and the saved session; only
+        # used if the pool has no warm Threads context to lend
+        context_options = {
+            'user_agent': await self._get_random_user_agent(),
+            'viewport': await self._get_random_viewport(),
+            'locale': 'en-US',
+            'timezone_id': 'America/New_York',
+            'permissions': ['geolocation'],
+            'extra_http_headers': {
+                'Accept-Language': 'en-US,en;q=0.9',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+                'Accept-Encoding': 'gzip, deflate, br',
+                'DNT': '1',
+                'Connection': 'keep-alive',
+                'Upgrade-Insecure-Requests': '1'
+            }
+        }
+        context_options = self.vault.context_options(self.platform_name, context_options)
+
+        async with get_browser_pool().lease(
+            self.platform_name,
+            context_options=context_options,
+            headless=self.headless,
+            args=BROWSER_ARGS
+        ) as lease:
+            context = lease.context
+            lease.state.setdefault('session_loaded', 'storage_state' in context_options)
             try:
-                # Launch browser with additional anti-detection args
-                self.logger.info(f"Launching browser (headless={self.headless})...")
-                browser = await p.chromium.launch(
-                    headless=self.headless,
-                    args=[
-                        '--disable-blink-features=AutomationControlled',
-                        '--disable-dev-shm-usage',
-                        '--no-sandbox',
-                        '--disable-setuid-sandbox',
-                        '--disable-web-security',
-                        '--disable-features=IsolateOrigins,site-per-process'
-                    ]
-                )
-
-                # Create context with random user agent and viewport
-                user_agent = await self._get_random_user_agent()
-                viewport = await self._get_random_viewport()
-
-                self.logger.info(f"Using viewport: {viewport['width']}x{viewport['height']}")
-
-                context = await browser.new_context(
-                    user_agent=user_agent,
-                    viewport=viewport,
-                    locale='en-US',
-                    timezone_id='America/New_York',
-                    permissions=['geolocation'],
-                    extra_http_headers={
-                        'Accept-Language': 'en-US,en;q=0.9',
-                        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                        'Accept-Encoding': 'gzip, deflate, br',
-                        'DNT': '1',
-                        'Connection': 'keep-alive',
-                        'Upgrade-Insecure-Requests': '1'
-                    }
-                )
-
-                # Try to load saved cookies
-                cookies_loaded = await self._load_cookies(context)
-                if cookies_loaded:
-                    self.logger.info("Using saved session cookies")
+                if lease.reused:
+                    self.logger.info("Reusing warm browser context")
 
                 page = await context.new_page()
 
+                # Read posts from the feed's JSON as the page loads and scrolls
+                capture = ResponseCapture(
+                    page,
+                    FEED_RESPONSE_PATTERN,
+                    partial(parse_feed_posts, username=username),
+                    partial(parse_feed_profile, username=username)
+                )
+
                 # Apply stealth mode if available
                 if STEALTH_AVAILABLE:
                     try:
@@ -846,14 +820,11 @@ class ThreadsScraper(BaseScraper):
                     except Exception as e:
                         self.logger.warning(f"Could not apply stealth mode: {e}")
 
-                # Attempt login if credentials are available and no cookies loaded
-                if self.username and self.password and not cookies_loaded:
-                    if not await self._login(page):
+                # Log in only if credentials are available and neither the
+                # context nor the vault has a session (the typed login is slow)
+                if self.username and self.password:
+                    if not await self.vault.authenticate(self.platform_name, lease, None, partial(self._login, page)):
                         self.logger.warning("Login failed, continuing without authentication")
-                    else:
-                        # Save cookies after successful login
-                        await self._save_cookies(context)
-                        await self._random_delay(1, 3)  # Brief pause after login
 
                 # Construct profile URL
                 profile_url = f"https://www.threads.net/@{username}" if not url.startswith('http') else url
@@ -861,14 +832,11 @@ class ThreadsScraper(BaseScraper):
                 self.logger.info(f"Navigating to {profile_url}...")
 
                 try:
-                    await page.goto(profile_url, timeout=self.timeout, wait_until='domcontentloaded')
+                    await self.goto(page, profile_url, timeout=self.deadline.timeout_ms(self.timeout), wait_until='domcontentloaded')
                 except PlaywrightTimeout:
                     result['errors'].append(f"Timeout loading profile page: {profile_url}")
                     return result
 
-                # Add realistic delay after page load
-                await self._random_delay(1, 2)
-
                 # Wait for content to load
                 await self._wait_for_page_load(page)
 
@@ -886,22 +854,40 @@ class ThreadsScraper(BaseScraper):
                     result['errors'].append(f"Profile @{username} not found")
                     return result
 
+                # The first posts and the profile are embedded in the page HTML
+                await capture.capture_embedded()
+
                 # Extract follower count
-                followers = await self._extract_follower_count(page)
+                followers = capture.profile.get('followers_count')
+                if followers is None:
+                    followers = await self._extract_follower_count(page)
                 result['engagement_metrics']['followers_count'] = followers
                 self.logger.info(f"Followers: {followers:,}")
 
                 # Scroll to load posts
                 self.logger.info(f"Scrolling to load up to {self.max_posts} posts...")
-                posts_loaded = await self._scroll_to_load_posts(page, self.max_posts)
+                dom_posts = await self._scroll_to_load_posts(
+                    page,
+                    self.max_posts,
+                    have_enough=lambda: len(capture.posts) >= self.max_posts
+                )
 
-                if posts_loaded == 0:
-                    result['errors'].append("No posts found on profile")
-                    return result
+                await capture.drain()
+                capture.stop()
+
+                if capture.posts:
+                    extraction_method = 'api'
+                    posts = [dict(post, index=index) for index, post in enumerate(capture.posts)]
+                    self.logger.info(f"Captured {len(posts)} posts from "
+                                     f"{capture.responses_parsed} feed payloads")
+                else:
+                    if not dom_posts:
+                        result['errors'].append("No posts found on profile")
+                        return result
 
-                # Extract post data
-                self.logger.info(f"Extracting data from {posts_loaded} posts...")
-                posts = await self._extract_post_data(page)
+                    # Fall back to the posts read from the rendered feed
+                    extraction_method = 'dom'
+                    posts = dom_posts
 
                 # Limit to max_posts
                 posts = posts[:self.max_posts]
@@ -932,6 +918,7 @@ class ThreadsScraper(BaseScraper):
                     'posts_count': len(posts),
                     'posts': posts,
                     'engagement_metrics': result['engagement_metrics'],
+                    'extraction_method': extraction_method,
                     'scraped_at': datetime.now().isoformat()
                 }
 
@@ -943,18 +930,27 @@ class ThreadsScraper(BaseScraper):
                 self.logger.info(f"Successfully scraped {len(posts)} posts from @{username}")
                 self.logger.info(f"Engagement: {total_likes:,} likes, {total_replies:,} replies, {total_reposts:,} reposts")
 
+                if self.deadline.expired:
+                    self.mark_timed_out(result, f"Job deadline reached while scraping @{username}")
+
+            except DeadlineExceeded as e:
+                result['errors'].append(str(e))
+                self.mark_timed_out(result, f"Timed out scraping @{username}: {e}")
+
             except Exception as e:
                 error_msg = f"Error during scraping: {str(e)}"
                 self.logger.exception(error_msg)
                 result['errors'].append(error_msg)
 
-            finally:
-                if browser:
-                    await browser.close()
-
         return result
 
-    def scrape(self, url: str, grantee_name: str, max_posts: int = 25) -> Dict[str, Any]:
+    async def scrape_async(
+        self,
+        url: str,
+        grantee_name: str,
+        max_posts: int = 25,
+        deadline: Optional[Deadline] = None
+    ) -> Dict[str, Any]:
         """
         Scrape Threads profile content.
 
@@ -962,6 +958,7 @@ class ThreadsScraper(BaseScraper):
             url: Threads profile URL
             grantee_name: Name of the grantee
             max_posts: Maximum posts to scrape
+            deadline: Time budget for this job (None for no limit)
 
         Returns:
             Dictionary containing:
@@ -975,6 +972,9 @@ class ThreadsScraper(BaseScraper):
                     - total_reposts: Sum of reposts across all posts
                     - avg_engagement_rate: Average engagement rate (%)
         """
+        self.set_deadline(deadline)
+        self.set_pacing(url)
+
         result = {
             'success': False,
             'posts_downloaded': 0,
@@ -1013,13 +1013,8 @@ class ThreadsScraper(BaseScraper):
                 self.logger.error(result['errors'][-1])
                 return result
 
-            # Run async scraping
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                result = loop.run_until_complete(self._scrape_async(url, username, output_dir))
-            finally:
-                loop.close()
+            result = await self._scrape_async(url, username, output_dir)
+            result.setdefault('output_path', str(output_dir))
 
         except Exception as e:
             error_msg = f"Fatal error scraping Threads: {str(e)}"
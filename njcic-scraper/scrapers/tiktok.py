@@ -8,7 +8,6 @@ import re
 import json
 import subprocess
 import sys
-import time
 import random
 import os
 from pathlib import Path
@@ -16,6 +15,8 @@ from typing import Dict, Any, Optional, List
 import logging
 
 from scrapers.base import BaseScraper
+from deadline import Deadline, DeadlineExceeded
+from time_accounting import get_time_ledger
 import config
 
 
@@ -60,6 +61,9 @@ class TikTokScraper(BaseScraper):
         "api22-normal-c-useast1a.tiktokv.com",
     ]
 
+    # Seconds yt-dlp sleeps before each request (--sleep-requests)
+    SLEEP_REQUESTS = 1
+
     def __init__(self, output_dir: Optional[Path] = None):
         """
         Initialize TikTok scraper.
@@ -121,7 +125,13 @@ class TikTokScraper(BaseScraper):
         self.logger.warning(f"Could not extract username from URL: {url}")
         return None
 
-    def scrape(self, url: str, grantee_name: str, max_posts: Optional[int] = None) -> Dict[str, Any]:
+    async def scrape_async(
+        self,
+        url: str,
+        grantee_name: str,
+        max_posts: Optional[int] = None,
+        deadline: Optional[Deadline] = None
+    ) -> Dict[str, Any]:
         """
         Scrape TikTok metadata using yt-dlp (no video downloads).
 
@@ -129,6 +139,7 @@ class TikTokScraper(BaseScraper):
             url: TikTok profile URL
             grantee_name: Name of the grantee/influencer
             max_posts: Maximum number of posts to scrape (defaults to config value)
+            deadline: Time budget for this job (None for no limit)
 
         Returns:
             Dictionary containing:
@@ -138,6 +149,9 @@ class TikTokScraper(BaseScraper):
                 - engagement_metrics: dict - Aggregated engagement data
                 - output_path: str - Path where data was saved
         """
+        self.set_deadline(deadline)
+        self.set_pacing(url)
+
         # Use provided max_posts or fall back to config default
         max_posts = max_posts or config.MAX_POSTS_PER_ACCOUNT
         result = {
@@ -180,7 +194,7 @@ class TikTokScraper(BaseScraper):
 
         try:
             # Run yt-dlp to extract metadata only (no video download)
-            posts_data = self._run_ytdlp(profile_url, temp_dir, username, max_posts)
+            posts_data = await self._run_ytdlp(profile_url, temp_dir, username, max_posts)
 
             if not posts_data:
                 result["errors"].append("No posts found or unable to extract metadata")
@@ -209,6 +223,16 @@ class TikTokScraper(BaseScraper):
                 f"{result['engagement_metrics']['total_views']:,} views"
             )
 
+        except DeadlineExceeded as e:
+            # Keep whatever info.json files yt-dlp wrote before it was stopped
+            posts_data = self._parse_info_json_files(temp_dir)
+            if posts_data:
+                result["posts_downloaded"] = len(posts_data)
+                result["engagement_metrics"] = self._calculate_engagement_metrics(posts_data)
+                self.save_posts(posts_data, output_path, "posts.json")
+            result["errors"].append(str(e))
+            self.mark_timed_out(result, f"Timed out scraping @{username}: {e}")
+
         except subprocess.TimeoutExpired:
             result["errors"].append("yt-dlp process timed out (>10 minutes)")
             self.logger.error(f"Timeout scraping @{username}")
@@ -229,7 +253,7 @@ class TikTokScraper(BaseScraper):
 
         return result
 
-    def _run_ytdlp(self, profile_url: str, temp_dir: Path, username: str, max_posts: int) -> List[Dict[str, Any]]:
+    async def _run_ytdlp(self, profile_url: str, temp_dir: Path, username: str, max_posts: int) -> List[Dict[str, Any]]:
         """
         Execute yt-dlp to extract metadata with improved retry logic.
 
@@ -244,6 +268,7 @@ class TikTokScraper(BaseScraper):
 
         Raises:
             subprocess.TimeoutExpired: If process exceeds timeout
+            DeadlineExceeded: If the job deadline passes first
             FileNotFoundError: If yt-dlp is not installed
         """
         output_template = str(temp_dir / "%(id)s.%(ext)s")
@@ -256,7 +281,7 @@ class TikTokScraper(BaseScraper):
             "--no-warnings",           # Suppress warnings for cleaner output
             "--playlist-end", str(max_posts),  # Limit to max_posts
             "--extractor-args", f"tiktok:api_hostname={self.api_endpoint}",  # Use configured API endpoint
-            "--sleep-requests", "1",   # Sleep 1 second between requests (rate limiting)
+            "--sleep-requests", str(self.SLEEP_REQUESTS),  # Sleep between requests (rate limiting)
             "--retries", "5",          # Retry failed requests 5 times
             "--fragment-retries", "5", # Retry failed fragments 5 times
             "-o", output_template,     # Output template
@@ -310,13 +335,12 @@ class TikTokScraper(BaseScraper):
                           if "tiktok:api_hostname" in arg else arg for arg in cmd]
                     self.logger.debug(f"Rotating API endpoint to: {new_endpoint}")
 
-                process = subprocess.run(
+                files_before = len(list(temp_dir.glob("*.info.json")))
+                process = await self.run_command(
                     cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=600,  # 10 minute timeout
-                    check=False,
+                    self.deadline.timeout(600)  # 10 minutes, or less if the job deadline is closer
                 )
+                self._account_sleep_requests(len(list(temp_dir.glob("*.info.json"))) - files_before)
 
                 # Check for common errors
                 if process.returncode != 0:
@@ -341,7 +365,7 @@ class TikTokScraper(BaseScraper):
                                 f"Anti-bot detection triggered. Retrying in {wait_time:.1f}s... "
                                 f"(Attempt {attempt + 1}/{max_retries})"
                             )
-                            time.sleep(wait_time)
+                            await self.wait(wait_time, 'retry_backoff')
                             continue
                         else:
                             raise Exception(
@@ -363,7 +387,7 @@ class TikTokScraper(BaseScraper):
                                 f"Network error detected. Retrying in {wait_time:.1f}s... "
                                 f"(Attempt {attempt + 1}/{max_retries})"
                             )
-                            time.sleep(wait_time)
+                            await self.wait(wait_time, 'retry_backoff')
                             continue
 
                     # Check for private account or embedding disabled
@@ -397,25 +421,43 @@ class TikTokScraper(BaseScraper):
                         f"No data extracted but no error. Retrying in {wait_time:.1f}s... "
                         f"(Attempt {attempt + 1}/{max_retries})"
                     )
-                    time.sleep(wait_time)
+                    await self.wait(wait_time, 'retry_backoff')
                     continue
                 else:
                     return []
 
             except subprocess.TimeoutExpired:
+                # The subprocess timeout was cut short by the job deadline
+                self.deadline.check("running yt-dlp")
+
                 if attempt < max_retries - 1:
                     wait_time = base_delay * (attempt + 1)
                     self.logger.warning(
                         f"Process timeout after 10 minutes. Retrying... "
                         f"(Attempt {attempt + 1}/{max_retries})"
                     )
-                    time.sleep(wait_time)
+                    await self.wait(wait_time, 'retry_backoff')
                     continue
                 else:
                     raise
 
         return []
 
+    def _account_sleep_requests(self, videos: int) -> None:
+        """
+        Move yt-dlp's --sleep-requests pauses from network to sleep time.
+
+        yt-dlp sleeps inside the subprocess, so the time ledger saw the
+        whole run as network time. One request per video written plus the
+        profile page is an estimate; the real count depends on paging.
+
+        Args:
+            videos: Number of info.json files the run wrote
+        """
+        get_time_ledger().reclassify(
+            self.SLEEP_REQUESTS * (videos + 1), 'network', 'yt_dlp', 'sleep', 'sleep_requests'
+        )
+
     def _parse_info_json_files(self, temp_dir: Path) -> List[Dict[str, Any]]:
         """
         Parse all .info.json files from temp directory.
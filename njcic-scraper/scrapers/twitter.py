@@ -2,22 +2,20 @@
 Twitter/X scraper implementation using Playwright with authentication.
 """
 
-import asyncio
-import json
 import os
 import re
 import time
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from urllib.parse import urlparse
 
 try:
-    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
+    from playwright.async_api import TimeoutError as PlaywrightTimeout
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
-    async_playwright = None
     PlaywrightTimeout = Exception
 
 try:
@@ -28,6 +26,188 @@ except ImportError:
     Stealth = None
 
 from .base import BaseScraper
+from browser_pool import get_browser_pool
+from deadline import Deadline, DeadlineExceeded
+from page_waits import wait_for_network_idle, wait_for_selector
+from response_capture import ResponseCapture, dig, iter_dicts
+from scroll_harvest import ScrollHarvester
+from selector_registry import get_selector_registry
+from session_vault import get_session_vault
+from time_accounting import measure
+
+# Chromium flags and context settings for the pooled Twitter browser
+BROWSER_ARGS = (
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--disable-web-security',
+    '--disable-features=IsolateOrigins,site-per-process',
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-infobars',
+    '--window-size=1920,1080',
+    '--start-maximized',
+    '--disable-extensions',
+    '--disable-gpu',
+)
+
+CONTEXT_OPTIONS = {
+    'viewport': {'width': 1920, 'height': 1080},
+    'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'locale': 'en-US',
+    'timezone_id': 'America/New_York',
+    'permissions': ['geolocation'],
+    'extra_http_headers': {
+        'Accept-Language': 'en-US,en;q=0.9',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'DNT': '1',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1'
+    },
+}
+
+# Fallback selectors for DOM extraction. The article list is ranked by
+# past hit rate (selector_registry.py); the rest are tried in order.
+TWEET_SELECTORS = {
+    'article': [
+        'article[data-testid="tweet"]',
+        'article[role="article"]',
+        '[data-testid="cellInnerDiv"] article',
+    ],
+    'text': ['[data-testid="tweetText"]', '[lang] span', 'div[dir="auto"]'],
+    'likes': ['[data-testid="like"] span', '[aria-label*="like"] span', '[data-testid="like"]'],
+    'retweets': ['[data-testid="retweet"] span', '[aria-label*="repost"] span', '[aria-label*="retweet"] span'],
+    'replies': ['[data-testid="reply"] span', '[aria-label*="repl"] span'],
+    'views': [
+        '[data-testid="app-text-transition-container"] span',
+        'a[href*="/analytics"] span',
+        '[aria-label*="view"] span',
+    ],
+}
+
+PRIMARY_COLUMN = '[data-testid="primaryColumn"]'
+
+# Login flow inputs
+USERNAME_SELECTORS = ['input[autocomplete="username"]', 'input[name="text"]', 'input[type="text"]']
+PASSWORD_SELECTORS = ['input[name="password"]', 'input[type="password"]', 'input[autocomplete="current-password"]']
+CHALLENGE_SELECTORS = ['input[data-testid="ocfEnterTextTextInput"]', 'input[name="text"]:not([autocomplete])']
+
+# Reads one tweet article's fields, for ScrollHarvester (scroll_harvest.py).
+# Metrics come back as the text each fallback selector matched, for
+# _pick_metric to parse; the id comes from the timestamp's status link.
+TWEET_FIELDS_JS = """
+(article, selectors) => {
+    const firstText = list => {
+        for (const selector of list) {
+            const el = article.querySelector(selector);
+            if (el) return el.innerText;
+        }
+        return '';
+    };
+    const texts = list => list.map(selector => {
+        const el = article.querySelector(selector);
+        return el ? el.innerText : null;
+    });
+
+    const time = article.querySelector('time');
+    const link = (time && time.closest('a[href*="/status/"]')) || article.querySelector('a[href*="/status/"]');
+    const status = link ? (link.getAttribute('href') || '').match(/\\/status\\/(\\d+)/) : null;
+    return {
+        id: status ? status[1] : null,
+        text: firstText(selectors.text),
+        likes: texts(selectors.likes),
+        retweets: texts(selectors.retweets),
+        replies: texts(selectors.replies),
+        views: texts(selectors.views),
+        date: time ? time.getAttribute('datetime') : null,
+    };
+}
+"""
+
+# GraphQL operations a profile page loads its timeline and user record from
+TIMELINE_RESPONSE_PATTERN = r"/i/api/graphql/[^/]+/(UserTweets|UserByScreenName)\b"
+
+
+def _screen_name(user: Dict[str, Any]) -> Optional[str]:
+    """Return a GraphQL user result's handle (older and newer layouts)."""
+    return dig(user, 'legacy', 'screen_name') or dig(user, 'core', 'screen_name')
+
+
+def _parse_created_at(created_at: Optional[str]) -> Optional[str]:
+    """Convert Twitter's 'Wed Oct 10 20:19:24 +0000 2018' to ISO 8601."""
+    if not created_at:
+        return None
+    try:
+        return datetime.strptime(created_at, '%a %b %d %H:%M:%S %z %Y').isoformat()
+    except ValueError:
+        return created_at
+
+
+def parse_timeline_tweets(payload: Any, username: str) -> List[Dict[str, Any]]:
+    """
+    Turn a UserTweets GraphQL payload into tweet dicts.
+
+    Quoted and retweeted originals nested inside a tweet are not returned
+    separately, and tweets by other accounts (e.g. in conversations) are
+    skipped.
+
+    Args:
+        payload: Decoded GraphQL response
+        username: Profile handle
+
+    Returns:
+        Tweet dicts with the same fields as DOM extraction, plus 'id'
+    """
+    tweets = []
+
+    def is_tweet(node):
+        return isinstance(node.get('legacy'), dict) and 'full_text' in node['legacy']
+
+    for result in iter_dicts(payload, is_tweet):
+        author = _screen_name(dig(result, 'core', 'user_results', 'result', default={}))
+        if author and author.lower() != username.lower():
+            continue
+
+        legacy = result['legacy']
+        text = dig(result, 'note_tweet', 'note_tweet_results', 'result', 'text') or legacy['full_text']
+
+        try:
+            views = int(dig(result, 'views', 'count', default=0))
+        except (TypeError, ValueError):
+            views = 0
+
+        tweets.append({
+            'id': result.get('rest_id') or legacy.get('id_str'),
+            'text': text,
+            'likes': legacy.get('favorite_count', 0),
+            'retweets': legacy.get('retweet_count', 0),
+            'replies': legacy.get('reply_count', 0),
+            'views': views,
+            'date': _parse_created_at(legacy.get('created_at')),
+        })
+
+    return tweets
+
+
+def parse_timeline_profile(payload: Any, username: str) -> Optional[Dict[str, Any]]:
+    """
+    Find the profile's follower count in a GraphQL payload.
+
+    Args:
+        payload: Decoded GraphQL response
+        username: Profile handle
+
+    Returns:
+        {'followers_count': int}, or None if the user is not in the payload
+    """
+    def is_user(node):
+        return isinstance(node.get('legacy'), dict) and 'followers_count' in node['legacy']
+
+    for user in iter_dicts(payload, is_user):
+        if (_screen_name(user) or '').lower() == username.lower():
+            return {'followers_count': user['legacy']['followers_count']}
+
+    return None
 
 
 class TwitterScraper(BaseScraper):
@@ -50,10 +230,7 @@ class TwitterScraper(BaseScraper):
         self.username = os.getenv('TWITTER_USERNAME')
         self.password = os.getenv('TWITTER_PASSWORD')
 
-        # Cookie persistence
-        self.cookies_dir = self.output_dir / '.cookies'
-        self.cookies_dir.mkdir(exist_ok=True, parents=True)
-        self.cookies_file = self.cookies_dir / 'twitter_cookies.json'
+        self.vault = get_session_vault()
 
         if not PLAYWRIGHT_AVAILABLE:
             self.logger.warning(
@@ -112,41 +289,13 @@ class TwitterScraper(BaseScraper):
         username_path.mkdir(exist_ok=True, parents=True)
         return username_path
 
-    async def _save_cookies(self, context) -> None:
-        """Save browser cookies to file for session persistence."""
-        try:
-            cookies = await context.cookies()
-            with open(self.cookies_file, 'w') as f:
-                json.dump(cookies, f, indent=2)
-            self.logger.info(f"Saved {len(cookies)} cookies to {self.cookies_file}")
-        except Exception as e:
-            self.logger.warning(f"Failed to save cookies: {e}")
-
-    async def _load_cookies(self, context) -> bool:
-        """Load saved cookies into browser context."""
-        try:
-            if not self.cookies_file.exists():
-                self.logger.info("No saved cookies found")
-                return False
-
-            with open(self.cookies_file, 'r') as f:
-                cookies = json.load(f)
-
-            if not cookies:
-                self.logger.info("No cookies to load")
-                return False
-
-            await context.add_cookies(cookies)
-            self.logger.info(f"Loaded {len(cookies)} cookies from {self.cookies_file}")
-            return True
-        except Exception as e:
-            self.logger.warning(f"Failed to load cookies: {e}")
-            return False
-
     async def _retry_with_backoff(self, func, max_retries: int = 3, initial_delay: float = 1.0):
         """
         Retry a function with exponential backoff.
 
+        Gives up early, re-raising DeadlineExceeded, once the job deadline
+        passes.
+
         Args:
             func: Async function to retry
             max_retries: Maximum number of retry attempts
@@ -164,11 +313,13 @@ class TwitterScraper(BaseScraper):
         for attempt in range(max_retries):
             try:
                 return await func()
+            except DeadlineExceeded:
+                raise
             except Exception as e:
                 last_exception = e
                 if attempt < max_retries - 1:
                     self.logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {delay}s...")
-                    await asyncio.sleep(delay)
+                    await self.wait(delay, 'retry_backoff')
                     delay *= 2  # Exponential backoff
                 else:
                     self.logger.error(f"All {max_retries} attempts failed")
@@ -186,13 +337,15 @@ class TwitterScraper(BaseScraper):
             True if already logged in, False otherwise
         """
         try:
-            await page.goto('https://x.com/home', wait_until='domcontentloaded', timeout=30000)
-            await page.wait_for_timeout(2000)
+            await self.goto(page, 'https://x.com/home', wait_until='domcontentloaded', timeout=self.deadline.timeout_ms(30000))
+
+            # Logged out, /home redirects to the login flow instead
+            await wait_for_selector(page, [PRIMARY_COLUMN, *USERNAME_SELECTORS], self.deadline.timeout_ms(10000))
 
             # Check for logged-in indicators
-            primary_column = await page.query_selector('[data-testid="primaryColumn"]')
+            primary_column = await page.query_selector(PRIMARY_COLUMN)
             if primary_column:
-                self.logger.info("Already logged in via saved cookies!")
+                self.logger.info("Already logged in via saved session!")
                 return True
 
             return False
@@ -216,32 +369,19 @@ class TwitterScraper(BaseScraper):
 
         try:
             self.logger.info("Navigating to Twitter login...")
-            await page.goto('https://x.com/i/flow/login', wait_until='domcontentloaded', timeout=60000)
-            await page.wait_for_timeout(3000)
+            await self.goto(page, 'https://x.com/i/flow/login', wait_until='domcontentloaded', timeout=self.deadline.timeout_ms(60000))
 
             # Enter username
             self.logger.info("Entering username...")
-            username_selectors = [
-                'input[autocomplete="username"]',
-                'input[name="text"]',
-                'input[type="text"]'
-            ]
-
-            username_input = None
-            for selector in username_selectors:
-                try:
-                    username_input = await page.wait_for_selector(selector, timeout=5000)
-                    if username_input:
-                        break
-                except PlaywrightTimeout:
-                    continue
+            username_input = await wait_for_selector(page, USERNAME_SELECTORS, self.deadline.timeout_ms(15000))
 
             if not username_input:
                 self.logger.error("Could not find username input field")
                 return False
 
             await username_input.fill(self.username)
-            await page.wait_for_timeout(1000)
+            with measure('sleep', 'wait_for_timeout'):
+                await page.wait_for_timeout(self.deadline.timeout_ms(self.pacing.scaled(1000)))
 
             # Click Next button with multiple selector attempts
             next_button_selectors = [
@@ -264,34 +404,23 @@ class TwitterScraper(BaseScraper):
             if not clicked:
                 await page.keyboard.press('Enter')
 
-            await page.wait_for_timeout(3000)
+            # The next step is either the password or a security challenge
+            await wait_for_selector(page, PASSWORD_SELECTORS + CHALLENGE_SELECTORS, self.deadline.timeout_ms(10000))
 
             # Handle various security challenges
             await self._handle_security_challenges(page)
 
             # Enter password with multiple selectors
             self.logger.info("Entering password...")
-            password_selectors = [
-                'input[name="password"]',
-                'input[type="password"]',
-                'input[autocomplete="current-password"]'
-            ]
-
-            password_input = None
-            for selector in password_selectors:
-                try:
-                    password_input = await page.wait_for_selector(selector, timeout=10000)
-                    if password_input:
-                        break
-                except PlaywrightTimeout:
-                    continue
+            password_input = await wait_for_selector(page, PASSWORD_SELECTORS, self.deadline.timeout_ms(10000))
 
             if not password_input:
                 self.logger.error("Could not find password input field - may be blocked by security challenge")
                 return False
 
             await password_input.fill(self.password)
-            await page.wait_for_timeout(1000)
+            with measure('sleep', 'wait_for_timeout'):
+                await page.wait_for_timeout(self.deadline.timeout_ms(self.pacing.scaled(1000)))
 
             # Click Log in button
             login_button_selectors = [
@@ -314,11 +443,9 @@ class TwitterScraper(BaseScraper):
             if not clicked:
                 await page.keyboard.press('Enter')
 
-            await page.wait_for_timeout(5000)
-
             # Verify login succeeded by checking for home timeline or profile elements
             try:
-                await page.wait_for_selector('[data-testid="primaryColumn"]', timeout=15000)
+                await page.wait_for_selector(PRIMARY_COLUMN, timeout=self.deadline.timeout_ms(20000))
                 self.logger.info("Login successful!")
                 return True
             except PlaywrightTimeout:
@@ -344,13 +471,7 @@ class TwitterScraper(BaseScraper):
         """
         # Check for unusual activity prompt (may ask for email/phone/username verification)
         try:
-            unusual_selectors = [
-                'input[data-testid="ocfEnterTextTextInput"]',
-                'input[name="text"]:not([autocomplete])',
-                'input[data-testid="ocfEnterTextTextInput"]'
-            ]
-
-            for selector in unusual_selectors:
+            for selector in CHALLENGE_SELECTORS:
                 unusual_prompt = await page.query_selector(selector)
                 if unusual_prompt:
                     self.logger.warning("Detected security challenge - attempting to handle...")
@@ -382,151 +503,165 @@ class TwitterScraper(BaseScraper):
                         await unusual_prompt.fill(self.username)
 
                     await page.keyboard.press('Enter')
-                    await page.wait_for_timeout(3000)
+                    await wait_for_network_idle(page, self.deadline.timeout_ms(5000))
                     break
 
         except Exception as e:
             self.logger.debug(f"No security challenge detected or error handling it: {e}")
 
-    async def _extract_tweets(self, page) -> List[Dict[str, Any]]:
+    async def _harvest_tweets(
+        self,
+        page,
+        capture: ResponseCapture,
+        harvested: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
         """
-        Extract tweets from the current page with fallback selectors.
+        Scroll the timeline, reading tweet articles as they render.
+
+        X's timeline is virtualised, so tweets are read after every scroll
+        (only the articles added since the last one) rather than once at the
+        end, when the first ones would already be unmounted. Scrolling stops
+        once enough tweets are read or captured from the timeline JSON, or
+        when a scroll brings in nothing new. The article selectors are
+        raced together and ranked by the selector registry.
 
         Args:
             page: Playwright page object
+            capture: Timeline response capture, checked to stop early
+            harvested: List the tweets are collected into as they are read,
+                so the caller keeps them if the job deadline interrupts
 
         Returns:
-            List of tweet data dictionaries
+            Raw tweet fields from TWEET_FIELDS_JS, one dict per tweet
         """
-        tweets = []
+        registry = get_selector_registry()
+
+        article = await registry.wait_for_any(
+            page, 'twitter', 'tweet_article', TWEET_SELECTORS['article'],
+            self.deadline.timeout_ms(5000)
+        )
+        if article is None:
+            self.logger.warning("Could not find any tweets on the page")
+            return []
+
+        harvester = ScrollHarvester(
+            page,
+            ', '.join(registry.order('twitter', 'tweet_article', TWEET_SELECTORS['article'])),
+            TWEET_FIELDS_JS,
+            self.max_posts,
+            options=TWEET_SELECTORS
+        )
+        harvester.items = harvested
+        await harvester.run(
+            max_scrolls=5,
+            timeout_ms=4000,
+            floor_ms=self.pacing.scroll_floor_ms,
+            have_enough=lambda: len(capture.posts) >= self.max_posts,
+            deadline=self.deadline
+        )
+        self.logger.info(f"Read {len(harvester.items)} tweets from the page over "
+                         f"{harvester.scrolls} scrolls ({harvester.duplicates} re-rendered)")
+        return harvester.items
+
+    def _collect_tweets(
+        self,
+        capture: Optional[ResponseCapture],
+        tweet_fields: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """
+        Pick the tweets to keep: the captured timeline JSON if any, else the rendered ones.
 
-        try:
-            # Try multiple selectors for tweets with fallbacks
-            tweet_article_selectors = [
-                'article[data-testid="tweet"]',
-                'article[role="article"]',
-                '[data-testid="cellInnerDiv"] article'
-            ]
+        Args:
+            capture: Timeline response capture (None if the page never opened)
+            tweet_fields: Raw tweet fields read from the rendered timeline
 
-            tweet_elements = None
-            for selector in tweet_article_selectors:
-                try:
-                    await page.wait_for_selector(selector, timeout=15000)
-                    tweet_elements = await page.query_selector_all(selector)
-                    if tweet_elements:
-                        self.logger.info(f"Found {len(tweet_elements)} tweets using selector: {selector}")
-                        break
-                except PlaywrightTimeout:
-                    continue
+        Returns:
+            Tuple of (tweets, extraction method: 'api' or 'dom')
+        """
+        if capture is not None and capture.posts:
+            return capture.posts[:self.max_posts], 'api'
+        return [tweet for tweet in map(self._tweet_from_fields, tweet_fields) if tweet], 'dom'
 
-            if not tweet_elements:
-                self.logger.error("Could not find any tweets on the page")
-                return tweets
+    def _update_engagement_metrics(self, engagement_metrics: Dict[str, Any],
+                                   tweets: List[Dict[str, Any]]) -> None:
+        """
+        Add totals and averages over the tweets to the engagement metrics.
 
-            # Extract data from each tweet
-            for i, tweet_el in enumerate(tweet_elements[:self.max_posts]):
-                try:
-                    tweet_data = {}
-
-                    # Extract text with fallback selectors
-                    text_selectors = [
-                        '[data-testid="tweetText"]',
-                        '[lang] span',
-                        'div[dir="auto"]'
-                    ]
-
-                    text_found = False
-                    for text_selector in text_selectors:
-                        text_el = await tweet_el.query_selector(text_selector)
-                        if text_el:
-                            tweet_data['text'] = await text_el.inner_text()
-                            text_found = True
-                            break
-
-                    if not text_found:
-                        tweet_data['text'] = ''
-
-                    # Extract engagement metrics with fallbacks
-                    # Likes
-                    like_selectors = [
-                        '[data-testid="like"] span',
-                        '[aria-label*="like"] span',
-                        '[data-testid="like"]'
-                    ]
-                    tweet_data['likes'] = await self._extract_metric(tweet_el, like_selectors)
-
-                    # Retweets
-                    retweet_selectors = [
-                        '[data-testid="retweet"] span',
-                        '[aria-label*="repost"] span',
-                        '[aria-label*="retweet"] span'
-                    ]
-                    tweet_data['retweets'] = await self._extract_metric(tweet_el, retweet_selectors)
-
-                    # Replies
-                    reply_selectors = [
-                        '[data-testid="reply"] span',
-                        '[aria-label*="repl"] span'
-                    ]
-                    tweet_data['replies'] = await self._extract_metric(tweet_el, reply_selectors)
-
-                    # Views (if available) - with multiple fallbacks
-                    view_selectors = [
-                        '[data-testid="app-text-transition-container"] span',
-                        'a[href*="/analytics"] span',
-                        '[aria-label*="view"] span'
-                    ]
-                    tweet_data['views'] = await self._extract_metric(tweet_el, view_selectors)
-
-                    # Extract time/date
-                    time_el = await tweet_el.query_selector('time')
-                    if time_el:
-                        tweet_data['date'] = await time_el.get_attribute('datetime')
-                    else:
-                        tweet_data['date'] = None
-
-                    # Only add tweet if we got at least some data
-                    if tweet_data.get('text') or any([
-                        tweet_data.get('likes', 0) > 0,
-                        tweet_data.get('retweets', 0) > 0,
-                        tweet_data.get('replies', 0) > 0
-                    ]):
-                        tweets.append(tweet_data)
-                        self.logger.debug(f"Extracted tweet {i+1}: {tweet_data.get('text', '')[:50]}...")
-                    else:
-                        self.logger.debug(f"Skipping tweet {i+1} - insufficient data")
+        Args:
+            engagement_metrics: Metrics dictionary, updated in place
+            tweets: Parsed tweets
+        """
+        if not tweets:
+            return
+
+        total_likes = sum(t.get('likes', 0) for t in tweets)
+        total_retweets = sum(t.get('retweets', 0) for t in tweets)
+        total_replies = sum(t.get('replies', 0) for t in tweets)
+        total_views = sum(t.get('views', 0) for t in tweets)
+        num_tweets = len(tweets)
+
+        engagement_metrics.update({
+            'total_likes': total_likes,
+            'total_retweets': total_retweets,
+            'total_replies': total_replies,
+            'total_views': total_views,
+            'avg_likes': round(total_likes / num_tweets, 2) if num_tweets > 0 else 0,
+            'avg_retweets': round(total_retweets / num_tweets, 2) if num_tweets > 0 else 0,
+            'avg_engagement_rate': round(
+                ((total_likes + total_retweets + total_replies) / total_views * 100)
+                if total_views > 0 else 0, 2
+            ),
+            'posts_analyzed': num_tweets
+        })
+        self.logger.info(f"Engagement metrics calculated: {total_likes:,} likes, "
+                         f"{total_retweets:,} retweets, {total_replies:,} replies, "
+                         f"{total_views:,} views")
+
+    def _tweet_from_fields(self, fields: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Build a tweet dictionary from the raw fields TWEET_FIELDS_JS returned.
 
-                except Exception as e:
-                    self.logger.warning(f"Error extracting tweet {i+1}: {e}")
-                    continue
+        Args:
+            fields: Raw fields of one tweet article
 
-        except Exception as e:
-            self.logger.error(f"Error during tweet extraction: {e}", exc_info=True)
+        Returns:
+            Tweet data dictionary, or None if the article held no usable data
+        """
+        tweet_data = {
+            'id': fields.get('id'),
+            'text': fields['text'],
+            'likes': self._pick_metric(fields['likes']),
+            'retweets': self._pick_metric(fields['retweets']),
+            'replies': self._pick_metric(fields['replies']),
+            'views': self._pick_metric(fields['views']),
+            'date': fields['date'],
+        }
 
-        self.logger.info(f"Successfully extracted {len(tweets)} tweets")
-        return tweets
+        # Only keep the tweet if we got at least some data
+        if tweet_data['text'] or any([
+            tweet_data['likes'] > 0,
+            tweet_data['retweets'] > 0,
+            tweet_data['replies'] > 0
+        ]):
+            return tweet_data
+        return None
 
-    async def _extract_metric(self, element, selectors: List[str]) -> int:
+    def _pick_metric(self, texts: List[Optional[str]]) -> int:
         """
-        Extract a metric value from an element using fallback selectors.
+        Parse a metric from the texts its fallback selectors matched.
 
         Args:
-            element: Playwright element to search within
-            selectors: List of selectors to try
+            texts: Text per selector, in fallback order (None if no match)
 
         Returns:
-            Parsed metric value (int)
+            First value that parses to a count (int), else 0
         """
-        for selector in selectors:
-            try:
-                metric_el = await element.query_selector(selector)
-                if metric_el:
-                    text = await metric_el.inner_text()
-                    value = self._parse_count(text)
-                    if value > 0 or text.strip() == '0':
-                        return value
-            except Exception:
+        for text in texts:
+            if text is None:
                 continue
+            value = self._parse_count(text)
+            if value > 0 or text.strip() == '0':
+                return value
         return 0
 
     def _parse_count(self, text: str) -> int:
@@ -558,7 +693,11 @@ class TwitterScraper(BaseScraper):
 
     async def _scrape_async(self, url: str, username: str, grantee_name: str) -> Dict[str, Any]:
         """
-        Async scraping implementation using Playwright with stealth and cookie persistence.
+        Async scraping implementation using Playwright with stealth and a saved session.
+
+        Runs on a warm context from the shared browser pool, created with the
+        session vault's saved session. The login is checked on /home only if
+        the session has not been validated within the vault's TTL.
 
         Args:
             url: Twitter profile URL
@@ -570,6 +709,9 @@ class TwitterScraper(BaseScraper):
         """
         errors = []
         tweets = []
+        # Kept outside the try so a timed-out job still returns what it read
+        capture = None
+        tweet_fields: List[Dict[str, Any]] = []
         engagement_metrics = {
             'username': username,
             'followers_count': None,
@@ -583,48 +725,27 @@ class TwitterScraper(BaseScraper):
             'posts_analyzed': 0
         }
 
-        async with async_playwright() as p:
-            browser = None
-            context = None
+        context_options = self.vault.context_options(self.platform_name, CONTEXT_OPTIONS)
+
+        async with get_browser_pool().lease(
+            self.platform_name,
+            context_options=context_options,
+            headless=self.headless,
+            args=BROWSER_ARGS
+        ) as lease:
+            context = lease.context
+            lease.state.setdefault('session_loaded', 'storage_state' in context_options)
             try:
-                # Launch browser with enhanced anti-detection
-                self.logger.info("Launching browser with stealth mode...")
-                browser = await p.chromium.launch(
-                    headless=self.headless,
-                    args=[
-                        '--disable-blink-features=AutomationControlled',
-                        '--disable-dev-shm-usage',
-                        '--disable-web-security',
-                        '--disable-features=IsolateOrigins,site-per-process',
-                        '--no-sandbox',
-                        '--disable-setuid-sandbox',
-                        '--disable-infobars',
-                        '--window-size=1920,1080',
-                        '--start-maximized',
-                        '--disable-extensions',
-                        '--disable-gpu'
-                    ]
-                )
+                page = await context.new_page()
 
-                # Create context with realistic settings
-                context = await browser.new_context(
-                    viewport={'width': 1920, 'height': 1080},
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    locale='en-US',
-                    timezone_id='America/New_York',
-                    permissions=['geolocation'],
-                    extra_http_headers={
-                        'Accept-Language': 'en-US,en;q=0.9',
-                        'Accept-Encoding': 'gzip, deflate, br',
-                        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                        'DNT': '1',
-                        'Connection': 'keep-alive',
-                        'Upgrade-Insecure-Requests': '1'
-                    }
+                # Read the timeline from its GraphQL responses as the page loads
+                capture = ResponseCapture(
+                    page,
+                    TIMELINE_RESPONSE_PATTERN,
+                    partial(parse_timeline_tweets, username=username),
+                    partial(parse_timeline_profile, username=username)
                 )
 
-                page = await context.new_page()
-
                 # Apply stealth mode
                 if STEALTH_AVAILABLE:
                     self.logger.info("Applying stealth mode to page...")
@@ -633,35 +754,29 @@ class TwitterScraper(BaseScraper):
                 else:
                     self.logger.warning("Stealth mode not available - detection risk higher")
 
-                # Try to load saved cookies
-                cookies_loaded = await self._load_cookies(context)
-
-                # Check if already logged in
-                already_logged_in = False
-                if cookies_loaded:
-                    self.logger.info("Checking login status with saved cookies...")
-                    already_logged_in = await self._check_login_status(page)
-
-                # Login if not already authenticated
+                # Reuse the context's or the vault's session; log in only if neither is valid
+                already_logged_in = await self.vault.authenticate(
+                    self.platform_name,
+                    lease,
+                    partial(self._check_login_status, page),
+                    partial(self._login, page)
+                )
                 if not already_logged_in:
-                    self.logger.info("Not logged in - attempting authentication...")
-                    login_success = await self._login(page)
-                    if login_success:
-                        # Save cookies after successful login
-                        await self._save_cookies(context)
-                    else:
-                        errors.append("Failed to login to Twitter")
-                        self.logger.warning("Continuing without authentication - data may be limited...")
-                else:
-                    self.logger.info("Using existing authentication session")
+                    errors.append("Failed to login to Twitter")
+                    self.logger.warning("Continuing without authentication - data may be limited...")
 
                 # Navigate to profile with retry logic
                 profile_url = f"https://x.com/{username}"
                 self.logger.info(f"Navigating to profile: {profile_url}")
 
                 async def navigate_to_profile():
-                    await page.goto(profile_url, wait_until='domcontentloaded', timeout=60000)
-                    await page.wait_for_timeout(3000)
+                    await self.goto(page, profile_url, wait_until='domcontentloaded', timeout=self.deadline.timeout_ms(60000))
+                    # Ready once the first tweet (or the empty timeline) renders
+                    await wait_for_selector(
+                        page,
+                        TWEET_SELECTORS['article'] + ['[data-testid="emptyState"]'],
+                        self.deadline.timeout_ms(10000)
+                    )
 
                 try:
                     await self._retry_with_backoff(navigate_to_profile, max_retries=3)
@@ -670,56 +785,38 @@ class TwitterScraper(BaseScraper):
                     errors.append(f"Navigation failed: {str(e)}")
                     raise
 
-                # Extract follower count
-                followers = await self._extract_follower_count(page)
+                # Extract follower count (from the captured user record if it arrived)
+                await capture.drain()
+                followers = capture.profile.get('followers_count')
+                if followers is None:
+                    followers = await self._extract_follower_count(page)
                 if followers:
                     engagement_metrics['followers_count'] = followers
                     self.logger.info(f"Follower count: {followers:,}")
 
-                # Scroll to load more tweets with progressive loading
+                # Scroll to load more tweets, reading rendered ones as we go
                 self.logger.info("Loading tweets with progressive scrolling...")
-                scroll_attempts = 5  # Increased from 3
-                for i in range(scroll_attempts):
-                    await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-                    await page.wait_for_timeout(2000)
-                    self.logger.debug(f"Scroll {i+1}/{scroll_attempts} completed")
-
-                # Extract tweets with retry logic
-                async def extract_tweets_wrapper():
-                    return await self._extract_tweets(page)
-
                 try:
-                    tweets = await self._retry_with_backoff(extract_tweets_wrapper, max_retries=2)
-                    self.logger.info(f"Successfully extracted {len(tweets)} tweets")
+                    await self._harvest_tweets(page, capture, tweet_fields)
+                except DeadlineExceeded:
+                    raise
                 except Exception as e:
-                    self.logger.error(f"Failed to extract tweets: {e}")
+                    self.logger.error(f"Error while loading tweets: {e}")
                     errors.append(f"Tweet extraction failed: {str(e)}")
-                    tweets = []
+
+                await capture.drain()
+                capture.stop()
+
+                # Prefer the timeline JSON; fall back to the tweets read from the page
+                tweets, extraction_method = self._collect_tweets(capture, tweet_fields)
+                if extraction_method == 'api':
+                    self.logger.info(f"Captured {len(tweets)} tweets from "
+                                     f"{capture.responses_parsed} timeline responses")
+                else:
+                    self.logger.info(f"Successfully extracted {len(tweets)} tweets")
 
                 # Calculate metrics
-                if tweets:
-                    total_likes = sum(t.get('likes', 0) for t in tweets)
-                    total_retweets = sum(t.get('retweets', 0) for t in tweets)
-                    total_replies = sum(t.get('replies', 0) for t in tweets)
-                    total_views = sum(t.get('views', 0) for t in tweets)
-                    num_tweets = len(tweets)
-
-                    engagement_metrics.update({
-                        'total_likes': total_likes,
-                        'total_retweets': total_retweets,
-                        'total_replies': total_replies,
-                        'total_views': total_views,
-                        'avg_likes': round(total_likes / num_tweets, 2) if num_tweets > 0 else 0,
-                        'avg_retweets': round(total_retweets / num_tweets, 2) if num_tweets > 0 else 0,
-                        'avg_engagement_rate': round(
-                            ((total_likes + total_retweets + total_replies) / total_views * 100)
-                            if total_views > 0 else 0, 2
-                        ),
-                        'posts_analyzed': num_tweets
-                    })
-                    self.logger.info(f"Engagement metrics calculated: {total_likes:,} likes, "
-                                   f"{total_retweets:,} retweets, {total_replies:,} replies, "
-                                   f"{total_views:,} views")
+                self._update_engagement_metrics(engagement_metrics, tweets)
 
                 # Save output
                 output_dir = self._create_output_directory(grantee_name, username)
@@ -732,6 +829,7 @@ class TwitterScraper(BaseScraper):
                     'scraped_at': datetime.now().isoformat(),
                     'posts_downloaded': len(tweets),
                     'engagement_metrics': engagement_metrics,
+                    'extraction_method': extraction_method,
                     'stealth_mode_enabled': STEALTH_AVAILABLE,
                     'authenticated': already_logged_in or (len(errors) == 0 or "Failed to login" not in str(errors))
                 }
@@ -739,10 +837,7 @@ class TwitterScraper(BaseScraper):
 
                 # Save tweets
                 if tweets:
-                    tweets_file = output_dir / 'tweets.json'
-                    with open(tweets_file, 'w', encoding='utf-8') as f:
-                        json.dump(tweets, f, indent=2, ensure_ascii=False)
-                    self.logger.info(f"Saved tweets to {tweets_file}")
+                    self.save_posts(tweets, output_dir, 'tweets.json')
 
                 # Take screenshot
                 try:
@@ -760,13 +855,36 @@ class TwitterScraper(BaseScraper):
                 else:
                     self.logger.warning(f"⚠ Scraping completed with limited data for @{username}")
 
-                return {
+                result = {
                     'success': success,
                     'posts_downloaded': len(tweets),
                     'errors': errors,
-                    'engagement_metrics': engagement_metrics
+                    'engagement_metrics': engagement_metrics,
+                    'output_path': str(output_dir)
                 }
 
+                if self.deadline.expired:
+                    self.mark_timed_out(result, f"Job deadline reached while scraping @{username}")
+
+                return result
+
+            except DeadlineExceeded as e:
+                # Keep the tweets captured or read before the deadline
+                if capture is not None:
+                    capture.stop()
+                tweets, _ = self._collect_tweets(capture, tweet_fields)
+                self._update_engagement_metrics(engagement_metrics, tweets)
+                if tweets:
+                    self.save_posts(tweets, self._create_output_directory(grantee_name, username), 'tweets.json')
+
+                errors.append(str(e))
+                return self.mark_timed_out({
+                    'success': False,
+                    'posts_downloaded': len(tweets),
+                    'errors': errors,
+                    'engagement_metrics': engagement_metrics
+                }, f"Timed out scraping @{username}: {e}")
+
             except Exception as e:
                 self.logger.error(f"Fatal error during scraping: {e}", exc_info=True)
                 errors.append(str(e))
@@ -777,20 +895,14 @@ class TwitterScraper(BaseScraper):
                     'engagement_metrics': engagement_metrics
                 }
 
-            finally:
-                if context:
-                    try:
-                        await context.close()
-                    except Exception:
-                        pass
-                if browser:
-                    try:
-                        await browser.close()
-                        self.logger.info("Browser closed successfully")
-                    except Exception:
-                        pass
-
-    def scrape(self, url: str, grantee_name: str, max_posts: Optional[int] = None) -> Dict[str, Any]:
+
+    async def scrape_async(
+        self,
+        url: str,
+        grantee_name: str,
+        max_posts: Optional[int] = None,
+        deadline: Optional[Deadline] = None
+    ) -> Dict[str, Any]:
         """
         Scrape Twitter/X profile.
 
@@ -798,10 +910,14 @@ class TwitterScraper(BaseScraper):
             url: Twitter/X profile URL
             grantee_name: Name of the grantee
             max_posts: Maximum posts to scrape (uses self.max_posts if None)
+            deadline: Time budget for this job (None for no limit)
 
         Returns:
             Dictionary containing scraping results
         """
+        self.set_deadline(deadline)
+        self.set_pacing(url)
+
         if not PLAYWRIGHT_AVAILABLE:
             return {
                 'success': False,
@@ -824,7 +940,7 @@ class TwitterScraper(BaseScraper):
 
         # Run async scraping
         try:
-            result = asyncio.run(self._scrape_async(url, username, grantee_name))
+            result = await self._scrape_async(url, username, grantee_name)
             return result
         except Exception as e:
             self.logger.error(f"Fatal error during scrape: {e}", exc_info=True)
@@ -11,6 +11,7 @@ from typing import Dict, Any, List, Optional
 from urllib.parse import urlparse
 
 from .base import BaseScraper
+from deadline import Deadline, DeadlineExceeded
 import config
 
 
@@ -85,7 +86,7 @@ class YouTubeScraper(BaseScraper):
             self.logger.error(f"Error extracting username from URL {url}: {e}")
             return None
 
-    def _run_ytdlp(self, url: str, max_videos: int = 25) -> List[Dict[str, Any]]:
+    async def _run_ytdlp(self, url: str, max_videos: int = 25) -> List[Dict[str, Any]]:
         """
         Run yt-dlp to extract video metadata.
 
@@ -98,6 +99,7 @@ class YouTubeScraper(BaseScraper):
 
         Raises:
             RuntimeError: If yt-dlp command fails
+            DeadlineExceeded: If the job deadline passes first
         """
         try:
             # Construct yt-dlp command (use python -m to ensure it works on Windows)
@@ -114,11 +116,9 @@ class YouTubeScraper(BaseScraper):
             self.logger.info(f"Running yt-dlp command: {' '.join(cmd)}")
 
             # Run command and capture output
-            result = subprocess.run(
+            result = await self.run_command(
                 cmd,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minute timeout
+                self.deadline.timeout(300)  # 5 minutes, or less if the job deadline is closer
             )
 
             if result.returncode != 0:
@@ -138,6 +138,7 @@ class YouTubeScraper(BaseScraper):
             return videos
 
         except subprocess.TimeoutExpired:
+            self.deadline.check("listing channel videos")
             raise RuntimeError("yt-dlp command timed out after 5 minutes")
         except FileNotFoundError:
             raise RuntimeError("yt-dlp not found. Please install it: pip install yt-dlp")
@@ -145,10 +146,13 @@ class YouTubeScraper(BaseScraper):
             self.logger.error(f"Error running yt-dlp: {e}")
             raise
 
-    def _get_detailed_video_info(self, video_ids: List[str]) -> List[Dict[str, Any]]:
+    async def _get_detailed_video_info(self, video_ids: List[str]) -> List[Dict[str, Any]]:
         """
         Get detailed information for specific videos.
 
+        Stops early when the job deadline passes, returning the videos
+        fetched so far.
+
         Args:
             video_ids: List of video IDs
 
@@ -158,8 +162,11 @@ class YouTubeScraper(BaseScraper):
         detailed_videos = []
 
         for video_id in video_ids:
+            if self.deadline.expired:
+                break
+
             try:
-                self.rate_limit()  # Respect rate limiting
+                await self.rate_limit()  # Respect rate limiting
 
                 video_url = f"https://www.youtube.com/watch?v={video_id}"
                 cmd = [
@@ -170,12 +177,7 @@ class YouTubeScraper(BaseScraper):
                     video_url
                 ]
 
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=config.TIMEOUT
-                )
+                result = await self.run_command(cmd, self.deadline.timeout(config.TIMEOUT))
 
                 if result.returncode == 0 and result.stdout:
                     video_data = json.loads(result.stdout)
@@ -183,6 +185,9 @@ class YouTubeScraper(BaseScraper):
                 else:
                     self.logger.warning(f"Failed to get details for video {video_id}")
 
+            except DeadlineExceeded:
+                break
+
             except Exception as e:
                 self.logger.error(f"Error getting video details for {video_id}: {e}")
                 if not config.SKIP_ON_ERROR:
@@ -289,11 +294,12 @@ class YouTubeScraper(BaseScraper):
             'avg_engagement_rate': round(avg_engagement_rate, 4),
         }
 
-    def scrape(
+    async def scrape_async(
         self,
         url: str,
         grantee_name: str,
-        max_posts: Optional[int] = None
+        max_posts: Optional[int] = None,
+        deadline: Optional[Deadline] = None
     ) -> Dict[str, Any]:
         """
         Scrape YouTube channel data.
@@ -302,6 +308,7 @@ class YouTubeScraper(BaseScraper):
             url: YouTube channel URL
             grantee_name: Name of the grantee
             max_posts: Maximum number of videos to scrape (defaults to 25)
+            deadline: Time budget for this job (None for no limit)
 
         Returns:
             Dictionary with:
@@ -311,6 +318,9 @@ class YouTubeScraper(BaseScraper):
                 - engagement_metrics: dict with engagement statistics
                 - output_path: str (path to output directory)
         """
+        self.set_deadline(deadline)
+        self.set_pacing(url)
+
         errors = []
         videos_metadata = []
         engagement_metrics = {}
@@ -339,7 +349,7 @@ class YouTubeScraper(BaseScraper):
             channel_output_path.mkdir(exist_ok=True, parents=True)
 
             # Get initial playlist data (flat format for speed)
-            flat_videos = self._run_ytdlp(url, max_videos=max_videos)
+            flat_videos = await self._run_ytdlp(url, max_videos=max_videos)
 
             if not flat_videos:
                 self.logger.warning("No videos found in channel")
@@ -371,9 +381,10 @@ class YouTubeScraper(BaseScraper):
             self.logger.info(f"Found {len(video_ids)} videos, fetching detailed metadata...")
 
             # Get detailed information for each video
-            detailed_videos = self._get_detailed_video_info(video_ids)
+            detailed_videos = await self._get_detailed_video_info(video_ids)
 
             if not detailed_videos:
+                self.deadline.check("fetching video details")
                 error_msg = "Failed to get detailed video information"
                 self.logger.error(error_msg)
                 errors.append({'error': error_msg, 'channel_id': channel_id})
@@ -425,11 +436,7 @@ class YouTubeScraper(BaseScraper):
             if errors:
                 self.save_errors(errors, channel_output_path)
 
-            self.logger.info(
-                f"Successfully scraped {len(videos_metadata)} videos from {channel_id}"
-            )
-
-            return {
+            result = {
                 'success': True,
                 'posts_downloaded': len(videos_metadata),
                 'errors': errors,
@@ -437,6 +444,18 @@ class YouTubeScraper(BaseScraper):
                 'output_path': str(channel_output_path)
             }
 
+            if len(detailed_videos) < len(video_ids) and self.deadline.expired:
+                return self.mark_timed_out(
+                    result,
+                    f"Job deadline reached after {len(detailed_videos)}/{len(video_ids)} videos from {channel_id}"
+                )
+
+            self.logger.info(
+                f"Successfully scraped {len(videos_metadata)} videos from {channel_id}"
+            )
+
+            return result
+
         except Exception as e:
             error_msg = f"Error scraping YouTube channel: {str(e)}"
             self.logger.error(error_msg, exc_info=True)
@@ -459,10 +478,15 @@ class YouTubeScraper(BaseScraper):
             except Exception as save_error:
                 self.logger.error(f"Failed to save error metadata: {save_error}")
 
-            return {
+            result = {
                 'success': False,
                 'posts_downloaded': len(videos_metadata),
                 'errors': errors,
                 'engagement_metrics': engagement_metrics or self._calculate_engagement_metrics([]),
                 'output_path': str(channel_output_path) if 'channel_output_path' in locals() else ''
             }
+
+            if isinstance(e, DeadlineExceeded):
+                self.mark_timed_out(result, error_msg)
+
+            return result
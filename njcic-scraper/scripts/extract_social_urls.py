@@ -20,15 +20,19 @@ Output: JSON file with grantee info + social media URLs
 
 import json
 import re
+import sys
 import time
 from pathlib import Path
 from typing import Dict, List, Optional
 from urllib.parse import urljoin, urlparse
 
-import requests
 from bs4 import BeautifulSoup
 from tqdm import tqdm
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from http_client import HttpError, get_http_client, http_client_stats
+
 
 # Configuration - Use relative paths
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -42,7 +46,6 @@ INPUT_FILE_OPTIONS = [
 INPUT_FILE = next((f for f in INPUT_FILE_OPTIONS if f.exists()), INPUT_FILE_OPTIONS[0])
 OUTPUT_FILE = BASE_DIR / "data" / "grantees_with_social.json"
 REQUEST_TIMEOUT = 10  # seconds
-REQUEST_DELAY = 0.5  # seconds between requests
 MAX_RETRIES = 2
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 
@@ -275,6 +278,10 @@ def fetch_website(url: str, retries: int = MAX_RETRIES) -> Optional[str]:
     """
     Fetch website HTML with retry logic.
 
+    Goes through the shared HTTP client, so a website fetched within the
+    cache TTL is not requested again and an older copy is revalidated.
+    Requests to the same host are spaced by the client.
+
     Args:
         url: Website URL
         retries: Number of retry attempts
@@ -297,22 +304,15 @@ def fetch_website(url: str, retries: int = MAX_RETRIES) -> Optional[str]:
 
     for attempt in range(retries + 1):
         try:
-            response = requests.get(
+            response = get_http_client().get(
                 url,
                 headers=headers,
                 timeout=REQUEST_TIMEOUT,
-                allow_redirects=True,
             )
             response.raise_for_status()
             return response.text
 
-        except requests.exceptions.Timeout:
-            if attempt < retries:
-                time.sleep(1)
-                continue
-            return None
-
-        except requests.exceptions.RequestException:
+        except HttpError:
             if attempt < retries:
                 time.sleep(1)
                 continue
@@ -376,9 +376,6 @@ def process_grantees(grantees: List[Dict]) -> List[Dict]:
 
         results.append(result)
 
-        # Rate limiting
-        time.sleep(REQUEST_DELAY)
-
     return results
 
 
@@ -418,6 +415,10 @@ def main():
     print("Extraction Complete!")
     print("=" * 70)
     print(f"Total grantees processed: {total_processed}")
+    http_stats = http_client_stats()
+    print(f"Websites downloaded: {http_stats['downloads']}, "
+          f"unchanged (304): {http_stats['revalidated']}, "
+          f"served from cache: {http_stats['cache_hits']}")
     print()
     print("Social media links found:")
     for platform, count in stats.items():
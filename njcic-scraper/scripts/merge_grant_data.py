@@ -7,10 +7,13 @@ grant-related information to each grantee's social media data file.
 
 import json
 import re
+import sys
 from pathlib import Path
 from typing import Dict, Optional
-import urllib.request
-import ssl
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from http_client import get_http_client
 
 # Paths
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -37,17 +40,21 @@ def slugify(name: str) -> str:
 
 
 def fetch_grant_data() -> Dict:
-    """Fetch grant data from GitHub."""
-    print("Fetching grant data from GitHub...")
+    """
+    Fetch grant data from GitHub.
 
-    # Create SSL context that doesn't verify (for some environments)
-    ctx = ssl.create_default_context()
+    The file is cached by the shared HTTP client and revalidated on every
+    run, so an unchanged file costs a 304 instead of a download.
+    """
+    print("Fetching grant data from GitHub...")
 
     try:
-        with urllib.request.urlopen(GRANTS_DATA_URL, context=ctx) as response:
-            data = json.loads(response.read().decode('utf-8'))
-            print(f"  Fetched data for {len(data.get('grantees', []))} grantees")
-            return data
+        response = get_http_client().get(GRANTS_DATA_URL)
+        response.raise_for_status()
+        data = response.json()
+        source = " (unchanged)" if response.from_cache else ""
+        print(f"  Fetched data for {len(data.get('grantees', []))} grantees{source}")
+        return data
     except Exception as e:
         print(f"  Error fetching from GitHub: {e}")
         # Try to load from local cache if available
@@ -30,6 +30,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from scrapers.instagram import InstagramScraper
+from pacing import get_pacing, parse_pacing, set_run_pacing
 import config
 
 
@@ -44,7 +45,8 @@ def get_instagram_grantees() -> List[Dict[str, Any]]:
     return [g for g in grantees if g.get('social', {}).get('instagram')]
 
 
-def scrape_batch(batch: List[Dict[str, Any]], worker_id: int, results_queue: mp.Queue) -> None:
+def scrape_batch(batch: List[Dict[str, Any]], worker_id: int, results_queue: mp.Queue,
+                 pacing_overrides: Dict[str, str]) -> None:
     """
     Scrape a batch of Instagram grantees.
 
@@ -52,8 +54,11 @@ def scrape_batch(batch: List[Dict[str, Any]], worker_id: int, results_queue: mp.
         batch: List of grantee dictionaries
         worker_id: Worker process ID
         results_queue: Queue for returning results
+        pacing_overrides: Parsed --pacing spec, applied in the worker process
     """
     print(f"[Worker {worker_id}] Starting with {len(batch)} grantees")
+    set_run_pacing(pacing_overrides)
+    pacing = get_pacing('instagram')
 
     # Initialize scraper
     scraper = InstagramScraper(
@@ -91,8 +96,8 @@ def scrape_batch(batch: List[Dict[str, Any]], worker_id: int, results_queue: mp.
 
         # Extra delay between grantees in the same batch
         if i < len(batch) - 1:
-            delay = 10 + (worker_id * 2)  # Stagger delays by worker ID
-            print(f"[Worker {worker_id}] Waiting {delay}s before next grantee...")
+            delay = pacing.scaled(10 + (worker_id * 2))  # Stagger delays by worker ID
+            print(f"[Worker {worker_id}] Waiting {delay:.0f}s before next grantee...")
             time.sleep(delay)
 
     print(f"[Worker {worker_id}] Completed batch. Sending {len(results)} results.")
@@ -122,8 +127,18 @@ def main():
     parser.add_argument('--test', action='store_true', help='Test mode: only process first 5 grantees')
     parser.add_argument('--start', type=int, default=0, help='Start index')
     parser.add_argument('--end', type=int, default=None, help='End index')
+    parser.add_argument('--pacing', type=str, default='',
+                        help='Pacing profile for this run, e.g. cautious (default: config.PLATFORM_PACING)')
     args = parser.parse_args()
 
+    try:
+        pacing_overrides = parse_pacing(args.pacing)
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+    set_run_pacing(pacing_overrides)
+    start_stagger = get_pacing('instagram').scaled(15)
+
     # Check credentials
     if not os.getenv('INSTAGRAM_USERNAME') or not os.getenv('INSTAGRAM_PASSWORD'):
         print("ERROR: INSTAGRAM_USERNAME and INSTAGRAM_PASSWORD must be set in .env")
@@ -165,10 +180,10 @@ def main():
     for i, batch in enumerate(batches):
         if i > 0:
             # Stagger process starts to avoid rate limit spikes
-            print(f"Waiting 15s before starting worker {i+1}...")
-            time.sleep(15)
+            print(f"Waiting {start_stagger:.0f}s before starting worker {i+1}...")
+            time.sleep(start_stagger)
 
-        p = mp.Process(target=scrape_batch, args=(batch, i+1, results_queue))
+        p = mp.Process(target=scrape_batch, args=(batch, i+1, results_queue, pacing_overrides))
         p.start()
         processes.append(p)
         print(f"Started worker {i+1}")
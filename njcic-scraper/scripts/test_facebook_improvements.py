@@ -20,7 +20,7 @@ def test_initialization():
     scraper = FacebookScraper(output_dir="output", headless=True, max_retries=5)
     assert scraper.headless == True
     assert scraper.max_retries == 5
-    assert scraper.cookies_file.name == "facebook_cookies.json"
+    assert scraper.vault.path(scraper.platform_name).name == "facebook.json"
     print("✓ Initialization test passed")
 
 
@@ -209,8 +209,7 @@ def test_stealth_features():
     methods_to_check = [
         '_random_delay',
         '_human_like_mouse_movement',
-        '_save_cookies',
-        '_load_cookies',
+        '_save_session',
         '_detect_blocks',
         '_handle_login_wall',
         '_scroll_page_realistic'
@@ -0,0 +1,220 @@
+"""
+Incremental harvesting of posts from infinite-scroll feeds.
+
+Scrolling a feed and re-reading every post element after each scroll makes
+the work grow quadratically with the number of posts, and reading only
+after the last scroll misses posts that virtualised timelines (X, Threads)
+have already unmounted. A ScrollHarvester reads posts as it scrolls and
+only touches elements it has not read before:
+
+- every element it extracts is marked with a data attribute in the page,
+  so the next pass skips it without a round trip per element
+- extracted posts are de-duplicated by their id, URN or URL in a seen-set,
+  which also catches a post that was unmounted and rendered again
+- scrolling stops as soon as the target count is reached
+
+The per-post extractor is a JavaScript function `(element, options) =>
+object`, inlined into the harvesting script. Returning null leaves the
+element unmarked so it is tried again on the next pass (LinkedIn fills in
+lazy "occludable" updates only once they scroll into view).
+"""
+
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Union
+
+from deadline import Deadline
+from page_waits import SCROLL_FLOOR_MS, scroll_and_wait
+
+
+logger = logging.getLogger(__name__)
+
+# Attribute marking elements that have been extracted
+HARVESTED_ATTRIBUTE = 'data-njcic-harvested'
+
+# Post fields used to de-duplicate, tried in order
+DEFAULT_KEYS = ('id', 'urn', 'url')
+
+# Reads up to `limit` unmarked, outermost matching elements and marks the
+# ones extracted. %s is replaced by the per-post extractor function.
+_HARVEST_JS_TEMPLATE = """
+({selector, mark, limit, options}) => {
+    const extract = %s;
+    const items = [];
+    for (const el of document.querySelectorAll(selector)) {
+        if (items.length >= limit) break;
+        if (el.hasAttribute(mark)) continue;
+        // A post nested in another match (a quoted post) belongs to its container
+        if (el.parentElement && el.parentElement.closest(selector)) continue;
+        let item = null;
+        try {
+            item = extract(el, options);
+        } catch (e) {
+            item = null;
+        }
+        if (item) {
+            el.setAttribute(mark, '');
+            items.push(item);
+        }
+    }
+    return items;
+}
+"""
+
+
+class ScrollHarvester:
+    """
+    Scrolls a feed and collects each post once, as it is rendered.
+
+    Usage:
+        harvester = ScrollHarvester(page, 'article', POST_FIELDS_JS, target=25)
+        posts = await harvester.run(max_scrolls=10, timeout_ms=4000)
+    """
+
+    def __init__(
+        self,
+        page: Any,
+        selector: str,
+        extract_js: str,
+        target: int,
+        options: Any = None,
+        keys: Sequence[str] = DEFAULT_KEYS
+    ):
+        """
+        Prepare a harvester for one page.
+
+        Args:
+            page: Playwright async Page
+            selector: CSS selector of the post elements
+            extract_js: JavaScript function `(element, options) => object|null`
+            target: Number of posts wanted
+            options: JSON-serialisable value passed to the extractor
+            keys: Post fields that identify a post, tried in order
+        """
+        self.page = page
+        self.selector = selector
+        self.target = target
+        self.options = options
+        self.keys = keys
+        self.script = _HARVEST_JS_TEMPLATE % extract_js.strip()
+
+        self.items: List[Dict[str, Any]] = []
+        self.seen = set()
+        self.duplicates = 0
+        self.scrolls = 0
+
+    @property
+    def done(self) -> bool:
+        """Whether the target number of posts has been collected."""
+        return len(self.items) >= self.target
+
+    def _key(self, item: Dict[str, Any]) -> Optional[str]:
+        for field in self.keys:
+            if item.get(field):
+                return f"{field}:{item[field]}"
+        return None
+
+    def add(self, items: List[Dict[str, Any]]) -> int:
+        """
+        Add extracted posts, skipping ones already seen.
+
+        Args:
+            items: Post dicts from the page
+
+        Returns:
+            Number of new posts added
+        """
+        added = 0
+        for item in items:
+            if self.done:
+                break
+            key = self._key(item)
+            if key is not None:
+                if key in self.seen:
+                    self.duplicates += 1
+                    continue
+                self.seen.add(key)
+            self.items.append(item)
+            added += 1
+        return added
+
+    async def harvest(self) -> int:
+        """
+        Extract the posts rendered since the last pass.
+
+        Returns:
+            Number of new posts added
+        """
+        if self.done:
+            return 0
+
+        found = await self.page.evaluate(self.script, {
+            'selector': self.selector,
+            'mark': HARVESTED_ATTRIBUTE,
+            'limit': self.target - len(self.items),
+            'options': self.options,
+        })
+        return self.add(found or [])
+
+    async def run(
+        self,
+        max_scrolls: int,
+        timeout_ms: float,
+        scroll_by: Union[None, float, Callable[[], Optional[float]]] = None,
+        floor_ms: float = SCROLL_FLOOR_MS,
+        patience: int = 1,
+        have_enough: Optional[Callable[[], bool]] = None,
+        before_scroll: Optional[Callable[[], Awaitable[Any]]] = None,
+        deadline: Optional[Deadline] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Harvest what is rendered, then scroll and harvest until done.
+
+        Args:
+            max_scrolls: Maximum number of scrolls
+            timeout_ms: Maximum wait for new posts after each scroll
+            scroll_by: Pixels per scroll, a function returning them (for
+                varied scrolling), or None to scroll to the bottom
+            floor_ms: Minimum time per scroll step
+            patience: Consecutive scrolls bringing nothing new before giving up
+            have_enough: Optional check that ends scrolling early, e.g. once
+                enough posts have been captured from the feed's JSON
+            before_scroll: Optional coroutine function run before each
+                scroll, e.g. to click a "Show more" button
+            deadline: Job deadline bounding each wait; scrolling stops
+                once it has expired
+
+        Returns:
+            The posts collected (also in self.items)
+        """
+        await self.harvest()
+        idle = 0
+
+        for step in range(max_scrolls):
+            if self.done or (have_enough is not None and have_enough()):
+                break
+            if deadline is not None and deadline.expired:
+                break
+
+            if before_scroll is not None:
+                await before_scroll()
+
+            added = await scroll_and_wait(
+                self.page,
+                self.selector,
+                deadline.timeout_ms(timeout_ms) if deadline is not None else timeout_ms,
+                scroll_by=scroll_by() if callable(scroll_by) else scroll_by,
+                floor_ms=floor_ms
+            )
+            new = await self.harvest()
+            self.scrolls += 1
+            logger.debug(f"Scroll {step + 1}/{max_scrolls}: {added} element(s) inserted, "
+                         f"{new} new post(s), {len(self.items)} total")
+
+            if added or new:
+                idle = 0
+            else:
+                idle += 1
+                if idle >= patience:
+                    break
+
+        return self.items
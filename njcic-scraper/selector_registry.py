@@ -0,0 +1,301 @@
+"""
+Adaptive ordering of the scrapers' fallback selectors.
+
+The platforms change their markup often, so every scraper keeps lists of
+fallback selectors (tweet articles, Facebook posts, Instagram post links).
+Tried in a fixed order, a stale first entry costs a full timeout or a
+wasted query before the working one is reached on every scrape.
+
+The registry records hits, misses and match latency per (platform,
+purpose, selector) in config.SELECTOR_STATS_PATH and hands the candidates
+back best first. wait_for_any races all candidates in one browser-side
+wait and then checks which of them matched, so ordering never costs a
+timeout; in-page extractors just receive the list in ranked order.
+Selectors that used to match but have missed
+config.SELECTOR_STALE_AFTER_MISSES times in a row are listed by stale()
+so they can be fixed before the last fallback stops working too.
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import config
+
+
+logger = logging.getLogger(__name__)
+
+# Weight given to the newest observation in the average match latency
+LATENCY_SMOOTHING = 0.3
+
+# Reports, for each candidate, whether it matches anything on the page
+_MATCHES_JS = "selectors => selectors.map(selector => document.querySelector(selector) !== null)"
+
+
+def playwright_timeout() -> type:
+    """
+    Return Playwright's TimeoutError, imported on first use.
+
+    Importing Playwright takes a noticeable share of startup, so this module
+    only loads it once a page is actually being waited on.
+
+    Returns:
+        playwright.async_api.TimeoutError, or Exception if Playwright is not installed
+    """
+    try:
+        from playwright.async_api import TimeoutError as PlaywrightTimeout
+    except ImportError:
+        return Exception
+    return PlaywrightTimeout
+
+
+class SelectorRegistry:
+    """
+    Persistent hit/miss statistics for fallback selectors.
+
+    Usage:
+        registry = get_selector_registry()
+        element = await registry.wait_for_any(page, 'twitter', 'tweet_article',
+                                              TWEET_SELECTORS['article'], 15000)
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Load statistics from disk.
+
+        Args:
+            path: JSON file holding the statistics (default: config.SELECTOR_STATS_PATH)
+        """
+        self.path = Path(path) if path else config.SELECTOR_STATS_PATH
+        self.entries: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f).get('selectors', {})
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Could not read selector stats {self.path}: {e}")
+
+    def _entry(self, platform: str, purpose: str, selector: str) -> Dict[str, Any]:
+        return self.entries.setdefault(platform, {}).setdefault(purpose, {}).setdefault(selector, {
+            'hits': 0,
+            'misses': 0,
+            'consecutive_misses': 0,
+            'latency_ms': None,
+            'last_hit': None,
+        })
+
+    @staticmethod
+    def _is_stale(entry: Dict[str, Any]) -> bool:
+        return entry['hits'] > 0 and entry['consecutive_misses'] >= config.SELECTOR_STALE_AFTER_MISSES
+
+    def order(self, platform: str, purpose: str, candidates: Sequence[str]) -> List[str]:
+        """
+        Rank fallback selectors, historically best first.
+
+        Candidates are ordered by smoothed hit rate, (hits + 1) / (attempts + 2),
+        with stale selectors last; ties, including selectors never tried,
+        keep their configured order.
+
+        Args:
+            platform: Platform name
+            purpose: What the selectors find, e.g. 'tweet_article'
+            candidates: Selectors in configured fallback order
+
+        Returns:
+            The candidates in ranked order
+        """
+        with self._lock:
+            stats = self.entries.get(platform, {}).get(purpose, {})
+
+            def rank(item):
+                index, selector = item
+                entry = stats.get(selector)
+                if entry is None:
+                    return (False, -0.5, index)
+                rate = (entry['hits'] + 1) / (entry['hits'] + entry['misses'] + 2)
+                return (self._is_stale(entry), -rate, index)
+
+            return [selector for _, selector in sorted(enumerate(candidates), key=rank)]
+
+    def record(
+        self,
+        platform: str,
+        purpose: str,
+        selector: str,
+        hit: bool,
+        latency_ms: Optional[float] = None
+    ) -> None:
+        """
+        Record one attempt of a selector.
+
+        Args:
+            platform: Platform name
+            purpose: What the selector finds
+            selector: The selector tried
+            hit: Whether it matched
+            latency_ms: Time until it matched, if measured
+        """
+        with self._lock:
+            entry = self._entry(platform, purpose, selector)
+            if hit:
+                entry['hits'] += 1
+                entry['consecutive_misses'] = 0
+                entry['last_hit'] = datetime.now().isoformat(timespec='seconds')
+                if latency_ms is not None:
+                    previous = entry['latency_ms']
+                    entry['latency_ms'] = round(latency_ms if previous is None else
+                                                LATENCY_SMOOTHING * latency_ms + (1 - LATENCY_SMOOTHING) * previous, 1)
+            else:
+                entry['misses'] += 1
+                entry['consecutive_misses'] += 1
+            self._dirty = True
+
+    def record_first_match(
+        self,
+        platform: str,
+        purpose: str,
+        ordered: Sequence[str],
+        matched: Optional[str],
+        latency_ms: Optional[float] = None
+    ) -> None:
+        """
+        Record the outcome of trying selectors in order until one matched.
+
+        The matching selector is a hit and those tried before it are misses;
+        those after it were never tried and are left alone. If nothing
+        matched, every candidate is a miss.
+
+        Args:
+            platform: Platform name
+            purpose: What the selectors find
+            ordered: Selectors in the order they were tried
+            matched: The selector that matched, or None
+            latency_ms: Time until it matched, if measured
+        """
+        for selector in ordered:
+            if selector == matched:
+                self.record(platform, purpose, selector, True, latency_ms)
+                return
+            self.record(platform, purpose, selector, False)
+
+    async def wait_for_any(
+        self,
+        page: Any,
+        platform: str,
+        purpose: str,
+        candidates: Sequence[str],
+        timeout_ms: float,
+        state: str = 'attached'
+    ) -> Optional[Any]:
+        """
+        Wait for any of the candidates to match and record which ones did.
+
+        All candidates are waited for together as one selector list, so a
+        stale candidate costs nothing when another one works. Once an
+        element appears, one evaluate call checks every candidate against
+        the page: those matching are hits (with the wait as their latency),
+        the others misses. On timeout every candidate is a miss.
+
+        Args:
+            page: Playwright async Page
+            platform: Platform name
+            purpose: What the selectors find
+            candidates: Fallback selectors
+            timeout_ms: Maximum wait in milliseconds
+            state: Element state to wait for ('attached' or 'visible')
+
+        Returns:
+            The first matching ElementHandle, or None on timeout
+        """
+        ordered = self.order(platform, purpose, candidates)
+        started = time.monotonic()
+
+        try:
+            element = await page.wait_for_selector(', '.join(ordered), timeout=timeout_ms, state=state)
+        except playwright_timeout():
+            element = None
+        latency_ms = (time.monotonic() - started) * 1000
+
+        if element is None:
+            for selector in ordered:
+                self.record(platform, purpose, selector, False)
+            return None
+
+        try:
+            matches = await page.evaluate(_MATCHES_JS, ordered)
+        except Exception as e:
+            logger.debug(f"Could not check which {platform} {purpose} selectors matched: {e}")
+            return element
+
+        for selector, hit in zip(ordered, matches):
+            self.record(platform, purpose, selector, hit, latency_ms if hit else None)
+        return element
+
+    def stale(self) -> List[Dict[str, Any]]:
+        """
+        List selectors that used to match but have stopped.
+
+        Returns:
+            Dicts with platform, purpose, selector, hits, consecutive_misses
+            and last_hit, most misses first
+        """
+        with self._lock:
+            found = [
+                {
+                    'platform': platform,
+                    'purpose': purpose,
+                    'selector': selector,
+                    'hits': entry['hits'],
+                    'consecutive_misses': entry['consecutive_misses'],
+                    'last_hit': entry['last_hit'],
+                }
+                for platform, purposes in self.entries.items()
+                for purpose, selectors in purposes.items()
+                for selector, entry in selectors.items()
+                if self._is_stale(entry)
+            ]
+
+        return sorted(found, key=lambda item: -item['consecutive_misses'])
+
+    def save(self) -> None:
+        """Atomically write statistics to disk, if anything was recorded."""
+        with self._lock:
+            if not self._dirty:
+                return
+            snapshot = json.loads(json.dumps(self.entries))
+            self._dirty = False
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'updated_at': datetime.now().isoformat(),
+                'selectors': snapshot
+            }, f, indent=2, ensure_ascii=False)
+
+        os.replace(tmp_path, self.path)
+
+
+_selector_registry: Optional[SelectorRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_selector_registry() -> SelectorRegistry:
+    """Return the process-wide selector registry, saved at interpreter exit."""
+    global _selector_registry
+
+    with _registry_lock:
+        if _selector_registry is None:
+            _selector_registry = SelectorRegistry()
+            atexit.register(_selector_registry.save)
+        return _selector_registry
@@ -0,0 +1,339 @@
+"""
+Central store of logged-in browser sessions for the NJCIC scrapers.
+
+Every authenticated scraper used to keep its own cookie file and decide on
+its own when to re-check or redo a login. The vault keeps one Playwright
+storage_state (cookies and local storage) per platform in
+config.SESSION_DIR, together with when it was saved and when it was last
+confirmed to be logged in:
+
+- a session validated within config.SESSION_VALIDATION_TTL_HOURS is trusted
+  without loading a page to check it
+- logins run under a per-platform file lock, so parallel runs or shards do
+  not log in to one account at the same time; a process that waited for
+  the lock picks up the session the other one just saved
+- writes are atomic, so readers never see a half-written file
+
+File locks use fcntl and are skipped where it is unavailable (Windows).
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+import config
+
+
+logger = logging.getLogger(__name__)
+
+# Seconds between attempts to take a lock held by another process
+LOCK_POLL_SECONDS = 0.2
+
+
+def _try_lock(handle: Any, blocking: bool = False) -> bool:
+    if fcntl is None:
+        return True
+    try:
+        fcntl.flock(handle, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        return True
+    except BlockingIOError:
+        return False
+
+
+def _unlock(handle: Any) -> None:
+    if fcntl is not None:
+        fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+class SessionVault:
+    """
+    Saved Playwright sessions per platform, with validation timestamps.
+
+    Usage:
+        vault = get_session_vault()
+        options = vault.context_options('twitter', CONTEXT_OPTIONS)
+        async with get_browser_pool().lease('twitter', context_options=options) as lease:
+            lease.state.setdefault('session_loaded', 'storage_state' in options)
+            logged_in = await vault.authenticate('twitter', lease, check_login, login)
+    """
+
+    def __init__(self, directory: Optional[Path] = None, ttl_hours: Optional[float] = None):
+        """
+        Set up the vault.
+
+        Args:
+            directory: Directory holding session files (default: config.SESSION_DIR)
+            ttl_hours: How long a validated session is trusted without a
+                check (default: config.SESSION_VALIDATION_TTL_HOURS)
+        """
+        self.directory = Path(directory) if directory else config.SESSION_DIR
+        self.ttl = timedelta(hours=config.SESSION_VALIDATION_TTL_HOURS if ttl_hours is None else ttl_hours)
+
+    def path(self, platform: str, account: Optional[str] = None, suffix: str = '.json') -> Path:
+        """
+        Return the file a platform's session is stored in.
+
+        Args:
+            platform: Platform name
+            account: Login account, for platforms with several (optional)
+            suffix: File extension, e.g. '.session' for non-Playwright sessions
+
+        Returns:
+            Path inside the vault directory
+        """
+        name = platform if not account else f"{platform}-{account}"
+        return self.directory / f"{re.sub(r'[^A-Za-z0-9_.@-]', '_', name)}{suffix}"
+
+    def load(self, platform: str, account: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Read a platform's session record.
+
+        Returns:
+            Dict with storage_state, saved_at and validated_at (ISO
+            timestamps, validated_at may be None), or None if there is none
+        """
+        path = self.path(platform, account)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                record = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not read session {path}: {e}")
+            return None
+
+        return record if isinstance(record.get('storage_state'), dict) else None
+
+    def storage_state(self, platform: str, account: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Return a platform's saved Playwright storage_state, or None."""
+        record = self.load(platform, account)
+        return record['storage_state'] if record else None
+
+    def context_options(
+        self,
+        platform: str,
+        options: Dict[str, Any],
+        account: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Add the platform's saved session to Playwright context options.
+
+        Args:
+            platform: Platform name
+            options: Options for browser.new_context()
+            account: Login account (optional)
+
+        Returns:
+            A copy of options, with storage_state set if a session is saved
+        """
+        options = dict(options)
+        storage_state = self.storage_state(platform, account)
+        if storage_state:
+            options['storage_state'] = storage_state
+        return options
+
+    def is_fresh(self, platform: str, account: Optional[str] = None, now: Optional[datetime] = None) -> bool:
+        """Whether the session was confirmed logged in within the TTL."""
+        record = self.load(platform, account)
+        if not record or not record.get('validated_at'):
+            return False
+
+        try:
+            validated_at = datetime.fromisoformat(record['validated_at'])
+        except ValueError:
+            return False
+        return (now or datetime.now()) - validated_at < self.ttl
+
+    def _write(self, platform: str, account: Optional[str], record: Dict[str, Any]) -> None:
+        path = self.path(platform, account)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(record, f, indent=2, ensure_ascii=False)
+
+        os.replace(tmp_path, path)
+
+    def save(
+        self,
+        platform: str,
+        storage_state: Dict[str, Any],
+        account: Optional[str] = None,
+        validated: bool = True
+    ) -> None:
+        """
+        Store a session.
+
+        Args:
+            platform: Platform name
+            storage_state: Playwright storage_state dict
+            account: Login account (optional)
+            validated: Whether the session was just confirmed logged in
+                (right after a login). False keeps the previous validation
+                time, e.g. when refreshing cookies after an anonymous scrape.
+        """
+        now = datetime.now().isoformat()
+        previous = None if validated else self.load(platform, account)
+        self._write(platform, account, {
+            'platform': platform,
+            'account': account,
+            'saved_at': now,
+            'validated_at': now if validated else (previous or {}).get('validated_at'),
+            'storage_state': storage_state,
+        })
+        logger.debug(f"Saved {platform} session to {self.path(platform, account)}")
+
+    async def save_context(self, platform: str, context: Any, account: Optional[str] = None,
+                           validated: bool = True) -> None:
+        """Store an async BrowserContext's storage_state (see save)."""
+        try:
+            self.save(platform, await context.storage_state(), account, validated)
+        except Exception as e:
+            logger.warning(f"Could not save {platform} session: {e}")
+
+    def _set_validated(self, platform: str, account: Optional[str], validated: bool) -> None:
+        record = self.load(platform, account)
+        if record:
+            record['validated_at'] = datetime.now().isoformat() if validated else None
+            self._write(platform, account, record)
+
+    def mark_validated(self, platform: str, account: Optional[str] = None) -> None:
+        """Record that the saved session was just confirmed to be logged in."""
+        self._set_validated(platform, account, True)
+
+    def invalidate(self, platform: str, account: Optional[str] = None) -> None:
+        """Record that the saved session is no longer logged in."""
+        self._set_validated(platform, account, False)
+
+    def _open_lock(self, platform: str, account: Optional[str]) -> Any:
+        path = self.path(platform, account, suffix='.lock')
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return open(path, 'a')
+
+    @contextmanager
+    def lock(self, platform: str, account: Optional[str] = None) -> Iterator[None]:
+        """Hold a platform's login lock, blocking until other processes release it."""
+        handle = self._open_lock(platform, account)
+        try:
+            _try_lock(handle, blocking=True)
+            yield
+        finally:
+            _unlock(handle)
+            handle.close()
+
+    @asynccontextmanager
+    async def async_lock(self, platform: str, account: Optional[str] = None):
+        """Async twin of lock that polls, so the event loop keeps running while it waits."""
+        handle = self._open_lock(platform, account)
+        try:
+            while not _try_lock(handle):
+                await asyncio.sleep(LOCK_POLL_SECONDS)
+            yield
+        finally:
+            _unlock(handle)
+            handle.close()
+
+    def _trust_loaded(self, platform: str, account: Optional[str], state: Dict[str, Any]) -> bool:
+        if self.is_fresh(platform, account):
+            logger.info(f"Using saved {platform} session (validated within {self.ttl.total_seconds() / 3600:g}h)")
+            state['logged_in'] = True
+            return True
+        return False
+
+    def _after_check(self, platform: str, account: Optional[str], state: Dict[str, Any], ok: bool) -> bool:
+        if ok:
+            self.mark_validated(platform, account)
+            state['logged_in'] = True
+        else:
+            logger.info(f"Saved {platform} session is no longer logged in")
+            self.invalidate(platform, account)
+        return ok
+
+    async def authenticate(
+        self,
+        platform: str,
+        lease: Any,
+        check: Optional[Callable[[], Awaitable[bool]]],
+        login: Optional[Callable[[], Awaitable[bool]]],
+        account: Optional[str] = None
+    ) -> bool:
+        """
+        Make sure a pooled context is logged in, doing as little as possible.
+
+        In order: a context that logged in earlier is trusted; a saved
+        session validated within the TTL is trusted; an older one is
+        checked with check() (or trusted if there is no check); otherwise
+        login() runs under the platform's lock, unless another process
+        saved a fresh session while this one waited for it.
+
+        Args:
+            platform: Platform name
+            lease: ContextLease; lease.state['session_loaded'] says whether
+                the context was created with the saved session
+            check: Coroutine function returning whether the context is
+                logged in (e.g. by loading the home feed), or None
+            login: Coroutine function logging in and returning success, or
+                None if the scraper has no credentials
+            account: Login account (optional)
+
+        Returns:
+            True if the context is logged in
+        """
+        state = lease.state
+        if state.get('logged_in'):
+            return True
+
+        if state.get('session_loaded'):
+            if self._trust_loaded(platform, account, state):
+                return True
+            if check is None:
+                state['logged_in'] = True
+                return True
+            if self._after_check(platform, account, state, await check()):
+                return True
+
+        if login is None:
+            return False
+
+        async with self.async_lock(platform, account):
+            # Another process may have logged in while this one waited
+            if self.is_fresh(platform, account):
+                await lease.context.add_cookies(self.storage_state(platform, account).get('cookies', []))
+                logger.info(f"Using {platform} session saved by another run")
+                state['logged_in'] = True
+                return True
+
+            if not await login():
+                return False
+
+            await self.save_context(platform, lease.context, account)
+            state['logged_in'] = True
+            return True
+
+
+
+_session_vault: Optional[SessionVault] = None
+_vault_lock = threading.Lock()
+
+
+def get_session_vault() -> SessionVault:
+    """Return the process-wide session vault."""
+    global _session_vault
+
+    with _vault_lock:
+        if _session_vault is None:
+            _session_vault = SessionVault()
+        return _session_vault
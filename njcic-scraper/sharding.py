@@ -0,0 +1,221 @@
+"""
+Deterministic multi-machine sharding for the NJCIC scraper orchestrator.
+
+Jobs are grouped by (platform, account key), the same key coalesce_jobs
+merges jobs on, so one account is never split across shards. Each account
+goes to the shard with the highest stable hash of "platform:account:shard"
+(rendezvous hashing). The assignment depends only on the account and the
+shard count: every machine computes the same one without sharing any state
+(machine-local job history differs between shards), and adding or removing
+an account moves no other account. Shards get about the same number of
+each platform's accounts in expectation, but not the same amount of work:
+hashing ignores how long each account takes to scrape.
+"""
+
+import hashlib
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Tuple
+
+from time_accounting import merge_time_reports
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """
+    Parse a K/N shard spec.
+
+    Args:
+        spec: Shard spec such as "2/3" (1-based shard index)
+
+    Returns:
+        Tuple of (shard index, shard count)
+
+    Raises:
+        ValueError: If the spec is malformed or out of range
+    """
+    try:
+        index_str, count_str = spec.split('/', 1)
+        index, count = int(index_str), int(count_str)
+    except ValueError:
+        raise ValueError(f"Invalid shard '{spec}' (expected K/N, e.g. 1/3)")
+
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Invalid shard '{spec}': K must be between 1 and N")
+
+    return index, count
+
+
+def stable_hash(value: str) -> int:
+    """Return a process-independent integer hash of a string."""
+    return int.from_bytes(hashlib.sha1(value.encode('utf-8')).digest()[:8], 'big')
+
+
+def shard_for_account(platform: str, account: str, shard_count: int) -> int:
+    """
+    Return the shard an account belongs to, by rendezvous hashing.
+
+    Every shard is equally likely for any account, so account counts
+    balance in expectation; scrape cost per shard can still differ.
+
+    Args:
+        platform: Platform name
+        account: Account key (job_history.account_key)
+        shard_count: Number of shards
+
+    Returns:
+        1-based shard index
+    """
+    return max(range(1, shard_count + 1),
+               key=lambda shard: stable_hash(f"{platform}:{account}:{shard}"))
+
+
+def filter_jobs_for_shard(
+    jobs: List[Dict[str, Any]],
+    shard: Tuple[int, int],
+    account_key: Callable[[str, str], str]
+) -> List[Dict[str, Any]]:
+    """
+    Keep only the jobs that belong to one shard.
+
+    Args:
+        jobs: All jobs for the run
+        shard: (shard index, shard count)
+        account_key: Function of (platform, url) returning the account key,
+            as passed to coalesce_jobs
+
+    Returns:
+        Jobs assigned to the given shard
+    """
+    index, count = shard
+    return [
+        job for job in jobs
+        if shard_for_account(job['platform'], account_key(job['platform'], job['url']), count) == index
+    ]
+
+
+def owns_grantee(grantee_name: str, shard: Tuple[int, int]) -> bool:
+    """Return True if a grantee with no jobs should be reported by this shard."""
+    index, count = shard
+    return stable_hash(grantee_name) % count == index - 1
+
+
+def merge_reports(reports: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Combine per-shard scraping reports into a single report.
+
+    Shards scrape disjoint jobs, so per-grantee platform results and
+    summaries are unioned and summed. Counters that every shard computes over
+    the same grantee list (skips) take the maximum instead of the sum, as
+    does the browser pool's peak RSS. Failed grantees are counted from the
+    merged grantee_processing errors, once per grantee. Time accounting is
+    merged by time_accounting.merge_time_reports.
+
+    Args:
+        reports: Parsed scraping_report.json dictionaries, one per shard
+
+    Returns:
+        Merged report dictionary in the same shape as a single-run report
+    """
+    grantees: Dict[str, Dict[str, Any]] = {}
+    platform_totals: Dict[str, Dict[str, int]] = {}
+    browser_pool: Dict[str, int] = {}
+    platforms_enabled: List[str] = []
+    errors: List[Dict[str, Any]] = []
+    shards = []
+
+    for report in reports:
+        metadata = report.get('metadata', {})
+        shards.append({
+            'shard': metadata.get('shard'),
+            'run_id': metadata.get('run_id'),
+            'generated_at': metadata.get('generated_at'),
+            'duration_seconds': metadata.get('duration_seconds', 0)
+        })
+
+        for platform in metadata.get('platforms_enabled', []):
+            if platform not in platforms_enabled:
+                platforms_enabled.append(platform)
+
+        for result in report.get('grantee_results', []):
+            merged = grantees.setdefault(result['name'], {
+                'name': result['name'],
+                'website': result.get('website'),
+                'platforms': {},
+                'summary': {}
+            })
+            merged['platforms'].update(result.get('platforms', {}))
+            for key, value in result.get('summary', {}).items():
+                merged['summary'][key] = merged['summary'].get(key, 0) + value
+
+        for platform, stats in report.get('platform_stats', {}).items():
+            totals = platform_totals.setdefault(platform, {
+                'attempted': 0,
+                'successful': 0,
+                'failed': 0,
+                'skipped': 0,
+                'timed_out': 0,
+                'total_posts_collected': 0,
+                'total_engagement': 0
+            })
+            for key in ('attempted', 'successful', 'failed', 'timed_out', 'total_posts_collected', 'total_engagement'):
+                totals[key] += stats.get(key, 0)
+            totals['skipped'] = max(totals['skipped'], stats.get('skipped', 0))
+
+        for key, value in report.get('browser_pool', {}).items():
+            if key == 'peak_rss_mb':
+                browser_pool[key] = max(browser_pool.get(key, 0), value)
+            else:
+                browser_pool[key] = browser_pool.get(key, 0) + value
+
+        errors.extend(report.get('errors', []))
+
+    platform_stats = {}
+    for platform, totals in platform_totals.items():
+        attempted = totals['attempted']
+        platform_stats[platform] = {
+            'attempted': attempted,
+            'successful': totals['successful'],
+            'failed': totals['failed'],
+            'skipped': totals['skipped'],
+            'timed_out': totals['timed_out'],
+            'success_rate': f"{(totals['successful'] / attempted * 100) if attempted > 0 else 0:.1f}%",
+            'total_posts_collected': totals['total_posts_collected'],
+            'total_engagement': totals['total_engagement']
+        }
+
+    summaries = [report.get('summary', {}) for report in reports]
+
+    # A grantee's platforms can fail on different shards; count each grantee once
+    failed_grantees = {e.get('grantee') for e in errors if e.get('type') == 'grantee_processing'}
+    grantee_results = sorted(grantees.values(), key=lambda r: r['name'].lower())
+
+    duration = max((s['duration_seconds'] or 0 for s in shards), default=0)
+
+    return {
+        'metadata': {
+            'generated_at': datetime.now().isoformat(),
+            'merged_from_shards': shards,
+            'duration_seconds': duration,
+            'duration_formatted': f"{int(duration // 3600)}h {int((duration % 3600) // 60)}m {int(duration % 60)}s",
+            'platforms_enabled': platforms_enabled,
+            'max_posts_per_account': max(
+                (r.get('metadata', {}).get('max_posts_per_account', 0) for r in reports),
+                default=0
+            )
+        },
+        'summary': {
+            'total_grantees_attempted': len(grantee_results),
+            'grantees_processed': len(grantee_results),
+            'grantees_skipped': max((s.get('grantees_skipped', 0) for s in summaries), default=0),
+            'grantees_failed': len(failed_grantees),
+            'jobs_coalesced': sum(s.get('jobs_coalesced', 0) for s in summaries),
+            'jobs_not_due': sum(s.get('jobs_not_due', 0) for s in summaries),
+            'jobs_cached': sum(s.get('jobs_cached', 0) for s in summaries),
+            'jobs_resumed': sum(s.get('jobs_resumed', 0) for s in summaries),
+            'total_errors': len(errors)
+        },
+        'platform_stats': platform_stats,
+        'browser_pool': browser_pool,
+        'time_accounting': merge_time_reports([r['time_accounting'] for r in reports if 'time_accounting' in r]),
+        'grantee_results': grantee_results,
+        'errors': errors
+    }
@@ -19,11 +19,12 @@ class TestScraper(BaseScraper):
             return url.split("test.com/")[-1].split("/")[0]
         return None
 
-    def scrape(
+    async def scrape_async(
         self,
         url: str,
         grantee_name: str,
-        max_posts: Optional[int] = None
+        max_posts: Optional[int] = None,
+        deadline=None
     ) -> Dict[str, Any]:
         """Scrape posts from URL."""
         max_posts = max_posts or config.MAX_POSTS_PER_ACCOUNT
@@ -0,0 +1,266 @@
+"""
+Test script for the async Bluesky client.
+
+Usage:
+    python test_bluesky_client.py
+"""
+import asyncio
+import sys
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import bluesky_client
+from bluesky_client import BlueskyClient, DidCache, ProfileBatcher, RateBudget
+from deadline import Deadline, DeadlineExceeded
+
+
+class FakeResponse:
+    """aiohttp response stand-in; delay is how long a request takes."""
+
+    delay = 0.02
+
+    def __init__(self, status=200, data=None, headers=None):
+        self.status = status
+        self.data = data or {}
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise bluesky_client.aiohttp.ClientResponseError(None, (), status=self.status)
+
+    async def json(self):
+        return self.data
+
+    async def __aenter__(self):
+        await asyncio.sleep(self.delay)
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    """aiohttp session stand-in answering the AppView endpoints."""
+
+    def __init__(self, posts_per_actor=30, rate_limited=0, fail=False):
+        self.calls = []
+        self.posts_per_actor = posts_per_actor
+        self.rate_limited = rate_limited
+        self.fail = fail
+
+    def get(self, url, params=None, timeout=None):
+        self.calls.append((url, params))
+
+        if self.fail:
+            raise RuntimeError("session is closed")
+
+        if self.rate_limited:
+            self.rate_limited -= 1
+            return FakeResponse(429, headers={'ratelimit-reset': str(time.time() + 0.2)})
+
+        if url == bluesky_client.PROFILES_ENDPOINT:
+            actors = [value for name, value in params if name == 'actors']
+            return FakeResponse(data={'profiles': [
+                {'handle': actor, 'did': f'did:plc:{actor}', 'followersCount': 1}
+                for actor in actors if not actor.startswith('missing')
+            ]})
+
+        if url == bluesky_client.RESOLVE_HANDLE_ENDPOINT:
+            return FakeResponse(data={'did': f"did:plc:{params['handle']}"})
+
+        if url == bluesky_client.FEED_ENDPOINT:
+            offset = int(params.get('cursor') or 0)
+            count = min(params['limit'], self.posts_per_actor - offset)
+            data = {'feed': [{'post': {'uri': f"{params['actor']}/{offset + i}"}} for i in range(count)]}
+            if offset + count < self.posts_per_actor:
+                data['cursor'] = str(offset + count)
+            return FakeResponse(data=data)
+
+        return FakeResponse(404)
+
+    def calls_to(self, url):
+        return [params for called, params in self.calls if called == url]
+
+
+def make_client(session, tmp, per_second=0, deadline=None):
+    """Create a client with its own budget and DID cache."""
+    return BlueskyClient(session, deadline, budget=RateBudget(per_second),
+                         did_cache=DidCache(Path(tmp) / 'dids.json', ttl_hours=1))
+
+
+def use_batcher(session):
+    """Install a profile batcher sending on the given session for the running loop."""
+    @asynccontextmanager
+    async def open_session(headers=None):
+        yield session
+
+    bluesky_client._batchers[asyncio.get_running_loop()] = ProfileBatcher(open_session=open_session)
+
+
+def test_rate_budget():
+    """Test that the budget spaces requests and holds them after a 429."""
+    print("Testing rate budget...")
+
+    budget = RateBudget(10)
+    waits = [budget.reserve() for _ in range(5)]
+    assert waits[0] == 0 and 0.39 <= waits[4] <= 0.41
+    print("✓ Five requests at 10/s are spread over 0.4s")
+
+    budget = RateBudget(0)
+    assert budget.reserve() == 0 and budget.reserve() == 0
+    budget.hold(1)
+    assert 0.9 <= budget.reserve() <= 1
+    print("✓ hold() delays every request, even without a rate limit")
+    print()
+
+
+def test_did_cache():
+    """Test that resolutions persist and expire."""
+    print("Testing DID cache...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'dids.json'
+        cache = DidCache(path, ttl_hours=1)
+        cache.put('NJSpotlight.bsky.social', 'did:plc:abc')
+        cache.save()
+
+        reloaded = DidCache(path, ttl_hours=1)
+        assert reloaded.get('njspotlight.bsky.social') == 'did:plc:abc'
+        print("✓ Resolutions are saved and reloaded, case-insensitively")
+
+        reloaded.entries['njspotlight.bsky.social']['resolved_at'] = (
+            datetime.now() - timedelta(hours=2)).isoformat()
+        assert reloaded.get('njspotlight.bsky.social') is None
+        print("✓ Resolutions older than the TTL are ignored")
+
+        session = FakeSession()
+        client = make_client(session, tmp)
+        assert asyncio.run(client.resolve_did('new.bsky.social')) == 'did:plc:new.bsky.social'
+        assert asyncio.run(client.resolve_did('new.bsky.social')) == 'did:plc:new.bsky.social'
+        assert len(session.calls_to(bluesky_client.RESOLVE_HANDLE_ENDPOINT)) == 1
+        print("✓ A handle is resolved over the network once")
+    print()
+
+
+def test_profiles():
+    """Test getProfiles chunking and batching of concurrent lookups."""
+    print("Testing profile batching...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        session = FakeSession()
+        client = make_client(session, tmp)
+        handles = [f'user{i}.bsky.social' for i in range(60)]
+
+        profiles = asyncio.run(client.get_profiles(handles + ['missing.bsky.social']))
+        calls = session.calls_to(bluesky_client.PROFILES_ENDPOINT)
+        assert len(calls) == 3 and max(len(params) for params in calls) == 25
+        assert profiles['user7.bsky.social']['did'] == 'did:plc:user7.bsky.social'
+        assert 'missing.bsky.social' not in profiles
+        assert client.did_cache.get('user59.bsky.social') == 'did:plc:user59.bsky.social'
+        print("✓ 61 actors take 3 getProfiles calls and their DIDs are cached")
+
+        session = FakeSession()
+        client = make_client(FakeSession(fail=True), tmp)
+
+        async def lookups():
+            use_batcher(session)
+            return await asyncio.gather(*(client.get_profile(handle) for handle in handles[:30]),
+                                        client.get_profile('missing.bsky.social'))
+
+        results = asyncio.run(lookups())
+        assert len(session.calls_to(bluesky_client.PROFILES_ENDPOINT)) == 2
+        assert results[3]['handle'] == 'user3.bsky.social' and results[-1] is None
+        print("✓ 31 concurrent lookups are batched into 2 calls on the batcher's session")
+    print()
+
+
+def test_batch_isolation():
+    """Test that one job's deadline or a failed batch does not leak into other lookups."""
+    print("Testing batch isolation...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        session = FakeSession()
+
+        # Slow responses, so the opener's 0.15s deadline passes mid-batch
+        async def lookups():
+            use_batcher(session)
+            FakeResponse.delay = 0.3
+            try:
+                opener = make_client(session, tmp, deadline=Deadline(0.15))
+                other = make_client(session, tmp)
+                return await asyncio.gather(opener.get_profile('a.bsky.social'),
+                                            other.get_profile('b.bsky.social'),
+                                            return_exceptions=True)
+            finally:
+                FakeResponse.delay = 0.02
+
+        opened, joined = asyncio.run(lookups())
+        assert isinstance(opened, DeadlineExceeded)
+        assert joined['handle'] == 'b.bsky.social'
+        print("✓ The opener's deadline ends only its own wait; the batch still answers the others")
+
+        async def failing():
+            use_batcher(FakeSession(fail=True))
+            client = make_client(session, tmp)
+            return await asyncio.gather(client.get_profile('a.bsky.social'),
+                                        client.get_profile('b.bsky.social'),
+                                        return_exceptions=True)
+
+        results = asyncio.run(failing())
+        assert all(isinstance(r, bluesky_client.aiohttp.ClientError) for r in results)
+        print("✓ A failed batch fails each lookup with a ClientError")
+    print()
+
+
+def test_feeds_and_rate_limits():
+    """Test concurrent feed paging and retry after a 429."""
+    print("Testing feeds...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        session = FakeSession(posts_per_actor=150)
+        client = make_client(session, tmp)
+        actors = [f'did:plc:{i}' for i in range(20)]
+
+        started = time.monotonic()
+        feeds = asyncio.run(client.get_author_feeds(actors, limit=120, concurrency=10))
+        elapsed = time.monotonic() - started
+        assert all(len(feed) == 120 for feed in feeds.values())
+        assert len(session.calls_to(bluesky_client.FEED_ENDPOINT)) == 40
+        assert elapsed < 0.4, f"feeds were paged one at a time ({elapsed:.2f}s)"
+        print(f"✓ 20 feeds of 120 posts paged in {elapsed:.2f}s")
+
+        session = FakeSession(rate_limited=1)
+        client = make_client(session, tmp)
+        started = time.monotonic()
+        feed = asyncio.run(client.get_author_feed('did:plc:x', limit=10))
+        assert len(feed) == 10 and time.monotonic() - started >= 0.15
+        print("✓ A 429 is retried after the rate-limit reset")
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("NJCIC Bluesky Client Test")
+    print("=" * 60)
+    print()
+
+    test_rate_budget()
+    test_did_cache()
+    test_profiles()
+    test_batch_isolation()
+    test_feeds_and_rate_limits()
+
+    print("=" * 60)
+    print("✓ All tests passed!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
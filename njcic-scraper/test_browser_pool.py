@@ -0,0 +1,113 @@
+"""
+Test script for the shared Playwright browser pool.
+
+The context reuse test needs Chromium (playwright install chromium) and is
+skipped when it cannot be launched.
+
+Usage:
+    python test_browser_pool.py
+"""
+import asyncio
+import sys
+import threading
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from browser_pool import BrowserPool
+
+
+def test_one_loop_for_all_scrapes():
+    """Test that every run() call, from any thread, uses the pool's one event loop."""
+    print("Testing pool event loop...")
+
+    pool = BrowserPool()
+
+    async def current_loop():
+        await asyncio.sleep(0)
+        return asyncio.get_running_loop()
+
+    try:
+        first = pool.run(current_loop())
+        second = pool.run(current_loop())
+        assert first is second
+        print("✓ Sequential scrapes share one event loop")
+
+        loops = []
+
+        def worker():
+            loops.append(pool.run(current_loop()))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(loop is first for loop in loops)
+        print("✓ Scrapes from worker threads run on the same loop")
+    finally:
+        pool.close()
+
+    assert pool.run(current_loop()) is not first
+    pool.close()
+    print("✓ close() stops the loop and the pool can start again")
+    print()
+
+
+def test_context_reuse():
+    """Test that a platform's context is reused across scrapes."""
+    print("Testing context reuse...")
+
+    pool = BrowserPool()
+    setups = []
+
+    async def setup(lease):
+        setups.append(lease.platform)
+        lease.state['logged_in'] = True
+
+    async def scrape():
+        async with pool.lease('twitter', setup=setup) as lease:
+            page = await lease.context.new_page()
+            await page.set_content("<p>ok</p>")
+            return lease.reused, lease.state.get('logged_in')
+
+    try:
+        try:
+            first = pool.run(scrape())
+        except Exception as e:
+            print(f"- Skipped: Chromium not available ({str(e).splitlines()[0]})")
+            print()
+            return
+
+        second = pool.run(scrape())
+        assert first == (False, True)
+        assert second == (True, True)
+        assert setups == ['twitter']
+        assert pool.stats['browsers_launched'] == 1
+        assert pool.stats['contexts_created'] == 1
+        assert pool.stats['contexts_reused'] == 1
+        print("✓ Second scrape reused the warm context without running setup")
+    finally:
+        pool.close()
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("NJCIC Browser Pool Test")
+    print("=" * 60)
+    print()
+
+    test_one_loop_for_all_scrapes()
+    test_context_reuse()
+
+    print("=" * 60)
+    print("✓ All tests passed!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Test script for per-job deadlines.
+
+Usage:
+    python test_deadline.py
+"""
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import config
+from deadline import Deadline, DeadlineExceeded
+from scrapers.base import BaseScraper
+
+
+class SlowScraper(BaseScraper):
+    """Scraper that collects one post per backoff sleep until it runs out of time."""
+
+    platform_name = "slow"
+
+    def extract_username(self, url):
+        return url.rsplit('/', 1)[-1]
+
+    async def scrape_async(self, url, grantee_name, max_posts=None, deadline=None):
+        self.set_deadline(deadline)
+        result = {'success': False, 'posts_downloaded': 0, 'errors': [], 'engagement_metrics': {}}
+
+        try:
+            for _ in range(max_posts or 25):
+                await self.deadline.async_sleep(0.05)
+                result['posts_downloaded'] += 1
+            result['success'] = True
+        except DeadlineExceeded as e:
+            self.mark_timed_out(result, str(e))
+
+        return result
+
+
+class StuckScraper(BaseScraper):
+    """Scraper stuck in a call that never checks its deadline (e.g. a hung page.evaluate)."""
+
+    platform_name = "stuck"
+    cancelled = False
+
+    def extract_username(self, url):
+        return url.rsplit('/', 1)[-1]
+
+    async def scrape_async(self, url, grantee_name, max_posts=None, deadline=None):
+        self.set_deadline(deadline)
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            StuckScraper.cancelled = True
+            raise
+        return {'success': True, 'posts_downloaded': 1, 'errors': [], 'engagement_metrics': {}}
+
+
+def test_deadline_bounds():
+    """Test that timeouts and sleeps are bounded by the time left."""
+    print("Testing deadline bounds...")
+
+    unlimited = Deadline.unlimited()
+    assert unlimited.remaining() is None
+    assert not unlimited.expired
+    assert unlimited.timeout(600) == 600
+    assert unlimited.timeout_ms(30000) == 30000
+    print("✓ Unlimited deadline leaves timeouts unchanged")
+
+    deadline = Deadline(1.0)
+    assert deadline.timeout(600) <= 1.0
+    assert deadline.timeout_ms(30000) <= 1000
+    assert deadline.timeout(0.5) == 0.5
+    print("✓ Timeouts are capped at the time left")
+
+    started = time.monotonic()
+    try:
+        Deadline(0.2).sleep(30)
+        assert False, "sleep past the deadline should raise"
+    except DeadlineExceeded:
+        assert time.monotonic() - started < 1
+    print("✓ Backoff longer than the time left raises immediately")
+
+    expired = Deadline(0)
+    assert expired.expired
+    try:
+        expired.timeout_ms(5000)
+        assert False, "expired deadline should raise"
+    except DeadlineExceeded:
+        print("✓ Expired deadline raises on the next wait")
+    print()
+
+
+def test_scraper_keeps_partial_data():
+    """Test that a scraper stopped by its deadline reports timed_out with partial posts."""
+    print("Testing scraper deadline...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = SlowScraper(output_dir=Path(tmp))
+
+        result = scraper.scrape("https://example.com/slow", "Slow News", max_posts=100,
+                                deadline=Deadline(0.3))
+        assert result['timed_out'] is True
+        assert result['success'] is False
+        assert 0 < result['posts_downloaded'] < 100
+        print(f"✓ Timed out with {result['posts_downloaded']} partial posts")
+
+        result = scraper.scrape("https://example.com/slow", "Slow News", max_posts=3)
+        assert result['success'] is True
+        assert 'timed_out' not in result
+        print("✓ No deadline means no time limit")
+
+        grace = config.JOB_TIMEOUT_GRACE_SECONDS
+        config.JOB_TIMEOUT_GRACE_SECONDS = 0.2
+        try:
+            started = time.monotonic()
+            result = StuckScraper(output_dir=Path(tmp)).scrape(
+                "https://example.com/stuck", "Stuck News", deadline=Deadline(0.2))
+            elapsed = time.monotonic() - started
+        finally:
+            config.JOB_TIMEOUT_GRACE_SECONDS = grace
+
+        assert result['timed_out'] is True and result['posts_downloaded'] == 0
+        assert elapsed < 2, f"worker waited {elapsed:.1f}s for a stuck scrape"
+        time.sleep(0.1)
+        assert StuckScraper.cancelled
+        print(f"✓ A scrape stuck past its deadline and grace is cancelled after {elapsed:.1f}s")
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("NJCIC Deadline Test")
+    print("=" * 60)
+    print()
+
+    test_deadline_bounds()
+    test_scraper_keeps_partial_data()
+
+    print("=" * 60)
+    print("✓ All tests passed!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""
+Test script for the shared HTTP client and its conditional-GET cache.
+
+Runs a local HTTP server; no external network is needed.
+
+Usage:
+    python test_http_client.py
+"""
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import config
+import http_client
+from http_client import HttpCache, HttpClient, HttpError
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Serves /page with an ETag, /dated with Last-Modified and /private as no-store."""
+
+    requests_seen = []
+    body = b'<html>NJ Spotlight</html>'
+
+    def do_GET(self):
+        Handler.requests_seen.append((self.path, dict(self.headers)))
+
+        if self.path.startswith('/page'):
+            if self.headers.get('If-None-Match') == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header('ETag', '"v1"')
+        elif self.path == '/dated':
+            if self.headers.get('If-Modified-Since') == 'Mon, 05 Oct 2026 12:00:00 GMT':
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header('Last-Modified', 'Mon, 05 Oct 2026 12:00:00 GMT')
+        elif self.path == '/private':
+            self.send_response(200)
+            self.send_header('Cache-Control', 'no-store')
+        else:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+@contextmanager
+def serving():
+    """Run the local server and a scratch directory, yielding (base URL, directory)."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            yield f"http://127.0.0.1:{server.server_port}", tmp
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_cache():
+    """Test fresh hits, 304 revalidation and what is not cached."""
+    print("Testing conditional-GET cache...")
+
+    with serving() as (base, tmp):
+        client = HttpClient(cache=HttpCache(Path(tmp) / 'cache'))
+        Handler.requests_seen.clear()
+
+        first = client.get(f"{base}/page", ttl=60)
+        second = client.get(f"{base}/page", ttl=60)
+        assert first.text == second.text == Handler.body.decode()
+        assert not first.from_cache and second.from_cache
+        assert len(Handler.requests_seen) == 1
+        print("✓ A response within its TTL is served without a request")
+
+        third = client.get(f"{base}/page", ttl=0)
+        assert third.revalidated and third.text == first.text
+        assert Handler.requests_seen[-1][1].get('If-None-Match') == '"v1"'
+        client.get(f"{base}/dated", ttl=0)
+        dated = client.get(f"{base}/dated", ttl=0)
+        assert dated.revalidated and dated.status_code == 200
+        assert client.stats['revalidated'] == 2 and client.stats['downloads'] == 2
+        print("✓ Stale entries are revalidated by ETag and Last-Modified and a 304 reuses the body")
+
+        reloaded = HttpClient(cache=HttpCache(Path(tmp) / 'cache'))
+        assert reloaded.get(f"{base}/page", ttl=60).from_cache
+        print("✓ The cache survives a new client")
+
+        client.get(f"{base}/private", ttl=60)
+        assert not client.get(f"{base}/private", ttl=60).from_cache
+        client.get(f"{base}/page?x=1", ttl=None)
+        assert client.cache.load(f"{base}/page?x=1") is None
+        missing = client.get(f"{base}/missing", ttl=60)
+        assert missing.status_code == 404 and client.cache.load(f"{base}/missing") is None
+        try:
+            missing.raise_for_status()
+            raise AssertionError("404 did not raise")
+        except HttpError as e:
+            assert e.status == 404
+        print("✓ no-store responses, ttl=None requests and errors are not cached")
+        print()
+
+
+def test_host_limits():
+    """Test per-host spacing and TTL lookup by host suffix."""
+    print("Testing per-host limits...")
+
+    with serving() as (base, tmp):
+        interval = config.HTTP_MIN_INTERVAL_PER_HOST_SECONDS
+        config.HTTP_MIN_INTERVAL_PER_HOST_SECONDS = 0.1
+        try:
+            client = HttpClient(cache=HttpCache(Path(tmp) / 'spaced'))
+            started = time.monotonic()
+            threads = [threading.Thread(target=client.get, args=(f"{base}/page?n={i}",), kwargs={'ttl': None})
+                       for i in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed = time.monotonic() - started
+            assert elapsed >= 0.3, f"requests were not spaced ({elapsed:.2f}s)"
+            print(f"✓ 4 requests to one host took {elapsed:.2f}s at 0.1s spacing")
+        finally:
+            config.HTTP_MIN_INTERVAL_PER_HOST_SECONDS = interval
+
+        assert HttpClient.ttl_for('https://raw.githubusercontent.com/x/y.json') == 0
+        assert HttpClient.ttl_for('https://api.airtable.com/v0/base') is None
+        assert HttpClient.ttl_for('https://example.org/') == config.HTTP_CACHE_DEFAULT_TTL_SECONDS
+        print("✓ Cache TTLs are looked up by host suffix")
+
+        try:
+            client.get('http://127.0.0.1:1/', ttl=None, timeout=2)
+            raise AssertionError("connection error did not raise")
+        except HttpError as e:
+            assert e.status is None
+        print("✓ Connection errors raise HttpError")
+        print()
+
+
+def test_urllib_fallback():
+    """Test the urllib path used when requests is not installed."""
+    print("Testing urllib fallback...")
+
+    with serving() as (base, tmp):
+        requests_module = http_client.requests
+        http_client.requests = None
+        try:
+            client = HttpClient(cache=HttpCache(Path(tmp) / 'urllib'))
+            assert client.session is None
+            client.get(f"{base}/page", ttl=0)
+            response = client.get(f"{base}/page", ttl=0)
+            assert response.revalidated and response.text == Handler.body.decode()
+            assert client.get(f"{base}/missing", ttl=0).status_code == 404
+            print("✓ Revalidation and error statuses work without requests")
+        finally:
+            http_client.requests = requests_module
+        print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("NJCIC HTTP Client Test")
+    print("=" * 60)
+    print()
+
+    test_cache()
+    test_host_limits()
+    test_urllib_fallback()
+
+    print("=" * 60)
+    print("✓ All tests passed!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
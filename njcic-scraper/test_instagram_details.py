@@ -0,0 +1,171 @@
+"""
+Test script for the parallel Instagram post-detail extraction.
+
+Usage:
+    python test_instagram_details.py
+"""
+import asyncio
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from scrapers.instagram_playwright import InstagramPlaywrightScraper
+
+
+def media_json(shortcode, likes):
+    """Build an embedded-JSON blob holding one post's media record."""
+    return json.dumps({'require': [{'xdt_api__v1__media__shortcode__web_info': {'items': [{
+        'code': shortcode, 'pk': '1', 'taken_at': 1700000000, 'like_count': likes,
+        'comment_count': 4, 'media_type': 1, 'caption': {'text': 'From JSON'},
+        'user': {'username': 'njnews'},
+    }]}}]})
+
+
+class FakeTab:
+    """Tab stand-in that tracks how many post pages load at once."""
+
+    def __init__(self, context):
+        self.context = context
+        self.url = None
+        self.closed = False
+
+    async def goto(self, url, wait_until, timeout):
+        self.context.loading += 1
+        self.context.peak = max(self.context.peak, self.context.loading)
+        await asyncio.sleep(0.05)
+        self.context.loading -= 1
+        self.context.visited.append(url)
+        self.url = url
+
+    async def go_back(self, **kwargs):
+        raise AssertionError("post tabs must not navigate back")
+
+    async def evaluate(self, script, shortcode):
+        return self.context.details.get(shortcode, {'description': None, 'date': None, 'json': []})
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    """BrowserContext stand-in that hands out FakeTabs."""
+
+    def __init__(self, details, failing_tab=None):
+        self.details = details
+        self.failing_tab = failing_tab
+        self.tabs = []
+        self.visited = []
+        self.loading = 0
+        self.peak = 0
+
+    async def new_page(self):
+        if len(self.tabs) == self.failing_tab:
+            self.tabs.append(None)
+            raise RuntimeError("Target page, context or browser has been closed")
+        tab = FakeTab(self)
+        self.tabs.append(tab)
+        return tab
+
+
+def make_scraper(tmp):
+    """Create a scraper whose pacing delays return immediately."""
+    scraper = InstagramPlaywrightScraper(output_dir=Path(tmp))
+
+    async def no_delay(min_ms=0, max_ms=0):
+        pass
+
+    scraper._random_delay = no_delay
+    return scraper
+
+
+def test_detail_parsing():
+    """Test reading a post from embedded JSON, then from og:description."""
+    print("Testing post detail parsing...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = make_scraper(tmp)
+
+    link = 'https://www.instagram.com/p/ABC/'
+    post = scraper._post_from_detail(
+        {'description': '9 likes, 1 comments - njnews', 'date': None, 'json': [media_json('ABC', 321)]},
+        link, 'ABC', 0, 'njnews'
+    )
+    assert post['likes'] == 321 and post['comments'] == 4 and post['caption'] == 'From JSON'
+    assert post['date'].startswith('2023-11-14')
+    print("✓ The embedded media record wins over og meta")
+
+    post = scraper._post_from_detail(
+        {'description': '1.2K likes, 56 comments - njnews on March 1, 2024: "Hello"',
+         'date': '2024-03-01T12:00:00.000Z', 'video': True, 'json': []},
+        link, 'ABC', 3, 'njnews'
+    )
+    assert (post['likes'], post['comments']) == (1200, 56)
+    assert post['caption'] == 'njnews on March 1, 2024: "Hello"'
+    assert post['is_video'] and post['id'] == 'post_3'
+    print("✓ og:description counts and caption parsed")
+
+    assert scraper._post_from_detail({'description': None, 'date': None, 'json': []},
+                                     link, 'ABC', 0, 'njnews') is None
+    print("✓ Pages without post data are dropped")
+    print()
+
+
+def test_parallel_fetch():
+    """Test that posts load a few tabs at a time and keep grid order."""
+    print("Testing parallel fetch...")
+
+    links = [f'https://www.instagram.com/p/P{i}/' for i in range(7)]
+    details = {f'P{i}': {'description': f'{i} likes, 0 comments - njnews', 'date': None, 'json': []}
+               for i in range(7) if i != 4}
+    context = FakeContext(details)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = make_scraper(tmp)
+        posts = asyncio.run(scraper._fetch_post_details(context, links, 'njnews', concurrency=3))
+
+    assert [post['likes'] for post in posts] == [0, 1, 2, 3, 5, 6]
+    assert sorted(context.visited) == sorted(links)
+    assert context.peak == 3 and len(context.tabs) == 3
+    assert all(tab.closed for tab in context.tabs)
+    print("✓ 3 tabs loaded posts in parallel; results in grid order; tabs closed")
+
+    context = FakeContext(details)
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = make_scraper(tmp)
+        asyncio.run(scraper._fetch_post_details(context, links[:2], 'njnews', concurrency=5))
+    assert len(context.tabs) == 2
+    print("✓ Never more tabs than posts")
+
+    context = FakeContext(details, failing_tab=1)
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = make_scraper(tmp)
+        posts = asyncio.run(scraper._fetch_post_details(context, links, 'njnews', concurrency=3))
+        assert [post['likes'] for post in posts] == [0, 1, 2, 3, 5, 6]
+        print("✓ A failed tab leaves its posts to the other tabs")
+
+        assert asyncio.run(scraper._fetch_post_details(FakeContext(details), [], 'njnews')) == []
+        print("✓ No links opens no tabs")
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("NJCIC Instagram Post Details Test")
+    print("=" * 60)
+    print()
+
+    test_detail_parsing()
+    test_parallel_fetch()
+
+    print("=" * 60)
+    print("✓ All tests passed!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Test script for the crash-safe run journal.
+
+Usage:
+    python test_journal.py
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from journal import RunJournal
+
+
+def test_record_and_replay():
+    """Test that the last outcome per job wins on replay."""
+    print("Testing journal record and replay...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = RunJournal("20260105-060000", runs_dir=Path(tmp))
+        journal.start(platforms=["bluesky", "facebook"], max_posts=25)
+
+        journal.record_job("Alpha News", "bluesky", "https://bsky.app/profile/alpha",
+                           {"success": True, "posts_downloaded": 25})
+        journal.record_job("Alpha News", "facebook", "https://facebook.com/alpha",
+                           {"success": False, "error": "Browser crashed"})
+        journal.record_job("Alpha News", "facebook", "https://facebook.com/alpha",
+                           {"success": True, "posts_downloaded": 10})
+
+        header = journal.header()
+        assert header["platforms"] == ["bluesky", "facebook"]
+        assert header["resumed"] is False
+        print("✓ Header restored")
+
+        outcomes = journal.job_outcomes()
+        assert len(outcomes) == 2
+        assert outcomes[("Alpha News", "facebook")]["result"]["posts_downloaded"] == 10
+        print("✓ Latest outcome wins")
+    print()
+
+
+def test_torn_final_line():
+    """Test that a partially written last line is ignored."""
+    print("Testing torn final line...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = RunJournal("20260105-060000", runs_dir=Path(tmp))
+        journal.record_job("Beta Media", "youtube", "https://youtube.com/@beta",
+                           {"success": True, "posts_downloaded": 5})
+
+        with open(journal.path, "a", encoding="utf-8") as f:
+            f.write('{"type": "job", "grantee": "Beta Me')
+
+        outcomes = journal.job_outcomes()
+        assert list(outcomes) == [("Beta Media", "youtube")]
+        print("✓ Torn line skipped")
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("NJCIC Run Journal Test")
+    print("=" * 60)
+    print()
+
+    test_record_and_replay()
+    test_torn_final_line()
+
+    print("=" * 60)
+    print("✓ All tests passed!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+"""
+Test script for the browser memory watchdog and context recycling.
+
+Usage:
+    python test_memory_watchdog.py
+"""
+import asyncio
+import subprocess
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from browser_pool import BrowserPool, ContextLease
+from memory_watchdog import ContextRecycler, MemoryWatchdog, NavigationCounter, process_tree_rss
+
+
+class FakePage:
+    """Page stand-in that can fire framenavigated events."""
+
+    def __init__(self):
+        self.main_frame = object()
+        self.handlers = []
+        self.closed = False
+
+    def on(self, event, handler):
+        if event == 'framenavigated':
+            self.handlers.append(handler)
+
+    def navigate(self, frame=None):
+        for handler in self.handlers:
+            handler(frame or self.main_frame)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    """BrowserContext stand-in with a storage_state and page events."""
+
+    def __init__(self, browser, options):
+        self.browser = browser
+        self.options = options
+        self.pages = []
+        self.page_handlers = []
+        self.closed = False
+        self.routes = []
+
+    def on(self, event, handler):
+        if event == 'page':
+            self.page_handlers.append(handler)
+
+    async def new_page(self):
+        page = FakePage()
+        self.pages.append(page)
+        for handler in self.page_handlers:
+            handler(page)
+        return page
+
+    async def storage_state(self):
+        return {'cookies': [{'name': 'session', 'value': str(id(self))}], 'origins': []}
+
+    async def route(self, pattern, handler):
+        self.routes.append(pattern)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    """Browser stand-in recording the contexts it creates."""
+
+    def __init__(self):
+        self.contexts = []
+
+    def is_connected(self):
+        return True
+
+    async def new_context(self, **options):
+        context = FakeContext(self, options)
+        self.contexts.append(context)
+        return context
+
+
+def test_process_tree_rss():
+    """Test that RSS is summed over child processes."""
+    print("Testing process tree RSS...")
+
+    before = process_tree_rss()
+    if before is None:
+        print("- Skipped: RSS cannot be measured on this platform")
+        print()
+        return
+
+    child = subprocess.Popen([sys.executable, '-c', 'import time; print("ready", flush=True); time.sleep(30)'],
+                             stdout=subprocess.PIPE, text=True)
+    try:
+        child.stdout.readline()
+        with_child = process_tree_rss()
+        assert with_child > before and with_child - before > 1024 * 1024
+        print(f"✓ A child Python adds {(with_child - before) / 1024 / 1024:.0f} MB to the tree")
+    finally:
+        child.kill()
+        child.wait()
+    print()
+
+
+def test_watchdog_triggers():
+    """Test the navigation and memory triggers and the recorded stats."""
+    print("Testing watchdog triggers...")
+
+    rss = {'bytes': 100 * 1024 * 1024}
+    stats = {}
+    watchdog = MemoryWatchdog(max_navigations=10, max_rss_mb=500, stats=stats,
+                              measure=lambda: rss['bytes'])
+
+    assert watchdog.check(9) is None
+    assert watchdog.check(10) == 'navigations'
+    print("✓ Recycles after the navigation limit")
+
+    rss['bytes'] = 600 * 1024 * 1024
+    assert watchdog.check(1) == 'memory'
+    rss['bytes'] = 200 * 1024 * 1024
+    assert watchdog.check(1) is None
+    assert stats['peak_rss_mb'] == 600
+    print("✓ Recycles above the memory limit and keeps the peak RSS")
+
+    watchdog.record('navigations')
+    watchdog.record('memory')
+    assert (stats['contexts_recycled'], stats['recycled_for_navigations'], stats['recycled_for_memory']) == (2, 1, 1)
+
+    disabled = MemoryWatchdog(max_navigations=0, max_rss_mb=0, measure=lambda: 10 ** 12)
+    assert disabled.check(10 ** 6) is None
+    print("✓ Recycles are counted by reason; 0 disables a trigger")
+    print()
+
+
+def test_navigation_counter():
+    """Test that only main-frame navigations on any page are counted."""
+    print("Testing navigation counter...")
+
+    context = FakeContext(FakeBrowser(), {})
+    existing = asyncio.run(context.new_page())
+    counter = NavigationCounter(context)
+    later = asyncio.run(context.new_page())
+
+    existing.navigate()
+    later.navigate()
+    later.navigate(frame=object())  # iframe
+    assert counter.count == 2
+    print("✓ Main-frame navigations on existing and new pages counted, iframes ignored")
+    print()
+
+
+def test_pool_recycles_on_release():
+    """Test that the pool swaps a worn context for a fresh one carrying its session."""
+    print("Testing pool recycling...")
+
+    pool = BrowserPool()
+    pool.watchdog = MemoryWatchdog(max_navigations=2, max_rss_mb=0, stats=pool.stats)
+    browser = FakeBrowser()
+    setups = []
+
+    async def setup(lease):
+        setups.append(lease.context)
+
+    async def scenario():
+        old = await browser.new_context(locale='en-US')
+        lease = ContextLease('test', old)
+        lease.options = {'locale': 'en-US'}
+        lease.setup = setup
+        lease.state['logged_in'] = True
+        key = ('test', True, ())
+
+        page = await old.new_page()
+        page.navigate()
+        await pool._release(key, lease, True)
+        assert pool._idle[key] == [lease] and lease.context is old
+        print("✓ A context under the limits goes back to the pool unchanged")
+
+        pool._idle[key].clear()
+        page = await old.new_page()
+        page.navigate()
+        await pool._release(key, lease, True)
+        return old, lease, key
+
+    old, lease, key = asyncio.run(scenario())
+
+    assert old.closed and lease.context is not old
+    assert lease.context.options['locale'] == 'en-US'
+    assert lease.context.options['storage_state']['cookies'][0]['value'] == str(id(old))
+    assert lease.state['logged_in'] and lease.navigations.count == 0
+    assert setups == [lease.context] and lease.context.routes == ['**/*']
+    assert pool._idle[key] == [lease]
+    assert pool.stats['contexts_recycled'] == 1 and pool.stats['recycled_for_navigations'] == 1
+    print("✓ A worn context is replaced with its session, setup and route filter, and counted")
+    print()
+
+
+def test_context_recycler():
+    """Test the recycler used by scripts that manage their own browser."""
+    print("Testing script context recycler...")
+
+    browser = FakeBrowser()
+    stealthed = []
+
+    async def page_setup(page):
+        stealthed.append(page)
+
+    async def scenario():
+        recycler = ContextRecycler(browser, {'locale': 'en-US'}, page_setup=page_setup,
+                                   watchdog=MemoryWatchdog(max_navigations=3, max_rss_mb=0))
+        page = await recycler.start()
+        first_context = recycler.context
+
+        page.navigate()
+        assert await recycler.maybe_recycle() is page
+        page.navigate()
+        page.navigate()
+        new_page = await recycler.maybe_recycle()
+        return recycler, first_context, page, new_page
+
+    recycler, first_context, page, new_page = asyncio.run(scenario())
+
+    assert new_page is not page and first_context.closed
+    assert recycler.context.options['storage_state']['cookies'][0]['value'] == str(id(first_context))
+    assert stealthed == [page, new_page]
+    assert recycler.navigations.count == 0
+    assert recycler.watchdog.stats['contexts_recycled'] == 1
+    print("✓ Recycled after 3 navigations with the login carried over and stealth reapplied")
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("NJCIC Memory Watchdog Test")
+    print("=" * 60)
+    print()
+
+    test_process_tree_rss()
+    test_watchdog_triggers()
+    test_navigation_counter()
+    test_pool_recycles_on_release()
+    test_context_recycler()
+
+    print("=" * 60)
+    print("✓ All tests passed!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
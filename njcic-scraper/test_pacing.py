@@ -0,0 +1,135 @@
+"""
+Test script for pacing profiles.
+
+Usage:
+    python test_pacing.py
+"""
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import config
+import pacing
+from pacing import get_pacing, parse_pacing, set_run_pacing
+from scrapers.base import BaseScraper
+from scrapers.facebook import FacebookScraper
+
+
+class PausingScraper(BaseScraper):
+    """Scraper that only pauses."""
+
+    platform_name = "linkedin"
+
+    def extract_username(self, url):
+        return url.rsplit('/', 1)[-1]
+
+    async def scrape_async(self, url, grantee_name, max_posts=None, deadline=None):
+        self.set_deadline(deadline)
+        self.set_pacing(url)
+        started = time.monotonic()
+        await self.pause(0.1, 0.1)
+        return {'success': True, 'paused': time.monotonic() - started, 'pacing': self.pacing.name}
+
+
+class FakeMouse:
+    def __init__(self):
+        self.moves = []
+
+    async def move(self, x, y):
+        self.moves.append((x, y))
+
+
+class FakePage:
+    def __init__(self):
+        self.mouse = FakeMouse()
+
+
+def test_profiles():
+    """Test profile selection per platform, per target and per run."""
+    print("Testing profile selection...")
+
+    try:
+        assert get_pacing('linkedin').name == config.PLATFORM_PACING['linkedin']
+        assert get_pacing('youtube').name == config.DEFAULT_PACING
+        print("✓ Platforms use config.PLATFORM_PACING, others the default")
+
+        company = get_pacing('linkedin', 'https://www.linkedin.com/company/njspotlight')
+        assert company.name == 'standard' and get_pacing('linkedin').name == 'cautious'
+        assert get_pacing('bluesky', 'https://www.linkedin.com/company/x').name == 'fast'
+        print("✓ Low-risk targets are paced one profile faster")
+
+        set_run_pacing(parse_pacing('fast,linkedin=cautious'))
+        assert get_pacing('facebook').name == 'fast'
+        assert get_pacing('linkedin').name == 'cautious'
+        print("✓ Run overrides apply to all platforms or just one")
+    finally:
+        set_run_pacing({})
+
+    assert parse_pacing('standard') == {'*': 'standard'}
+    try:
+        parse_pacing('instagram=reckless')
+        assert False, "unknown profile should raise"
+    except ValueError:
+        print("✓ Unknown profiles are rejected")
+
+    fast = pacing.profile('fast')
+    assert fast.scaled(1000) == 1000 * config.PACING_PROFILES['fast']['delay_scale']
+    assert all(0 <= fast.delay(1, 2) <= 2 * fast.delay_scale for _ in range(20))
+    print("✓ Delays are scaled by the profile")
+    print()
+
+
+def test_scraper_pauses():
+    """Test that scraper pauses and human simulation follow the profile."""
+    print("Testing scraper pacing...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = PausingScraper(output_dir=Path(tmp))
+
+        profile_result = scraper.scrape("https://www.linkedin.com/in/someone", "A")
+        company_result = scraper.scrape("https://www.linkedin.com/company/someone", "A")
+        assert profile_result['pacing'] == 'cautious' and company_result['pacing'] == 'standard'
+        assert profile_result['paused'] >= 0.14 and company_result['paused'] < 0.14
+        print(f"✓ A 0.1s pause took {profile_result['paused']:.2f}s cautious, "
+              f"{company_result['paused']:.2f}s on a company page")
+
+        try:
+            set_run_pacing({'*': 'fast'})
+            scraper = FacebookScraper(output_dir=Path(tmp))
+            scraper.set_pacing('https://www.facebook.com/njspotlight')
+            page = FakePage()
+            asyncio.run(scraper._human_like_mouse_movement(page))
+            assert page.mouse.moves == []
+
+            set_run_pacing({})
+            scraper.set_pacing('https://www.facebook.com/njspotlight')
+            asyncio.run(scraper._human_like_mouse_movement(page))
+            assert page.mouse.moves
+            print("✓ Human simulation is skipped on fast pacing and runs on standard")
+        finally:
+            set_run_pacing({})
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("NJCIC Pacing Test")
+    print("=" * 60)
+    print()
+
+    test_profiles()
+    test_scraper_pauses()
+
+    print("=" * 60)
+    print("✓ All tests passed!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Test script for the condition-based page waits.
+
+The in-browser test needs Chromium (playwright install chromium) and is
+skipped when it cannot be launched.
+
+Usage:
+    python test_page_waits.py
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from browser_pool import BrowserPool
+from page_waits import scroll_and_wait, wait_for_network_idle
+
+
+class FakePage:
+    """Page stand-in that emits request events and answers evaluate()."""
+
+    def __init__(self, evaluate_result=0):
+        self.handlers = {}
+        self.evaluate_result = evaluate_result
+        self.evaluated = []
+
+    def on(self, event, handler):
+        self.handlers.setdefault(event, []).append(handler)
+
+    def remove_listener(self, event, handler):
+        self.handlers[event].remove(handler)
+
+    def emit(self, event, request):
+        for handler in list(self.handlers.get(event, [])):
+            handler(request)
+
+    async def evaluate(self, script, arg):
+        self.evaluated.append(arg)
+        return self.evaluate_result
+
+
+def test_network_idle():
+    """Test that the idle wait tracks in-flight requests and times out."""
+    print("Testing network idle...")
+
+    async def run():
+        page = FakePage()
+
+        async def traffic():
+            await asyncio.sleep(0.01)
+            page.emit('request', 'a')
+            await asyncio.sleep(0.3)
+            page.emit('requestfinished', 'a')
+
+        started = time.monotonic()
+        idle, _ = await asyncio.gather(
+            wait_for_network_idle(page, timeout_ms=3000, idle_ms=100),
+            traffic()
+        )
+        elapsed = time.monotonic() - started
+
+        assert idle
+        assert 0.35 <= elapsed < 1.5
+        assert all(not handlers for handlers in page.handlers.values())
+        print(f"✓ Returned {elapsed:.2f}s after start, once the request finished")
+
+        page.emit('request', 'stuck')
+        # The stuck request predates the wait, so it is not tracked
+        assert await wait_for_network_idle(page, timeout_ms=1000, idle_ms=100)
+
+        async def stuck():
+            await asyncio.sleep(0.01)
+            page.emit('request', 'long-poll')
+
+        idle, _ = await asyncio.gather(wait_for_network_idle(page, timeout_ms=400, idle_ms=100), stuck())
+        assert not idle
+        print("✓ A request that never finishes ends in a timeout, not a hang")
+
+        started = time.monotonic()
+        assert await wait_for_network_idle(page, timeout_ms=2000, idle_ms=50, floor_ms=300)
+        assert time.monotonic() - started >= 0.3
+        print("✓ floor_ms keeps a minimum pause")
+
+    asyncio.run(run())
+    print()
+
+
+def test_scroll_and_wait_arguments():
+    """Test that scroll_and_wait passes its options to the page and honours the floor."""
+    print("Testing scroll_and_wait...")
+
+    async def run():
+        page = FakePage(evaluate_result=3)
+        started = time.monotonic()
+        added = await scroll_and_wait(page, 'article', 2000, count=2, scroll_by=800, floor_ms=200)
+        assert added == 3
+        assert time.monotonic() - started >= 0.2
+        assert page.evaluated == [{'selector': 'article', 'count': 2, 'timeoutMs': 2000, 'scrollBy': 800}]
+
+    asyncio.run(run())
+    print("✓ Options passed in one evaluate call, floor respected")
+    print()
+
+
+def test_in_browser():
+    """Test the MutationObserver wait against a page that appends articles."""
+    print("Testing scroll_and_wait in Chromium...")
+
+    pool = BrowserPool()
+
+    async def run():
+        async with pool.lease('test') as lease:
+            page = await lease.context.new_page()
+            await page.set_content("""
+                <div id="feed" style="height: 3000px"><article>1</article></div>
+                <script>
+                    window.addEventListener('scroll', () => setTimeout(() => {
+                        for (let i = 0; i < 3; i++) {
+                            document.getElementById('feed').appendChild(document.createElement('article'));
+                        }
+                    }, 200), {once: true});
+                </script>
+            """)
+            started = time.monotonic()
+            added = await scroll_and_wait(page, 'article', 5000, count=3)
+            elapsed = time.monotonic() - started
+            nothing = await scroll_and_wait(page, 'article', 300)
+            return added, elapsed, nothing
+
+    try:
+        try:
+            added, elapsed, nothing = pool.run(run())
+        except Exception as e:
+            print(f"- Skipped: Chromium not available ({str(e).splitlines()[0]})")
+            print()
+            return
+
+        assert added == 3 and elapsed < 2
+        assert nothing == 0
+        print(f"✓ Returned after {elapsed:.2f}s when 3 articles arrived; 0 on timeout")
+    finally:
+        pool.close()
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("NJCIC Page Waits Test")
+    print("=" * 60)
+    print()
+
+    test_network_idle()
+    test_scroll_and_wait_arguments()
+    test_in_browser()
+
+    print("=" * 60)
+    print("✓ All tests passed!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Test script for activity-aware refresh scheduling.
+
+Usage:
+    python test_refresh.py
+"""
+import json
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from refresh import RefreshSchedule, choose_tier, load_activity
+from scrapers.base import BaseScraper
+
+
+class TweetingScraper(BaseScraper):
+    """Scraper saving tweets.json under a username directory, as TwitterScraper does."""
+
+    platform_name = "twitter"
+
+    def extract_username(self, url):
+        return url.rstrip('/').rsplit('/', 1)[-1]
+
+    async def scrape_async(self, url, grantee_name, max_posts=None, deadline=None):
+        output_dir = self.get_output_path(grantee_name) / self.extract_username(url)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        tweets = [{'id': str(i), 'date': (datetime.now() - timedelta(hours=12 * i)).isoformat()}
+                  for i in range(10)]
+        self.save_posts(tweets, output_dir, 'tweets.json')
+        return {'success': True, 'posts_downloaded': len(tweets), 'errors': [], 'engagement_metrics': {}}
+
+
+NOW = datetime(2026, 3, 1, 6, 0, 0)
+
+
+def days_ago(days):
+    """Return an ISO timestamp the given number of days before NOW."""
+    return (NOW - timedelta(days=days)).isoformat()
+
+
+def test_choose_tier():
+    """Test that posting activity maps to the expected refresh tier."""
+    print("Testing refresh tiers...")
+
+    assert choose_tier(10, days_ago(1), NOW) == 'daily'
+    assert choose_tier(1, days_ago(3), NOW) == 'weekly'
+    assert choose_tier(0.2, days_ago(10), NOW) == 'monthly'
+    print("✓ Posting frequency picks daily, weekly or monthly")
+
+    assert choose_tier(10, days_ago(120), NOW) == 'monthly'
+    assert choose_tier(0, None, NOW) == 'monthly'
+    print("✓ Dormant accounts and accounts with no posts are monthly")
+    print()
+
+
+def test_due_accounts():
+    """Test due checks against the last scrape time and tier."""
+    print("Testing due accounts...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "refresh_state.json"
+        schedule = RefreshSchedule(path)
+
+        url = "https://bsky.app/profile/active.example"
+        assert schedule.is_due("bluesky", url, NOW)
+        print("✓ Accounts never scraped are due")
+
+        tier = schedule.record("bluesky", url, {'posts_per_week': 14, 'last_post': days_ago(0)},
+                               scraped_at=NOW)
+        assert tier == 'daily'
+        assert not schedule.is_due("bluesky", url, NOW + timedelta(hours=12))
+        assert schedule.is_due("bluesky", url, NOW + timedelta(hours=23))
+        print("✓ Daily account is due again after a day, with a grace window")
+
+        quiet = "https://x.com/quiet"
+        schedule.record("twitter", quiet, None, scraped_at=NOW)
+        assert not schedule.is_due("twitter", "https://twitter.com/quiet/", NOW + timedelta(days=20))
+        assert schedule.is_due("twitter", quiet, NOW + timedelta(days=30))
+        print("✓ Monthly account is skipped for a month (URL forms share one entry)")
+
+        schedule.save()
+        reloaded = RefreshSchedule(path)
+        assert reloaded.entries == schedule.entries
+        print("✓ State survives a save and reload")
+    print()
+
+
+def test_load_activity():
+    """Test that activity is measured from saved posts."""
+    print("Testing activity from saved posts...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = Path(tmp) / "Alpha_News" / "bluesky"
+        output_path.mkdir(parents=True)
+
+        posts = [
+            {'post_id': str(i), 'timestamp': (NOW - timedelta(days=i)).isoformat()}
+            for i in range(14)
+        ]
+        with open(output_path / "posts.json", 'w', encoding='utf-8') as f:
+            json.dump(posts, f)
+
+        activity = load_activity(str(output_path))
+        assert activity['posts_per_week'] > 3
+        assert activity['last_post'] == NOW.isoformat()
+        print(f"✓ Measured {activity['posts_per_week']} posts per week")
+
+        assert load_activity(str(Path(tmp) / "missing")) is None
+        print("✓ Missing output directory gives no activity")
+
+        # A scraper that does not report output_path still gets its activity measured
+        result = TweetingScraper(output_dir=Path(tmp)).scrape("https://x.com/busynews", "Busy News")
+        assert Path(result['output_path']) == Path(tmp) / "Busy_News" / "twitter"
+        activity = load_activity(result['output_path'])
+        assert choose_tier(activity['posts_per_week'], activity['last_post']) == 'daily'
+        print(f"✓ Twitter-style tweets.json under a username directory measured at "
+              f"{activity['posts_per_week']} posts per week")
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("NJCIC Refresh Scheduling Test")
+    print("=" * 60)
+    print()
+
+    test_choose_tier()
+    test_due_accounts()
+    test_load_activity()
+
+    print("=" * 60)
+    print("✓ All tests passed!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
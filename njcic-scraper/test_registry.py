@@ -0,0 +1,80 @@
+"""
+Test script for the lazy scraper registry.
+
+Usage:
+    python test_registry.py
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from scrapers.registry import SCRAPER_PATHS, ScraperRegistry
+
+
+def test_membership_does_not_import():
+    """Test that listing and membership checks never import scraper modules."""
+    print("Testing registry membership...")
+
+    registry = ScraperRegistry(SCRAPER_PATHS)
+    assert 'bluesky' in registry
+    assert 'myspace' not in registry
+    assert sorted(registry) == sorted(SCRAPER_PATHS)
+    assert registry.loaded() == {}
+    print("✓ Membership and iteration import nothing")
+    print()
+
+
+def test_lookup_imports_once():
+    """Test that looking up a platform imports only that scraper."""
+    print("Testing registry lookup...")
+
+    registry = ScraperRegistry(SCRAPER_PATHS)
+    scraper_class = registry['bluesky']
+    assert scraper_class.__name__ == 'BlueSkyScraper'
+    assert registry['bluesky'] is scraper_class
+    assert list(registry.loaded()) == ['bluesky']
+    assert 'bluesky' in registry.import_times
+    print("✓ Only the requested scraper was imported")
+
+    try:
+        registry['myspace']
+        assert False, "unknown platform should raise KeyError"
+    except KeyError:
+        print("✓ Unknown platform raises KeyError")
+    print()
+
+
+def test_main_import_is_light():
+    """Test that importing main loads no browser or scraping libraries."""
+    print("Testing main import...")
+
+    heavy = ['playwright', 'requests', 'aiohttp']
+    check = f"import sys, main; print([m for m in {heavy!r} if m in sys.modules])"
+    output = subprocess.run([sys.executable, '-c', check], cwd=Path(__file__).parent,
+                            capture_output=True, text=True, check=True).stdout
+    assert output.strip().splitlines()[-1] == '[]', output
+    print(f"✓ import main loads none of {', '.join(heavy)}")
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("NJCIC Scraper Registry Test")
+    print("=" * 60)
+    print()
+
+    test_membership_does_not_import()
+    test_lookup_imports_once()
+    test_main_import_is_light()
+
+    print("=" * 60)
+    print("✓ All tests passed!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
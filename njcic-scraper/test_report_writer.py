@@ -0,0 +1,102 @@
+"""
+Test script for the streaming report writer.
+
+Usage:
+    python test_report_writer.py
+"""
+import csv
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from report_writer import StreamingReportWriter
+
+
+def make_result(name, posts):
+    """Build a grantee result with one Bluesky platform entry."""
+    return {
+        "name": name,
+        "website": f"https://{name.lower().replace(' ', '')}.example",
+        "platforms": {
+            "bluesky": {"url": "https://bsky.app/profile/x", "success": True,
+                        "posts_downloaded": posts, "engagement_metrics": {"likes": 3}},
+        },
+        "summary": {"total_posts": posts, "total_followers": 0, "total_engagement": 3,
+                    "platforms_scraped": 1, "platforms_failed": 0},
+    }
+
+
+def test_partial_output_then_finalize():
+    """Test that results are on disk before finalize and in the final report after."""
+    print("Testing streaming report writer...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        report_path = Path(tmp) / "scraping_report.json"
+        csv_path = Path(tmp) / "engagement_summary.csv"
+        writer = StreamingReportWriter(report_path, csv_path, ["bluesky"])
+
+        writer.write_error({"type": "scraper_init", "platform": "bluesky", "error": "early"})
+        writer.open()
+        writer.write_grantee(make_result("Alpha News", 5))
+        writer.write_error({"type": "scraping", "grantee": "Beta Media", "error": "timeout"})
+        writer.write_grantee(make_result("Beta Media", 0))
+
+        # A crash here would leave these partial files behind
+        lines = writer.results_path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 2
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert [r["Grantee Name"] for r in rows] == ["Alpha News", "Beta Media"]
+        assert rows[0]["Bluesky Posts"] == "5"
+        print("✓ Partial NDJSON and CSV written as grantees finish")
+
+        writer.finalize({"metadata": {"run_id": "test"}, "summary": {"total_errors": 2}})
+
+        with open(report_path, encoding="utf-8") as f:
+            report = json.load(f)
+        assert [r["name"] for r in report["grantee_results"]] == ["Alpha News", "Beta Media"]
+        assert [e["error"] for e in report["errors"]] == ["early", "timeout"]
+        assert writer.error_count == 2
+        assert not writer.results_path.exists()
+        print("✓ Final report assembled from header and NDJSON")
+    print()
+
+
+def test_empty_run():
+    """Test finalizing a run with no results or errors."""
+    print("Testing empty run...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        report_path = Path(tmp) / "scraping_report.json"
+        writer = StreamingReportWriter(report_path, Path(tmp) / "summary.csv", [])
+        writer.open()
+        writer.finalize({"summary": {}})
+
+        with open(report_path, encoding="utf-8") as f:
+            report = json.load(f)
+        assert report == {"summary": {}, "grantee_results": [], "errors": []}
+        print("✓ Empty report is valid JSON")
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("NJCIC Report Writer Test")
+    print("=" * 60)
+    print()
+
+    test_partial_output_then_finalize()
+    test_empty_run()
+
+    print("=" * 60)
+    print("✓ All tests passed!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
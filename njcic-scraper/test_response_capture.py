@@ -0,0 +1,197 @@
+"""
+Test script for JSON response capture and the platform payload parsers.
+
+Usage:
+    python test_response_capture.py
+"""
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from response_capture import ResponseCapture, parse_json_payload
+from scrapers.instagram_playwright import parse_profile_posts, parse_profile_stats
+from scrapers.threads import parse_feed_posts, parse_feed_profile
+from scrapers.twitter import parse_timeline_profile, parse_timeline_tweets
+
+
+def tweet(rest_id, author, text, likes, quoted=None):
+    """Build a minimal UserTweets tweet result."""
+    result = {
+        'rest_id': rest_id,
+        'core': {'user_results': {'result': {'legacy': {'screen_name': author, 'followers_count': 1234}}}},
+        'views': {'count': '500'},
+        'legacy': {
+            'full_text': text,
+            'favorite_count': likes,
+            'retweet_count': 2,
+            'reply_count': 1,
+            'created_at': 'Wed Oct 10 20:19:24 +0000 2018',
+        },
+    }
+    if quoted:
+        result['quoted_status_result'] = {'result': quoted}
+    return {'content': {'itemContent': {'tweet_results': {'result': result}}}}
+
+
+USER_TWEETS = {
+    'data': {'user': {'result': {'timeline_v2': {'timeline': {'instructions': [{'entries': [
+        tweet('1', 'NJNews', 'Hello', 10, quoted=tweet('9', 'Other', 'Quoted', 99)
+              ['content']['itemContent']['tweet_results']['result']),
+        tweet('2', 'njnews', 'Second', 4),
+        tweet('3', 'someone_else', 'Reply in thread', 50),
+    ]}]}}}}}
+}
+
+
+def test_twitter_parser():
+    """Test that UserTweets payloads give exact counts for the account's own tweets."""
+    print("Testing Twitter timeline parser...")
+
+    tweets = parse_timeline_tweets(USER_TWEETS, 'NJNews')
+    assert [t['id'] for t in tweets] == ['1', '2']
+    assert tweets[0] == {
+        'id': '1', 'text': 'Hello', 'likes': 10, 'retweets': 2, 'replies': 1,
+        'views': 500, 'date': '2018-10-10T20:19:24+00:00'
+    }
+    print("✓ Own tweets parsed; quoted and other accounts' tweets skipped")
+
+    assert parse_timeline_profile(USER_TWEETS, 'njnews') == {'followers_count': 1234}
+    print("✓ Follower count found in the author record")
+    print()
+
+
+def test_threads_and_instagram_parsers():
+    """Test the Threads feed and Instagram profile parsers."""
+    print("Testing Threads and Instagram parsers...")
+
+    threads_payload = {'data': {'mediaData': {'edges': [{'node': {'thread_items': [
+        {'post': {
+            'pk': '77', 'code': 'Cabc', 'taken_at': 1700000000, 'like_count': 12,
+            'caption': {'text': 'Story'}, 'user': {'username': 'njnews', 'follower_count': 800},
+            'text_post_app_info': {'direct_reply_count': 3, 'repost_count': 1, 'quote_count': 2},
+        }},
+        {'post': {
+            'pk': '78', 'code': 'Cdef', 'taken_at': 1700000100, 'like_count': 1,
+            'caption': None, 'user': {'username': 'reader'},
+        }},
+    ]}}]}}}
+
+    posts = parse_feed_posts(threads_payload, 'njnews')
+    assert len(posts) == 1
+    assert posts[0]['likes'] == 12 and posts[0]['replies'] == 3 and posts[0]['reposts'] == 3
+    assert posts[0]['url'] == 'https://www.threads.net/@njnews/post/Cabc'
+    assert posts[0]['timestamp'].startswith('2023-11-14T22:13:20')
+    assert parse_feed_profile(threads_payload, 'NJNews') == {'followers_count': 800}
+    print("✓ Threads posts and follower count parsed")
+
+    instagram_payload = {'data': {'user': {
+        'username': 'njnews',
+        'edge_followed_by': {'count': 5000},
+        'edge_follow': {'count': 10},
+        'edge_owner_to_timeline_media': {'count': 321, 'edges': [{'node': {
+            'id': '111', 'shortcode': 'XYZ', 'taken_at_timestamp': 1700000000, 'is_video': True,
+            'edge_liked_by': {'count': 42}, 'edge_media_to_comment': {'count': 7},
+            'edge_media_to_caption': {'edges': [{'node': {'text': 'Caption'}}]},
+        }}]},
+    }}}
+
+    posts = parse_profile_posts(instagram_payload, 'njnews')
+    assert posts == [{
+        'likes': 42, 'comments': 7, 'caption': 'Caption', 'date': '2023-11-14T22:13:20+00:00',
+        'is_video': True, 'id': '111', 'url': 'https://www.instagram.com/p/XYZ/', 'shortcode': 'XYZ'
+    }]
+    assert parse_profile_stats(instagram_payload, 'njnews') == {
+        'followers_count': 5000, 'following_count': 10, 'posts_count': 321
+    }
+    print("✓ Instagram grid posts and profile stats parsed")
+    print()
+
+
+class FakePage:
+    """Page stand-in that lets the test emit response events."""
+
+    def __init__(self):
+        self.handlers = []
+
+    def on(self, event, handler):
+        self.handlers.append(handler)
+
+    def remove_listener(self, event, handler):
+        self.handlers.remove(handler)
+
+    def emit(self, response):
+        for handler in list(self.handlers):
+            handler(response)
+
+
+class FakeResponse:
+    """Response stand-in with a URL, status and body."""
+
+    def __init__(self, url, body, status=200):
+        self.url = url
+        self.status = status
+        self.body = body
+
+    async def text(self):
+        return self.body
+
+
+def test_capture():
+    """Test URL filtering, de-duplication, multi-document bodies and stop()."""
+    print("Testing response capture...")
+
+    assert parse_json_payload('for (;;);{"a": 1}') == [{'a': 1}]
+    assert parse_json_payload('{"a": 1}\n{"b": 2}\nnot json') == [{'a': 1}, {'b': 2}]
+    print("✓ Prefixed and line-delimited bodies decode")
+
+    async def run():
+        page = FakePage()
+        capture = ResponseCapture(
+            page,
+            r"/UserTweets",
+            lambda payload: parse_timeline_tweets(payload, 'njnews'),
+            lambda payload: parse_timeline_profile(payload, 'njnews')
+        )
+
+        body = json.dumps(USER_TWEETS)
+        page.emit(FakeResponse("https://x.com/i/api/graphql/q/UserTweets", body))
+        page.emit(FakeResponse("https://x.com/i/api/graphql/q/UserTweets?cursor=2", body))
+        page.emit(FakeResponse("https://x.com/i/api/graphql/q/HomeTimeline", body))
+        page.emit(FakeResponse("https://x.com/i/api/graphql/q/UserTweets", "", status=429))
+        await capture.drain()
+        capture.stop()
+        page.emit(FakeResponse("https://x.com/i/api/graphql/q/UserTweets", body))
+        await capture.drain()
+        return capture, page
+
+    capture, page = asyncio.run(run())
+    assert capture.responses_parsed == 2
+    assert [post['id'] for post in capture.posts] == ['1', '2']
+    assert capture.profile == {'followers_count': 1234}
+    assert page.handlers == []
+    print("✓ Matching responses parsed once per post; others and post-stop() ignored")
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("NJCIC Response Capture Test")
+    print("=" * 60)
+    print()
+
+    test_twitter_parser()
+    test_threads_and_instagram_parsers()
+    test_capture()
+
+    print("=" * 60)
+    print("✓ All tests passed!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Test script for the cross-run result cache.
+
+Usage:
+    python test_result_cache.py
+"""
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from result_cache import ResultCache
+
+
+class CountingScraper:
+    """Scraper stand-in that counts how often it really scrapes."""
+
+    def __init__(self, success=True):
+        self.calls = 0
+        self.success = success
+
+    def extract_username(self, url):
+        return url.rstrip('/').rsplit('/', 1)[-1]
+
+    def scrape(self, url, grantee_name, max_posts=None):
+        self.calls += 1
+        return {'success': self.success, 'posts_downloaded': max_posts or 0,
+                'engagement_metrics': {'likes': 7}}
+
+
+def test_hits_and_keys():
+    """Test that a fresh result is reused for the same account and max_posts only."""
+    print("Testing cache hits...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ResultCache(Path(tmp), ttl_seconds=3600)
+        scraper = CountingScraper()
+
+        first = cache.scrape("bluesky", scraper, "https://bsky.app/profile/Org", "A", max_posts=25)
+        second = cache.scrape("bluesky", scraper, "https://bsky.app/profile/org/", "B", max_posts=25)
+        assert scraper.calls == 1
+        assert 'cached' not in first
+        assert second['cached'] is True and second['engagement_metrics'] == {'likes': 7}
+        print("✓ Second entry point reuses the result for the same account")
+
+        cache.scrape("bluesky", scraper, "https://bsky.app/profile/org", "A", max_posts=50)
+        assert scraper.calls == 2
+        print("✓ A different max_posts is a separate entry")
+    print()
+
+
+def test_ttl_force_and_failures():
+    """Test expiry, --force invalidation and that failures are never cached."""
+    print("Testing expiry and invalidation...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = CountingScraper()
+        ResultCache(Path(tmp)).scrape("youtube", scraper, "https://youtube.com/@org", "A", 10)
+
+        ResultCache(Path(tmp), ttl_seconds=0).scrape("youtube", scraper, "https://youtube.com/@org", "A", 10)
+        assert scraper.calls == 2
+        print("✓ Entries older than the TTL are re-scraped")
+
+        ResultCache(Path(tmp), force=True).scrape("youtube", scraper, "https://youtube.com/@org", "A", 10)
+        assert scraper.calls == 3
+        print("✓ force=True scrapes again")
+
+        failing = CountingScraper(success=False)
+        cache = ResultCache(Path(tmp) / "failures")
+        cache.scrape("tiktok", failing, "https://tiktok.com/@org", "A", 10)
+        cache.scrape("tiktok", failing, "https://tiktok.com/@org", "A", 10)
+        assert failing.calls == 2
+        print("✓ Failed results are not cached")
+
+        for path in Path(tmp).glob("*.json"):
+            with open(path, 'r', encoding='utf-8') as f:
+                assert json.load(f)['key'] == "youtube:org:10"
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("NJCIC Result Cache Test")
+    print("=" * 60)
+    print()
+
+    test_hits_and_keys()
+    test_ttl_force_and_failures()
+
+    print("=" * 60)
+    print("✓ All tests passed!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Test script for the Playwright request-blocking route filters.
+
+Usage:
+    python test_route_filters.py
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import config
+from route_filters import RouteFilter, format_bytes
+
+
+class FakeRequest:
+    """Request stand-in with the two attributes the filter reads."""
+
+    def __init__(self, url, resource_type):
+        self.url = url
+        self.resource_type = resource_type
+
+
+class FakeRoute:
+    """Route stand-in that records whether it was aborted or continued."""
+
+    def __init__(self, url, resource_type):
+        self.request = FakeRequest(url, resource_type)
+        self.outcome = None
+
+    async def abort(self):
+        self.outcome = 'aborted'
+
+    async def continue_(self):
+        self.outcome = 'continued'
+
+
+def test_block_rules():
+    """Test resource-type, domain and allow-list decisions."""
+    print("Testing block rules...")
+
+    route_filter = RouteFilter.for_platform('twitter')
+
+    assert route_filter.should_block("https://pbs.twimg.com/media/abc.jpg", 'image')
+    assert route_filter.should_block("https://video.twimg.com/clip.mp4", 'media')
+    assert route_filter.should_block("https://abs.twimg.com/font.woff2", 'font')
+    print("✓ Images, video and fonts are blocked")
+
+    assert route_filter.should_block("https://stats.g.doubleclick.net/j/collect", 'script')
+    assert route_filter.should_block("https://static.ads-twitter.com/uwt.js", 'script')
+    assert not route_filter.should_block("https://notdoubleclick.net/app.js", 'script')
+    print("✓ Ad and analytics hosts are blocked (subdomains only)")
+
+    assert not route_filter.should_block("https://x.com/i/api/graphql/UserTweets", 'xhr')
+    assert not route_filter.should_block("https://x.com/i/api/graphql/thumb", 'image')
+    assert not route_filter.should_block("https://x.com/nasa", 'document')
+    assert not route_filter.should_block("https://abs.twimg.com/main.js", 'script')
+    print("✓ Allow-listed XHRs, documents and app scripts pass")
+    print()
+
+
+def test_stats_and_config():
+    """Test bytes-saved accounting and disabling a platform."""
+    print("Testing stats...")
+
+    totals = {}
+    route_filter = RouteFilter.for_platform('instagram', totals=totals)
+    routes = [
+        FakeRoute("https://scontent.cdninstagram.com/p.jpg", 'image'),
+        FakeRoute("https://scontent.cdninstagram.com/v.mp4", 'media'),
+        FakeRoute("https://www.instagram.com/api/v1/users/web_profile_info/", 'fetch'),
+    ]
+
+    async def handle_all():
+        for route in routes:
+            await route_filter.handle(route)
+
+    asyncio.run(handle_all())
+
+    assert [route.outcome for route in routes] == ['aborted', 'aborted', 'continued']
+    expected = config.ROUTE_BLOCK_BYTE_ESTIMATES['image'] + config.ROUTE_BLOCK_BYTE_ESTIMATES['media']
+    assert route_filter.stats['requests_blocked'] == 2
+    assert route_filter.stats['bytes_saved'] == expected
+    assert route_filter.stats['blocked_by_type'] == {'image': 1, 'media': 1}
+    assert totals['bytes_saved'] == expected
+    print(f"✓ Blocked 2 requests, ~{format_bytes(expected)} saved, mirrored into pool totals")
+
+    original = config.ROUTE_BLOCK_RULES.get('linkedin')
+    config.ROUTE_BLOCK_RULES['linkedin'] = None
+    try:
+        assert RouteFilter.for_platform('linkedin') is None
+    finally:
+        config.ROUTE_BLOCK_RULES['linkedin'] = original
+    print("✓ Mapping a platform to None disables blocking")
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("NJCIC Route Filter Test")
+    print("=" * 60)
+    print()
+
+    test_block_rules()
+    test_stats_and_config()
+
+    print("=" * 60)
+    print("✓ All tests passed!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
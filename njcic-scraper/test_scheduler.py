@@ -0,0 +1,203 @@
+"""
+Test script for the orchestrator job scheduler.
+
+Usage:
+    python test_scheduler.py
+"""
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from scheduler import (
+    JobScheduler,
+    build_jobs,
+    coalesce_jobs,
+    order_longest_first,
+    parse_concurrency,
+    plan_run,
+)
+
+
+GRANTEES = [
+    {
+        "name": "Alpha News",
+        "social": {
+            "bluesky": "https://bsky.app/profile/alpha.bsky.social",
+            "facebook": "https://www.facebook.com/alphanews",
+        },
+    },
+    {
+        "name": "Beta Media",
+        "social": {"bluesky": "https://bsky.app/profile/beta.bsky.social"},
+    },
+    {
+        "name": "Gamma Collective",
+        "social": {},
+    },
+]
+
+
+def test_parse_concurrency():
+    """Test parsing of --concurrency specs."""
+    print("Testing concurrency spec parsing...")
+
+    assert parse_concurrency("bluesky=8, youtube=4,Facebook=1") == {
+        "bluesky": 8,
+        "youtube": 4,
+        "facebook": 1,
+    }
+    print("✓ Valid spec parsed")
+
+    for bad_spec in ["bluesky", "bluesky=fast", "bluesky=0"]:
+        try:
+            parse_concurrency(bad_spec)
+        except ValueError:
+            print(f"✓ Rejected invalid spec: {bad_spec}")
+        else:
+            raise AssertionError(f"Spec should have been rejected: {bad_spec}")
+    print()
+
+
+def test_build_jobs():
+    """Test expansion of grantees into (grantee, platform) jobs."""
+    print("Testing job expansion...")
+
+    jobs = build_jobs(GRANTEES, ["facebook", "bluesky"])
+
+    assert [(j["grantee"], j["platform"]) for j in jobs] == [
+        ("Alpha News", "facebook"),
+        ("Alpha News", "bluesky"),
+        ("Beta Media", "bluesky"),
+    ]
+    assert [j["grantee_index"] for j in jobs] == [0, 0, 1]
+    print(f"✓ Built {len(jobs)} jobs, grantees without URLs produce none")
+    print()
+
+
+def test_coalesce_jobs():
+    """Test that jobs for the same account are merged into one."""
+    print("Testing job coalescing...")
+
+    grantees = [
+        {"name": "Alpha News", "social": {"twitter": "https://twitter.com/SharedOrg"}},
+        {"name": "Beta Media", "social": {"twitter": "https://x.com/sharedorg?ref=1"}},
+        {"name": "Gamma Radio", "social": {"twitter": "https://x.com/gamma"}},
+    ]
+    jobs = build_jobs(grantees, ["twitter"])
+
+    def account_key(platform, url):
+        return url.split("?")[0].rstrip("/").rsplit("/", 1)[-1].lower()
+
+    merged = coalesce_jobs(jobs, account_key)
+    assert [j["account"] for j in merged] == ["sharedorg", "gamma"]
+    assert merged[0]["grantee"] == "Alpha News"
+    assert [m["grantee"] for m in merged[0]["members"]] == ["Alpha News", "Beta Media"]
+    assert [m["grantee"] for m in merged[1]["members"]] == ["Gamma Radio"]
+    print(f"✓ {len(jobs)} jobs coalesced into {len(merged)} accounts")
+    print()
+
+
+def test_per_platform_limits():
+    """Test that no platform exceeds its concurrency limit."""
+    print("Testing per-platform concurrency limits...")
+
+    jobs = (
+        [{"platform": "bluesky", "grantee": f"b{i}"} for i in range(12)]
+        + [{"platform": "facebook", "grantee": f"f{i}"} for i in range(3)]
+    )
+    limits = {"bluesky": 4, "facebook": 1}
+
+    lock = threading.Lock()
+    active = {"bluesky": 0, "facebook": 0}
+    peak = {"bluesky": 0, "facebook": 0}
+    completed = []
+
+    def worker(job):
+        platform = job["platform"]
+        with lock:
+            active[platform] += 1
+            peak[platform] = max(peak[platform], active[platform])
+        time.sleep(0.02)
+        with lock:
+            active[platform] -= 1
+        if job["grantee"] == "b3":
+            raise RuntimeError("boom")
+        return {"success": True, "posts_downloaded": 1}
+
+    def on_complete(job, result):
+        # Callbacks must run on the calling thread
+        assert threading.current_thread() is threading.main_thread()
+        completed.append((job["grantee"], result["success"]))
+
+    scheduler = JobScheduler(limits)
+    scheduler.run(jobs, worker, on_complete)
+
+    assert len(completed) == len(jobs)
+    assert ("b3", False) in completed, "Worker exceptions should become failed results"
+    assert peak["bluesky"] == 4, f"Bluesky peak was {peak['bluesky']}"
+    assert peak["facebook"] == 1, f"Facebook peak was {peak['facebook']}"
+    print(f"✓ Peak concurrency: {peak}")
+    print()
+
+
+def test_longest_first_plan():
+    """Test longest-first ordering and the run time estimate."""
+    print("Testing longest-first planning...")
+
+    costs = {"f1": 10, "f2": 60, "f3": 30, "b1": 5, "b2": 5, "b3": 20}
+    jobs = [
+        {"platform": "facebook" if name[0] == "f" else "bluesky", "grantee": name, "url": name}
+        for name in costs
+    ]
+
+    def estimate(job):
+        return costs[job["grantee"]]
+
+    def limit_for(platform):
+        return {"facebook": 1, "bluesky": 2}[platform]
+
+    ordered = order_longest_first(jobs, estimate)
+    assert [j["grantee"] for j in ordered] == ["f2", "f3", "b3", "f1", "b1", "b2"]
+    print("✓ Jobs ordered longest first")
+
+    plan = plan_run(ordered, estimate, limit_for)
+    assert plan["total_seconds"] == 100
+    assert plan["critical_platform"] == "facebook"
+    assert [job["grantee"] for job, _ in plan["critical_path"]] == ["f2", "f3", "f1"]
+    assert plan["platforms"]["bluesky"]["seconds"] == 20
+    assert plan["platforms"]["bluesky"]["work_seconds"] == 30
+    print(f"✓ Estimated {plan['total_seconds']:.0f}s, critical path on {plan['critical_platform']}")
+
+    # In file order a slow job last on a 2-worker pool stretches the run
+    tail_heavy = [{"platform": "bluesky", "grantee": n, "url": n} for n in ("b1", "b2", "b3")]
+    costs.update({"b1": 10, "b2": 10, "b3": 20})
+    assert plan_run(tail_heavy, estimate, limit_for)["total_seconds"] == 30
+    assert plan_run(order_longest_first(tail_heavy, estimate), estimate, limit_for)["total_seconds"] == 20
+    print("✓ Longest-first shortens a tail-heavy run")
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("NJCIC Scheduler Test")
+    print("=" * 60)
+    print()
+
+    test_parse_concurrency()
+    test_build_jobs()
+    test_coalesce_jobs()
+    test_per_platform_limits()
+    test_longest_first_plan()
+
+    print("=" * 60)
+    print("✓ All tests passed!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Test script for the async scraper interface.
+
+Usage:
+    python test_scraper_async.py
+"""
+import asyncio
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from scrapers.base import BaseScraper
+
+
+class WaitingScraper(BaseScraper):
+    """Scraper that waits between posts like a paced scrape would."""
+
+    platform_name = "waiting"
+
+    def extract_username(self, url):
+        return url.rsplit('/', 1)[-1]
+
+    async def scrape_async(self, url, grantee_name, max_posts=None, deadline=None):
+        self.set_deadline(deadline)
+        posts = 0
+        for _ in range(max_posts or 5):
+            await self.deadline.async_sleep(0.1)
+            posts += 1
+        return {'success': True, 'posts_downloaded': posts, 'errors': [],
+                'engagement_metrics': {}, 'account': self.extract_username(url)}
+
+
+def test_shim():
+    """Test that the sync scrape() shim runs scrape_async()."""
+    print("Testing sync shim...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = WaitingScraper(output_dir=Path(tmp))
+        result = scraper.scrape("https://example.com/one", "One News", max_posts=2)
+        assert result['success'] and result['posts_downloaded'] == 2
+        print("✓ scrape() returns the result of scrape_async()")
+
+        result = scraper.scrape("https://example.com/one", "One News")
+        assert result['posts_downloaded'] == 5
+        print("✓ Omitted max_posts leaves the scraper's own default")
+    print()
+
+
+def test_concurrent_jobs():
+    """Test that scrapes for different accounts overlap on one event loop."""
+    print("Testing concurrent scrapes...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scrapers = [WaitingScraper(output_dir=Path(tmp)) for _ in range(3)]
+
+        async def run_all():
+            return await asyncio.gather(*(
+                scraper.scrape_async(f"https://example.com/{i}", f"Grantee {i}", max_posts=5)
+                for i, scraper in enumerate(scrapers)
+            ))
+
+        started = time.monotonic()
+        results = asyncio.run(run_all())
+        elapsed = time.monotonic() - started
+
+        assert [r['account'] for r in results] == ['0', '1', '2']
+        assert all(r['posts_downloaded'] == 5 for r in results)
+        assert elapsed < 1.2, f"scrapes ran one after another ({elapsed:.2f}s)"
+        print(f"✓ Three 0.5s scrapes finished together in {elapsed:.2f}s")
+    print()
+
+
+def test_run_command():
+    """Test the non-blocking subprocess helper."""
+    print("Testing run_command...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = WaitingScraper(output_dir=Path(tmp))
+
+        result = asyncio.run(scraper.run_command(
+            [sys.executable, '-c', 'import sys; print("out"); print("err", file=sys.stderr); sys.exit(3)'],
+            10
+        ))
+        assert result.returncode == 3
+        assert result.stdout.strip() == 'out' and result.stderr.strip() == 'err'
+        print("✓ Output and exit status match subprocess.run")
+
+        started = time.monotonic()
+        try:
+            asyncio.run(scraper.run_command([sys.executable, '-c', 'import time; time.sleep(30)'], 0.3))
+            assert False, "a command outliving its timeout should raise"
+        except subprocess.TimeoutExpired:
+            assert time.monotonic() - started < 5
+        print("✓ A command outliving its timeout is killed and raises TimeoutExpired")
+
+        try:
+            asyncio.run(scraper.run_command(['njcic-no-such-command'], 5))
+            assert False, "a missing executable should raise"
+        except FileNotFoundError:
+            print("✓ A missing executable raises FileNotFoundError")
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("NJCIC Async Scraper Interface Test")
+    print("=" * 60)
+    print()
+
+    test_shim()
+    test_concurrent_jobs()
+    test_run_command()
+
+    print("=" * 60)
+    print("✓ All tests passed!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Test script for incremental harvesting of infinite-scroll feeds.
+
+The in-browser test needs Chromium (playwright install chromium) and is
+skipped when it cannot be launched.
+
+Usage:
+    python test_scroll_harvest.py
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from browser_pool import BrowserPool
+from scroll_harvest import HARVESTED_ATTRIBUTE, ScrollHarvester
+
+
+class FakeFeed:
+    """
+    Page stand-in serving one batch of posts per scroll.
+
+    Harvest calls return the current batch (up to the limit); scroll calls
+    move on to the next batch and report how many elements it inserted.
+    """
+
+    def __init__(self, batches):
+        self.batches = batches
+        self.position = 0
+        self.harvests = []
+        self.scrolls = 0
+
+    async def evaluate(self, script, arg):
+        if 'mark' in arg:
+            self.harvests.append(arg['limit'])
+            batch = self.batches[self.position] if self.position < len(self.batches) else []
+            return batch[:arg['limit']]
+        self.scrolls += 1
+        self.position += 1
+        return len(self.batches[self.position]) if self.position < len(self.batches) else 0
+
+
+def posts(*ids):
+    """Build minimal post dicts with the given ids."""
+    return [{'id': post_id, 'text': f"post {post_id}"} for post_id in ids]
+
+
+def test_dedupe_and_target():
+    """Test de-duplication across passes and stopping at the target."""
+    print("Testing de-duplication and target...")
+
+    async def run():
+        # The second batch re-renders post 3, as virtualised feeds do
+        page = FakeFeed([posts(1, 2, 3), posts(3, 4, 5), posts(6, 7, 8, 9)])
+        harvester = ScrollHarvester(page, 'article', '(el) => null', target=6)
+        items = await harvester.run(max_scrolls=10, timeout_ms=100, floor_ms=0)
+        return page, harvester, items
+
+    page, harvester, items = asyncio.run(run())
+    assert [item['id'] for item in items] == [1, 2, 3, 4, 5, 6]
+    assert harvester.duplicates == 1
+    assert page.scrolls == 2
+    assert page.harvests == [6, 3, 1]
+    print("✓ Re-rendered posts skipped; scrolling stopped once 6 posts were read")
+
+    items = ScrollHarvester(None, 'article', '(el) => null', target=10, keys=('urn', 'url'))
+    items.add([{'urn': 'a'}, {'url': 'x'}, {'urn': 'a', 'url': 'y'}, {'text': 'no key'}, {'text': 'no key'}])
+    assert len(items.items) == 4 and items.duplicates == 1
+    print("✓ Keys tried in order; posts without a key are kept")
+    print()
+
+
+def test_stopping():
+    """Test patience, have_enough and before_scroll."""
+    print("Testing stop conditions...")
+
+    async def run():
+        page = FakeFeed([posts(1), [], [], posts(2)])
+        harvester = ScrollHarvester(page, 'article', '(el) => null', target=10)
+        await harvester.run(max_scrolls=10, timeout_ms=100, floor_ms=0, patience=2)
+        assert [item['id'] for item in harvester.items] == [1]
+        assert page.scrolls == 2
+        print("✓ Gives up after `patience` scrolls that bring nothing")
+
+        page = FakeFeed([posts(1), posts(2), posts(3)])
+        clicks = []
+
+        async def before_scroll():
+            clicks.append(page.position)
+
+        harvester = ScrollHarvester(page, 'article', '(el) => null', target=10)
+        await harvester.run(max_scrolls=10, timeout_ms=100, floor_ms=0,
+                            have_enough=lambda: len(harvester.items) >= 2, before_scroll=before_scroll)
+        assert len(harvester.items) == 2 and clicks == [0]
+        print("✓ have_enough ends scrolling early; before_scroll runs before each scroll")
+
+    asyncio.run(run())
+    print()
+
+
+def test_in_browser():
+    """Test harvesting a feed that appends posts on scroll and unmounts old ones."""
+    print("Testing harvesting in Chromium...")
+
+    pool = BrowserPool()
+
+    async def run():
+        async with pool.lease('test', setup=None) as lease:
+            page = await lease.context.new_page()
+            await page.set_content("""
+                <div id="feed" style="height: 20000px"></div>
+                <script>
+                    let next = 0;
+                    const feed = document.getElementById('feed');
+                    const render = () => {
+                        // Keep only the newest 3 posts mounted, like a virtualised list
+                        while (feed.children.length >= 3) feed.firstChild.remove();
+                        for (let i = 0; i < 3; i++, next++) {
+                            const a = document.createElement('article');
+                            a.innerHTML = `<a href="/p/${next}">post ${next}</a><article>quoted</article>`;
+                            feed.appendChild(a);
+                        }
+                    };
+                    render();
+                    window.addEventListener('scroll', () => setTimeout(render, 50));
+                </script>
+            """)
+            harvester = ScrollHarvester(
+                page, 'article',
+                "(el) => ({url: el.querySelector('a').getAttribute('href'), text: el.innerText})",
+                target=10
+            )
+            await harvester.run(max_scrolls=10, timeout_ms=2000, scroll_by=500, floor_ms=0)
+            marked = await page.evaluate(f"document.querySelectorAll('[{HARVESTED_ATTRIBUTE}]').length")
+            return harvester, marked
+
+    try:
+        try:
+            harvester, marked = pool.run(run())
+        except Exception as e:
+            print(f"- Skipped: Chromium not available ({str(e).splitlines()[0]})")
+            print()
+            return
+
+        assert [item['url'] for item in harvester.items] == [f"/p/{i}" for i in range(10)]
+        assert marked > 0
+        print("✓ All 10 posts read although only 3 were ever mounted at once; nested matches skipped")
+    finally:
+        pool.close()
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("NJCIC Scroll Harvest Test")
+    print("=" * 60)
+    print()
+
+    test_dedupe_and_target()
+    test_stopping()
+    test_in_browser()
+
+    print("=" * 60)
+    print("✓ All tests passed!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+Test script for the adaptive selector registry.
+
+The in-browser test needs Chromium (playwright install chromium) and is
+skipped when it cannot be launched.
+
+Usage:
+    python test_selector_registry.py
+"""
+import asyncio
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import config
+from browser_pool import BrowserPool
+from selector_registry import SelectorRegistry, playwright_timeout
+
+
+CANDIDATES = ['article.old', 'article.new', 'article']
+
+
+class FakePage:
+    """Page stand-in whose DOM matches a fixed set of selectors."""
+
+    def __init__(self, present):
+        self.present = present
+        self.waited = []
+
+    async def wait_for_selector(self, selector, timeout, state):
+        self.waited.append(selector)
+        if not any(s in self.present for s in selector.split(', ')):
+            raise playwright_timeout()('timeout')
+        return 'element'
+
+    async def evaluate(self, script, selectors):
+        return [selector in self.present for selector in selectors]
+
+
+def test_ordering_and_persistence():
+    """Test ranking by hit rate, first-match recording and the JSON file."""
+    print("Testing ordering and persistence...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'selector_stats.json'
+        registry = SelectorRegistry(path)
+
+        assert registry.order('twitter', 'tweet_article', CANDIDATES) == CANDIDATES
+        print("✓ Untried selectors keep their configured order")
+
+        for _ in range(3):
+            registry.record_first_match('twitter', 'tweet_article', CANDIDATES, 'article.new', latency_ms=120)
+        assert registry.order('twitter', 'tweet_article', CANDIDATES) == ['article.new', 'article', 'article.old']
+        entries = registry.entries['twitter']['tweet_article']
+        assert entries['article.old']['misses'] == 3 and 'article' not in entries
+        assert entries['article.new']['latency_ms'] == 120
+        print("✓ The selector that matched moves first; untried ones are left alone")
+
+        registry.save()
+        reloaded = SelectorRegistry(path)
+        assert reloaded.order('twitter', 'tweet_article', CANDIDATES)[0] == 'article.new'
+        assert 'updated_at' in json.loads(path.read_text())
+        assert not list(Path(tmp).glob('*.tmp'))
+        print("✓ Statistics survive a reload")
+    print()
+
+
+def test_stale_report():
+    """Test that a selector that stops matching is reported and demoted."""
+    print("Testing stale selectors...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        registry = SelectorRegistry(Path(tmp) / 'selector_stats.json')
+
+        for _ in range(50):
+            registry.record('facebook', 'post', '[role="article"]', True)
+        for _ in range(config.SELECTOR_STALE_AFTER_MISSES - 1):
+            registry.record('facebook', 'post', '[role="article"]', False)
+        registry.record('facebook', 'post', '.userContentWrapper', True)
+        assert registry.stale() == []
+
+        registry.record('facebook', 'post', '[role="article"]', False)
+        stale = registry.stale()
+        assert [item['selector'] for item in stale] == ['[role="article"]']
+        assert stale[0]['consecutive_misses'] == config.SELECTOR_STALE_AFTER_MISSES
+        assert registry.order('facebook', 'post', ['[role="article"]', '.userContentWrapper'])[0] == \
+            '.userContentWrapper'
+        print("✓ A selector with a long hit history is reported and demoted once it stops matching")
+
+        registry.record('facebook', 'post', '[role="article"]', True)
+        assert registry.stale() == []
+        print("✓ One new hit clears it")
+
+        for _ in range(30):
+            registry.record('facebook', 'post', 'div.never', False)
+        assert all(item['selector'] != 'div.never' for item in registry.stale())
+        print("✓ Selectors that never matched are not reported as stale")
+    print()
+
+
+def test_wait_for_any():
+    """Test that candidates are raced in one wait and each is recorded."""
+    print("Testing wait_for_any...")
+
+    async def run(registry):
+        page = FakePage({'article.new', 'article'})
+        element = await registry.wait_for_any(page, 'twitter', 'tweet_article', CANDIDATES, 1000)
+        assert element == 'element'
+        assert page.waited == ['article.old, article.new, article']
+
+        page = FakePage(set())
+        assert await registry.wait_for_any(page, 'twitter', 'tweet_article', CANDIDATES, 1000) is None
+        return page
+
+    with tempfile.TemporaryDirectory() as tmp:
+        registry = SelectorRegistry(Path(tmp) / 'selector_stats.json')
+        page = asyncio.run(run(registry))
+
+        entries = registry.entries['twitter']['tweet_article']
+        assert (entries['article.new']['hits'], entries['article.new']['misses']) == (1, 1)
+        assert (entries['article.old']['hits'], entries['article.old']['misses']) == (0, 2)
+        assert page.waited[0].startswith('article.new, article, ')
+        print("✓ One combined wait; every candidate's hit or miss recorded; ranking applied next time")
+    print()
+
+
+def test_in_browser():
+    """Test wait_for_any against a page where only the last candidate exists."""
+    print("Testing wait_for_any in Chromium...")
+
+    pool = BrowserPool()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        registry = SelectorRegistry(Path(tmp) / 'selector_stats.json')
+
+        async def run():
+            async with pool.lease('test', setup=None) as lease:
+                page = await lease.context.new_page()
+                await page.set_content('<div id="feed"></div>')
+                await page.evaluate(
+                    "setTimeout(() => document.getElementById('feed').appendChild("
+                    "document.createElement('article')), 200)"
+                )
+                return await registry.wait_for_any(page, 'test', 'article', CANDIDATES, 5000)
+
+        try:
+            try:
+                element = pool.run(run())
+            except Exception as e:
+                print(f"- Skipped: Chromium not available ({str(e).splitlines()[0]})")
+                print()
+                return
+
+            assert element is not None
+            entries = registry.entries['test']['article']
+            assert entries['article']['hits'] == 1 and entries['article.old']['misses'] == 1
+            print(f"✓ Matched the last candidate after {entries['article']['latency_ms']:.0f} ms, no per-selector timeout")
+        finally:
+            pool.close()
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("NJCIC Selector Registry Test")
+    print("=" * 60)
+    print()
+
+    test_ordering_and_persistence()
+    test_stale_report()
+    test_wait_for_any()
+    test_in_browser()
+
+    print("=" * 60)
+    print("✓ All tests passed!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
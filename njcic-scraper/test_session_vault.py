@@ -0,0 +1,196 @@
+"""
+Test script for the shared session vault.
+
+Usage:
+    python test_session_vault.py
+"""
+import asyncio
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import session_vault
+from session_vault import SessionVault
+
+
+STATE = {'cookies': [{'name': 'auth_token', 'value': 'abc', 'domain': '.x.com', 'path': '/'}], 'origins': []}
+
+
+class FakeContext:
+    """BrowserContext stand-in recording added cookies."""
+
+    def __init__(self):
+        self.added = []
+
+    async def add_cookies(self, cookies):
+        self.added.extend(cookies)
+
+    async def storage_state(self):
+        return {'cookies': [{'name': 'fresh', 'value': '1', 'domain': '.x.com', 'path': '/'}], 'origins': []}
+
+
+class FakeLease:
+    """ContextLease stand-in."""
+
+    def __init__(self, session_loaded):
+        self.context = FakeContext()
+        self.state = {'session_loaded': session_loaded}
+
+
+class Calls:
+    """Records calls to the check and login coroutines."""
+
+    def __init__(self, check_result=True, login_result=True):
+        self.checks = 0
+        self.logins = 0
+        self.check_result = check_result
+        self.login_result = login_result
+
+    async def check(self):
+        self.checks += 1
+        return self.check_result
+
+    async def login(self):
+        self.logins += 1
+        return self.login_result
+
+
+def test_records():
+    """Test saving, loading, TTL freshness and invalidation."""
+    print("Testing session records...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        vault = SessionVault(Path(tmp), ttl_hours=6)
+
+        assert vault.load('twitter') is None
+        assert vault.context_options('twitter', {'locale': 'en-US'}) == {'locale': 'en-US'}
+
+        vault.save('twitter', STATE)
+        assert vault.storage_state('twitter') == STATE
+        options = vault.context_options('twitter', {'locale': 'en-US'})
+        assert options['storage_state'] == STATE and options['locale'] == 'en-US'
+        assert not list(Path(tmp).glob('*.tmp'))
+        print("✓ storage_state saved atomically and added to context options")
+
+        assert vault.is_fresh('twitter')
+        assert not vault.is_fresh('twitter', now=datetime.now() + timedelta(hours=7))
+        print("✓ A session is fresh for the TTL after validation")
+
+        validated_at = vault.load('twitter')['validated_at']
+        vault.save('twitter', STATE, validated=False)
+        assert vault.load('twitter')['validated_at'] == validated_at
+        vault.invalidate('twitter')
+        assert not vault.is_fresh('twitter') and vault.storage_state('twitter') == STATE
+        vault.mark_validated('twitter')
+        assert vault.is_fresh('twitter')
+        print("✓ Unvalidated saves keep the validation time; invalidate and mark_validated update it")
+
+        vault.save('linkedin', STATE, account='me@example.org')
+        assert vault.path('linkedin', 'me@example.org').name == 'linkedin-me@example.org.json'
+        assert vault.load('linkedin') is None
+        vault.path('threads').write_text('{not json')
+        assert vault.load('threads') is None
+        print("✓ Sessions kept per account; unreadable files ignored")
+    print()
+
+
+def test_authenticate():
+    """Test that authenticate checks and logs in only when needed."""
+    print("Testing authenticate...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        vault = SessionVault(Path(tmp), ttl_hours=6)
+
+        async def run(session_loaded, calls):
+            lease = FakeLease(session_loaded)
+            logged_in = await vault.authenticate('twitter', lease, calls.check, calls.login)
+            return lease, logged_in
+
+        vault.save('twitter', STATE)
+        calls = Calls()
+        lease, logged_in = asyncio.run(run(True, calls))
+        assert logged_in and lease.state['logged_in'] and (calls.checks, calls.logins) == (0, 0)
+        print("✓ A session validated within the TTL is used without a check")
+
+        vault.invalidate('twitter')
+        calls = Calls()
+        lease, logged_in = asyncio.run(run(True, calls))
+        assert logged_in and (calls.checks, calls.logins) == (1, 0) and vault.is_fresh('twitter')
+        print("✓ An older session is checked once, then trusted again for the TTL")
+
+        vault.invalidate('twitter')
+        calls = Calls(check_result=False)
+        lease, logged_in = asyncio.run(run(True, calls))
+        assert logged_in and (calls.checks, calls.logins) == (1, 1)
+        assert vault.storage_state('twitter')['cookies'][0]['name'] == 'fresh'
+        print("✓ A logged-out session leads to a login, and the new session is saved")
+
+        # Another process logged in after this context was created without a session
+        calls = Calls()
+        lease, logged_in = asyncio.run(run(False, calls))
+        assert logged_in and calls.logins == 0 and lease.context.added[0]['name'] == 'fresh'
+        print("✓ A fresh session saved by another run is picked up instead of logging in")
+
+        vault.invalidate('twitter')
+        lease, logged_in = asyncio.run(run(False, Calls(login_result=False)))
+        assert not logged_in and 'logged_in' not in lease.state
+        lease = FakeLease(False)
+        assert not asyncio.run(vault.authenticate('twitter', lease, None, None))
+        print("✓ Failed or impossible logins report False")
+    print()
+
+
+def test_lock():
+    """Test that the login lock excludes other holders until released."""
+    print("Testing login lock...")
+
+    if session_vault.fcntl is None:
+        print("- Skipped: fcntl not available on this platform")
+        print()
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        vault = SessionVault(Path(tmp))
+
+        async def take(platform):
+            async with vault.async_lock(platform):
+                return True
+
+        def attempt(platform):
+            try:
+                return asyncio.run(asyncio.wait_for(take(platform), 0.5))
+            except asyncio.TimeoutError:
+                return False
+
+        # flock locks belong to the open file, so a second open in this
+        # process conflicts just like another process would
+        with vault.lock('twitter'):
+            assert not attempt('twitter')
+            assert attempt('threads')
+        assert attempt('twitter')
+        print("✓ A held lock blocks the async lock, which is taken once released; other platforms unaffected")
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("NJCIC Session Vault Test")
+    print("=" * 60)
+    print()
+
+    test_records()
+    test_authenticate()
+    test_lock()
+
+    print("=" * 60)
+    print("✓ All tests passed!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+Test script for orchestrator sharding and report merging.
+
+Usage:
+    python test_sharding.py
+"""
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from job_history import JobHistory, account_key, canonical_url
+from main import record_shard_history
+from refresh import RefreshSchedule
+from sharding import filter_jobs_for_shard, merge_reports, parse_shard
+
+
+def url_key(platform, url):
+    """Account key from the URL alone, as main.py's _account_key falls back to."""
+    return account_key(None, url)
+
+
+def make_jobs():
+    """Build a job list with mixed platforms."""
+    jobs = []
+    for i in range(20):
+        jobs.append({"grantee": f"Grantee {i}", "platform": "bluesky",
+                     "url": f"https://bsky.app/profile/g{i}.bsky.social"})
+        if i % 2 == 0:
+            jobs.append({"grantee": f"Grantee {i}", "platform": "facebook",
+                         "url": f"https://www.facebook.com/g{i}/"})
+    return jobs
+
+
+def test_parse_shard():
+    """Test K/N parsing."""
+    print("Testing shard spec parsing...")
+
+    assert parse_shard("2/3") == (2, 3)
+    for bad_spec in ["0/3", "4/3", "a/b", "3"]:
+        try:
+            parse_shard(bad_spec)
+        except ValueError:
+            print(f"✓ Rejected invalid spec: {bad_spec}")
+        else:
+            raise AssertionError(f"Spec should have been rejected: {bad_spec}")
+    print()
+
+
+def test_canonical_url():
+    """Test URL canonicalisation."""
+    print("Testing canonical URLs...")
+
+    assert canonical_url("https://www.Twitter.com/NJNews/") == "x.com/NJNews"
+    assert canonical_url("facebook.com/page?ref=bookmarks") == "facebook.com/page"
+    print("✓ Scheme, www, query and trailing slash stripped")
+    print()
+
+
+def test_assignment_is_stable_and_complete():
+    """Test that shards partition the jobs independent of input order."""
+    print("Testing shard assignment...")
+
+    jobs = make_jobs()
+    shuffled = list(jobs)
+    random.Random(7).shuffle(shuffled)
+    key = lambda j: (j["platform"], j["url"])
+
+    seen = []
+    counts = []
+    for k in (1, 2, 3):
+        shard_jobs = filter_jobs_for_shard(jobs, (k, 3), url_key)
+        shuffled_jobs = filter_jobs_for_shard(shuffled, (k, 3), url_key)
+        assert sorted(map(key, shard_jobs)) == sorted(map(key, shuffled_jobs))
+
+        seen.extend(map(key, shard_jobs))
+        counts.append(len(shard_jobs))
+
+    assert sorted(seen) == sorted(key(j) for j in jobs)
+    assert min(counts) > 0, f"Empty shard: {counts}"
+    print(f"✓ Every job on exactly one shard, regardless of order (jobs per shard: {counts})")
+
+    before = {key(j): k for k in (1, 2, 3) for j in filter_jobs_for_shard(jobs, (k, 3), url_key)}
+    extra = jobs + [{"grantee": "New", "platform": "bluesky", "url": "https://bsky.app/profile/new.bsky.social"}]
+    after = {key(j): k for k in (1, 2, 3) for j in filter_jobs_for_shard(extra, (k, 3), url_key)}
+    assert all(after[job] == shard for job, shard in before.items())
+    print("✓ Adding an account moves no other account")
+
+    # Two URL forms of one account share its key, so they stay on one shard
+    same = [{"grantee": "A", "platform": "facebook", "url": "https://www.facebook.com/g0/"},
+            {"grantee": "B", "platform": "facebook", "url": "https://m.facebook.com/g0?ref=x"}]
+    assert any(len(filter_jobs_for_shard(same, (k, 3), url_key)) == 2 for k in (1, 2, 3))
+    print("✓ Jobs coalesced into one account are never split")
+    print()
+
+
+def test_merge_reports():
+    """Test combining per-shard reports."""
+    print("Testing report merge...")
+
+    def report(shard, platform, posts):
+        return {
+            "metadata": {"shard": shard, "platforms_enabled": ["bluesky", "facebook"],
+                         "duration_seconds": 100, "max_posts_per_account": 25},
+            "summary": {"grantees_skipped": 1, "grantees_failed": 1, "jobs_resumed": 2},
+            "platform_stats": {platform: {"attempted": 1, "successful": 1, "failed": 0,
+                                          "skipped": 4, "total_posts_collected": posts,
+                                          "total_engagement": 10}},
+            "grantee_results": [{
+                "name": "Alpha News",
+                "website": "https://alpha.example",
+                "platforms": {platform: {"url": "u", "success": True, "posts_downloaded": posts}},
+                "summary": {"total_posts": posts, "total_engagement": 10,
+                            "platforms_scraped": 1, "platforms_failed": 0},
+            }],
+            "errors": [{"type": "grantee_processing", "grantee": f"Failed {shard}"},
+                       {"type": "grantee_processing", "grantee": "Beta News"}],
+        }
+
+    merged = merge_reports([report("1/2", "bluesky", 5), report("2/2", "facebook", 7)])
+
+    assert len(merged["grantee_results"]) == 1
+    alpha = merged["grantee_results"][0]
+    assert set(alpha["platforms"]) == {"bluesky", "facebook"}
+    assert alpha["summary"]["total_posts"] == 12
+    assert merged["summary"]["grantees_skipped"] == 1
+    assert merged["platform_stats"]["facebook"]["skipped"] == 4
+    print("✓ Grantee split across shards merged back into one result")
+
+    assert merged["summary"]["grantees_failed"] == 3
+    assert merged["summary"]["jobs_resumed"] == 4
+    print("✓ Failed grantees counted once across shards; resumed jobs summed")
+    print()
+
+
+def test_record_shard_history():
+    """Test that merged results update history once per scraped account."""
+    print("Testing shard history...")
+
+    shared = {"url": "https://x.com/shared", "success": True, "duration_seconds": 40,
+              "activity": {"posts_per_week": 14, "last_post": None}}
+    grantee_results = [
+        {"name": "Alpha News", "platforms": {"twitter": shared}},
+        {"name": "Beta News", "platforms": {"twitter": dict(shared, url="https://twitter.com/shared/")}},
+        {"name": "Gamma News", "platforms": {"bluesky": {
+            "url": "https://bsky.app/profile/gamma.example", "success": True,
+            "duration_seconds": 5, "cached": True}}},
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        history = JobHistory(Path(tmp) / "job_history.json")
+        refresh_schedule = RefreshSchedule(Path(tmp) / "refresh_state.json")
+        record_shard_history(grantee_results, history, refresh_schedule)
+
+    assert list(history.entries) == [JobHistory.key("twitter", "https://x.com/shared")]
+    assert history.entries[JobHistory.key("twitter", "https://x.com/shared")]["runs"] == 1
+    assert list(refresh_schedule.entries) == list(history.entries)
+    print("✓ Shared account recorded once; cached result not recorded")
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("NJCIC Sharding Test")
+    print("=" * 60)
+    print()
+
+    test_parse_shard()
+    test_canonical_url()
+    test_assignment_is_stable_and_complete()
+    test_merge_reports()
+    test_record_shard_history()
+
+    print("=" * 60)
+    print("✓ All tests passed!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Test script for sleep and delay accounting.
+
+Usage:
+    python test_time_accounting.py
+"""
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from scrapers.base import BaseScraper
+from scrapers.tiktok import TikTokScraper
+from time_accounting import TimeLedger, get_time_ledger, measure, merge_time_reports
+
+
+class SleepyScraper(BaseScraper):
+    """Scraper that rate limits, pauses, backs off and runs a command."""
+
+    platform_name = "sleepy"
+
+    def extract_username(self, url):
+        return url.rsplit('/', 1)[-1]
+
+    async def scrape_async(self, url, grantee_name, max_posts=None, deadline=None):
+        self.set_deadline(deadline)
+        await self.rate_limit()
+        await self.rate_limit()
+        await self.pause(0.05, 0.05)
+        await self.wait(0.05, 'retry_backoff')
+        await self.run_command([sys.executable, '-c', 'import time; time.sleep(0.1)'], 10)
+        return {'success': True}
+
+
+def reasons(report, platform, account):
+    """Return an account's reasons from a report."""
+    for entry in report['accounts']:
+        if (entry['platform'], entry['account']) == (platform, account):
+            return entry['reasons']
+    raise AssertionError(f"no row for {platform}/{account}")
+
+
+def test_ledger():
+    """Test nesting, job attribution and the breakdown."""
+    print("Testing time ledger...")
+
+    ledger = TimeLedger()
+
+    with ledger.job('twitter', 'njspotlight'):
+        with ledger.measure('network', 'page_load'):
+            time.sleep(0.1)
+            with ledger.measure('sleep', 'wait_for_timeout'):
+                time.sleep(0.1)
+        time.sleep(0.05)
+    with ledger.measure('sleep', 'rate_limit'):
+        pass
+
+    report = ledger.report()
+    row = report['accounts'][0]
+    assert (row['platform'], row['account']) == ('twitter', 'njspotlight')
+    assert 0.09 <= row['network'] < 0.15 and 0.09 <= row['sleep'] < 0.15
+    print("✓ A nested wait is counted once, as sleep, not inside the page load")
+
+    assert 0.04 <= row['cpu'] < 0.1
+    assert abs(row['job_seconds'] - (row['sleep'] + row['network'] + row['browser'] + row['cpu'])) < 0.02
+    assert report['accounts'][1]['platform'] == '-'
+    print(f"✓ Job time {row['job_seconds']:.2f}s splits into sleep, network, browser and cpu; "
+          f"waits outside a job are unattributed")
+    print()
+
+
+def test_concurrent_jobs():
+    """Test that jobs sharing an event loop and threads keep their own buckets."""
+    print("Testing attribution across tasks and threads...")
+
+    ledger = TimeLedger()
+
+    def blocking_wait():
+        with ledger.measure('sleep', 'retry_backoff'):
+            time.sleep(0.05)
+
+    async def scrape(account, seconds):
+        with ledger.job('instagram', account):
+            with ledger.measure('network', 'instaloader'):
+                await asyncio.to_thread(blocking_wait)
+            with ledger.measure('sleep', 'rate_limit'):
+                await asyncio.sleep(seconds)
+
+    async def run_all():
+        await asyncio.gather(scrape('a', 0.1), scrape('b', 0.3))
+
+    asyncio.run(run_all())
+    report = ledger.report()
+
+    assert 0.09 <= reasons(report, 'instagram', 'a')['sleep:rate_limit']['seconds'] < 0.2
+    assert 0.29 <= reasons(report, 'instagram', 'b')['sleep:rate_limit']['seconds'] < 0.4
+    assert reasons(report, 'instagram', 'a')['sleep:retry_backoff']['seconds'] >= 0.04
+    assert reasons(report, 'instagram', 'a')['network:instaloader']['seconds'] < 0.04
+    print("✓ Overlapping jobs are attributed separately, including waits in to_thread workers")
+    print()
+
+
+def test_scraper_waits():
+    """Test that BaseScraper's waits and commands land in the job's buckets."""
+    print("Testing scraper instrumentation...")
+
+    ledger = get_time_ledger()
+    ledger.start()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = SleepyScraper(output_dir=Path(tmp))
+        scraper.scrape("https://example.com/NJSpotlight", "NJ Spotlight")
+
+        report = ledger.report()
+        found = reasons(report, 'sleepy', 'njspotlight')
+        assert {'sleep:rate_limit', 'sleep:random_delay', 'sleep:retry_backoff'} <= set(found)
+        assert found['sleep:rate_limit']['count'] == 1
+        assert found[f"network:{Path(sys.executable).name}"]['seconds'] >= 0.1
+        print("✓ rate_limit, pause, retry backoff and subprocesses are attributed to the account")
+
+        tiktok = TikTokScraper(output_dir=Path(tmp))
+        with ledger.job('tiktok', 'someone'):
+            ledger.record('network', 'yt_dlp', 10)
+            tiktok._account_sleep_requests(3)
+        found = reasons(ledger.report(), 'tiktok', 'someone')
+        assert found['network:yt_dlp']['seconds'] == 10 - 4 * TikTokScraper.SLEEP_REQUESTS
+        assert found['sleep:sleep_requests']['seconds'] == 4 * TikTokScraper.SLEEP_REQUESTS
+        print("✓ yt-dlp --sleep-requests time is moved from network to sleep")
+
+    assert report['sleep_by_reason'] and report['job_seconds'] > 0
+    print()
+
+
+def test_merge():
+    """Test merging shard reports."""
+    print("Testing shard merge...")
+
+    first = TimeLedger()
+    second = TimeLedger()
+    for ledger, account in ((first, 'a'), (second, 'b')):
+        with ledger.job('bluesky', account):
+            with ledger.measure('sleep', 'rate_limit'):
+                time.sleep(0.05)
+
+    merged = merge_time_reports([first.report(), second.report()])
+    assert len(merged['accounts']) == 2
+    assert merged['breakdown']['sleep'] >= 0.1
+    assert merged['sleep_by_reason']['rate_limit'] >= 0.1
+    print("✓ Shard time is summed and accounts are combined")
+    print()
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("NJCIC Time Accounting Test")
+    print("=" * 60)
+    print()
+
+    test_ledger()
+    test_concurrent_jobs()
+    test_scraper_waits()
+    test_merge()
+
+    print("=" * 60)
+    print("✓ All tests passed!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+"""
+Time accounting for scraping runs.
+
+A run spends most of its wall-clock time waiting, and not all of that
+waiting is the platform's fault: rate limits, human-like pauses, retry
+backoff, fixed page timeouts and yt-dlp's --sleep-requests are all delays
+we chose. The time ledger attributes every deliberate wait, and the time
+spent on the network and in the browser, to a (platform, account, reason)
+bucket so a run can show which delays cost the most.
+
+Each scrape runs inside job(platform, account), which the BaseScraper.scrape
+shim enters; measure(category, reason) blocks inside it are charged to that
+job. Categories are:
+
+- sleep: deliberate waits (rate_limit, random_delay, retry_backoff, ...)
+- network: page loads, API requests and network-bound subprocesses
+- browser: waiting on the page (selectors, scroll-and-wait)
+- cpu: the rest of a job's time, i.e. scraper code, parsing and waiting
+  for the shared event loop
+
+A measure() nested in another is subtracted from the outer one, so a sleep
+inside a network-bound instaloader call is only counted as sleep. The job
+context is held in a ContextVar, so it follows the job into tasks and
+asyncio.to_thread() workers but never leaks into jobs running alongside.
+"""
+
+import contextvars
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# Measured categories; 'cpu' is whatever is left of a job's time
+CATEGORIES = ['sleep', 'network', 'browser']
+
+# Bucket used for waits outside any job (e.g. a script calling scrape_async directly)
+UNATTRIBUTED = ('-', '-')
+
+# (platform, account) of the job being run in this context
+_current_job: contextvars.ContextVar = contextvars.ContextVar('time_accounting_job', default=None)
+
+# Stack of open measure() frames; each frame is [seconds spent in nested measures]
+_frames: contextvars.ContextVar = contextvars.ContextVar('time_accounting_frames', default=())
+
+
+class TimeLedger:
+    """
+    Process-wide record of where scraping time went.
+
+    Attributes:
+        started_at: time.monotonic() when the run started
+        cpu_started_at: time.process_time() when the run started
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.start()
+
+    def start(self) -> None:
+        """Clear the ledger and start timing a new run."""
+        with self._lock:
+            self.started_at = time.monotonic()
+            self.cpu_started_at = time.process_time()
+            # (platform, account, category, reason) -> [seconds, count]
+            self._buckets: Dict[Tuple[str, str, str, str], List[float]] = {}
+            # (platform, account) -> total job seconds
+            self._jobs: Dict[Tuple[str, str], float] = {}
+
+    def record(self, category: str, reason: str, seconds: float, count: int = 1) -> None:
+        """
+        Charge time to the current job.
+
+        Args:
+            category: 'sleep', 'network' or 'browser'
+            reason: What the time was spent on, e.g. 'rate_limit'
+            seconds: Time spent
+            count: Number of waits the time covers
+        """
+        platform, account = _current_job.get() or UNATTRIBUTED
+        with self._lock:
+            bucket = self._buckets.setdefault((platform, account, category, reason), [0.0, 0])
+            bucket[0] += seconds
+            bucket[1] += count
+
+    def reclassify(self, seconds: float, from_category: str, from_reason: str,
+                   to_category: str, to_reason: str) -> float:
+        """
+        Move time already recorded for the current job to another bucket.
+
+        Used when part of a measured call is known to have been something
+        else, e.g. the --sleep-requests pauses inside a yt-dlp run.
+
+        Args:
+            seconds: Time to move; capped at what the source bucket holds
+            from_category: Category the time was recorded under
+            from_reason: Reason the time was recorded under
+            to_category: Category to move it to
+            to_reason: Reason to move it to
+
+        Returns:
+            Seconds actually moved
+        """
+        platform, account = _current_job.get() or UNATTRIBUTED
+        with self._lock:
+            source = self._buckets.get((platform, account, from_category, from_reason))
+            moved = min(seconds, source[0]) if source else 0.0
+            if moved <= 0:
+                return 0.0
+            source[0] -= moved
+            target = self._buckets.setdefault((platform, account, to_category, to_reason), [0.0, 0])
+            target[0] += moved
+            target[1] += 1
+        return moved
+
+    @contextmanager
+    def measure(self, category: str, reason: str) -> Iterator[None]:
+        """
+        Time a block and charge it to the current job.
+
+        Works around awaits as well as blocking calls. Time spent in nested
+        measure() blocks is left out.
+
+        Args:
+            category: 'sleep', 'network' or 'browser'
+            reason: What the time is spent on
+        """
+        frame = [0.0]
+        parents = _frames.get()
+        token = _frames.set(parents + (frame,))
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - started
+            _frames.reset(token)
+            if parents:
+                parents[-1][0] += elapsed
+            self.record(category, reason, max(0.0, elapsed - frame[0]))
+
+    @contextmanager
+    def job(self, platform: str, account: str) -> Iterator[None]:
+        """
+        Attribute everything measured inside the block to one job.
+
+        Args:
+            platform: Platform name
+            account: Account being scraped
+        """
+        token = _current_job.set((platform, account))
+        frames_token = _frames.set(())
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - started
+            _frames.reset(frames_token)
+            _current_job.reset(token)
+            with self._lock:
+                self._jobs[(platform, account)] = self._jobs.get((platform, account), 0.0) + elapsed
+
+    def report(self, top: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Break the run's time down by category, reason and account.
+
+        Jobs run concurrently, so job time adds up to more than the run's
+        wall-clock time; the breakdown is of job time.
+
+        Args:
+            top: Only list this many accounts, most deliberate sleep first
+
+        Returns:
+            Dictionary with the run's wall-clock and CPU time, the job-time
+            breakdown, sleep by reason and per-account rows
+        """
+        with self._lock:
+            buckets = {key: list(value) for key, value in self._buckets.items()}
+            jobs = dict(self._jobs)
+            wall = time.monotonic() - self.started_at
+            cpu = time.process_time() - self.cpu_started_at
+
+        accounts: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        sleep_by_reason: Dict[str, float] = {}
+
+        def row(platform: str, account: str) -> Dict[str, Any]:
+            return accounts.setdefault((platform, account), {
+                'platform': platform,
+                'account': account,
+                'job_seconds': jobs.get((platform, account), 0.0),
+                **{category: 0.0 for category in CATEGORIES},
+                'reasons': {}
+            })
+
+        for key in jobs:
+            row(*key)
+
+        for (platform, account, category, reason), (seconds, count) in buckets.items():
+            entry = row(platform, account)
+            entry[category] += seconds
+            entry['reasons'][f"{category}:{reason}"] = {'seconds': round(seconds, 2), 'count': int(count)}
+            if category == 'sleep':
+                sleep_by_reason[reason] = sleep_by_reason.get(reason, 0.0) + seconds
+
+        breakdown = {category: 0.0 for category in CATEGORIES + ['cpu']}
+        for entry in accounts.values():
+            entry['cpu'] = max(0.0, entry['job_seconds'] - sum(entry[c] for c in CATEGORIES))
+            for category in breakdown:
+                breakdown[category] += entry[category]
+            for field in ['job_seconds', 'cpu'] + CATEGORIES:
+                entry[field] = round(entry[field], 2)
+
+        rows = sorted(accounts.values(), key=lambda entry: entry['sleep'], reverse=True)
+
+        return {
+            'wall_seconds': round(wall, 2),
+            'process_cpu_seconds': round(cpu, 2),
+            'job_seconds': round(sum(jobs.values()), 2),
+            'breakdown': {category: round(seconds, 2) for category, seconds in breakdown.items()},
+            'sleep_by_reason': {
+                reason: round(seconds, 2)
+                for reason, seconds in sorted(sleep_by_reason.items(), key=lambda item: -item[1])
+            },
+            'accounts': rows[:top] if top else rows
+        }
+
+
+_time_ledger: Optional[TimeLedger] = None
+_ledger_lock = threading.Lock()
+
+
+def get_time_ledger() -> TimeLedger:
+    """Return the process-wide time ledger."""
+    global _time_ledger
+
+    with _ledger_lock:
+        if _time_ledger is None:
+            _time_ledger = TimeLedger()
+        return _time_ledger
+
+
+def measure(category: str, reason: str):
+    """Shortcut for get_time_ledger().measure()."""
+    return get_time_ledger().measure(category, reason)
+
+
+def merge_time_reports(reports: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Combine the time accounting sections of several shard reports.
+
+    Shards run side by side, so the merged wall-clock time is the longest
+    shard's; job, CPU and per-category times are summed.
+
+    Args:
+        reports: report() dictionaries, one per shard
+
+    Returns:
+        Merged dictionary in the same shape as report()
+    """
+    breakdown = {category: 0.0 for category in CATEGORIES + ['cpu']}
+    sleep_by_reason: Dict[str, float] = {}
+    accounts: List[Dict[str, Any]] = []
+
+    for report in reports:
+        for category, seconds in report.get('breakdown', {}).items():
+            breakdown[category] = breakdown.get(category, 0.0) + seconds
+        for reason, seconds in report.get('sleep_by_reason', {}).items():
+            sleep_by_reason[reason] = sleep_by_reason.get(reason, 0.0) + seconds
+        accounts.extend(report.get('accounts', []))
+
+    return {
+        'wall_seconds': max((r.get('wall_seconds', 0) for r in reports), default=0),
+        'process_cpu_seconds': round(sum(r.get('process_cpu_seconds', 0) for r in reports), 2),
+        'job_seconds': round(sum(r.get('job_seconds', 0) for r in reports), 2),
+        'breakdown': {category: round(seconds, 2) for category, seconds in breakdown.items()},
+        'sleep_by_reason': {
+            reason: round(seconds, 2)
+            for reason, seconds in sorted(sleep_by_reason.items(), key=lambda item: -item[1])
+        },
+        'accounts': sorted(accounts, key=lambda entry: entry.get('sleep', 0), reverse=True)
+    }
+
+
+def time_accounting_stats(top: Optional[int] = None) -> Dict[str, Any]:
+    """Return the time ledger's report for the run report."""
+    return get_time_ledger().report(top)
@@ -14,15 +14,16 @@ Existing file is backed up to .bak-YYYYMMDD-HHMMSS before overwrite.
 """
 import argparse
 import csv
-import json
 import shutil
 import subprocess
 import sys
-import urllib.request
-import urllib.parse
 from datetime import datetime
 from pathlib import Path
 
+# Shared pooled HTTP client (falls back to urllib when requests is missing)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "njcic-scraper"))
+from http_client import get_http_client
+
 BASE_ID  = "appryDZWgPpP0GmZw"
 TABLE_ID = "tblFADXYCq495smGH"
 
@@ -52,15 +53,18 @@ def get_token() -> str:
 
 
 def fetch_records(token: str) -> list[dict]:
+    # Pages share one pooled connection; API responses are never cached
+    client = get_http_client()
+    url = f"https://api.airtable.com/v0/{BASE_ID}/{TABLE_ID}"
     records, offset = [], None
     while True:
         params = [("pageSize", "100")]
         if offset:
             params.append(("offset", offset))
-        url = f"https://api.airtable.com/v0/{BASE_ID}/{TABLE_ID}?" + urllib.parse.urlencode(params)
-        req = urllib.request.Request(url, headers={"Authorization": f"Bearer {token}"})
-        with urllib.request.urlopen(req, timeout=30) as r:
-            data = json.load(r)
+        r = client.get(url, params=params, headers={"Authorization": f"Bearer {token}"},
+                       timeout=30, ttl=None)
+        r.raise_for_status()
+        data = r.json()
         records.extend(data["records"])
         offset = data.get("offset")
         if not offset: